@@ -3,10 +3,10 @@ Armory All Templates Manager - Manages template data and operations
 Handles loading, filtering, and managing all templates across realms and classes
 """
 
-import json
 import logging
 from pathlib import Path
 
+from Functions.json_bulk_loader import json_bulk_load
 from Functions.path_manager import get_resource_path
 
 logger = logging.getLogger(__name__)
@@ -27,29 +27,38 @@ class ArmoryAllTemplatesManager:
         logger.info(f"Starting template load from: {armory_base}")
         logger.info(f"Armory base exists: {armory_base.exists()}")
 
+        template_files = []
         for realm in realms:
             realm_path = armory_base / realm / "Templates"
             logger.info(f"Loading templates from {realm_path}")
             logger.info(f"Realm path exists: {realm_path.exists()}")
             if realm_path.exists():
-                template_files = list(realm_path.glob("*.txt"))
-                logger.info(f"Found {len(template_files)} template files in {realm}")
-                for template_file in template_files:
-                    if template_file.name.startswith("_"):
-                        continue
-
-                    metadata = self._load_template_metadata(realm, template_file.name)
-                    self.all_templates.append({
-                        "realm": realm,
-                        "name": template_file.stem,
-                        "class": metadata.get("class", "Unknown"),
-                        "season": metadata.get("season", "Unknown"),
-                        "file": template_file.name,
-                        "path": template_file
-                    })
+                realm_files = sorted(realm_path.glob("*.txt"))
+                logger.info(f"Found {len(realm_files)} template files in {realm}")
+                template_files.extend(
+                    (realm, template_file) for template_file in realm_files
+                    if not template_file.name.startswith("_")
+                )
             else:
                 logger.warning(f"Realm path does not exist: {realm_path}")
 
+        # Read the metadata files of all realms at once (missing files fall back to the file name)
+        metadata_paths = [
+            self._get_metadata_path(realm, template_file.name)
+            for realm, template_file in template_files
+        ]
+        loaded = json_bulk_load(metadata_paths)
+        for (realm, template_file), (json_path, data, error) in zip(template_files, loaded):
+            metadata = self._parse_template_metadata(template_file.name, json_path, data, error)
+            self.all_templates.append({
+                "realm": realm,
+                "name": template_file.stem,
+                "class": metadata.get("class", "Unknown"),
+                "season": metadata.get("season", "Unknown"),
+                "file": template_file.name,
+                "path": template_file
+            })
+
         logger.info(f"Total templates loaded: {len(self.all_templates)}")
 
     def get_all_classes(self):
@@ -79,27 +88,35 @@ class ArmoryAllTemplatesManager:
         ]
         return filtered
 
-    def _load_template_metadata(self, realm, filename):
-        """Load metadata from JSON file if it exists
+    def _get_metadata_path(self, realm, filename):
+        """Path of the JSON metadata file of a template
 
         Args:
             realm: Realm name
             filename: Template filename
 
         Returns:
-            Dictionary with class and season metadata
+            Path of Armory/<realm>/Json/<filename>.json
         """
-        json_path = (
-            Path(get_resource_path("Armory")) / realm / "Json" / f"{filename}.json"
-        )
+        return Path(get_resource_path("Armory")) / realm / "Json" / f"{filename}.json"
 
-        if json_path.exists():
-            try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get("metadata", {})
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load metadata from {json_path}: {e}")
+    def _parse_template_metadata(self, filename, json_path, data, error):
+        """Metadata of a loaded JSON file, or parsed from the template filename
+
+        Args:
+            filename: Template filename
+            json_path: JSON metadata file
+            data: Parsed JSON file (None if it failed)
+            error: Load error (None if loaded)
+
+        Returns:
+            Dictionary with class and season metadata
+        """
+        if error is None:
+            if isinstance(data, dict):
+                return data.get("metadata", {})
+        elif not isinstance(error, FileNotFoundError):
+            logger.warning(f"Could not load metadata from {json_path}: {error}")
 
         # Parse from filename: Class_Season_Description.txt
         parts = filename.replace(".txt", "").split("_", 2)
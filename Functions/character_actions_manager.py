@@ -304,8 +304,7 @@ class CharacterActionsManager:
         # Mapper l'index of the proxy vers the modèle source
         source_index = self.tree_manager.proxy_model.mapToSource(index)
         row = source_index.row()
-        name_item = self.tree_manager.model.item(row, 2)
-        char_name = name_item.text()
+        char_name = self.tree_manager.model.index(row, 2).data()
         
         character_data = self.tree_manager.characters_by_id.get(char_name)
         
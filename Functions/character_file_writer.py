@@ -0,0 +1,174 @@
+"""
+Character File Writer
+Atomic, change-detecting and coalesced writes of the character JSON files.
+
+save_character used to rewrite the whole file in place on every call: a crash
+during the write could truncate the character, and callers such as the rank
+auto-apply or the Herald update save the same character several times in a
+row. Writes now go through character_file_write:
+
+  - atomic: the JSON is written to a temporary file in the same folder,
+    fsync'ed, then moved over the character file (os.replace)
+  - change-detecting: a write whose content hash matches the file on disk is
+    skipped (the hash of the last write is trusted while the file keeps the
+    same mtime and size, otherwise the file is hashed again)
+  - coalesced: a second write to the same file within
+    system.character_save_coalesce_ms of the previous one is deferred; later
+    writes in the window replace it, and the last content is written when the
+    window ends
+
+Deferred writes are flushed by character_file_flush_pending, called before the
+character files are read, renamed, moved or deleted, when the main window
+closes and at interpreter exit.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from Functions.config_manager import config
+from Functions.character_repository import character_repository
+
+DEFAULT_COALESCE_MS = 500
+
+_lock = threading.RLock()
+_saved: Dict[str, Tuple[str, int, int]] = {}  # file path -> (content hash, mtime_ns, size) of our last write
+_last_write: Dict[str, float] = {}  # file path -> monotonic time of the last write
+_pending: Dict[str, Tuple[str, str]] = {}  # file path -> (content, content hash) waiting for the window end
+_timers: Dict[str, threading.Timer] = {}
+
+
+def character_file_write(file_path: str, content: str) -> str:
+    """
+    Write a character file (atomic, skipped when unchanged, coalesced)
+
+    Args:
+        file_path: Character JSON file
+        content: Serialized character
+
+    Returns:
+        str: "written", "unchanged" or "deferred" (written at the end of the coalescing window)
+
+    Raises:
+        OSError: The immediate write failed (the previous file is left intact)
+    """
+    content_hash = _hash_content(content)
+    window = max(config.get("system.character_save_coalesce_ms", DEFAULT_COALESCE_MS), 0) / 1000
+
+    with _lock:
+        if content_hash == _get_disk_hash(file_path):
+            # Back to the content on disk: a deferred write is no longer needed
+            _cancel_pending(file_path)
+            return "unchanged"
+
+        elapsed = time.monotonic() - _last_write.get(file_path, float("-inf"))
+        if elapsed >= window and file_path not in _pending:
+            _write_now(file_path, content, content_hash)
+            return "written"
+
+        _pending[file_path] = (content, content_hash)
+        if file_path not in _timers:
+            timer = threading.Timer(max(window - elapsed, 0), _flush_one, args=(file_path,))
+            timer.daemon = True
+            _timers[file_path] = timer
+            timer.start()
+        return "deferred"
+
+
+def character_file_flush_pending(file_path: Optional[str] = None):
+    """
+    Write the deferred character files now
+
+    Args:
+        file_path: Only this file (None = every deferred file)
+    """
+    with _lock:
+        paths = [file_path] if file_path is not None else list(_pending)
+        for path in paths:
+            timer = _timers.pop(path, None)
+            if timer:
+                timer.cancel()
+            _flush_one(path)
+
+
+def character_file_forget(file_path: str):
+    """
+    Drop the state of a character file removed or renamed by the caller
+
+    A deferred write of the file is discarded: flush it first to keep it.
+    """
+    with _lock:
+        _cancel_pending(file_path)
+        _saved.pop(file_path, None)
+        _last_write.pop(file_path, None)
+
+
+def _flush_one(file_path: str):
+    with _lock:
+        _timers.pop(file_path, None)
+        pending = _pending.pop(file_path, None)
+        if pending is None:
+            return
+        try:
+            _write_now(file_path, *pending)
+            logging.debug(f"Deferred character save written: {file_path}")
+        except OSError as e:
+            logging.error(f"Deferred character save failed for {file_path}: {e}")
+
+
+def _cancel_pending(file_path: str):
+    timer = _timers.pop(file_path, None)
+    if timer:
+        timer.cancel()
+    _pending.pop(file_path, None)
+
+
+def _write_now(file_path: str, content: str, content_hash: str):
+    """Atomic write: temporary file in the same folder, fsync, replace"""
+    temp_path = file_path + ".tmp"  # Not a .json file: ignored by the character scans
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    stat = os.stat(file_path)
+    _saved[file_path] = (content_hash, stat.st_mtime_ns, stat.st_size)
+    _last_write[file_path] = time.monotonic()
+    character_repository.invalidate(file_path)
+
+
+def _get_disk_hash(file_path: str) -> Optional[str]:
+    """Content hash of the file on disk (None if missing or unreadable)"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    saved = _saved.get(file_path)
+    if saved and saved[1:] == (stat.st_mtime_ns, stat.st_size):
+        return saved[0]
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content_hash = _hash_content(f.read())
+    except (OSError, ValueError):
+        return None
+    _saved[file_path] = (content_hash, stat.st_mtime_ns, stat.st_size)
+    return content_hash
+
+
+def _hash_content(content: str) -> str:
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+atexit.register(character_file_flush_pending)
@@ -3,6 +3,8 @@ import json
 import uuid
 import logging
 from Functions.config_manager import config
+from Functions.character_repository import character_repository
+from Functions.character_file_writer import character_file_write, character_file_flush_pending, character_file_forget
 from Functions.path_manager import get_base_path
 from Functions.debug_logging_manager import get_logger, log_with_action, LOGGER_CHARACTER
 
@@ -112,6 +114,10 @@ def save_character(character_data, allow_overwrite=False):
     inside a subfolder corresponding to its season and realm.
     e.g., 'Characters/S1/Albion/Merlin.json'
     
+    The write is atomic and skipped when the content did not change; repeated
+    saves of the same character within a short window are coalesced into one
+    write (see character_file_writer).
+    
     Args:
         character_data: The character data to save
         allow_overwrite: If True, allows overwriting existing files (for updates)
@@ -149,9 +155,11 @@ def save_character(character_data, allow_overwrite=False):
         return False, "char_exists_error"
 
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(character_data, f, indent=4)
-        log_with_action(logger, "info", f"Character '{character_name}' saved to {file_path}", action="CREATE")
+        status = character_file_write(file_path, json.dumps(character_data, indent=4))
+        if status == "unchanged":
+            log_with_action(logger, "debug", f"Character '{character_name}' unchanged, not written", action="CREATE")
+        else:
+            log_with_action(logger, "info", f"Character '{character_name}' saved to {file_path} ({status})", action="CREATE")
         return True, "Character saved successfully."
     except Exception as e:
         error_msg = f"Error saving character '{character_name}': {e}"
@@ -182,28 +190,12 @@ def get_all_characters():
     """
     Loads all characters from .json files by walking through realm subdirectories.
     The character 'id' is derived from the filename.
+    Files are parsed once and cached: only the files changed since the last call are re-read.
     """
-    base_char_dir = get_character_dir()
-    if not os.path.exists(base_char_dir):
-        return []
-
-    characters = []
-    # os.walk will traverse the root and all subdirectories
-    for root, _, files in os.walk(base_char_dir):
-        for filename in files:
-            if filename.endswith('.json'):
-                file_path = os.path.join(root, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        char_data = json.load(f)
-                        # Ensure the 'id' in the app matches the filename (without extension)
-                        char_data['id'] = os.path.splitext(filename)[0]
-                        characters.append(char_data)
-                except (json.JSONDecodeError, KeyError) as e:
-                    logging.warning(f"Could not load or parse {file_path}: {e}")
-    
+    character_file_flush_pending()  # Deferred saves first: the files are the source of truth
+    characters = character_repository.get_all(get_character_dir())
     log_with_action(logger, "debug", f"Loaded {len(characters)} characters from disk", action="LOAD")
-    return sorted(characters, key=lambda c: c.get('name', '').lower())
+    return characters
 
 def rename_character(old_name, new_name):
     """
@@ -217,6 +209,7 @@ def rename_character(old_name, new_name):
         log_with_action(logger, "debug", f"Rename attempt: old and new names are the same ('{old_name}')", action="RENAME")
         return True, "Names are the same, no action taken."
 
+    character_file_flush_pending()
     base_char_dir = get_character_dir()
     old_file_path = None
     character_realm = None
@@ -253,11 +246,11 @@ def rename_character(old_name, new_name):
         char_data['id'] = new_name
 
         # Write the updated data to the new file
-        with open(new_file_path, 'w', encoding='utf-8') as f:
-            json.dump(char_data, f, indent=4)
+        character_file_write(new_file_path, json.dumps(char_data, indent=4))
 
         # Remove the old file
         os.remove(old_file_path)
+        character_file_forget(old_file_path)
         log_with_action(logger, "info", f"Character renamed from '{old_name}' to '{new_name}'", action="RENAME")
         return True, "Character renamed successfully."
     except (IOError, json.JSONDecodeError, OSError) as e:
@@ -276,6 +269,7 @@ def delete_character(character_name):
     if not character_name:
         return False, "Character name not provided."
 
+    character_file_flush_pending()
     base_char_dir = get_character_dir()
     file_to_delete = None
 
@@ -288,6 +282,7 @@ def delete_character(character_name):
     if file_to_delete:
         try:
             os.remove(file_to_delete)
+            character_file_forget(file_to_delete)
             log_with_action(logger, "info", f"Character '{character_name}' deleted from {file_to_delete}", action="DELETE")
             return True, "Character deleted successfully."
         except OSError as e:
@@ -329,6 +324,7 @@ def move_character_to_realm(character_data, old_realm, new_realm):
     old_file_path = os.path.join(base_char_dir, character_season, old_realm, f"{character_name}.json")
     new_file_path = os.path.join(base_char_dir, character_season, new_realm, f"{character_name}.json")
     
+    character_file_flush_pending()
     try:
         # Check if old file exists
         if not os.path.exists(old_file_path):
@@ -346,11 +342,11 @@ def move_character_to_realm(character_data, old_realm, new_realm):
         character_data['realm'] = new_realm
         
         # Save to new location
-        with open(new_file_path, 'w', encoding='utf-8') as f:
-            json.dump(character_data, f, indent=4)
+        character_file_write(new_file_path, json.dumps(character_data, indent=4))
         
         # Remove old file
         os.remove(old_file_path)
+        character_file_forget(old_file_path)
         
         log_with_action(logger, "info", f"Character '{character_name}' moved from {old_realm} to {new_realm}", action="UPDATE")
         return True, f"Character moved to {new_realm} successfully."
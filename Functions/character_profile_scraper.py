@@ -13,9 +13,9 @@ Version: 0.107
 """
 
 import logging
-import time
 import traceback
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -25,6 +25,12 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from Functions.debug_logging_manager import get_logger, log_with_action
 from Functions.config_manager import config
+from Functions.eden_request_scheduler import scheduler_navigate
+from Functions.eden_wait_policy import (
+    HERALD_NOT_AVAILABLE, wait_until_ready, wait_condition_all, wait_condition_any,
+    wait_condition_document_ready, wait_condition_element_present, wait_condition_text_present,
+    wait_condition_count_stable
+)
 
 # Create dedicated logger for character profile scraping
 profile_logger = get_logger("CHARACTER_PROFILE")
@@ -49,6 +55,94 @@ class CharacterProfileScraper:
         
         log_with_action(profile_logger, "info", "CharacterProfileScraper initialized", action="INIT")
     
+    def _wait_for_profile_page(self):
+        """
+        Wait until a character profile tab is rendered: player_content present
+        with a stable number of cells, or the Herald "not available" message.
+        
+        Returns:
+            bool: True if the page is ready, False on timeout
+        """
+        return wait_until_ready(
+            self.driver, "herald_profile",
+            wait_condition_all(
+                wait_condition_document_ready(),
+                wait_condition_any(
+                    wait_condition_text_present(HERALD_NOT_AVAILABLE),
+                    wait_condition_all(
+                        wait_condition_element_present(By.ID, "player_content"),
+                        wait_condition_count_stable(By.CSS_SELECTOR, "#player_content td")
+                    )
+                )
+            ),
+            description=self.driver.current_url
+        )
+    
+    @staticmethod
+    def _get_profile_tab_url(character_url, tab):
+        """
+        Build the URL of a profile tab
+        
+        Args:
+            character_url: Character profile URL (any tab)
+            tab: Tab parameter (pvp, pve, wealth, achievements) or None for the Characters tab
+            
+        Returns:
+            str: Tab URL
+        """
+        base_url = character_url.split('&t=')[0].split('?t=')[0]
+        if not tab:
+            return base_url
+        return f"{base_url}&t={tab}" if '?' in base_url else f"{base_url}?t={tab}"
+    
+    def _load_profile_tab(self, tab_url, action):
+        """
+        Navigate the browser to a profile tab and return its HTML
+        
+        Args:
+            tab_url: Tab URL
+            action: Log action of the calling scrape
+            
+        Returns:
+            str: Page source once the tab is rendered
+        """
+        log_with_action(profile_logger, "info", f"Navigating to: {tab_url}", action=action)
+        scheduler_navigate(self.driver, tab_url)
+        ready = self._wait_for_profile_page()
+        page_source = self.driver.page_source
+        
+        # Rendered tab kept in the page cache (Herald pages are recorded, not served online)
+        if ready and self._eden_scraper:
+            from Functions.eden_http_client import http_check_herald_profile
+            tab = parse_qs(urlsplit(tab_url).query).get('t', ['characters'])[0]
+            self._eden_scraper.store_page(tab_url, f"herald_profile_{tab}", page_source,
+                                          http_check_herald_profile("player_content"))
+        return page_source
+    
+    def _fetch_profile_tab(self, tab_url, tab, marker):
+        """
+        Fetch a profile tab over HTTP with the session cookies (no browser navigation)
+        
+        Args:
+            tab_url: Tab URL
+            tab: Tab parameter (page type suffix for the HTTP statistics)
+            marker: Text that must be present for the tab content to be usable
+            
+        Returns:
+            str: Page source, or None when the tab must be loaded in the browser
+        """
+        if not self._eden_scraper:
+            return None
+        
+        from Functions.eden_http_client import http_check_herald_profile
+        try:
+            return self._eden_scraper.fetch_html(
+                tab_url, f"herald_profile_{tab}", http_check_herald_profile(marker)
+            )
+        except Exception as e:
+            log_with_action(profile_logger, "debug", f"HTTP fetch failed for {tab_url}: {e}", action="SCRAPE_PROFILE")
+            return None
+    
     def connect(self, headless=False):
         """
         Establish connection to Eden Herald using centralized connection function.
@@ -63,14 +157,14 @@ class CharacterProfileScraper:
                    If failure: (False, "error description")
         """
         try:
-            from Functions.eden_scraper import _connect_to_eden_herald
+            from Functions.eden_herald_session import herald_session_acquire
             
             log_with_action(profile_logger, "info", 
-                          "Connecting to Eden Herald using centralized function", 
+                          "Connecting to Eden Herald using shared session", 
                           action="CONNECT")
             
-            # Use centralized connection function
-            scraper, error_message = _connect_to_eden_herald(
+            # Shared Herald session (started by the centralized connection function if needed)
+            scraper, error_message = herald_session_acquire(
                 cookie_manager=self.cookie_manager,
                 headless=headless
             )
@@ -95,13 +189,14 @@ class CharacterProfileScraper:
             log_with_action(profile_logger, "error", error_msg, action="CONNECT")
             return False, error_msg
     
-    def scrape_wealth_money(self, character_url):
+    def scrape_wealth_money(self, character_url, page_source=None):
         """
         Scrape the Money value from the Wealth tab of a character profile
         Uses the same method as search_herald_character in eden_scraper.py
         
         Args:
             character_url: Full URL to character profile (e.g., https://eden-daoc.net/herald?n=player&k=CharName)
+            page_source: HTML of the Wealth tab already loaded (skips navigation)
             
         Returns:
             dict: {
@@ -118,28 +213,16 @@ class CharacterProfileScraper:
             }
         
         try:
-            # Ensure URL includes wealth tab parameter
-            if 't=wealth' not in character_url:
-                if '?' in character_url:
-                    character_url += '&t=wealth'
-                else:
-                    character_url += '?t=wealth'
-            
-            log_with_action(profile_logger, "info", 
-                          f"Navigating to: {character_url}", 
-                          action="SCRAPE_WEALTH")
-            
-            # Navigate to character wealth page (SAME AS eden_scraper.py does for search)
-            self.driver.get(character_url)
-            
-            # Wait for page to fully load (SAME AS search: 5 seconds)
-            log_with_action(profile_logger, "info", 
-                          "Waiting for page to fully load (5 seconds)...", 
-                          action="SCRAPE_WEALTH")
-            time.sleep(5)
+            if page_source is None:
+                # Ensure URL includes wealth tab parameter
+                if 't=wealth' not in character_url:
+                    if '?' in character_url:
+                        character_url += '&t=wealth'
+                    else:
+                        character_url += '?t=wealth'
+                
+                page_source = self._load_profile_tab(character_url, "SCRAPE_WEALTH")
             
-            # Extract HTML content (SAME AS search)
-            page_source = self.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             log_with_action(profile_logger, "info", 
@@ -219,12 +302,18 @@ class CharacterProfileScraper:
                 'error': error_msg
             }
     
-    def close(self):
-        """Close the WebDriver cleanly"""
+    def close(self, discard=False):
+        """
+        Release the Herald session (kept warm for the next operation)
+        
+        Args:
+            discard: If True, close the browser instead (interrupted operation)
+        """
         if self._eden_scraper:
             try:
-                self._eden_scraper.close()
-                log_with_action(profile_logger, "info", "EdenScraper closed", action="CLEANUP")
+                from Functions.eden_herald_session import herald_session_release
+                herald_session_release(self._eden_scraper, discard=discard)
+                log_with_action(profile_logger, "info", "Herald session released", action="CLEANUP")
             except Exception as e:
                 log_with_action(profile_logger, "warning", f"Error closing scraper: {e}", action="CLEANUP")
             finally:
@@ -240,12 +329,13 @@ class CharacterProfileScraper:
             finally:
                 self.driver = None
     
-    def scrape_rvr_captures(self, character_url):
+    def scrape_rvr_captures(self, character_url, page_source=None):
         """
         Scrape RvR capture statistics from the Characters tab (default view)
         
         Args:
             character_url: Full URL to character profile (e.g., https://eden-daoc.net/herald?n=player&k=CharName)
+            page_source: HTML of the Characters tab already loaded (skips navigation)
             
         Returns:
             dict: {
@@ -266,24 +356,11 @@ class CharacterProfileScraper:
             }
         
         try:
-            # Remove any tab parameter to get default Characters tab
-            base_url = character_url.split('&t=')[0].split('?t=')[0]
-            
-            log_with_action(profile_logger, "info", 
-                          f"Navigating to: {base_url}", 
-                          action="SCRAPE_RVR")
+            if page_source is None:
+                # Remove any tab parameter to get default Characters tab
+                base_url = character_url.split('&t=')[0].split('?t=')[0]
+                page_source = self._load_profile_tab(base_url, "SCRAPE_RVR")
             
-            # Navigate to character page (default Characters tab)
-            self.driver.get(base_url)
-            
-            # Wait for page to fully load
-            log_with_action(profile_logger, "info", 
-                          "Waiting for page to fully load (5 seconds)...", 
-                          action="SCRAPE_RVR")
-            time.sleep(5)
-            
-            # Extract HTML content
-            page_source = self.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             log_with_action(profile_logger, "info", 
@@ -405,12 +482,13 @@ class CharacterProfileScraper:
                 'error': error_msg
             }
     
-    def scrape_pvp_stats(self, character_url):
+    def scrape_pvp_stats(self, character_url, page_source=None):
         """
         Scrape PvP statistics from the PvP tab
         
         Args:
             character_url: Full URL to character profile (e.g., https://eden-daoc.net/herald?n=player&k=CharName)
+            page_source: HTML of the PvP tab already loaded (skips navigation)
             
         Returns:
             dict: {
@@ -444,25 +522,11 @@ class CharacterProfileScraper:
             }
         
         try:
-            # Ensure URL includes PvP tab parameter
-            base_url = character_url.split('&t=')[0].split('?t=')[0]
-            pvp_url = f"{base_url}&t=pvp" if '?' in base_url else f"{base_url}?t=pvp"
-            
-            log_with_action(profile_logger, "info", 
-                          f"Navigating to PvP tab: {pvp_url}", 
-                          action="SCRAPE_PVP")
-            
-            # Navigate to PvP tab
-            self.driver.get(pvp_url)
-            
-            # Wait for page to fully load
-            log_with_action(profile_logger, "info", 
-                          "Waiting for page to fully load (5 seconds)...", 
-                          action="SCRAPE_PVP")
-            time.sleep(5)
+            if page_source is None:
+                # Ensure URL includes PvP tab parameter
+                pvp_url = self._get_profile_tab_url(character_url, "pvp")
+                page_source = self._load_profile_tab(pvp_url, "SCRAPE_PVP")
             
-            # Extract HTML content
-            page_source = self.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             log_with_action(profile_logger, "info", 
@@ -599,12 +663,13 @@ class CharacterProfileScraper:
                 'error': error_msg
             }
 
-    def scrape_pve_stats(self, character_url):
+    def scrape_pve_stats(self, character_url, page_source=None):
         """
         Scrape PvE statistics from character profile
         
         Args:
             character_url: Character profile URL (e.g., https://eden-daoc.net/herald?n=player&k=XXX)
+            page_source: HTML of the PvE tab already loaded (skips navigation)
             
         Returns:
             dict: PvE statistics
@@ -616,25 +681,11 @@ class CharacterProfileScraper:
             }
         
         try:
-            # Ensure URL includes PvE tab parameter
-            base_url = character_url.split('&t=')[0].split('?t=')[0]
-            pve_url = f"{base_url}&t=pve" if '?' in base_url else f"{base_url}?t=pve"
-            
-            log_with_action(profile_logger, "info", 
-                          f"Navigating to PvE tab: {pve_url}", 
-                          action="SCRAPE_PVE")
-            
-            # Navigate to PvE tab
-            self.driver.get(pve_url)
-            
-            # Wait for page to fully load
-            log_with_action(profile_logger, "info", 
-                          "Waiting for page to fully load (5 seconds)...", 
-                          action="SCRAPE_PVE")
-            time.sleep(5)
+            if page_source is None:
+                # Ensure URL includes PvE tab parameter
+                pve_url = self._get_profile_tab_url(character_url, "pve")
+                page_source = self._load_profile_tab(pve_url, "SCRAPE_PVE")
             
-            # Extract HTML content
-            page_source = self.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             log_with_action(profile_logger, "info", 
@@ -829,12 +880,13 @@ class CharacterProfileScraper:
                 'error': error_msg
             }
     
-    def scrape_achievements(self, character_url):
+    def scrape_achievements(self, character_url, page_source=None):
         """
         Scrape achievements from character Herald page.
         
         Args:
             character_url (str): URL of the character Herald page
+            page_source (str): HTML of the Achievements tab already loaded (skips navigation)
             
         Returns:
             dict: {
@@ -848,24 +900,16 @@ class CharacterProfileScraper:
                           f"Starting achievements scraping for URL: {character_url}", 
                           action="SCRAPE_ACHIEVEMENTS")
             
-            # Navigate to Achievements tab (accessed via &t=achievements parameter)
-            if '&t=' in character_url:
-                achievements_url = character_url
-            else:
-                achievements_url = f"{character_url}&t=achievements"
-            
-            log_with_action(profile_logger, "info", 
-                          f"Loading achievements URL: {achievements_url}", 
-                          action="SCRAPE_ACHIEVEMENTS")
-            
-            self.driver.get(achievements_url)
-            
-            # Wait for page to load
-            import time
-            time.sleep(2)
+            if page_source is None:
+                # Navigate to Achievements tab (accessed via &t=achievements parameter)
+                if '&t=' in character_url:
+                    achievements_url = character_url
+                else:
+                    achievements_url = f"{character_url}&t=achievements"
+                
+                page_source = self._load_profile_tab(achievements_url, "SCRAPE_ACHIEVEMENTS")
             
             # Check if connected
-            page_source = self.driver.page_source
             
             if 'The requested page "herald" is not available.' in page_source:
                 log_with_action(profile_logger, "error", 
@@ -955,6 +999,72 @@ class CharacterProfileScraper:
                 'error': error_msg
             }
     
+    def iter_profile_sections(self, character_url):
+        """
+        Scrape every section of a character profile with a single browser page load.
+        
+        The Characters tab (RvR captures) is loaded once in the browser. The other
+        tabs are fetched over HTTP with the same session cookies and parsed from
+        that snapshot; a tab whose content is not usable that way (fast path
+        disabled, bot check, JS-only content) is loaded in the browser as before.
+        
+        Args:
+            character_url: Character profile URL (any tab)
+            
+        Yields:
+            tuple: (section, result) in _profile_sections() order, result being the
+                   dict returned by the matching scrape_* method
+        """
+        if not self.driver:
+            for section, _, _, method in self._profile_sections():
+                yield section, method(character_url)
+            return
+        
+        base_url = self._get_profile_tab_url(character_url, None)
+        try:
+            base_source = self._load_profile_tab(base_url, "SCRAPE_PROFILE")
+        except Exception as e:
+            log_with_action(profile_logger, "error", f"Error loading profile page: {e}", action="SCRAPE_PROFILE")
+            base_source = None
+        
+        # Not connected: every section reports it from the same page, no further load
+        not_connected = base_source is not None and HERALD_NOT_AVAILABLE in base_source
+        
+        for section, tab, marker, method in self._profile_sections():
+            tab_url = self._get_profile_tab_url(character_url, tab)
+            if tab is None or not_connected:
+                page_source = base_source
+            else:
+                page_source = self._fetch_profile_tab(tab_url, tab, marker)
+                if page_source is not None:
+                    log_with_action(profile_logger, "info", f"Tab {tab} fetched without browser navigation",
+                                    action="SCRAPE_PROFILE")
+            yield section, method(tab_url, page_source=page_source)
+    
+    def scrape_profile(self, character_url):
+        """
+        Scrape every section of a character profile (see iter_profile_sections)
+        
+        Args:
+            character_url: Character profile URL (any tab)
+            
+        Returns:
+            dict: {'rvr', 'pvp', 'pve', 'wealth', 'achievements'} - same per section
+                  dicts as scrape_rvr_captures, scrape_pvp_stats, scrape_pve_stats,
+                  scrape_wealth_money and scrape_achievements
+        """
+        return dict(self.iter_profile_sections(character_url))
+    
+    def _profile_sections(self):
+        """(section, tab parameter, content marker, scrape method) for each profile section"""
+        return (
+            ('rvr', None, None, self.scrape_rvr_captures),
+            ('pvp', 'pvp', 'Solo Kills', self.scrape_pvp_stats),
+            ('pve', 'pve', 'pvestats', self.scrape_pve_stats),
+            ('wealth', 'wealth', 'Money', self.scrape_wealth_money),
+            ('achievements', 'achievements', 'titlerow', self.scrape_achievements),
+        )
+    
     def __enter__(self):
         """Context manager entry"""
         return self
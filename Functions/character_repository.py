@@ -0,0 +1,189 @@
+"""
+Character Repository
+In-memory cache of the character files (Characters/<Season>/<Realm>/<Name>.json).
+
+get_all_characters used to walk the whole character folder and json.load every
+file on each call, and the character list calls it after every create, rename,
+delete or Herald update. The repository keeps the parsed characters in memory
+with the (mtime, size) signature of their file: a refresh still walks the
+folder, but only re-reads the files whose signature changed (in one
+json_bulk_load pass).
+
+Each refresh reports what changed, keyed by character id (the file name):
+
+    {"added": [ids], "updated": [ids], "removed": [ids]}
+
+and notifies the listeners registered with add_listener when something did.
+
+Writers of character files (character_manager) call invalidate() on the files
+they write, so a rewrite is seen even when the filesystem mtime is too coarse
+to tell it apart.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Functions.debug_logging_manager import get_logger, log_with_action, LOGGER_CHARACTER
+from Functions.json_bulk_loader import json_bulk_load
+
+logger = get_logger(LOGGER_CHARACTER)
+
+CHANGE_KINDS = ("added", "updated", "removed")
+
+
+class CharacterRepository:
+    """Parsed character files, re-read only when they change on disk"""
+
+    def __init__(self):
+        # file path -> ((mtime_ns, size), character data or None if unreadable)
+        self._entries: Dict[str, Tuple[Optional[Tuple[int, int]], Optional[Dict[str, Any]]]] = {}
+        self._base_dir: Optional[str] = None
+        self._listeners: List[Callable[[Dict[str, List[str]]], None]] = []
+        self._lock = threading.RLock()
+
+    def refresh(self, base_dir: str) -> Dict[str, List[str]]:
+        """
+        Synchronize the cache with the character folder
+
+        Args:
+            base_dir: Character folder (get_character_dir())
+
+        Returns:
+            dict: {"added": [ids], "updated": [ids], "removed": [ids]}
+        """
+        changes = {kind: [] for kind in CHANGE_KINDS}
+        with self._lock:
+            if base_dir != self._base_dir:
+                # Character folder changed in the settings: start over
+                changes["removed"].extend(_get_character_id(path) for path, (_, char_data) in self._entries.items()
+                                          if char_data is not None)
+                self._entries = {}
+                self._base_dir = base_dir
+
+            seen = set()
+            changed = []  # (file path, signature) of the files to read again
+            if os.path.exists(base_dir):
+                for root, _, files in os.walk(base_dir):
+                    for filename in files:
+                        if not filename.endswith('.json'):
+                            continue
+                        file_path = os.path.join(root, filename)
+                        try:
+                            stat = os.stat(file_path)
+                        except OSError:
+                            continue  # Removed while walking
+                        seen.add(file_path)
+
+                        signature = (stat.st_mtime_ns, stat.st_size)
+                        previous = self._entries.get(file_path)
+                        if previous is None or previous[0] != signature:
+                            changed.append((file_path, signature))
+
+            loaded = json_bulk_load([file_path for file_path, _ in changed])
+            for (file_path, signature), (_, data, error) in zip(changed, loaded):
+                char_data = _to_character(file_path, data, error)
+                previous = self._entries.get(file_path)
+                self._entries[file_path] = (signature, char_data)
+                was_loaded = previous is not None and previous[1] is not None
+                if char_data is None:
+                    if was_loaded:
+                        changes["removed"].append(_get_character_id(file_path))
+                elif was_loaded:
+                    changes["updated"].append(char_data['id'])
+                else:
+                    changes["added"].append(char_data['id'])
+            reloaded = len(changed)
+
+            for file_path in [path for path in self._entries if path not in seen]:
+                _, char_data = self._entries.pop(file_path)
+                if char_data is not None:
+                    changes["removed"].append(_get_character_id(file_path))
+
+            listeners = list(self._listeners)
+
+        if any(changes.values()):
+            log_with_action(logger, "debug",
+                            f"Character files changed: {len(changes['added'])} added, {len(changes['updated'])} updated, "
+                            f"{len(changes['removed'])} removed ({reloaded} file(s) read)", action="LOAD")
+            for listener in listeners:
+                try:
+                    listener(changes)
+                except Exception as e:
+                    logging.error(f"Character repository listener error: {e}", exc_info=True)
+        return changes
+
+    def get_all(self, base_dir: str) -> List[Dict[str, Any]]:
+        """
+        Refresh, then get every character sorted by name
+
+        Args:
+            base_dir: Character folder (get_character_dir())
+
+        Returns:
+            list: Shallow copies of the cached character data. Top-level fields may be
+                  modified freely; nested values are shared with the cache, so changes
+                  to them must go through save_character (which invalidates the file).
+        """
+        self.refresh(base_dir)
+        with self._lock:
+            # A deep copy costs more than parsing the file again
+            characters = [dict(char_data) for _, char_data in self._entries.values() if char_data is not None]
+        return sorted(characters, key=lambda c: c.get('name', '').lower())
+
+    def invalidate(self, file_path: Optional[str] = None):
+        """
+        Force the next refresh to re-read a file (or every file)
+
+        Args:
+            file_path: Character file just written (None = all files)
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries = {path: (None, char_data) for path, (_, char_data) in self._entries.items()}
+            elif file_path in self._entries:
+                self._entries[file_path] = (None, self._entries[file_path][1])
+
+    def add_listener(self, callback: Callable[[Dict[str, List[str]]], None]):
+        """
+        Call callback(changes) after each refresh that found changes
+
+        Args:
+            callback: Receives {"added": [ids], "updated": [ids], "removed": [ids]}
+        """
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, List[str]]], None]):
+        """Unregister a callback given to add_listener"""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+
+def _get_character_id(file_path: str) -> str:
+    """Character id: the file name without extension"""
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+def _to_character(file_path: str, data: Any, error: Optional[Exception]) -> Optional[Dict[str, Any]]:
+    """
+    Character data of a loaded file (json_bulk_load result)
+
+    Returns:
+        dict: Character data with 'id' matching the file name, or None if unreadable
+    """
+    if error is None and not isinstance(data, dict):
+        error = TypeError(f"expected a JSON object, got {type(data).__name__}")
+    if error is not None:
+        logging.warning(f"Could not load or parse {file_path}: {error}")
+        return None
+    # Ensure the 'id' in the app matches the filename (without extension)
+    data['id'] = _get_character_id(file_path)
+    return data
+
+
+# Shared repository of the application
+character_repository = CharacterRepository()
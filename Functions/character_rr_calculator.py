@@ -9,6 +9,7 @@ Functions:
 - character_rr_get_valid_levels() - Get valid level range for a given rank
 - character_rr_calculate_points_info() - Get progression info to next rank
 - character_rr_calculate_from_points() - Calculate rank/level from realm points
+- character_rr_calculate_from_points_batch() - Same for a list of realm points values
 
 Realm Rank System:
 - 14 ranks (1-14) with multiple levels per rank
@@ -167,42 +168,71 @@ def character_rr_calculate_from_points(data_manager, realm, realm_points):
             'realm_points': 1500000
         }
     """
+    return character_rr_calculate_from_points_batch(data_manager, realm, [realm_points])[0]
+
+
+def character_rr_calculate_from_points_batch(data_manager, realm, realm_points_list):
+    """
+    Calculate realm rank and level for a list of realm points values.
+
+    Uses DataManager.get_realm_ranks_batch: one binary search per value over
+    the realm's precomputed RP thresholds.
+
+    Args:
+        data_manager: DataManager instance for accessing rank data
+        realm (str): Realm name (e.g., 'Albion', 'Midgard', 'Hibernia')
+        realm_points_list (list): Realm points values (int or str)
+
+    Returns:
+        list: One dict per value, same format as character_rr_calculate_from_points
+              (default Rank 1 for values that cannot be resolved)
+
+    Example:
+        >>> infos = character_rr_calculate_from_points_batch(
+        ...     data_manager, 'Albion', [0, '1 500 000']
+        ... )
+        >>> [info['level_str'] for info in infos]
+        ['1L1', '6L6']
+    """
     try:
         # Normalize realm_points (handle string with commas/spaces)
-        if isinstance(realm_points, str):
-            realm_points = int(realm_points.replace(' ', '').replace('\xa0', '').replace(',', ''))
-
-        if not isinstance(realm_points, int):
-            realm_points = 0
-
-        # Get rank info from data_manager
-        rank_info = data_manager.get_realm_rank_info(realm, realm_points)
-
-        if rank_info:
-            return {
-                'rank': rank_info.get('rank', 1),
-                'level': rank_info.get('level', 1),
-                'title': rank_info.get('title', 'Guardian'),
-                'level_str': rank_info.get('level_str', '1L1'),
-                'realm_points': realm_points
-            }
-        else:
-            # Fallback to Rank 1 Guardian if lookup fails
-            logger.warning(f"Could not determine rank for {realm} {realm_points} RP, defaulting to Rank 1")
-            return {
-                'rank': 1,
-                'level': 1,
-                'title': 'Guardian',
-                'level_str': '1L1',
-                'realm_points': realm_points
-            }
+        normalized = []
+        for realm_points in realm_points_list:
+            try:
+                if isinstance(realm_points, str):
+                    realm_points = int(realm_points.replace(' ', '').replace('\xa0', '').replace(',', ''))
+            except ValueError:
+                realm_points = 0
+            normalized.append(realm_points if isinstance(realm_points, int) else 0)
+
+        results = []
+        for realm_points, rank_info in zip(normalized, data_manager.get_realm_ranks_batch(realm, normalized)):
+            if rank_info:
+                results.append({
+                    'rank': rank_info['rank'],
+                    'level': rank_info['level'],
+                    'title': rank_info['title'],
+                    'level_str': rank_info['level'],
+                    'realm_points': realm_points
+                })
+            else:
+                # Fallback to Rank 1 Guardian if lookup fails
+                logger.warning(f"Could not determine rank for {realm} {realm_points} RP, defaulting to Rank 1")
+                results.append({
+                    'rank': 1,
+                    'level': 1,
+                    'title': 'Guardian',
+                    'level_str': '1L1',
+                    'realm_points': realm_points
+                })
+        return results
 
     except Exception as e:
-        logger.error(f"Failed to calculate rank from points ({realm} {realm_points}): {e}")
-        return {
+        logger.error(f"Failed to calculate rank from points ({realm}): {e}")
+        return [{
             'rank': 1,
             'level': 1,
             'title': 'Guardian',
             'level_str': '1L1',
             'realm_points': 0
-        }
+        } for _ in realm_points_list]
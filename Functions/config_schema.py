@@ -56,6 +56,23 @@ DEFAULT_CONFIG = {
         "disable_disclaimer": False,
         "preferred_browser": "Chrome",
         "allow_browser_download": False,
+        "wait_timeouts": {},
+        "http_fast_path": True,
+        "herald_session_idle_seconds": 300,
+        "character_save_coalesce_ms": 500,
+        "page_cache": {
+            "enabled": True,
+            "offline": False,
+            "max_mb": 200,
+            "ttl_hours": {}
+        },
+        "request_scheduler": {
+            "rate_per_second": 2.0,
+            "burst": 4,
+            "max_concurrent": 4,
+            "backoff_max_seconds": 60,
+            "hosts": {}
+        },
         "debug": {
             "save_herald_html": False,
             "save_test_connection_html": False,
@@ -78,7 +95,10 @@ DEFAULT_CONFIG = {
         "personal_db_created": False,
         "personal_db_path": None,
         "auto_add_scraped_items": True,
-        "last_internal_db_version": "1.0"
+        "last_internal_db_version": "1.0",
+        "storage_backend": "json",
+        "negative_cache_ttl_hours": 24,
+        "import_sessions": 1
     }
 }
 
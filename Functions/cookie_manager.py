@@ -14,6 +14,8 @@ from pathlib import Path
 
 # Import new logging system
 from .debug_logging_manager import get_logger, LOGGER_EDEN, LOGGER_EDEN_PERF, setup_eden_performance_logger
+from .eden_request_scheduler import scheduler_navigate, scheduler_refresh
+from .eden_wait_policy import wait_until_ready, wait_condition_document_ready
 
 # Dedicated logger for Eden
 eden_logger = get_logger(LOGGER_EDEN)
@@ -753,14 +755,13 @@ class CookieManager:
             _log_perf(f"⏱️  STEP 6: Initialisation {browser_name} (headless) - {elapsed:.0f}ms")
             
             # TEST ALIGNED EXACTLY WITH load_cookies()
-            import time
             
             # Step 1: Homepage
             start_step = time_module.time()
-            driver.get("https://eden-daoc.net/")
-            time.sleep(0.5)  # Attente réduite homepage
+            scheduler_navigate(driver, "https://eden-daoc.net/")
+            wait_until_ready(driver, "eden_page", wait_condition_document_ready(), description="homepage")
             elapsed = (time_module.time() - start_step) * 1000
-            _log_perf(f"⏱️  STEP 7: Navigation homepage + wait 0.5s - {elapsed:.0f}ms")
+            _log_perf(f"⏱️  STEP 7: Navigation homepage + wait ready - {elapsed:.0f}ms")
             
             # Step 2: Add cookies
             start_step = time_module.time()
@@ -770,24 +771,23 @@ class CookieManager:
                 except:
                     pass
             
-            # OPTIMISATION 2: Attente réduite après ajout cookies (0.3s au lieu de 1s)
-            time.sleep(0.3)
+            # add_cookie est synchrone: aucune attente nécessaire
             elapsed = (time_module.time() - start_step) * 1000
-            _log_perf(f"⏱️  STEP 8: Ajout {len(cookies_list)} cookies + wait 0.3s - {elapsed:.0f}ms")
+            _log_perf(f"⏱️  STEP 8: Ajout {len(cookies_list)} cookies - {elapsed:.0f}ms")
             
             # Step 3: Refresh
             start_step = time_module.time()
-            driver.refresh()
-            time.sleep(1)  # Attente réduite refresh
+            scheduler_refresh(driver)
+            wait_until_ready(driver, "eden_page", wait_condition_document_ready(), description="refresh")
             elapsed = (time_module.time() - start_step) * 1000
-            _log_perf(f"⏱️  STEP 9: Refresh page + wait 1s - {elapsed:.0f}ms")
+            _log_perf(f"⏱️  STEP 9: Refresh page + wait ready - {elapsed:.0f}ms")
             
             # Step 4: Go to Herald
             start_step = time_module.time()
-            driver.get("https://eden-daoc.net/herald")
-            time.sleep(1.5)  # Attente réduite Herald (au lieu de 3s)
+            scheduler_navigate(driver, "https://eden-daoc.net/herald")
+            wait_until_ready(driver, "eden_page", wait_condition_document_ready(), description="herald")
             elapsed = (time_module.time() - start_step) * 1000
-            _log_perf(f"⏱️  STEP 10: Navigation Herald + wait 1.5s - {elapsed:.0f}ms")
+            _log_perf(f"⏱️  STEP 10: Navigation Herald + wait ready - {elapsed:.0f}ms")
             
             # Retrieve and parse HTML
             start_step = time_module.time()
@@ -892,7 +892,6 @@ class CookieManager:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
             from webdriver_manager.chrome import ChromeDriverManager
-            import time
             
             # Charger les cookies
             cookies_list = self.get_cookies_for_scraper()
@@ -925,8 +924,8 @@ class CookieManager:
             try:
                 # Step 1: Go to homepage first
                 eden_logger.info(f"Ouverture de {url} avec cookies", extra={"action": "NAVIGATE"})
-                driver.get("https://eden-daoc.net/")
-                time.sleep(2)
+                scheduler_navigate(driver, "https://eden-daoc.net/")
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 # Step 2: Add cookies
                 eden_logger.info(f"Chargement de {len(cookies_list)} cookies", extra={"action": "NAVIGATE"})
@@ -936,20 +935,18 @@ class CookieManager:
                     except Exception as cookie_err:
                         eden_logger.debug(f"Impossible d'ajouter un cookie: {cookie_err}")
                 
-                time.sleep(1)
-                
                 # Step 3: Refresh pour activer les cookies
                 eden_logger.info("Refresh pour activer les cookies", extra={"action": "NAVIGATE"})
-                driver.refresh()
-                time.sleep(2)
+                scheduler_refresh(driver)
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 # Step 4: Navigate to requested URL
                 if not url.startswith(('http://', 'https://')):
                     url = 'https://' + url
                 
                 eden_logger.info(f"Navigation vers {url}", extra={"action": "NAVIGATE"})
-                driver.get(url)
-                time.sleep(2)
+                scheduler_navigate(driver, url)
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 eden_logger.info(f"✅ Page ouverte avec succès via {browser_name}", extra={"action": "NAVIGATE"})
                 
@@ -1012,7 +1009,6 @@ class CookieManager:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
             from webdriver_manager.chrome import ChromeDriverManager
-            import time
             
             # Charger les cookies
             cookies_list = self.get_cookies_for_scraper()
@@ -1047,8 +1043,8 @@ class CookieManager:
             try:
                 # Step 1: Go to homepage first
                 eden_logger.info(f"Ouverture de {url} avec cookies (persistent)", extra={"action": "NAVIGATE"})
-                driver.get("https://eden-daoc.net/")
-                time.sleep(3)  # Increased from 2 to 3
+                scheduler_navigate(driver, "https://eden-daoc.net/")
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 # Step 2: Add cookies
                 eden_logger.info(f"Chargement de {len(cookies_list)} cookies", extra={"action": "NAVIGATE"})
@@ -1058,20 +1054,18 @@ class CookieManager:
                     except Exception as cookie_err:
                         eden_logger.debug(f"Impossible d'ajouter un cookie: {cookie_err}")
                 
-                time.sleep(2)  # Increased from 1 to 2
-                
                 # Step 3: Refresh pour activer les cookies
                 eden_logger.info("Refresh pour activer les cookies", extra={"action": "NAVIGATE"})
-                driver.refresh()
-                time.sleep(4)  # Augmenté of 2 à 4
+                scheduler_refresh(driver)
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 # Step 4: Navigate to requested URL
                 if not url.startswith(('http://', 'https://')):
                     url = 'https://' + url
                 
                 eden_logger.info(f"Navigation vers {url}", extra={"action": "NAVIGATE"})
-                driver.get(url)
-                time.sleep(5)  # Augmenté of 2 à 5 - laisser the temps au contenu of Load
+                scheduler_navigate(driver, url)
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 eden_logger.info(f"✅ Page ouverte avec succès via {browser_name} (navigateur restera ouvert)", extra={"action": "NAVIGATE"})
                 
@@ -1134,7 +1128,6 @@ class CookieManager:
             from http.server import HTTPServer, BaseHTTPRequestHandler
             import threading
             import webbrowser
-            import time
             
             cookies_list = self.get_cookies_for_scraper()
             if not cookies_list:
@@ -1199,8 +1192,8 @@ class CookieManager:
             eden_logger.info(f"Ouverture de {target_url} avec cookies via serveur local", extra={"action": "NAVIGATE"})
             webbrowser.open(local_url)
             
-            # Attendre que la page soit servie
-            time.sleep(3)
+            # Attendre que la page soit servie (fin de handle_request), au plus 10s
+            server_thread.join(timeout=10)
             server.server_close()
             
             return {
@@ -1239,7 +1232,6 @@ class CookieManager:
             from selenium import webdriver
             from selenium.webdriver.chrome.options import Options
             from webdriver_manager.chrome import ChromeDriverManager
-            import time
             import os
             
             cookies_list = self.get_cookies_for_scraper()
@@ -1275,8 +1267,8 @@ class CookieManager:
                 eden_logger.info(f"Ouverture détachée de {url} avec cookies", extra={"action": "NAVIGATE"})
                 
                 # Step 1: Homepage
-                driver.get("https://eden-daoc.net/")
-                time.sleep(1)
+                scheduler_navigate(driver, "https://eden-daoc.net/")
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 # Step 2: Add cookies
                 for cookie in cookies_list:
@@ -1285,15 +1277,13 @@ class CookieManager:
                     except:
                         pass
                 
-                time.sleep(1)
-                
                 # Step 3: Refresh
-                driver.refresh()
-                time.sleep(2)
+                scheduler_refresh(driver)
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 # Step 4: Navigation vers l'URL
-                driver.get(url)
-                time.sleep(2)
+                scheduler_navigate(driver, url)
+                wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                 
                 eden_logger.info(f"✅ Page ouverte avec succès via {browser_name} (détaché)", extra={"action": "NAVIGATE"})
                 
@@ -1408,7 +1398,6 @@ class CookieManager:
             
             # NE PAS lancer le navigateur directement
             # Seulement utiliser Selenium pour lancer et charger les cookies
-            import time
             
             try:
                 from selenium import webdriver
@@ -1432,8 +1421,8 @@ class CookieManager:
                 
                 try:
                     # Charger la page et ajouter les cookies
-                    driver.get("https://eden-daoc.net/")
-                    time.sleep(1)
+                    scheduler_navigate(driver, "https://eden-daoc.net/")
+                    wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                     
                     for cookie in cookies_list:
                         try:
@@ -1441,12 +1430,11 @@ class CookieManager:
                         except:
                             pass
                     
-                    time.sleep(1)
-                    driver.refresh()
-                    time.sleep(2)
+                    scheduler_refresh(driver)
+                    wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                     
-                    driver.get(url)
-                    time.sleep(3)
+                    scheduler_navigate(driver, url)
+                    wait_until_ready(driver, "eden_page", wait_condition_document_ready())
                     
                     eden_logger.info(f"✅ Navigateur lancé via Selenium avec cookies chargés", extra={"action": "NAVIGATE"})
                     
@@ -4,9 +4,31 @@ Charge et fournit un accès facile aux Realm Ranks et autres données du jeu
 """
 import json
 import os
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from .path_manager import get_resource_path
 
+
+@lru_cache(maxsize=4096)
+def _parse_realm_points_str(realm_points: str) -> Optional[int]:
+    """Convertit des points de royaume texte ("1 234 567", espaces insécables) en entier"""
+    try:
+        return int(realm_points.replace(' ', '').replace('\xa0', ''))
+    except ValueError:
+        return None
+
+
+def _parse_realm_points(realm_points) -> Optional[int]:
+    """Convertit des points de royaume (int ou str) en entier, None si invalide"""
+    if isinstance(realm_points, str):
+        return _parse_realm_points_str(realm_points)
+    try:
+        return int(realm_points)
+    except (ValueError, TypeError):
+        return None
+
+
 class DataManager:
     """Gestionnaire des données statiques du jeu DAOC"""
     
@@ -24,6 +46,7 @@ class DataManager:
         else:
             self.data_folder = data_folder
         self.realm_ranks = None
+        self._rank_index = {}  # royaume -> (seuils RP triés, rangs triés, rangs par niveau "XLY")
         self.classes_races = None
         self._realms_cache = None
         
@@ -40,6 +63,27 @@ class DataManager:
                 self.realm_ranks = json.load(f)
         return self.realm_ranks
     
+    def _get_rank_index(self, realm: str) -> Optional[Tuple[List[int], List[Dict], Dict[str, Dict]]]:
+        """
+        Index des rangs d'un royaume, construit une seule fois
+        
+        Returns:
+            tuple: (seuils RP triés, rangs dans le même ordre, rangs par niveau "XLY") ou None
+        """
+        index = self._rank_index.get(realm)
+        if index is None:
+            ranks = self.load_realm_ranks()
+            if realm not in ranks:
+                return None
+            realm_data = sorted(ranks[realm], key=lambda rank_info: rank_info['realm_points'])
+            index = (
+                [rank_info['realm_points'] for rank_info in realm_data],
+                realm_data,
+                {rank_info['level']: rank_info for rank_info in reversed(realm_data)}
+            )
+            self._rank_index[realm] = index
+        return index
+    
     def get_realm_rank_info(self, realm: str, realm_points) -> Optional[Dict]:
         """
         Récupère les informations du Realm Rank en fonction des points de royaume
@@ -51,32 +95,15 @@ class DataManager:
         Returns:
             Dictionnaire avec les infos du rang (rank, title, level, etc.) ou None
         """
-        ranks = self.load_realm_ranks()
-        
-        if realm not in ranks:
+        index = self._get_rank_index(realm)
+        realm_points = _parse_realm_points(realm_points)
+        if index is None or realm_points is None:
             return None
         
-        # Convertir realm_points en entier (gérer the strings with espaces)
-        try:
-            if isinstance(realm_points, str):
-                # Supprimer les espaces et convertir en int
-                realm_points = int(realm_points.replace(' ', '').replace('\xa0', ''))
-            else:
-                realm_points = int(realm_points)
-        except (ValueError, AttributeError):
-            return None
-        
-        realm_data = ranks[realm]
-        
-        # Trouver le rang correspondant aux points (le plus haut rank atteint)
-        current_rank = None
-        for rank_info in realm_data:
-            if realm_points >= rank_info['realm_points']:
-                current_rank = rank_info
-            else:
-                break
-        
-        return current_rank
+        # Le plus haut rang atteint : dernier seuil <= points (recherche dichotomique)
+        thresholds, realm_data, _ = index
+        position = bisect_right(thresholds, realm_points)
+        return realm_data[position - 1] if position else None
     
     def get_next_realm_rank(self, realm: str, current_realm_points) -> Optional[Dict]:
         """
@@ -89,29 +116,50 @@ class DataManager:
         Returns:
             Dictionnaire avec les infos du prochain rang ou None si max rank
         """
-        ranks = self.load_realm_ranks()
-        
-        if realm not in ranks:
+        index = self._get_rank_index(realm)
+        current_realm_points = _parse_realm_points(current_realm_points)
+        if index is None or current_realm_points is None:
             return None
         
-        # Convertir current_realm_points en entier (gérer the strings with espaces)
-        try:
-            if isinstance(current_realm_points, str):
-                # Supprimer les espaces et convertir en int
-                current_realm_points = int(current_realm_points.replace(' ', '').replace('\xa0', ''))
-            else:
-                current_realm_points = int(current_realm_points)
-        except (ValueError, AttributeError):
-            return None
-        
-        realm_data = ranks[realm]
-        
-        # Trouver le prochain rang
-        for rank_info in realm_data:
-            if rank_info['realm_points'] > current_realm_points:
-                return rank_info
+        # Premier seuil strictement supérieur aux points
+        thresholds, realm_data, _ = index
+        position = bisect_right(thresholds, current_realm_points)
+        return realm_data[position] if position < len(realm_data) else None  # None : max rank atteint
+    
+    def get_realm_ranks_batch(self, realm: str, realm_points_list: Iterable) -> List[Optional[Dict]]:
+        """
+        Convertit une liste de points de royaume en rangs en un seul appel
         
-        return None  # Max rank atteint
+        Args:
+            realm: Nom du royaume
+            realm_points_list: Points de royaume (int ou str)
+            
+        Returns:
+            Liste alignée sur realm_points_list de dictionnaires
+            {rank, level, title, realm_points, next_realm_points} (next_realm_points
+            None au max rank), ou None pour des points invalides ou un royaume inconnu
+        """
+        index = self._get_rank_index(realm)
+        if index is None:
+            return [None for _ in realm_points_list]
+        
+        thresholds, realm_data, _ = index
+        results = []
+        for realm_points in realm_points_list:
+            realm_points = _parse_realm_points(realm_points)
+            position = bisect_right(thresholds, realm_points) if realm_points is not None else 0
+            if not position:
+                results.append(None)
+                continue
+            rank_info = realm_data[position - 1]
+            results.append({
+                'rank': rank_info['rank'],
+                'level': rank_info['level'],
+                'title': rank_info['title'],
+                'realm_points': realm_points,
+                'next_realm_points': thresholds[position] if position < len(thresholds) else None
+            })
+        return results
     
     def get_rank_by_level(self, realm: str, level: str) -> Optional[Dict]:
         """
@@ -124,16 +172,10 @@ class DataManager:
         Returns:
             Dictionnaire avec les infos du rang ou None
         """
-        ranks = self.load_realm_ranks()
-        
-        if realm not in ranks:
+        index = self._get_rank_index(realm)
+        if index is None:
             return None
-        
-        for rank_info in ranks[realm]:
-            if rank_info['level'] == level:
-                return rank_info
-        
-        return None
+        return index[2].get(level)
     
     def calculate_rp_needed(self, realm: str, current_rp: int, target_rank: int) -> int:
         """
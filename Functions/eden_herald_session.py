@@ -0,0 +1,266 @@
+"""
+Eden Herald Session - Long-lived authenticated browser shared across Herald operations.
+
+Every Herald operation (search, character update, stats, wealth, mass import)
+used to start its own browser and replay the cookie loading sequence
+(homepage, add cookies, refresh, Herald) before doing any real work. This
+module keeps one authenticated EdenScraper alive between operations:
+
+  - started lazily by the first herald_session_acquire()
+  - health-checked before each reuse (browser alive, same display mode,
+    cookie file unchanged and still valid), recreated otherwise
+  - used by one operation at a time (lease protected by a lock); an operation
+    that cannot get it within HERALD_SESSION_WAIT_SECONDS gets a dedicated
+    session instead, closed on release
+  - closed after system.herald_session_idle_seconds without use
+    (0 = disabled: every operation gets a dedicated session, as before)
+
+Usage:
+    scraper, error_message = herald_session_acquire(cookie_manager, headless=False)
+    try:
+        ...
+    finally:
+        herald_session_release(scraper)
+
+herald_session_release() accepts any EdenScraper: a scraper that is not the
+shared session is simply closed. Releasing twice is harmless.
+
+Naming Convention: module functions use the 'herald_session_*' prefix.
+"""
+
+import os
+import threading
+from typing import Any, Optional, Tuple
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+
+logger = get_logger(LOGGER_EDEN)
+
+# Default idle time before the shared browser is closed (system.herald_session_idle_seconds)
+HERALD_SESSION_IDLE_SECONDS = 300
+
+# Maximum wait for the shared session before falling back to a dedicated one
+HERALD_SESSION_WAIT_SECONDS = 15.0
+
+
+def herald_session_get_idle_seconds() -> float:
+    """
+    Get the configured idle timeout (system.herald_session_idle_seconds)
+
+    Returns:
+        float: Idle timeout in seconds (0 = shared session disabled)
+    """
+    try:
+        from Functions.config_manager import config
+        value = config.get("system.herald_session_idle_seconds", HERALD_SESSION_IDLE_SECONDS)
+        return max(float(value), 0.0)
+    except Exception:
+        return float(HERALD_SESSION_IDLE_SECONDS)
+
+
+class HeraldSessionManager:
+    """Owner of the shared authenticated EdenScraper"""
+
+    def __init__(self):
+        self._lease_lock = threading.Lock()   # Held by the operation using the shared session
+        self._state_lock = threading.Lock()   # Protects the fields below
+        self._scraper = None
+        self._headless = None
+        self._cookie_stamp = None
+        self._leased = False
+        self._idle_timer = None
+
+    def acquire(self, cookie_manager=None, headless: bool = False,
+                wait_seconds: float = HERALD_SESSION_WAIT_SECONDS) -> Tuple[Optional[Any], str]:
+        """
+        Get an authenticated EdenScraper (shared session if available)
+
+        Args:
+            cookie_manager: CookieManager instance (created if None)
+            headless: Browser display mode
+            wait_seconds: Maximum wait for the shared session
+
+        Returns:
+            tuple: (scraper: EdenScraper|None, error_message: str)
+        """
+        from Functions.eden_scraper import _connect_to_eden_herald
+
+        if herald_session_get_idle_seconds() <= 0:
+            return _connect_to_eden_herald(cookie_manager=cookie_manager, headless=headless)
+
+        if not self._lease_lock.acquire(timeout=wait_seconds):
+            logger.info("Herald session busy - opening a dedicated session", extra={"action": "SESSION"})
+            return _connect_to_eden_herald(cookie_manager=cookie_manager, headless=headless)
+
+        try:
+            with self._state_lock:
+                self._cancel_idle_timer()
+                scraper = self._scraper
+
+            if scraper is not None and not self._is_reusable(scraper, headless):
+                self._close_shared()
+                scraper = None
+
+            if scraper is None:
+                scraper, error_message = _connect_to_eden_herald(cookie_manager=cookie_manager, headless=headless)
+                if not scraper:
+                    self._lease_lock.release()
+                    return None, error_message
+                with self._state_lock:
+                    self._scraper = scraper
+                    self._headless = headless
+                    self._cookie_stamp = self._get_cookie_stamp(scraper.cookie_manager)
+                logger.info("Herald session started (shared)", extra={"action": "SESSION"})
+            else:
+                logger.info("♻️ Herald session reused - startup skipped", extra={"action": "SESSION"})
+
+            with self._state_lock:
+                self._leased = True
+            return scraper, ""
+
+        except Exception as e:
+            self._lease_lock.release()
+            logger.error(f"Herald session error: {e}", extra={"action": "SESSION"})
+            return None, f"Erreur de connexion: {str(e)}"
+
+    def release(self, scraper, discard: bool = False):
+        """
+        Give a scraper back after an operation
+
+        Args:
+            scraper: Scraper returned by acquire() (None accepted)
+            discard: If True, close the shared session instead of keeping it warm
+                     (operation interrupted, browser state unknown)
+        """
+        if scraper is None:
+            return
+
+        with self._state_lock:
+            is_shared = scraper is self._scraper
+            was_leased = self._leased
+            if is_shared and was_leased:
+                self._leased = False
+
+        if not is_shared:
+            # Dedicated session (or shared session already replaced): close it
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.warning(f"Error closing Herald session: {e}", extra={"action": "SESSION"})
+            return
+
+        if not was_leased:
+            return
+
+        if discard:
+            self._close_shared()
+        else:
+            self._start_idle_timer()
+        self._lease_lock.release()
+
+    def shutdown(self):
+        """Close the shared session (application exit)"""
+        with self._state_lock:
+            self._cancel_idle_timer()
+        self._close_shared()
+
+    def _is_reusable(self, scraper, headless: bool) -> bool:
+        """Health check of the shared session before reuse"""
+        if scraper.driver is None or headless != self._headless:
+            return False
+
+        cookie_manager = scraper.cookie_manager
+        if self._get_cookie_stamp(cookie_manager) != self._cookie_stamp:
+            logger.info("Cookies changed - Herald session restarted", extra={"action": "SESSION"})
+            return False
+        try:
+            info = cookie_manager.get_cookie_info()
+            if not info or not info.get('is_valid'):
+                return False
+            # Browser still alive (window not closed by the user, driver responding)
+            scraper.driver.current_url
+            return len(scraper.driver.window_handles) > 0
+        except Exception as e:
+            logger.info(f"Herald session not responding - restarted ({e})", extra={"action": "SESSION"})
+            return False
+
+    @staticmethod
+    def _get_cookie_stamp(cookie_manager):
+        """Modification stamp of the cookie file (detects regenerated/imported cookies)"""
+        try:
+            stat = os.stat(cookie_manager.cookie_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except Exception:
+            return None
+
+    def _close_shared(self):
+        """Close the shared browser (caller holds the lease or the session is idle)"""
+        with self._state_lock:
+            scraper, self._scraper = self._scraper, None
+            self._leased = False
+        if scraper is not None:
+            try:
+                scraper.close()
+                logger.info("Herald session closed", extra={"action": "SESSION"})
+            except Exception as e:
+                logger.warning(f"Error closing Herald session: {e}", extra={"action": "SESSION"})
+
+    def _start_idle_timer(self):
+        """Schedule the idle close of the shared session"""
+        idle_seconds = herald_session_get_idle_seconds()
+        with self._state_lock:
+            self._cancel_idle_timer()
+            if idle_seconds > 0:
+                self._idle_timer = threading.Timer(idle_seconds, self._on_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def _cancel_idle_timer(self):
+        """Cancel the idle timer (caller holds _state_lock)"""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _on_idle(self):
+        """Idle timeout: close the shared session unless an operation is using it"""
+        if not self._lease_lock.acquire(blocking=False):
+            return
+        try:
+            logger.info("Herald session idle - closing browser", extra={"action": "SESSION"})
+            self._close_shared()
+        finally:
+            self._lease_lock.release()
+
+
+_manager = HeraldSessionManager()
+
+
+def herald_session_acquire(cookie_manager=None, headless: bool = False) -> Tuple[Optional[Any], str]:
+    """
+    Get an authenticated EdenScraper, reusing the shared Herald session when possible
+
+    Args:
+        cookie_manager: CookieManager instance (created if None)
+        headless: Browser display mode
+
+    Returns:
+        tuple: (scraper: EdenScraper|None, error_message: str) - same contract
+               as _connect_to_eden_herald()
+    """
+    return _manager.acquire(cookie_manager=cookie_manager, headless=headless)
+
+
+def herald_session_release(scraper, discard: bool = False):
+    """
+    Give back a scraper obtained from herald_session_acquire()
+
+    Args:
+        scraper: EdenScraper (None accepted)
+        discard: If True, close it even if it is the shared session
+    """
+    _manager.release(scraper, discard=discard)
+
+
+def herald_session_shutdown():
+    """Close the shared Herald session (application exit)"""
+    _manager.shutdown()
@@ -0,0 +1,171 @@
+"""
+Eden HTML Parser - Targeted parsing of Eden result tables.
+
+Eden pages carry the whole site layout (menus, scripts, forum blocks) around
+the tables the scrapers actually read. Instead of building a BeautifulSoup
+tree of the entire page, this module:
+
+  - slices the wanted tables (table_result, table_merchants...) out of the
+    page source and parses only those fragments
+  - uses the lxml parser backend when it is installed (html.parser otherwise)
+  - reads the items search results in one pass: row id, cell texts and realm
+    icon per row, level/utility columns mapped once from the header row
+
+When a table cannot be located in the source, the whole page is parsed as
+before, so the callers always receive a usable soup.
+
+Naming Convention: module functions use the 'html_*' prefix.
+
+Functions:
+  - html_get_backend()                  Parser backend name (lxml or html.parser)
+  - html_extract_element()              Source of one table, sliced by id
+  - html_parse_fragment()               Soup restricted to some tables
+  - html_parse_items_search()           Items search rows and header column map
+"""
+
+import importlib.util
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+# Realm icons of the items search rows
+REALM_ICON_PATTERN = re.compile(r'(albion_logo|hibernia_logo|midgard_logo|all_logo)\.png')
+
+# Items search row ids (result_row_<item id>)
+RESULT_ROW_PATTERN = re.compile(r'^result_row_(\d+)$')
+
+# Header labels of the items search columns read by the scrapers
+ITEMS_SEARCH_COLUMNS = {
+    "level": ("level", "lvl"),
+    "utility": ("utility", "util"),
+}
+
+_backend = None
+
+
+def html_get_backend() -> str:
+    """
+    Get the BeautifulSoup parser backend (lxml if installed, html.parser otherwise)
+
+    Returns:
+        str: Backend name for BeautifulSoup()
+    """
+    global _backend
+    if _backend is None:
+        _backend = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+    return _backend
+
+
+def _html_find_element_span(html: str, element_id: str, tag: str) -> Optional[Tuple[int, int]]:
+    """Start/end offsets of the <tag id=element_id> element in the source"""
+    opening = re.search(
+        r'<%s\b[^>]*\bid\s*=\s*["\']?%s(?=["\'\s>])' % (tag, re.escape(element_id)),
+        html, re.IGNORECASE
+    )
+    if not opening:
+        return None
+
+    depth = 0
+    for match in re.compile(r'<(/?)%s\b' % tag, re.IGNORECASE).finditer(html, opening.start()):
+        if match.group(1):
+            depth -= 1
+            if depth == 0:
+                end = html.find('>', match.end())
+                return opening.start(), (end + 1 if end >= 0 else len(html))
+        else:
+            depth += 1
+    # Element not closed in the source: the parser closes it
+    return opening.start(), len(html)
+
+
+def html_extract_element(html: str, element_id: str, tag: str = "table") -> Optional[str]:
+    """
+    Slice the source of one element out of a page
+
+    Args:
+        html: Page source
+        element_id: id attribute of the element
+        tag: Tag name of the element (nested elements of the same tag are balanced)
+
+    Returns:
+        str: Source of the element, or None if not found
+    """
+    span = _html_find_element_span(html, element_id, tag)
+    return html[span[0]:span[1]] if span else None
+
+
+def html_parse_fragment(html: str, element_ids: Iterable[str], tag: str = "table") -> BeautifulSoup:
+    """
+    Parse only some elements of a page
+
+    Args:
+        html: Page source
+        element_ids: ids of the elements to keep (soup.find(tag, id=...) works as on the full page)
+        tag: Tag name of the elements
+
+    Returns:
+        BeautifulSoup: Soup of the elements found, or of the whole page if none was found
+    """
+    spans = []
+    for element_id in element_ids:
+        span = _html_find_element_span(html, element_id, tag)
+        # An element nested in an already kept one is already parsed
+        if span and not any(start <= span[0] and span[1] <= end for start, end in spans):
+            spans.append(span)
+
+    if not spans:
+        return BeautifulSoup(html, html_get_backend())
+    return BeautifulSoup("".join(html[start:end] for start, end in sorted(spans)), html_get_backend())
+
+
+def _html_map_columns(header_texts: List[str], columns: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    """Column index of each wanted column, from the header labels"""
+    mapping = {}
+    for idx, text in enumerate(header_texts):
+        label = text.strip().lower()
+        for column, aliases in columns.items():
+            if column not in mapping and any(alias in label for alias in aliases):
+                mapping[column] = idx
+    return mapping
+
+
+def html_parse_items_search(html: str) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Read the rows of an items search results page
+
+    Args:
+        html: Page source
+
+    Returns:
+        tuple: (rows, columns)
+            rows: [{'id': str, 'cells': [str], 'realm_src': str or None}] in page order
+            columns: {'level': idx, 'utility': idx} found in the header row
+                     (missing keys: column not identified, callers scan the cells)
+    """
+    soup = html_parse_fragment(html, ("table_result",))
+
+    rows = []
+    header_texts = None
+    for tr in soup.find_all('tr'):
+        match = RESULT_ROW_PATTERN.match(tr.get('id') or '')
+        if not match:
+            # First non result row with several cells: header of the table
+            if header_texts is None and not rows:
+                cells = tr.find_all(['th', 'td'])
+                if len(cells) > 2:
+                    header_texts = [cell.get_text(strip=True) for cell in cells]
+            continue
+
+        realm_img = tr.find('img', src=REALM_ICON_PATTERN)
+        rows.append({
+            'id': match.group(1),
+            'cells': [cell.get_text(strip=True) for cell in tr.find_all('td')],
+            'realm_src': realm_img.get('src', '') if realm_img else None,
+        })
+
+    # Header indexes only apply when the header has one label per row cell
+    columns = {}
+    if header_texts and rows and len(header_texts) == len(rows[0]['cells']):
+        columns = _html_map_columns(header_texts, ITEMS_SEARCH_COLUMNS)
+    return rows, columns
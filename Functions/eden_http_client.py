@@ -0,0 +1,229 @@
+"""
+Eden HTTP Client - Requests-based fast path for Eden pages.
+
+Fetches the items search, item detail and Herald search pages with a plain
+authenticated HTTP request (requests.Session with connection pooling and
+keep-alive) instead of a full browser navigation. The cookies are the ones
+exposed by CookieManager.get_cookies_for_scraper(), and the browser user
+agent is reused so that anti-bot clearance cookies stay valid.
+
+The fast path never replaces Selenium: a response is only accepted when it
+is not a bot check and the page specific completeness check passes (content
+rendered server side, not JS-only). Otherwise fetch() returns None and the
+caller falls back to the Selenium path. After a few consecutive misses for
+a page type, that page type is not tried again in this client.
+
+The returned HTML is the raw page source: the existing BeautifulSoup parsers
+run unchanged on either source.
+
+Naming Convention: module functions use the 'http_*' prefix.
+
+Functions:
+  - http_is_enabled()                   Fast path switch (system.http_fast_path)
+  - http_get_stats() / http_reset_stats()  Per page type hit/fallback statistics
+  - http_check_*()                      Completeness checks (callable(html) -> bool)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+from Functions.eden_request_scheduler import scheduler_slot
+from Functions.eden_wait_policy import HERALD_NOT_AVAILABLE
+
+logger = get_logger(LOGGER_EDEN)
+
+# Markers of an anti-bot interstitial (Cloudflare and similar)
+BOT_CHECK_MARKERS = (
+    "cf-browser-verification",
+    "challenge-platform",
+    "cf_chl_",
+    "Just a moment...",
+    "Checking your browser",
+    "Enable JavaScript and cookies to continue",
+)
+
+# Per request timeout (connect, read) in seconds
+REQUEST_TIMEOUT = (5.0, 15.0)
+
+# Consecutive misses after which a page type is no longer tried in a client
+MAX_CONSECUTIVE_MISSES = 3
+
+_stats_lock = threading.Lock()
+_http_stats: Dict[str, Dict[str, float]] = {}
+
+
+def http_is_enabled() -> bool:
+    """
+    Check whether the HTTP fast path is enabled (system.http_fast_path)
+
+    Returns:
+        bool: True if enabled (default)
+    """
+    try:
+        from Functions.config_manager import config
+        return bool(config.get("system.http_fast_path", True))
+    except Exception:
+        return True
+
+
+class EdenHttpClient:
+    """Authenticated requests.Session for Eden pages, with Selenium fallback signalling"""
+
+    def __init__(self, cookies: List[Dict], user_agent: Optional[str] = None):
+        """
+        Args:
+            cookies: Selenium-style cookie dicts (CookieManager.get_cookies_for_scraper)
+            user_agent: User agent of the browser the cookies were issued to
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Connection": "keep-alive",
+        })
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+        for cookie in cookies or []:
+            try:
+                self.session.cookies.set(
+                    cookie["name"], cookie["value"],
+                    domain=cookie.get("domain", "eden-daoc.net"),
+                    path=cookie.get("path", "/")
+                )
+            except Exception as e:
+                logger.debug(f"Cookie {cookie.get('name')} ignored by HTTP client: {e}", extra={"action": "HTTP"})
+
+        self._misses: Dict[str, int] = {}
+
+    def fetch(self, url: str, page_type: str, is_complete: Callable[[str], bool]) -> Optional[str]:
+        """
+        Fetch a page over HTTP.
+
+        Args:
+            url: Page URL
+            page_type: Page type key (items_search, item_details, herald_search...)
+            is_complete: Callable(html) returning True when the page content is usable
+
+        Returns:
+            str: Page HTML, or None when the caller must use the Selenium path
+        """
+        if self._misses.get(page_type, 0) >= MAX_CONSECUTIVE_MISSES:
+            return None
+
+        start = time.monotonic()
+        reason = None
+        html = None
+        try:
+            with scheduler_slot(url) as slot:
+                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+                if response.status_code != 200:
+                    reason = f"HTTP {response.status_code}"
+                    if response.status_code == 429 or response.status_code >= 500:
+                        slot.report_error()
+                else:
+                    html = response.text
+                    if any(marker in html for marker in BOT_CHECK_MARKERS):
+                        reason = "bot check"
+                        slot.report_bot_check()
+                    elif HERALD_NOT_AVAILABLE in html:
+                        reason = "session not accepted"
+                    elif not is_complete(html):
+                        reason = "incomplete content (JS-only)"
+        except Exception as e:
+            reason = f"request error: {e}"
+
+        elapsed = time.monotonic() - start
+        _http_record(page_type, elapsed, reason is None)
+
+        if reason:
+            self._misses[page_type] = self._misses.get(page_type, 0) + 1
+            if self._misses[page_type] >= MAX_CONSECUTIVE_MISSES:
+                logger.info(f"🌐 HTTP {page_type}: fast path disabled for this session after "
+                            f"{MAX_CONSECUTIVE_MISSES} misses", extra={"action": "HTTP"})
+            logger.debug(f"🌐 HTTP {page_type}: fallback to browser ({reason}, {elapsed:.2f}s)",
+                         extra={"action": "HTTP"})
+            return None
+
+        self._misses[page_type] = 0
+        logger.debug(f"🌐 HTTP {page_type}: {len(html)} chars in {elapsed:.2f}s", extra={"action": "HTTP"})
+        return html
+
+    def close(self):
+        """Close the pooled connections"""
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
+
+def _http_record(page_type: str, elapsed: float, hit: bool):
+    """Aggregate one fetch into the per page type statistics"""
+    with _stats_lock:
+        stats = _http_stats.setdefault(page_type, {"hits": 0, "fallbacks": 0, "total_seconds": 0.0})
+        stats["hits" if hit else "fallbacks"] += 1
+        stats["total_seconds"] += elapsed
+
+
+def http_get_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Get the fast path statistics aggregated per page type.
+
+    Returns:
+        dict: {page_type: {hits, fallbacks, total_seconds}}
+    """
+    with _stats_lock:
+        return {page_type: dict(stats) for page_type, stats in _http_stats.items()}
+
+
+def http_reset_stats():
+    """Reset the fast path statistics"""
+    with _stats_lock:
+        _http_stats.clear()
+
+
+# ============================================================================
+# COMPLETENESS CHECKS
+# ============================================================================
+
+def http_check_items_search() -> Callable[[str], bool]:
+    """
+    Returns:
+        Check met when the items search results rows are rendered in the HTML
+    """
+    return lambda html: "table_result" in html and "result_row_" in html
+
+
+def http_check_item_details() -> Callable[[str], bool]:
+    """
+    Returns:
+        Check met when the item details lines are rendered in the HTML
+    """
+    return lambda html: "item_line_left" in html
+
+
+def http_check_herald_search() -> Callable[[str], bool]:
+    """
+    Returns:
+        Check met when the Herald search results table has at least one data row
+    """
+    return lambda html: "<table" in html and "n=player" in html
+
+
+def http_check_herald_profile(marker: str) -> Callable[[str], bool]:
+    """
+    Args:
+        marker: Text specific to the requested profile tab
+
+    Returns:
+        Check met when the character profile content of that tab is rendered in the HTML
+    """
+    return lambda html: "player_content" in html and marker in html
@@ -0,0 +1,418 @@
+"""
+Eden Page Cache - Compressed on-disk cache of Eden HTML pages.
+
+Items searches, item details and Herald pages are stored gzip-compressed
+under the user data directory (PageCache/<page_type>/<key>.html.gz), the
+key being the SHA-256 of the normalized URL (scheme/host lower case, query
+parameters sorted, fragment dropped). A page is stored only once its
+completeness check passed, whether it came from the HTTP fast path or from
+the browser.
+
+Each page type has its own time to live (system.page_cache.ttl_hours, see
+PAGE_CACHE_TTL_HOURS): a TTL of 0 stores the page without ever serving it
+online (Herald pages, always refreshed). The total size is capped by
+system.page_cache.max_mb, least recently used pages evicted first.
+
+Offline mode (system.page_cache.offline): pages are served from the cache
+whatever their age, nothing is fetched and no browser is started; a page
+missing from the cache raises PageCacheMiss. Re-running a parser over
+already visited pages then needs no network.
+
+Naming Convention: module functions use the 'page_cache_*' prefix.
+
+Functions:
+  - page_cache_get() / page_cache_put()       Read / store a page
+  - page_cache_get_stored_at()                Date a cached page was fetched
+  - page_cache_clear()                        Remove cached pages
+  - page_cache_is_enabled() / page_cache_is_offline()  Configuration switches
+  - page_cache_normalize_url()                Cache key source
+  - page_cache_get_stats() / page_cache_reset_stats()  Per page type statistics
+"""
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+
+logger = get_logger(LOGGER_EDEN)
+
+# Default time to live per page type family, in hours (overridable via
+# system.page_cache.ttl_hours = {"items_search": 12, ...}). 0 = never served online.
+PAGE_CACHE_TTL_HOURS = {
+    "items_search": 24,
+    "item_details": 168,
+    "herald_search": 0,
+    "herald_profile": 0,
+}
+
+# Default size cap of the cache directory in MB (system.page_cache.max_mb)
+PAGE_CACHE_MAX_MB = 200
+
+PAGE_CACHE_SUFFIX = ".html.gz"
+
+
+class PageCacheMiss(LookupError):
+    """Page not in the cache while offline mode forbids fetching it"""
+
+
+def _page_cache_settings() -> Dict:
+    """Get the system.page_cache configuration section"""
+    try:
+        from Functions.config_manager import config
+        return config.get("system.page_cache", {}) or {}
+    except Exception:
+        return {}
+
+
+def page_cache_is_enabled() -> bool:
+    """
+    Check whether the page cache is enabled (system.page_cache.enabled)
+
+    Returns:
+        bool: True if enabled (default)
+    """
+    return bool(_page_cache_settings().get("enabled", True))
+
+
+def page_cache_is_offline() -> bool:
+    """
+    Check whether the cache-only mode is active (system.page_cache.offline)
+
+    Returns:
+        bool: True if pages must only be read from the cache
+    """
+    return bool(_page_cache_settings().get("offline", False))
+
+
+def page_cache_get_ttl(page_type: str) -> float:
+    """
+    Get the time to live of a page type, in seconds.
+
+    The page type family is the longest PAGE_CACHE_TTL_HOURS key the page
+    type starts with (herald_profile_pvp -> herald_profile).
+
+    Args:
+        page_type: Page type key
+
+    Returns:
+        float: TTL in seconds (0 = not served online)
+    """
+    overrides = _page_cache_settings().get("ttl_hours", {}) or {}
+    ttl_hours = dict(PAGE_CACHE_TTL_HOURS)
+    ttl_hours.update(overrides)
+
+    families = [family for family in ttl_hours if page_type.startswith(family)]
+    if not families:
+        return 0.0
+    try:
+        return max(float(ttl_hours[max(families, key=len)]), 0.0) * 3600
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def page_cache_normalize_url(url: str) -> str:
+    """
+    Normalize a page URL so that equivalent URLs share a cache entry
+
+    Args:
+        url: Page URL
+
+    Returns:
+        str: URL with lower case scheme/host, sorted query, no fragment
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class PageCache:
+    """Gzip page store with per page type TTL and LRU size cap"""
+
+    def __init__(self, cache_dir: Path):
+        """
+        Args:
+            cache_dir: Root directory of the cache
+        """
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        self._entries = None  # {key: {"path", "page_type", "size", "stored_at", "last_access"}}
+        self._total_size = 0
+
+    def get(self, url: str, page_type: str, ignore_ttl: bool = False) -> Optional[str]:
+        """
+        Read a page from the cache
+
+        Args:
+            url: Page URL
+            page_type: Page type key
+            ignore_ttl: If True, serve the page whatever its age (offline mode)
+
+        Returns:
+            str: Page HTML, or None if absent or expired
+        """
+        key = self._get_key(url)
+        with self._lock:
+            entry = self._get_entries().get(key)
+            if entry is None or entry["page_type"] != page_type:
+                return None
+            if not ignore_ttl:
+                ttl = page_cache_get_ttl(page_type)
+                if ttl <= 0 or time.time() - entry["stored_at"] > ttl:
+                    return None
+            entry["last_access"] = time.time()
+            path = entry["path"]
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            logger.warning(f"Page cache entry unreadable, removed: {path.name} ({e})", extra={"action": "CACHE"})
+            with self._lock:
+                self._remove_entry(key)
+            return None
+
+    def get_stored_at(self, url: str, page_type: str) -> Optional[float]:
+        """
+        Date a page was stored, i.e. fetched from Eden
+
+        Args:
+            url: Page URL
+            page_type: Page type key
+
+        Returns:
+            float: Timestamp (time.time()), or None if the page is not cached
+        """
+        with self._lock:
+            entry = self._get_entries().get(self._get_key(url))
+            if entry is None or entry["page_type"] != page_type:
+                return None
+            return entry["stored_at"]
+
+    def put(self, url: str, page_type: str, html: str):
+        """
+        Store a page in the cache (replaces the previous version)
+
+        Args:
+            url: Page URL
+            page_type: Page type key
+            html: Page HTML
+        """
+        key = self._get_key(url)
+        folder = self.cache_dir / page_type
+        path = folder / f"{key}{PAGE_CACHE_SUFFIX}"
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(html)
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except Exception as e:
+            logger.warning(f"Page cache write failed for {url}: {e}", extra={"action": "CACHE"})
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = self._get_entries()
+            previous = entries.get(key)
+            if previous is not None:
+                self._total_size -= previous["size"]
+                if previous["path"] != path:
+                    self._unlink(previous["path"])
+            entries[key] = {"path": path, "page_type": page_type, "size": size,
+                            "stored_at": now, "last_access": now}
+            self._total_size += size
+            self._evict()
+
+    def clear(self, page_type: Optional[str] = None) -> int:
+        """
+        Remove cached pages
+
+        Args:
+            page_type: Only remove this page type (None = all)
+
+        Returns:
+            int: Number of pages removed
+        """
+        with self._lock:
+            entries = self._get_entries()
+            keys = [key for key, entry in entries.items()
+                    if page_type is None or entry["page_type"] == page_type]
+            for key in keys:
+                self._remove_entry(key)
+        return len(keys)
+
+    @staticmethod
+    def _get_key(url: str) -> str:
+        """Cache key of a URL (SHA-256 of the normalized URL)"""
+        return hashlib.sha256(page_cache_normalize_url(url).encode("utf-8")).hexdigest()
+
+    def _get_entries(self) -> Dict[str, Dict]:
+        """In-memory index of the cache directory, built on first use (caller holds _lock)"""
+        if self._entries is None:
+            self._entries = {}
+            self._total_size = 0
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob(f"*/*{PAGE_CACHE_SUFFIX}"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    key = path.name[:-len(PAGE_CACHE_SUFFIX)]
+                    self._entries[key] = {"path": path, "page_type": path.parent.name, "size": stat.st_size,
+                                          "stored_at": stat.st_mtime, "last_access": stat.st_mtime}
+                    self._total_size += stat.st_size
+        return self._entries
+
+    def _evict(self):
+        """Remove least recently used pages above the size cap (caller holds _lock)"""
+        try:
+            max_mb = float(_page_cache_settings().get("max_mb", PAGE_CACHE_MAX_MB))
+        except (TypeError, ValueError):
+            max_mb = PAGE_CACHE_MAX_MB
+        max_bytes = max_mb * 1024 * 1024
+        if self._total_size <= max_bytes:
+            return
+
+        evicted = 0
+        for key, _ in sorted(self._entries.items(), key=lambda item: item[1]["last_access"]):
+            if self._total_size <= max_bytes:
+                break
+            self._remove_entry(key)
+            evicted += 1
+        logger.debug(f"Page cache: {evicted} pages evicted (cap {max_mb:g} MB)", extra={"action": "CACHE"})
+
+    def _remove_entry(self, key: str):
+        """Remove one page from the index and the disk (caller holds _lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_size -= entry["size"]
+            self._unlink(entry["path"])
+
+    @staticmethod
+    def _unlink(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_cache_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _page_cache_instance() -> PageCache:
+    """Shared PageCache in the user data directory, created on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from Functions.path_manager import get_user_data_dir
+            _cache = PageCache(get_user_data_dir() / "PageCache")
+        return _cache
+
+
+def _page_cache_record(page_type: str, event: str):
+    """Count one hit/miss/store for a page type"""
+    with _stats_lock:
+        stats = _cache_stats.setdefault(page_type, {"hits": 0, "misses": 0, "stores": 0})
+        stats[event] += 1
+
+
+def page_cache_get(url: str, page_type: str) -> Optional[str]:
+    """
+    Read a page from the cache (any age in offline mode)
+
+    Args:
+        url: Page URL
+        page_type: Page type key
+
+    Returns:
+        str: Page HTML, or None when the page must be fetched
+    """
+    offline = page_cache_is_offline()
+    if not offline and not page_cache_is_enabled():
+        return None
+
+    html = _page_cache_instance().get(url, page_type, ignore_ttl=offline)
+    _page_cache_record(page_type, "hits" if html is not None else "misses")
+    if html is not None:
+        logger.debug(f"💾 Page cache hit ({page_type}): {url}", extra={"action": "CACHE"})
+    return html
+
+
+def page_cache_put(url: str, page_type: str, html: str):
+    """
+    Store a complete page in the cache
+
+    Args:
+        url: Page URL
+        page_type: Page type key
+        html: Page HTML
+    """
+    if not html or not page_cache_is_enabled():
+        return
+    _page_cache_instance().put(url, page_type, html)
+    _page_cache_record(page_type, "stores")
+
+
+def page_cache_get_stored_at(url: str, page_type: str) -> Optional[float]:
+    """
+    Date a cached page was fetched from Eden (any age)
+
+    Args:
+        url: Page URL
+        page_type: Page type key
+
+    Returns:
+        float: Timestamp (time.time()), or None if the page is not cached
+               or the cache is not used (disabled, not offline)
+    """
+    if not page_cache_is_offline() and not page_cache_is_enabled():
+        return None
+    return _page_cache_instance().get_stored_at(url, page_type)
+
+
+def page_cache_clear(page_type: Optional[str] = None) -> int:
+    """
+    Remove cached pages
+
+    Args:
+        page_type: Only remove this page type (None = all)
+
+    Returns:
+        int: Number of pages removed
+    """
+    removed = _page_cache_instance().clear(page_type)
+    logger.info(f"Page cache cleared: {removed} pages", extra={"action": "CACHE"})
+    return removed
+
+
+def page_cache_get_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get the cache statistics aggregated per page type.
+
+    Returns:
+        dict: {page_type: {hits, misses, stores}}
+    """
+    with _stats_lock:
+        return {page_type: dict(stats) for page_type, stats in _cache_stats.items()}
+
+
+def page_cache_reset_stats():
+    """Reset the cache statistics"""
+    with _stats_lock:
+        _cache_stats.clear()
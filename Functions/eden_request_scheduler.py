@@ -0,0 +1,279 @@
+"""
+Eden Request Scheduler - Central pacing of all Eden traffic.
+
+Every browser navigation and HTTP fast path request to Eden takes a slot
+from this scheduler before it leaves the application:
+
+  - token bucket per host: sustained rate (rate_per_second) with a small
+    burst allowance (burst), shared by all threads and browser sessions
+  - concurrency cap per host (max_concurrent requests in flight)
+  - adaptive backoff: an error or a bot check pauses the host and halves
+    its effective rate; each success restores 10% of the rate and shortens
+    the pause
+
+This replaces the fixed sleeps the scrapers used between requests: parallel
+sessions and bulk refreshes run at the configured rate, and slow down on
+their own when Eden pushes back.
+
+Configuration (system.request_scheduler):
+    {"rate_per_second": 2.0, "burst": 4, "max_concurrent": 4,
+     "backoff_max_seconds": 60, "hosts": {"eden-daoc.net": {"rate_per_second": 3}}}
+
+Usage:
+    with scheduler_slot(url) as slot:
+        response = session.get(url)
+        if bot_check:
+            slot.report_bot_check()
+
+Naming Convention: module functions use the 'scheduler_*' prefix.
+
+Functions:
+  - scheduler_slot()                    Context manager around one request
+  - scheduler_navigate()                driver.get() through a slot
+  - scheduler_refresh()                 driver.refresh() through a slot
+  - scheduler_get_policy()              Effective policy of a host
+  - scheduler_get_stats() / scheduler_reset_stats()  Per host metrics
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+from urllib.parse import urlsplit
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+
+logger = get_logger(LOGGER_EDEN)
+
+DEFAULT_SCHEDULER_POLICY = {
+    "rate_per_second": 2.0,
+    "burst": 4,
+    "max_concurrent": 4,
+    "backoff_max_seconds": 60.0,
+}
+
+# Effective rate never drops below this fraction of the configured rate
+MIN_RATE_FACTOR = 0.1
+
+# Titles of anti-bot interstitials (browser navigations)
+BOT_CHECK_TITLES = ("Just a moment", "Attention Required", "Checking your browser")
+
+
+def scheduler_get_policy(host: str) -> Dict[str, float]:
+    """
+    Get the effective scheduling policy of a host.
+
+    Args:
+        host: Host name (eden-daoc.net)
+
+    Returns:
+        dict: {rate_per_second, burst, max_concurrent, backoff_max_seconds}
+    """
+    policy = dict(DEFAULT_SCHEDULER_POLICY)
+    try:
+        from Functions.config_manager import config
+        settings = config.get("system.request_scheduler", {}) or {}
+        hosts = settings.get("hosts", {}) or {}
+        for source in (settings, hosts.get(host, {}) or {}):
+            for key in DEFAULT_SCHEDULER_POLICY:
+                if key in source:
+                    policy[key] = float(source[key])
+    except Exception:
+        pass
+    policy["rate_per_second"] = max(policy["rate_per_second"], 0.01)
+    policy["burst"] = max(policy["burst"], 1.0)
+    policy["max_concurrent"] = max(int(policy["max_concurrent"]), 1)
+    return policy
+
+
+class HostScheduler:
+    """Token bucket, concurrency cap and backoff state of one host"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.policy = scheduler_get_policy(host)
+        self._condition = threading.Condition()
+        self._tokens = self.policy["burst"]
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._rate_factor = 1.0
+        self._backoff_seconds = 0.0
+        self._paused_until = 0.0
+        self.stats = {"requests": 0, "errors": 0, "bot_checks": 0, "throttled": 0,
+                      "total_wait_seconds": 0.0, "max_in_flight": 0}
+
+    def acquire(self):
+        """Block until a token and a concurrency slot are available"""
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                delay = 0.0
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._in_flight >= self.policy["max_concurrent"]:
+                    delay = None  # Woken up by release()
+                elif self._tokens < 1.0:
+                    delay = (1.0 - self._tokens) / self._effective_rate()
+                else:
+                    self._tokens -= 1.0
+                    self._in_flight += 1
+                    break
+                self._condition.wait(delay)
+
+            waited = time.monotonic() - start
+            self.stats["requests"] += 1
+            self.stats["total_wait_seconds"] += waited
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self._in_flight)
+            if waited > 0.01:
+                self.stats["throttled"] += 1
+
+    def release(self, outcome: str):
+        """
+        Free the slot and adapt the pacing
+
+        Args:
+            outcome: 'ok', 'error' or 'bot_check'
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if outcome == "ok":
+                self._rate_factor = min(self._rate_factor * 1.1, 1.0)
+                self._backoff_seconds = self._backoff_seconds / 2 if self._backoff_seconds >= 1.0 else 0.0
+            else:
+                self.stats["errors" if outcome == "error" else "bot_checks"] += 1
+                self._rate_factor = max(self._rate_factor / 2, MIN_RATE_FACTOR)
+                self._backoff_seconds = min(max(self._backoff_seconds * 2, 2.0), self.policy["backoff_max_seconds"])
+                self._paused_until = time.monotonic() + self._backoff_seconds
+                self._tokens = 0.0
+                logger.warning(f"⏸️ {self.host}: {outcome} - pause {self._backoff_seconds:.0f}s, "
+                               f"rate {self._effective_rate():.2f}/s", extra={"action": "SCHEDULER"})
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, float]:
+        """Metrics and current pacing state"""
+        with self._condition:
+            entry = dict(self.stats)
+            entry["in_flight"] = self._in_flight
+            entry["effective_rate"] = self._effective_rate()
+            entry["backoff_seconds"] = self._backoff_seconds
+            return entry
+
+    def _effective_rate(self) -> float:
+        return self.policy["rate_per_second"] * self._rate_factor
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last refill (caller holds _condition)"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self._tokens + elapsed * self._effective_rate(), self.policy["burst"])
+
+
+class SchedulerSlot:
+    """Outcome holder of one scheduled request"""
+
+    def __init__(self):
+        self.outcome = "ok"
+
+    def report_error(self):
+        """Eden answered with an error (HTTP 429/5xx, connection failure...)"""
+        self.outcome = "error"
+
+    def report_bot_check(self):
+        """Eden answered with an anti-bot interstitial"""
+        self.outcome = "bot_check"
+
+
+_hosts_lock = threading.Lock()
+_hosts: Dict[str, HostScheduler] = {}
+
+
+def _scheduler_get_host(url: str) -> HostScheduler:
+    """Scheduler of the host of a URL, created on first use"""
+    host = (urlsplit(url).hostname or "").lower()
+    with _hosts_lock:
+        scheduler = _hosts.get(host)
+        if scheduler is None:
+            scheduler = _hosts[host] = HostScheduler(host)
+        return scheduler
+
+
+@contextmanager
+def scheduler_slot(url: str) -> Iterator[SchedulerSlot]:
+    """
+    Run one Eden request within the host rate and concurrency limits.
+
+    The request counts as an error if the block raises; otherwise its outcome
+    is 'ok' unless reported with slot.report_error() / slot.report_bot_check().
+
+    Args:
+        url: Requested URL (selects the host)
+
+    Yields:
+        SchedulerSlot: Outcome holder
+    """
+    scheduler = _scheduler_get_host(url)
+    scheduler.acquire()
+    slot = SchedulerSlot()
+    try:
+        yield slot
+    except BaseException:
+        slot.report_error()
+        raise
+    finally:
+        scheduler.release(slot.outcome)
+
+
+def _scheduler_check_title(driver, slot: SchedulerSlot):
+    """Report an anti-bot interstitial shown in the browser"""
+    try:
+        title = driver.title or ""
+    except Exception:
+        title = ""
+    if any(marker in title for marker in BOT_CHECK_TITLES):
+        slot.report_bot_check()
+
+
+def scheduler_navigate(driver, url: str):
+    """
+    Navigate a Selenium driver through the scheduler (bot check detected on the page title)
+
+    Args:
+        driver: Selenium WebDriver
+        url: Page URL
+    """
+    with scheduler_slot(url) as slot:
+        driver.get(url)
+        _scheduler_check_title(driver, slot)
+
+
+def scheduler_refresh(driver):
+    """
+    Reload the current page of a Selenium driver through the scheduler
+
+    Args:
+        driver: Selenium WebDriver
+    """
+    with scheduler_slot(driver.current_url) as slot:
+        driver.refresh()
+        _scheduler_check_title(driver, slot)
+
+
+def scheduler_get_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Get the scheduler metrics per host.
+
+    Returns:
+        dict: {host: {requests, errors, bot_checks, throttled, total_wait_seconds,
+                      max_in_flight, in_flight, effective_rate, backoff_seconds}}
+    """
+    with _hosts_lock:
+        schedulers = list(_hosts.values())
+    return {scheduler.host: scheduler.snapshot() for scheduler in schedulers}
+
+
+def scheduler_reset_stats():
+    """Reset the metrics and reload the host policies from the configuration"""
+    with _hosts_lock:
+        _hosts.clear()
@@ -14,10 +14,21 @@ from pathlib import Path
 
 # Import new logging system
 from .debug_logging_manager import get_logger, log_with_action, LOGGER_EDEN
+from .eden_wait_policy import (
+    HERALD_NOT_AVAILABLE, wait_until_ready, wait_condition_all, wait_condition_any,
+    wait_condition_document_ready, wait_condition_text_present, wait_condition_count_stable
+)
+from .eden_http_client import http_check_herald_search
+from .eden_page_cache import page_cache_is_offline
+from .eden_request_scheduler import scheduler_navigate, scheduler_refresh
+from .eden_herald_session import herald_session_acquire, herald_session_release
 
 # Logger au niveau du module pour les fonctions qui ne sont pas dans la classe
 module_logger = get_logger(LOGGER_EDEN)
 
+# Adresse du site Eden (DAOC_EDEN_BASE_URL: serveur de remplacement local pour les benchmarks)
+EDEN_BASE_URL = os.environ.get("DAOC_EDEN_BASE_URL", "https://eden-daoc.net").rstrip("/")
+
 from bs4 import BeautifulSoup
 import json
 
@@ -76,6 +87,7 @@ class EdenScraper:
         """
         self.cookie_manager = cookie_manager
         self.driver = None
+        self.http_client = None  # EdenHttpClient, created on first fetch_html()
         self.logger = get_logger(LOGGER_EDEN)
         
     def initialize_driver(self, headless=True, minimize=True):
@@ -144,23 +156,14 @@ class EdenScraper:
                 return False
             
             # Step 1: Navigate to root domain
-            self.logger.info("🌐 Étape 1: Navigation vers https://eden-daoc.net/", extra={"action": "COOKIES"})
-            self.driver.get("https://eden-daoc.net/")
+            self.logger.info(f"🌐 Étape 1: Navigation vers {EDEN_BASE_URL}/", extra={"action": "COOKIES"})
+            scheduler_navigate(self.driver, f"{EDEN_BASE_URL}/")
             
             # Wait for page to be completely loaded (fixes first-load freeze)
-            import time
-            from selenium.webdriver.support.ui import WebDriverWait
-            try:
-                # Wait for document.readyState to be 'complete'
-                WebDriverWait(self.driver, 15).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
+            if wait_until_ready(self.driver, "eden_page", wait_condition_document_ready(), description="homepage"):
                 self.logger.debug("✅ Page complètement chargée (readyState=complete)", extra={"action": "COOKIES"})
-            except Exception as e:
-                self.logger.warning(f"⚠️ Timeout attente page load: {e}", extra={"action": "COOKIES"})
-            
-            # Additional safety wait for first load (Chrome profile initialization)
-            time.sleep(1)
+            else:
+                self.logger.warning("⚠️ Timeout attente page load", extra={"action": "COOKIES"})
             
             # Step 2: Add cookies
             self.logger.info(f"🍪 Étape 2: Ajout de {len(cookies_list)} cookies...", extra={"action": "COOKIES"})
@@ -183,13 +186,13 @@ class EdenScraper:
             
             # Step 3: Refresh homepage (PHASE 1: sleep removed)
             self.logger.info("🔄 Rafraîchissement de la page d'accueil pour activer la session...", extra={"action": "COOKIES"})
-            self.driver.refresh()
-            time.sleep(2)  # PHASE 1: Optimisé 3s → 2s
+            scheduler_refresh(self.driver)
+            wait_until_ready(self.driver, "eden_page", wait_condition_document_ready(), description="refresh")
             
             # Step 4: Navigate to Herald to test session
             self.logger.info("🔍 Étape 4: Navigation vers le Herald (test de session)...", extra={"action": "COOKIES"})
-            self.driver.get("https://eden-daoc.net/herald")
-            time.sleep(2)  # PHASE 1: Optimisé 4s → 2s
+            scheduler_navigate(self.driver, f"{EDEN_BASE_URL}/herald")
+            wait_until_ready(self.driver, "eden_page", wait_condition_document_ready(), description="herald")
             
             # Check if connected
             current_url = self.driver.current_url
@@ -254,15 +257,14 @@ class EdenScraper:
         
         try:
             # Construire l'URL du personnage
-            url = f"https://eden-daoc.net/herald?n=player&k={character_name}"
+            url = f"{EDEN_BASE_URL}/herald?n=player&k={character_name}"
             self.logger.info(f"Scraping du personnage: {character_name} ({url})", extra={"action": "SCRAPE"})
             
             # Charger la page
-            self.driver.get(url)
+            scheduler_navigate(self.driver, url)
             
-            # Attendre un peu que la page se charge
-            import time
-            time.sleep(2)
+            # Attendre que la page se charge
+            wait_until_ready(self.driver, "herald_profile", wait_condition_document_ready(), description=character_name)
             
             # Retrieve HTML
             html_content = self.driver.page_source
@@ -293,31 +295,36 @@ class EdenScraper:
         Returns:
             list: Liste des personnages trouvés
         """
-        if not self.driver:
-            if not self.initialize_driver():
+        # Mode hors ligne: pages lues uniquement dans le cache, pas de navigateur
+        if not page_cache_is_offline():
+            if not self.driver:
+                if not self.initialize_driver():
+                    return []
+            
+            if not self.load_cookies():
+                self.logger.error("❌ Impossible de charger les cookies", extra={"action": "COOKIES"})
                 return []
         
-        if not self.load_cookies():
-            self.logger.error("❌ Impossible de charger les cookies", extra={"action": "COOKIES"})
-            return []
-        
         try:
             # Construire l'URL de recherche
-            url = f"https://eden-daoc.net/herald?n=search&s={search_query}"
+            url = f"{EDEN_BASE_URL}/herald?n=search&s={search_query}"
             if realm:
                 url += f"&r={realm}"
             
             self.logger.info(f"Recherche: {search_query} (realm: {realm or 'tous'})", extra={"action": "SEARCH"})
             
-            # Charger la page
-            self.driver.get(url)
-            
-            # Attendre que la page se charge
-            import time
-            time.sleep(2)
-            
-            # Retrieve HTML
-            html_content = self.driver.page_source
+            # Chemin rapide HTTP, sinon navigateur
+            html_content = self.fetch_html(url, "herald_search", http_check_herald_search())
+            if html_content is None:
+                # Charger la page
+                scheduler_navigate(self.driver, url)
+                
+                # Attendre que la page se charge
+                wait_until_ready(self.driver, "herald_search", _herald_search_ready(), description=search_query)
+                
+                # Retrieve HTML
+                html_content = self.driver.page_source
+                self.store_page(url, "herald_search", html_content, http_check_herald_search())
             
             # Parser avec BeautifulSoup
             soup = BeautifulSoup(html_content, 'html.parser')
@@ -398,11 +405,11 @@ class EdenScraper:
                                 href = link.get('href')
                                 # Build complete URL if it's a relative link
                                 if href.startswith('?'):
-                                    char_url = f"https://eden-daoc.net/herald{href}"
+                                    char_url = f"{EDEN_BASE_URL}/herald{href}"
                                 elif href.startswith('/'):
-                                    char_url = f"https://eden-daoc.net{href}"
+                                    char_url = f"{EDEN_BASE_URL}{href}"
                                 elif not href.startswith('http'):
-                                    char_url = f"https://eden-daoc.net/herald?{href}"
+                                    char_url = f"{EDEN_BASE_URL}/herald?{href}"
                                 else:
                                     char_url = href
                             
@@ -417,8 +424,85 @@ class EdenScraper:
         
         return characters
     
+    def fetch_html(self, url, page_type, is_complete, use_cache=True):
+        """
+        Récupère une page depuis le cache disque, sinon par requête HTTP
+        (chemin rapide, sans navigateur)
+        
+        Le HTML retourné est le code source brut de la page: les parsers
+        BeautifulSoup existants s'appliquent tels quels.
+        
+        Args:
+            url: URL de la page
+            page_type: Type de page (items_search, item_details, herald_search...)
+            is_complete: Callable(html) -> bool, voir eden_http_client.http_check_*
+            use_cache: Si False, ignore le cache de pages (sauf mode hors ligne)
+            
+        Returns:
+            str: HTML de la page, ou None si le chemin Selenium doit être utilisé
+                 (désactivé, vérification anti-bot, contenu généré en JavaScript...)
+        
+        Raises:
+            PageCacheMiss: Page absente du cache en mode hors ligne
+        """
+        from .eden_http_client import EdenHttpClient, http_is_enabled
+        from .eden_page_cache import PageCacheMiss, page_cache_get, page_cache_is_offline, page_cache_put
+        
+        offline = page_cache_is_offline()
+        if use_cache or offline:
+            html = page_cache_get(url, page_type)
+            if html is not None:
+                return html
+        
+        if offline:
+            raise PageCacheMiss(f"Page absente du cache (mode hors ligne): {url}")
+        
+        if not http_is_enabled():
+            return None
+        
+        if self.http_client is None:
+            cookies = self.cookie_manager.get_cookies_for_scraper() if self.cookie_manager else None
+            if not cookies:
+                return None
+            
+            # Même user agent que le navigateur: les cookies anti-bot y sont liés
+            user_agent = None
+            if self.driver:
+                try:
+                    user_agent = self.driver.execute_script("return navigator.userAgent")
+                except Exception:
+                    pass
+            self.http_client = EdenHttpClient(cookies, user_agent)
+        
+        html = self.http_client.fetch(url, page_type, is_complete)
+        if html is not None:
+            page_cache_put(url, page_type, html)
+        return html
+    
+    def store_page(self, url, page_type, html, is_complete):
+        """
+        Enregistre dans le cache de pages une page chargée par le navigateur
+        
+        Args:
+            url: URL de la page
+            page_type: Type de page
+            html: Code source de la page
+            is_complete: Callable(html) -> bool, la page n'est gardée que si complète
+        """
+        from .eden_page_cache import page_cache_put
+        
+        try:
+            if html and is_complete(html):
+                page_cache_put(url, page_type, html)
+        except Exception as e:
+            self.logger.debug(f"Page non mise en cache: {e}", extra={"action": "CACHE"})
+    
     def close(self):
-        """Ferme le driver Selenium"""
+        """Ferme le driver Selenium (et les connexions HTTP)"""
+        if self.http_client:
+            self.http_client.close()
+            self.http_client = None
+        
         if self.driver:
             try:
                 self.driver.quit()
@@ -469,6 +553,21 @@ def search_characters(query, realm=None, cookie_manager=None):
         return scraper.scrape_search_results(query, realm)
 
 
+def _herald_search_ready():
+    """
+    Fonction interne: condition de fin de chargement d'une recherche Herald
+    (page chargée ET lignes de résultats stables, ou message "not available")
+    """
+    from selenium.webdriver.common.by import By
+    return wait_condition_all(
+        wait_condition_document_ready(),
+        wait_condition_any(
+            wait_condition_text_present(HERALD_NOT_AVAILABLE),
+            wait_condition_count_stable(By.CSS_SELECTOR, "table tr", empty_stable_seconds=2.0)
+        )
+    )
+
+
 def _connect_to_eden_herald(cookie_manager=None, headless=False):
     """
     Fonction interne: Établit la connexion au Herald Eden
@@ -490,6 +589,11 @@ def _connect_to_eden_herald(cookie_manager=None, headless=False):
         if cookie_manager is None:
             cookie_manager = CookieManager()
         
+        # Mode hors ligne: pages servies par le cache, aucun navigateur démarré
+        if page_cache_is_offline():
+            module_logger.info("Mode hors ligne - pages lues depuis le cache", extra={"action": "CONNECT"})
+            return EdenScraper(cookie_manager), ""
+        
         # ÉTAPE 2: Vérifier l'existence des cookies
         if not cookie_manager.cookie_exists():
             module_logger.error("Aucun cookie trouvé", extra={"action": "CONNECT"})
@@ -538,15 +642,13 @@ def search_herald_character(character_name, realm_filter=""):
     Returns:
         tuple: (success: bool, message: str, json_path: str)
     """
-    import time
-    
     scraper = None  # Initialize to None for safe cleanup in finally block
     
     try:
         module_logger.info(f"Début de la recherche Herald pour: {character_name}", extra={"action": "SEARCH"})
         
-        # ÉTAPES 1-6: Connexion au Herald (fonction centralisée)
-        scraper, error_message = _connect_to_eden_herald(headless=False)
+        # ÉTAPES 1-6: Connexion au Herald (session partagée, démarrée si nécessaire)
+        scraper, error_message = herald_session_acquire(headless=False)
         
         if not scraper:
             module_logger.error(f"Échec de la connexion: {error_message}", extra={"action": "SEARCH"})
@@ -556,20 +658,24 @@ def search_herald_character(character_name, realm_filter=""):
         
         # Construire l'URL de recherche avec le filtre de royaume
         if realm_filter:
-            search_url = f"https://eden-daoc.net/herald?n=search&r={realm_filter}&s={character_name}"
+            search_url = f"{EDEN_BASE_URL}/herald?n=search&r={realm_filter}&s={character_name}"
         else:
-            search_url = f"https://eden-daoc.net/herald?n=search&s={character_name}"
+            search_url = f"{EDEN_BASE_URL}/herald?n=search&s={character_name}"
         module_logger.info(f"Recherche Herald: {search_url}", extra={"action": "SEARCH"})
         
-        # Naviguer vers la page de recherche
-        scraper.driver.get(search_url)
-        
-        # Wait for page to fully load
-        module_logger.info("Attente du chargement de la page de recherche (5 secondes)...", extra={"action": "SEARCH"})
-        time.sleep(5)
-        
-        # Extraire le contenu HTML
-        page_source = scraper.driver.page_source
+        # Chemin rapide HTTP (mêmes cookies), sinon navigation dans le navigateur
+        page_source = scraper.fetch_html(search_url, "herald_search", http_check_herald_search())
+        if page_source is None:
+            # Naviguer vers la page de recherche
+            scheduler_navigate(scraper.driver, search_url)
+            
+            # Wait for page to fully load (results table stable or "not available" message)
+            module_logger.info("Attente du chargement de la page de recherche...", extra={"action": "SEARCH"})
+            wait_until_ready(scraper.driver, "herald_search", _herald_search_ready(), description=character_name)
+            
+            # Extraire le contenu HTML
+            page_source = scraper.driver.page_source
+            scraper.store_page(search_url, "herald_search", page_source, http_check_herald_search())
         soup = BeautifulSoup(page_source, 'html.parser')
         
         module_logger.info(f"Page chargée - Taille: {len(page_source)} caractères", extra={"action": "SEARCH"})
@@ -662,17 +768,17 @@ def search_herald_character(character_name, realm_filter=""):
                     href = result['col_1_links'][0]
                     # Build complete URL
                     if href.startswith('?'):
-                        url = f"https://eden-daoc.net/herald{href}"
+                        url = f"{EDEN_BASE_URL}/herald{href}"
                     elif href.startswith('/'):
-                        url = f"https://eden-daoc.net{href}"
+                        url = f"{EDEN_BASE_URL}{href}"
                     elif not href.startswith('http'):
-                        url = f"https://eden-daoc.net/herald?{href}"
+                        url = f"{EDEN_BASE_URL}/herald?{href}"
                     else:
                         url = href
                 else:
                     # Fallback to built URL if no link found
                     clean_name = name.split()[0]
-                    url = f"https://eden-daoc.net/herald?n=player&k={clean_name}"
+                    url = f"{EDEN_BASE_URL}/herald?n=player&k={clean_name}"
                 
                 if name and char_class:
                     clean_name = name.split()[0]
@@ -720,13 +826,13 @@ def search_herald_character(character_name, realm_filter=""):
         return False, f"Erreur: {str(e)}", ""
     
     finally:
-        # Always close the scraper/driver properly to prevent crashes
+        # Always give the session back (kept warm for the next Herald operation)
         if scraper:
             try:
-                scraper.close()
-                module_logger.debug("Scraper fermé proprement", extra={"action": "CLEANUP"})
+                herald_session_release(scraper)
+                module_logger.debug("Session Herald libérée", extra={"action": "CLEANUP"})
             except Exception as e:
-                module_logger.warning(f"Erreur lors de la fermeture du scraper: {e}", extra={"action": "CLEANUP"})
+                module_logger.warning(f"Erreur lors de la libération de la session: {e}", extra={"action": "CLEANUP"})
 
 
 def scrape_character_from_url(character_url, cookie_manager):
@@ -741,7 +847,6 @@ def scrape_character_from_url(character_url, cookie_manager):
     Returns:
         tuple: (success, data_dict, error_message)
     """
-    import time
     scraper = None
     
     try:
@@ -758,8 +863,8 @@ def scrape_character_from_url(character_url, cookie_manager):
         
         module_logger.info(f"Mise à jour du personnage: {character_name} depuis URL: {character_url}", extra={"action": "UPDATE"})
         
-        # ÉTAPES 2-7: Connexion au Herald (fonction centralisée)
-        scraper, error_message = _connect_to_eden_herald(cookie_manager=cookie_manager, headless=False)
+        # ÉTAPES 2-7: Connexion au Herald (session partagée, démarrée si nécessaire)
+        scraper, error_message = herald_session_acquire(cookie_manager=cookie_manager, headless=False)
         
         if not scraper:
             module_logger.error(f"Échec de la connexion: {error_message}", extra={"action": "UPDATE"})
@@ -768,15 +873,15 @@ def scrape_character_from_url(character_url, cookie_manager):
         module_logger.info("Connexion établie - Début de la mise à jour", extra={"action": "UPDATE"})
         
         # ÉTAPE 8: Construire l'URL de recherche
-        search_url = f"https://eden-daoc.net/herald?n=search&s={character_name}"
+        search_url = f"{EDEN_BASE_URL}/herald?n=search&s={character_name}"
         module_logger.info(f"Recherche Herald: {search_url}", extra={"action": "UPDATE"})
         
         # ÉTAPE 9: Naviguer vers la page de recherche
-        scraper.driver.get(search_url)
+        scheduler_navigate(scraper.driver, search_url)
         
         # ÉTAPE 10: Attendre le chargement de la page
-        module_logger.info("Attente du chargement de la page (5 secondes)...", extra={"action": "UPDATE"})
-        time.sleep(5)
+        module_logger.info("Attente du chargement de la page...", extra={"action": "UPDATE"})
+        wait_until_ready(scraper.driver, "herald_search", _herald_search_ready(), description=character_name)
         
         # ÉTAPE 11: Extraire le contenu HTML
         page_source = scraper.driver.page_source
@@ -839,16 +944,16 @@ def scrape_character_from_url(character_url, cookie_manager):
                 if 'col_1_links' in result and result['col_1_links']:
                     href = result['col_1_links'][0]
                     if href.startswith('?'):
-                        url = f"https://eden-daoc.net/herald{href}"
+                        url = f"{EDEN_BASE_URL}/herald{href}"
                     elif href.startswith('/'):
-                        url = f"https://eden-daoc.net{href}"
+                        url = f"{EDEN_BASE_URL}{href}"
                     elif not href.startswith('http'):
-                        url = f"https://eden-daoc.net/herald?{href}"
+                        url = f"{EDEN_BASE_URL}/herald?{href}"
                     else:
                         url = href
                 else:
                     clean_name = name.split()[0]
-                    url = f"https://eden-daoc.net/herald?n=player&k={clean_name}"
+                    url = f"{EDEN_BASE_URL}/herald?n=player&k={clean_name}"
                 
                 if name and char_class:
                     clean_name = name.split()[0]
@@ -896,13 +1001,13 @@ def scrape_character_from_url(character_url, cookie_manager):
         return False, None, f"Erreur: {str(e)}"
     
     finally:
-        # Toujours fermer le scraper proprement
+        # Toujours libérer la session (gardée active pour la prochaine opération)
         if scraper:
             try:
-                scraper.close()
-                module_logger.debug("Scraper fermé proprement", extra={"action": "CLEANUP"})
+                herald_session_release(scraper)
+                module_logger.debug("Session Herald libérée", extra={"action": "CLEANUP"})
             except Exception as e:
-                module_logger.warning(f"Erreur lors de la fermeture du scraper: {e}", extra={"action": "CLEANUP"})
+                module_logger.warning(f"Erreur lors de la libération de la session: {e}", extra={"action": "CLEANUP"})
 
 
 def _normalize_herald_data(char_data):
@@ -0,0 +1,188 @@
+"""
+Eden Session Pool - N authenticated browser sessions sharing a work queue.
+
+Mass item scraping (ImportWorker, SuperAdminTools.refresh_all_items) used to
+drive a single Selenium session, one item at a time. The pool opens N sessions
+(the first one is the shared Herald session when available, the others come
+from _connect_to_eden_herald; each one loads the cookies once), then one
+thread per session pulls item names from a shared queue.
+
+Workers never touch shared results: every outcome is sent back as an event
+and the caller, consuming run(), is the single writer that merges results
+(merged_items, DB, statistics). Events are:
+
+    ("start", worker_id, item, None)     worker picked up an item
+    ("result", worker_id, item, result)  task returned
+    ("error", worker_id, item, exc)      task raised
+    ("done", worker_id, None, None)      worker has no more work
+
+Worker ids start at 1. The pool size comes from armory.import_sessions.
+ImportWorker only opens the sessions here: its worker threads belong to
+ImportPipeline (separate search and details stages).
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+
+logger = get_logger(LOGGER_EDEN)
+
+# Upper bound of parallel browser sessions (each one is a full browser)
+MAX_SESSIONS = 8
+
+
+def pool_get_configured_size() -> int:
+    """
+    Get the configured number of sessions (armory.import_sessions)
+
+    Returns:
+        int: Pool size clamped to [1, MAX_SESSIONS]
+    """
+    try:
+        from Functions.config_manager import config
+        size = int(config.get("armory.import_sessions", 1) or 1)
+    except Exception:
+        size = 1
+    return max(1, min(size, MAX_SESSIONS))
+
+
+class EdenSessionPool:
+    """Pool of authenticated EdenScraper sessions consuming a shared work queue"""
+
+    def __init__(self, size: Optional[int] = None, headless: bool = False):
+        """
+        Args:
+            size: Number of sessions (None = armory.import_sessions)
+            headless: Browser display mode passed to _connect_to_eden_herald
+        """
+        self.size = max(1, min(size, MAX_SESSIONS)) if size else pool_get_configured_size()
+        self.headless = headless
+        self.sessions: List[Any] = []
+        self._stop_event = threading.Event()
+
+    def open(self, on_progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+        """
+        Open the sessions (sequentially: driver setup is not safe to run concurrently).
+
+        A session that fails to connect is skipped; the pool only fails when no
+        session at all could be opened.
+
+        Args:
+            on_progress: Optional callback(opened_count, requested_size) after each session
+
+        Returns:
+            tuple: (success: bool, error_message: str)
+        """
+        from Functions.cookie_manager import CookieManager
+        from Functions.eden_herald_session import herald_session_acquire
+        from Functions.eden_scraper import _connect_to_eden_herald
+
+        cookie_manager = CookieManager()
+        error_message = ""
+
+        for index in range(self.size):
+            if index == 0:
+                scraper, error_message = herald_session_acquire(cookie_manager=cookie_manager,
+                                                                headless=self.headless)
+            else:
+                scraper, error_message = _connect_to_eden_herald(cookie_manager=cookie_manager,
+                                                                 headless=self.headless)
+            if scraper:
+                self.sessions.append(scraper)
+            else:
+                logger.warning(f"Session {index + 1}/{self.size} not opened: {error_message}",
+                               extra={"action": "POOL"})
+                if not self.sessions:
+                    # The first session failed: cookies or browser unusable, don't insist
+                    break
+            if on_progress:
+                on_progress(len(self.sessions), self.size)
+
+        if not self.sessions:
+            return False, error_message
+
+        logger.info(f"Session pool ready: {len(self.sessions)}/{self.size} session(s)",
+                    extra={"action": "POOL"})
+        return True, ""
+
+    def run(self, items: Iterable[Any], task: Callable[[int, Any, Any], Any]) -> Iterator[Tuple[str, int, Any, Any]]:
+        """
+        Distribute items over the sessions and yield worker events.
+
+        Must be consumed entirely (or stop() called): the generator returns once
+        every worker has sent its "done" event.
+
+        Args:
+            items: Work items (e.g. item names)
+            task: Callable(worker_id, eden_scraper, item) executed in the worker thread
+
+        Yields:
+            tuple: (event, worker_id, item, payload) - see module docstring
+        """
+        if not self.sessions:
+            raise RuntimeError("Session pool is not open")
+
+        self._stop_event.clear()
+        work_queue = queue.Queue()
+        for item in items:
+            work_queue.put(item)
+        event_queue = queue.Queue()
+
+        def worker(worker_id, scraper):
+            try:
+                while not self._stop_event.is_set():
+                    try:
+                        item = work_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    event_queue.put(("start", worker_id, item, None))
+                    try:
+                        event_queue.put(("result", worker_id, item, task(worker_id, scraper, item)))
+                    except Exception as e:
+                        logger.error(f"Worker {worker_id}: error on {item}: {e}", extra={"action": "POOL"})
+                        event_queue.put(("error", worker_id, item, e))
+            finally:
+                event_queue.put(("done", worker_id, None, None))
+
+        threads = []
+        for worker_id, scraper in enumerate(self.sessions, 1):
+            thread = threading.Thread(target=worker, args=(worker_id, scraper),
+                                      name=f"EdenSessionPool-{worker_id}", daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        running = len(threads)
+        while running:
+            event = event_queue.get()
+            if event[0] == "done":
+                running -= 1
+            yield event
+
+        for thread in threads:
+            thread.join()
+
+    def stop(self):
+        """Ask the workers to stop after their current item"""
+        self._stop_event.set()
+
+    def close(self, discard: bool = False):
+        """
+        Close every session (the shared Herald session is released, kept warm)
+
+        Args:
+            discard: If True, close the shared Herald session too (forced cleanup)
+        """
+        from Functions.eden_herald_session import herald_session_release
+
+        self.stop()
+        sessions, self.sessions = self.sessions, []
+        for scraper in sessions:
+            try:
+                herald_session_release(scraper, discard=discard)
+            except Exception as e:
+                logger.warning(f"Error closing pooled session: {e}", extra={"action": "POOL"})
+
+    def __len__(self) -> int:
+        return len(self.sessions)
@@ -0,0 +1,306 @@
+"""
+Eden Wait Policy - Condition-based page readiness for Selenium scrapers.
+
+Replaces fixed time.sleep() calls after navigation with polling of a concrete
+DOM condition (element present, row count stable across polls, document
+ready...). Each page type has its own timeout and polling backoff, and the
+actual time spent waiting is logged and aggregated per page type so the
+policies can be tuned.
+
+Naming Convention: module functions use the 'wait_*' prefix.
+
+Functions:
+  - wait_until_ready()                  Poll a condition with the page type policy
+  - wait_get_policy()                   Effective policy for a page type
+  - wait_get_stats() / wait_reset_stats()  Per page type wait statistics
+  - wait_condition_*()                  Condition factories (callable(driver) -> bool)
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+
+logger = get_logger(LOGGER_EDEN)
+
+# ============================================================================
+# POLICIES
+# ============================================================================
+
+# Per page type policy:
+#   timeout:       maximum wait in seconds (overridable via system.wait_timeouts)
+#   poll_interval: first delay between two polls
+#   backoff:       multiplier applied to the delay after each unsuccessful poll
+#   max_interval:  upper bound of the delay between two polls
+WAIT_POLICIES = {
+    "eden_page":      {"timeout": 15.0, "poll_interval": 0.1, "backoff": 1.5, "max_interval": 1.0},
+    "herald_search":  {"timeout": 20.0, "poll_interval": 0.2, "backoff": 1.5, "max_interval": 1.0},
+    "herald_profile": {"timeout": 20.0, "poll_interval": 0.2, "backoff": 1.5, "max_interval": 1.0},
+    "items_search":   {"timeout": 25.0, "poll_interval": 0.25, "backoff": 1.5, "max_interval": 1.5},
+    "item_details":   {"timeout": 15.0, "poll_interval": 0.2, "backoff": 1.5, "max_interval": 1.0},
+}
+
+DEFAULT_WAIT_POLICY = {"timeout": 15.0, "poll_interval": 0.2, "backoff": 1.5, "max_interval": 1.0}
+
+# Message displayed by the Herald when the session is not authenticated
+HERALD_NOT_AVAILABLE = 'The requested page "herald" is not available.'
+
+# Longest sleep between two checks of a stop callback (wait_until_ready stop=)
+STOP_CHECK_SECONDS = 0.1
+
+_stats_lock = threading.Lock()
+_wait_stats: Dict[str, Dict[str, float]] = {}
+
+
+def wait_get_policy(page_type: str) -> Dict[str, float]:
+    """
+    Get the effective wait policy for a page type.
+
+    The timeout can be tuned per page type in the configuration
+    (system.wait_timeouts = {"items_search": 30, ...}).
+
+    Args:
+        page_type: Page type key (see WAIT_POLICIES)
+
+    Returns:
+        dict: {timeout, poll_interval, backoff, max_interval}
+    """
+    policy = dict(WAIT_POLICIES.get(page_type, DEFAULT_WAIT_POLICY))
+    try:
+        from Functions.config_manager import config
+        overrides = config.get("system.wait_timeouts", {}) or {}
+        if page_type in overrides:
+            policy["timeout"] = float(overrides[page_type])
+    except Exception:
+        pass
+    return policy
+
+
+# ============================================================================
+# WAIT ENGINE
+# ============================================================================
+
+def wait_until_ready(driver, page_type: str, condition: Callable[[Any], Any], description: str = "",
+                     stop: Optional[Callable[[], bool]] = None) -> bool:
+    """
+    Poll a readiness condition until it is met or the page type timeout expires.
+
+    Exceptions raised by the condition (element not yet attached, stale
+    element...) count as "not ready yet".
+
+    Args:
+        driver: Selenium WebDriver
+        page_type: Page type key selecting the policy (see WAIT_POLICIES)
+        condition: Callable(driver) returning a truthy value when the page is ready
+        description: Optional label for logs
+        stop: Optional callable returning True to abandon the wait (checked at
+              least every STOP_CHECK_SECONDS, e.g. a thread stop request)
+
+    Returns:
+        bool: True if the condition was met, False on timeout or stop
+    """
+    policy = wait_get_policy(page_type)
+    interval = policy["poll_interval"]
+    start = time.monotonic()
+    deadline = start + policy["timeout"]
+    polls = 0
+    ready = False
+    label = f" ({description})" if description else ""
+
+    while True:
+        polls += 1
+        try:
+            ready = bool(condition(driver))
+        except Exception:
+            ready = False
+        if ready:
+            break
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if stop is None:
+            time.sleep(min(interval, remaining))
+        elif _wait_sleep_or_stop(min(interval, remaining), stop):
+            logger.debug(f"⏱️ Wait {page_type}{label}: stopped after {time.monotonic() - start:.2f}s",
+                         extra={"action": "WAIT"})
+            return False
+        interval = min(interval * policy["backoff"], policy["max_interval"])
+
+    elapsed = time.monotonic() - start
+    _wait_record(page_type, elapsed, ready)
+
+    if ready:
+        logger.debug(f"⏱️ Wait {page_type}{label}: ready in {elapsed:.2f}s ({polls} poll(s))",
+                     extra={"action": "WAIT"})
+    else:
+        logger.warning(f"⏱️ Wait {page_type}{label}: timeout after {elapsed:.2f}s ({polls} poll(s))",
+                       extra={"action": "WAIT"})
+    return ready
+
+
+def _wait_sleep_or_stop(seconds: float, stop: Callable[[], bool]) -> bool:
+    """Sleep in short slices; True as soon as stop() returns True"""
+    end = time.monotonic() + seconds
+    while True:
+        if stop():
+            return True
+        left = end - time.monotonic()
+        if left <= 0:
+            return False
+        time.sleep(min(left, STOP_CHECK_SECONDS))
+
+
+def _wait_record(page_type: str, elapsed: float, ready: bool):
+    """Aggregate one wait into the per page type statistics"""
+    with _stats_lock:
+        stats = _wait_stats.setdefault(page_type, {
+            "count": 0, "timeouts": 0, "total_seconds": 0.0, "max_seconds": 0.0
+        })
+        stats["count"] += 1
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        if not ready:
+            stats["timeouts"] += 1
+
+
+def wait_get_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Get the wait statistics aggregated per page type.
+
+    Returns:
+        dict: {page_type: {count, timeouts, total_seconds, max_seconds, avg_seconds}}
+    """
+    with _stats_lock:
+        result = {}
+        for page_type, stats in _wait_stats.items():
+            entry = dict(stats)
+            entry["avg_seconds"] = stats["total_seconds"] / stats["count"] if stats["count"] else 0.0
+            result[page_type] = entry
+        return result
+
+
+def wait_reset_stats():
+    """Reset the wait statistics"""
+    with _stats_lock:
+        _wait_stats.clear()
+
+
+# ============================================================================
+# CONDITIONS
+# ============================================================================
+
+def wait_condition_document_ready() -> Callable[[Any], bool]:
+    """
+    Returns:
+        Condition met when document.readyState is 'complete'
+    """
+    return lambda driver: driver.execute_script("return document.readyState") == "complete"
+
+
+def wait_condition_element_present(by: str, value: str) -> Callable[[Any], bool]:
+    """
+    Args:
+        by: Selenium locator strategy (By.ID, By.CLASS_NAME, By.CSS_SELECTOR...)
+        value: Locator value
+
+    Returns:
+        Condition met when at least one matching element exists
+    """
+    return lambda driver: len(driver.find_elements(by, value)) > 0
+
+
+def wait_condition_text_present(text: str) -> Callable[[Any], bool]:
+    """
+    Args:
+        text: Text to look for in the page source
+
+    Returns:
+        Condition met when the page source contains the text
+    """
+    return lambda driver: text in driver.page_source
+
+
+def wait_condition_count_stable(by: str, value: str, stable_polls: int = 2, min_count: int = 0,
+                                empty_stable_seconds: float = 0.0) -> Callable[[Any], bool]:
+    """
+    Condition met when the number of matching elements stops changing.
+
+    Used for tables populated by JavaScript: the count must be identical on
+    'stable_polls' consecutive polls (and at least 'min_count'). An empty
+    result may just mean "not populated yet", so a count of 0 must also stay
+    unchanged for 'empty_stable_seconds'.
+
+    Args:
+        by: Selenium locator strategy
+        value: Locator value
+        stable_polls: Number of consecutive identical counts required
+        min_count: Minimum number of elements
+        empty_stable_seconds: Minimum time a count of 0 must stay unchanged
+
+    Returns:
+        Stateful condition (create one per wait)
+    """
+    state = {"last": None, "repeats": 0, "since": 0.0}
+
+    def condition(driver):
+        count = len(driver.find_elements(by, value))
+        if count == state["last"]:
+            state["repeats"] += 1
+        else:
+            state["last"] = count
+            state["repeats"] = 1
+            state["since"] = time.monotonic()
+        if count < min_count or state["repeats"] < stable_polls:
+            return False
+        if count == 0:
+            return time.monotonic() - state["since"] >= empty_stable_seconds
+        return True
+
+    return condition
+
+
+def wait_condition_stale(element) -> Callable[[Any], bool]:
+    """
+    Args:
+        element: WebElement from the previous page state (None = already stale)
+
+    Returns:
+        Condition met when the element is detached from the DOM
+    """
+    def condition(driver):
+        if element is None:
+            return True
+        try:
+            element.is_enabled()
+            return False
+        except Exception:
+            return True
+
+    return condition
+
+
+def wait_condition_all(*conditions: Callable[[Any], Any]) -> Callable[[Any], bool]:
+    """
+    Returns:
+        Condition met when every condition is met (evaluated in order, short-circuit)
+    """
+    return lambda driver: all(condition(driver) for condition in conditions)
+
+
+def wait_condition_any(*conditions: Callable[[Any], Any]) -> Callable[[Any], bool]:
+    """
+    Returns:
+        Condition met when at least one condition is met (evaluated in order)
+    """
+    def condition(driver):
+        for candidate in conditions:
+            try:
+                if candidate(driver):
+                    return True
+            except Exception:
+                continue
+        return False
+
+    return condition
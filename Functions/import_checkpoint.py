@@ -0,0 +1,172 @@
+"""
+Import Checkpoint
+Sidecar file making a mass import (ImportWorker) restartable.
+
+The items database is only written once the whole import is done, so a crash
+or a closed monitor used to lose every variant scraped so far. The worker now
+records its progress next to the target database, in
+"<database>.import_checkpoint.json":
+
+  - params: import options (template files, realm, merge, duplicates...)
+  - processed: item names already handled (skipped when resuming)
+  - items: entries added or changed by this import ({composite_key: item_data})
+  - filtered_items: filtered items collected for the review dialog
+  - counters: added / variants / failed / duplicates
+
+Only the entries touched by the import are stored: on resume they are laid
+over the database loaded as usual, so a checkpoint stays small even for a
+large database. The file is written atomically (temporary file, then
+replace) and removed once the database has been saved.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_SUFFIX = ".import_checkpoint.json"
+
+# A checkpoint is written after this many processed items or this many seconds
+CHECKPOINT_EVERY_ITEMS = 10
+CHECKPOINT_EVERY_SECONDS = 60.0
+
+
+class ImportCheckpoint:
+    """Progress of a mass import, saved next to its target database"""
+
+    def __init__(self, source_db_path, params: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            source_db_path: Items database written by the import
+            params: Import options to store (resume uses them to rebuild the worker)
+        """
+        self.path = get_checkpoint_path(source_db_path)
+        self.params = dict(params or {})
+        self.processed: List[str] = []
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self.filtered_items: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {"added": 0, "variants": 0, "failed": 0, "duplicates": 0}
+        self.started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pending = 0
+        self._last_save = time.monotonic()
+
+    @classmethod
+    def load(cls, source_db_path) -> Optional["ImportCheckpoint"]:
+        """
+        Load the checkpoint of a database
+
+        Args:
+            source_db_path: Items database written by the import
+
+        Returns:
+            ImportCheckpoint: Saved progress, or None if there is none (or it is unreadable)
+        """
+        path = get_checkpoint_path(source_db_path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CHECKPOINT_VERSION:
+                logging.warning(f"Import checkpoint ignored (version {data.get('version')}): {path}")
+                return None
+        except Exception as e:
+            logging.warning(f"Import checkpoint unreadable, ignored: {path} ({e})")
+            return None
+
+        checkpoint = cls(source_db_path, data.get("params"))
+        checkpoint.processed = list(data.get("processed", []))
+        checkpoint.items = dict(data.get("items", {}))
+        checkpoint.filtered_items = list(data.get("filtered_items", []))
+        checkpoint.counters.update(data.get("counters", {}))
+        checkpoint.started = data.get("started", checkpoint.started)
+        return checkpoint
+
+    def get_processed_names(self) -> set:
+        """Lowercase names of the items already handled"""
+        return {name.lower() for name in self.processed}
+
+    def record(self, item_name: str, merged_items: Dict[str, Dict[str, Any]], changed_keys: Iterable[str],
+               filtered_items: List[Dict[str, Any]], counters: Dict[str, int]) -> bool:
+        """
+        Record one processed item, saving the checkpoint when it is due
+
+        Args:
+            item_name: Item just handled
+            merged_items: Items of the import ({composite_key: item_data})
+            changed_keys: Composite keys added or changed for this item
+            filtered_items: All filtered items collected so far
+            counters: added / variants / failed / duplicates counts
+
+        Returns:
+            bool: True if the checkpoint was written
+        """
+        self.processed.append(item_name)
+        for key in changed_keys:
+            if key in merged_items:
+                self.items[key] = merged_items[key]
+        self.filtered_items = filtered_items
+        self.counters.update(counters)
+
+        self._pending += 1
+        if self._pending >= CHECKPOINT_EVERY_ITEMS or time.monotonic() - self._last_save >= CHECKPOINT_EVERY_SECONDS:
+            return self.save()
+        return False
+
+    def save(self) -> bool:
+        """
+        Write the checkpoint (atomic replace)
+
+        Returns:
+            bool: True if written
+        """
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "started": self.started,
+            "updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "params": self.params,
+            "processed": self.processed,
+            "items": self.items,
+            "filtered_items": self.filtered_items,
+            "counters": self.counters,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.path)
+        except Exception as e:
+            logging.error(f"Import checkpoint not saved: {e}")
+            return False
+
+        self._pending = 0
+        self._last_save = time.monotonic()
+        logging.debug(f"Import checkpoint saved: {len(self.processed)} item(s) processed, "
+                      f"{len(self.items)} entrie(s)")
+        return True
+
+    def remove(self):
+        """Delete the checkpoint file (import completed)"""
+        try:
+            self.path.unlink(missing_ok=True)
+        except Exception as e:
+            logging.warning(f"Import checkpoint not removed: {self.path} ({e})")
+
+
+def get_checkpoint_path(source_db_path) -> Path:
+    """
+    Get the checkpoint file of a database
+
+    Args:
+        source_db_path: Items database written by the import
+
+    Returns:
+        Path: "<database>.import_checkpoint.json"
+    """
+    source_db_path = Path(source_db_path)
+    return source_db_path.with_name(source_db_path.name + CHECKPOINT_SUFFIX)
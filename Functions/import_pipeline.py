@@ -0,0 +1,340 @@
+"""
+Import Pipeline - Staged producer/consumer flow of a mass import.
+
+ImportWorker used to parse every template file, then hand whole items
+(search + all variant details) to the Eden sessions, then merge them, one
+phase after the other. The pipeline splits the work into stages connected by
+bounded queues, so template parsing and merging overlap the browser waits:
+
+    parse    (1 thread)         template files -> item names
+    search   (Eden sessions)    item name -> variants          search queue
+    details  (Eden sessions)    variant -> item details        details queue
+    merge    (caller thread)    events -> merged items / DB    event queue
+
+Every Eden session runs one worker thread taking details tasks first (they
+complete items already in progress), then search tasks. The caller consuming
+events() is the single writer: it decides which names to search and which
+variants need details (submit_search / submit_details) and merges the
+results. Tasks wait in a local backlog until their queue has room, so the
+caller never blocks on a full queue.
+
+Events (tuples):
+
+    ("parsed_file", file_name, item_count, error)    template file parsed
+    ("parsed", item_name, source_file, None)         new unique item name
+    ("parse_done", None, None, None)                 every file parsed
+    ("start", worker_id, task, None)                 session picked a task
+    ("idle", worker_id, None, None)                  session waits for work
+    ("searched", worker_id, task, result)            search task returned
+    ("details", worker_id, task, result)             details task returned
+    ("error", worker_id, task, exc)                  task raised
+
+task is the object given to submit_search / submit_details.
+
+Each stage reports its throughput and queue depth (get_stage_stats) for the
+mass import monitor.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from Functions.debug_logging_manager import get_logger, LOGGER_EDEN
+
+logger = get_logger(LOGGER_EDEN)
+
+# Stage queues bounds (search/details queues: per session)
+TASKS_PER_SESSION = 2
+EVENT_QUEUE_SIZE = 256
+
+# Worker poll interval when both task queues are empty
+WORKER_POLL_SECONDS = 0.2
+
+STAGES = ("parse", "search", "details", "merge")
+
+
+class PipelineStage:
+    """Throughput and queue depth of one pipeline stage"""
+
+    def __init__(self, name: str, maxsize: int = 0):
+        self.name = name
+        self.queue = queue.Queue(maxsize=maxsize) if maxsize else None
+        self.backlog = deque()  # Tasks waiting for room in the queue (caller thread only)
+        self.processed = 0
+        self.busy_seconds = 0.0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, elapsed: float, count: int = 1):
+        """Count processed units that took elapsed seconds"""
+        with self._lock:
+            self.processed += count
+            self.busy_seconds += elapsed
+
+    def snapshot(self, workers: int = 1) -> Dict[str, float]:
+        """
+        Get the stage metrics
+
+        Args:
+            workers: Threads running the stage (busy ratio denominator)
+
+        Returns:
+            dict: {processed, per_minute, queue_depth, busy_ratio}
+        """
+        with self._lock:
+            processed, busy_seconds = self.processed, self.busy_seconds
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        depth = len(self.backlog) + (self.queue.qsize() if self.queue else 0)
+        return {
+            "processed": processed,
+            "per_minute": processed / elapsed * 60,
+            "queue_depth": depth,
+            "busy_ratio": min(busy_seconds / (elapsed * max(workers, 1)), 1.0),
+        }
+
+
+class ImportPipeline:
+    """Parse / search / details / merge stages of a mass import"""
+
+    def __init__(self, session_count: int):
+        """
+        Args:
+            session_count: Number of Eden sessions (search/details worker threads)
+        """
+        self.session_count = max(1, session_count)
+        queue_size = self.session_count * TASKS_PER_SESSION
+        self.stages = {
+            "parse": PipelineStage("parse"),
+            "search": PipelineStage("search", queue_size),
+            "details": PipelineStage("details", queue_size),
+            "merge": PipelineStage("merge", EVENT_QUEUE_SIZE),
+        }
+        self._events = self.stages["merge"].queue
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._parse_done = threading.Event()
+        self._parse_remaining = 0
+        self._submitted = 0  # Tasks given by the caller (caller thread only)
+        self._completed = 0  # Tasks whose result event was consumed (caller thread only)
+        self._in_flight = 0  # Tasks taken by a session and not reported yet
+        self._in_flight_lock = threading.Lock()
+
+    # --- Stage: parse ---
+
+    def start_parser(self, file_paths: List[Any], parse_func: Callable[[Any], List[str]]):
+        """
+        Parse the template files in a background thread
+
+        Args:
+            file_paths: Template files
+            parse_func: Callable(file_path) returning the item names of a file
+        """
+        from pathlib import Path
+
+        self._parse_remaining = len(file_paths)
+
+        def parser():
+            seen = set()
+            try:
+                for file_path in file_paths:
+                    if self._stop_event.is_set():
+                        break
+                    start = time.monotonic()
+                    file_name = Path(file_path).name
+                    try:
+                        item_names = parse_func(file_path) or []
+                    except Exception as e:
+                        self._put_event(("parsed_file", file_name, 0, e))
+                        continue
+                    finally:
+                        self._parse_remaining -= 1
+
+                    self._put_event(("parsed_file", file_name, len(item_names), None))
+                    for item_name in item_names:
+                        if not item_name or not item_name.strip():
+                            continue
+                        item_name = item_name.strip()
+                        if item_name.lower() not in seen:
+                            seen.add(item_name.lower())
+                            self._put_event(("parsed", item_name, file_name, None))
+                    self.stages["parse"].record(time.monotonic() - start)
+            finally:
+                # Event first: the end of the pipeline is only checked on an empty event queue
+                self._put_event(("parse_done", None, None, None))
+                self._parse_done.set()
+
+        thread = threading.Thread(target=parser, name="ImportPipeline-parse", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    # --- Stages: search / details (Eden sessions) ---
+
+    def start_workers(self, search_func: Callable[[int, Any], Any], details_func: Callable[[int, Any], Any],
+                      worker_count: Optional[int] = None):
+        """
+        Start one worker thread per Eden session
+
+        Args:
+            search_func: Callable(worker_id, task) run for submit_search tasks
+            details_func: Callable(worker_id, task) run for submit_details tasks
+            worker_count: Sessions actually opened (default: session_count)
+        """
+        if worker_count:
+            self.session_count = worker_count
+
+        def worker(worker_id):
+            search_queue = self.stages["search"].queue
+            details_queue = self.stages["details"].queue
+            idle = True
+            while not self._stop_event.is_set():
+                # Details first: they complete items already in progress
+                try:
+                    stage, kind, func, task = "details", "details", details_func, details_queue.get_nowait()
+                except queue.Empty:
+                    try:
+                        task = search_queue.get(timeout=WORKER_POLL_SECONDS)
+                        stage, kind, func = "search", "searched", search_func
+                    except queue.Empty:
+                        if not idle:
+                            idle = True
+                            self._put_event(("idle", worker_id, None, None))
+                        continue
+
+                with self._in_flight_lock:
+                    self._in_flight += 1
+                try:
+                    idle = False
+                    self._put_event(("start", worker_id, task, None))
+                    start = time.monotonic()
+                    try:
+                        event = (kind, worker_id, task, func(worker_id, task))
+                    except Exception as e:
+                        logger.error(f"Import worker {worker_id}: error on {task}: {e}", extra={"action": "POOL"})
+                        event = ("error", worker_id, task, e)
+                    self.stages[stage].record(time.monotonic() - start)
+                    self._put_event(event)
+                finally:
+                    with self._in_flight_lock:
+                        self._in_flight -= 1
+
+        for worker_id in range(1, self.session_count + 1):
+            thread = threading.Thread(target=worker, args=(worker_id,),
+                                      name=f"ImportPipeline-session-{worker_id}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit_search(self, task: Any):
+        """Queue an item name search (caller thread)"""
+        self._submit("search", task)
+
+    def submit_details(self, task: Any):
+        """Queue a variant details fetch (caller thread)"""
+        self._submit("details", task)
+
+    # --- Stage: merge (caller thread) ---
+
+    def events(self) -> Iterator[Tuple[str, Any, Any, Any]]:
+        """
+        Yield the pipeline events until every file is parsed and every submitted task is done.
+
+        Tasks submitted while handling an event are taken into account before
+        the end is checked. After stop(), ends once no task is in progress.
+
+        Yields:
+            tuple: (event, a, b, c) - see module docstring
+        """
+        while True:
+            self._pump()
+            if self._is_finished():
+                return
+            try:
+                event = self._events.get(timeout=WORKER_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+            start = time.monotonic()
+            if event[0] in ("searched", "details", "error"):
+                self._completed += 1
+            yield event
+            self.stages["merge"].record(time.monotonic() - start, count=0)
+    
+    def record_merged(self):
+        """Count one item merged by the caller (merge stage throughput)"""
+        self.stages["merge"].record(0.0)
+
+    def get_stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the metrics of every stage
+
+        Returns:
+            dict: {stage: {processed, per_minute, queue_depth, busy_ratio}}
+                  (parse queue_depth: files left to parse)
+        """
+        stats = {}
+        for name in STAGES:
+            workers = self.session_count if name in ("search", "details") else 1
+            stats[name] = self.stages[name].snapshot(workers)
+        stats["parse"]["queue_depth"] = max(self._parse_remaining, 0)
+        return stats
+
+    def stop(self):
+        """Stop parsing and stop the sessions after their current task"""
+        self._stop_event.set()
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the pipeline threads (after the end of events() or stop())"""
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for thread in self._threads:
+            # Threads blocked on a full event queue are released by draining it
+            while thread.is_alive():
+                self._drain_events()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return
+                thread.join(WORKER_POLL_SECONDS if remaining is None else min(remaining, WORKER_POLL_SECONDS))
+
+    # --- Internals ---
+
+    def _submit(self, stage: str, task: Any):
+        self._submitted += 1
+        self.stages[stage].backlog.append(task)
+        self._pump()
+
+    def _pump(self):
+        """Move backlog tasks into their stage queue while it has room (never blocks)"""
+        for stage in ("details", "search"):
+            pipeline_stage = self.stages[stage]
+            while pipeline_stage.backlog:
+                try:
+                    pipeline_stage.queue.put_nowait(pipeline_stage.backlog[0])
+                except queue.Full:
+                    break
+                pipeline_stage.backlog.popleft()
+
+    def _put_event(self, event):
+        """Send an event to the merge stage (blocks while the event queue is full)"""
+        while True:
+            try:
+                self._events.put(event, timeout=WORKER_POLL_SECONDS)
+                return
+            except queue.Full:
+                if self._stop_event.is_set() and event[0] not in ("searched", "details", "error"):
+                    return
+
+    def _is_finished(self) -> bool:
+        if not self._events.empty():
+            return False
+        if self._stop_event.is_set():
+            with self._in_flight_lock:
+                return self._in_flight == 0
+        return self._parse_done.is_set() and self._submitted == self._completed
+
+    def _drain_events(self):
+        try:
+            while True:
+                self._events.get_nowait()
+        except queue.Empty:
+            pass
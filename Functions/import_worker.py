@@ -4,14 +4,24 @@ Allows scraping execution in a separate thread to keep UI responsive
 """
 
 import logging
-import json
+import time
 from pathlib import Path
 from datetime import datetime
 from PySide6.QtCore import QThread, Signal
 
 from Functions.cookie_manager import CookieManager
-from Functions.eden_scraper import EdenScraper, _connect_to_eden_herald
+from Functions.eden_scraper import EdenScraper
+from Functions.eden_session_pool import EdenSessionPool
+from Functions.import_checkpoint import ImportCheckpoint
+from Functions.import_pipeline import ImportPipeline
+from Functions.items_database_manager import get_items_storage_path, load_items_document, save_items_document
+from Functions.items_refresh_policy import stamp_scraped_item
 from Functions.items_scraper import ItemsScraper
+from Functions.items_variant_index import ItemVariantIndex
+
+
+# Stage metrics are sent to the monitor at most this often
+STAGES_EMIT_SECONDS = 1.0
 
 
 class ImportWorker(QThread):
@@ -23,7 +33,7 @@ class ImportWorker(QThread):
     import_finished = Signal(bool, str, dict)  # success, message, stats
     
     def __init__(self, file_paths, realm, merge, remove_duplicates, auto_backup, 
-                 source_db_path, path_manager, skip_filters_mode=False):
+                 source_db_path, path_manager, skip_filters_mode=False, force_scrape=False, resume=False):
         super().__init__()
         self.file_paths = file_paths
         self.realm = realm
@@ -33,104 +43,126 @@ class ImportWorker(QThread):
         self.source_db_path = source_db_path
         self.path_manager = path_manager
         self.skip_filters_mode = skip_filters_mode  # NEW: Bypass level/utility filters
-        self._eden_scraper = None  # Reference for external cleanup
+        self.force_scrape = force_scrape  # Ignore the negative cache (known-dead names)
+        self.resume = resume  # Continue the import saved in the checkpoint of source_db_path
+        self._session_pool = None  # Reference for external cleanup
+        self._pipeline = None
+        self._stop_requested = False
+    
+    @classmethod
+    def from_checkpoint(cls, source_db_path, path_manager):
+        """
+        Create a worker resuming the import saved next to a database
+        
+        Returns:
+            ImportWorker: Worker with the saved import options, or None if there is no checkpoint
+        """
+        checkpoint = ImportCheckpoint.load(source_db_path)
+        if checkpoint is None:
+            return None
+        params = checkpoint.params
+        return cls(
+            file_paths=params.get("file_paths", []),
+            realm=params.get("realm", "All"),
+            merge=params.get("merge", True),
+            remove_duplicates=params.get("remove_duplicates", True),
+            auto_backup=False,  # Backup made when the import started
+            source_db_path=source_db_path,
+            path_manager=path_manager,
+            skip_filters_mode=params.get("skip_filters_mode", False),
+            force_scrape=params.get("force_scrape", False),
+            resume=True
+        )
+    
+    def request_stop(self):
+        """Stop after the items being scraped (progress kept in the checkpoint, DB not written)"""
+        self._stop_requested = True
+        if self._pipeline:
+            self._pipeline.stop()
+        if self._session_pool:
+            self._session_pool.stop()
     
     def cleanup_external_resources(self):
-        """Forced scraper cleanup (called from main thread if needed)"""
-        if self._eden_scraper:
+        """Forced sessions cleanup (called from main thread if needed)"""
+        if self._session_pool:
             try:
-                logging.info("Forced cleanup: Closing mass import scraper")
-                self._eden_scraper.close()
-                logging.info("Scraper fermé avec succès")
+                logging.info("Forced cleanup: Closing mass import sessions")
+                self._session_pool.close(discard=True)
+                logging.info("Sessions fermées avec succès")
             except Exception as e:
-                logging.warning(f"Erreur cleanup scraper: {e}")
+                logging.warning(f"Erreur cleanup sessions: {e}")
             finally:
-                self._eden_scraper = None
-        
+                self._session_pool = None
+    
     def run(self):
         """Execute import in separate thread"""
-        eden_scraper = None  # Protection for guaranteed cleanup
+        session_pool = None  # Protection for guaranteed cleanup
+        items_scraper = None
+        checkpoint = None
+        pipeline = None
         
         try:
             from Functions.items_parser import parse_template_file
             
-            # Parse files
-            self.log_message.emit("Parsing template files...", "info")
-            
-            new_items_names = {}
-            parse_errors = []
-            
-            for file_path in self.file_paths:
-                try:
-                    file_path_obj = Path(file_path)
-                    
-                    # Parse items (realm will be detected during scraping)
-                    item_names = parse_template_file(file_path)
-                    
-                    # DEBUG: Log parsing result
-                    self.log_message.emit(f"📄 {file_path_obj.name}: {len(item_names) if item_names else 0} item(s) trouvé(s)", "info")
-                    
-                    if item_names:
-                        for item_name in item_names:
-                            if not item_name or not item_name.strip():
-                                continue
-                            
-                            item_name = item_name.strip()
-                            item_data = {
-                                "name": item_name,
-                                "realm": self.realm if self.realm != "All" else "All",
-                                "source_file": file_path_obj.name
-                            }
-                            
-                            key = item_name.lower()
-                            if key not in new_items_names:
-                                new_items_names[key] = item_data
-                
-                except Exception as e:
-                    parse_errors.append(f"Error parsing {Path(file_path).name}: {str(e)}")
-            
-            if not new_items_names:
-                self.log_message.emit("❌ Aucun item parsé depuis les fichiers template", "error")
-                
-                # Show parsing errors if any
-                if parse_errors:
-                    self.log_message.emit(f"⚠️ {len(parse_errors)} erreur(s) de parsing:", "warning")
-                    for error in parse_errors:
-                        self.log_message.emit(f"  • {error}", "warning")
+            # Progress of this import, saved periodically next to the database (resumable)
+            if self.resume:
+                checkpoint = ImportCheckpoint.load(self.source_db_path)
+                if checkpoint is None:
+                    self.log_message.emit("⚠️ No checkpoint found - starting the import from the beginning", "warning")
                 else:
-                    self.log_message.emit("ℹ️ Les fichiers ne contiennent peut-être pas d'items avec 'Source Type: Loot'", "info")
-                    self.log_message.emit("ℹ️ Format attendu: Name: <nom> + Source Type: Loot", "info")
-                
-                self.import_finished.emit(False, "No items parsed from template files", {})
-                return
+                    self.log_message.emit(f"⏯️ Resuming import started {checkpoint.started} "
+                                          f"({len(checkpoint.processed)} item(s) already processed)", "info")
+            if checkpoint is None:
+                checkpoint = ImportCheckpoint(self.source_db_path, params={
+                    "file_paths": [str(file_path) for file_path in self.file_paths],
+                    "realm": self.realm,
+                    "merge": self.merge,
+                    "remove_duplicates": self.remove_duplicates,
+                    "skip_filters_mode": self.skip_filters_mode,
+                    "force_scrape": self.force_scrape
+                })
             
-            self.log_message.emit(f"Fichiers parsés: {len(self.file_paths)}", "info")
-            if parse_errors:
-                for error in parse_errors:
-                    self.log_message.emit(error, "warning")
+            # Initialize the Eden sessions (armory.import_sessions), each one loads the cookies once
+            session_pool = EdenSessionPool(headless=False)
+            self._session_pool = session_pool  # Store for external cleanup
             
-            # Initialize scraper using centralized connection
-            self.log_message.emit("Initializing Eden scraper...", "info")
+            # Staged import: template files are parsed while the sessions open
+            pipeline = ImportPipeline(session_pool.size)
+            self._pipeline = pipeline
+            self.log_message.emit("Parsing template files...", "info")
+            pipeline.start_parser(self.file_paths, parse_template_file)
             
-            eden_scraper, error_message = _connect_to_eden_herald(headless=False)
-            if not eden_scraper:
+            self.log_message.emit(f"Initializing {session_pool.size} Eden session(s)...", "info")
+            
+            success, error_message = session_pool.open(
+                on_progress=lambda opened, size: self.log_message.emit(f"Eden session(s) ready: {opened}/{size}", "info")
+            )
+            if not success:
                 self.log_message.emit(f"Failed to connect to Eden Herald: {error_message}", "error")
                 self.import_finished.emit(False, f"Failed to connect to Eden Herald: {error_message}", {})
                 return
             
-            self._eden_scraper = eden_scraper  # Store for external cleanup
-            items_scraper = ItemsScraper(eden_scraper)
-            self.log_message.emit("Eden scraper initialized successfully", "success")
+            # One ItemsScraper per session, all sharing the web cache and the ID index
+            items_scraper = ItemsScraper(session_pool.sessions[0])
+            worker_scrapers = {1: items_scraper}
+            for worker_id, session in enumerate(session_pool.sessions[1:], 2):
+                worker_scrapers[worker_id] = items_scraper.for_session(session)
+            self.log_message.emit(f"Eden scraper initialized successfully ({len(session_pool)} session(s))", "success")
+            
+            # Items written by this import are mirrored into the scraper ID index
+            if Path(self.source_db_path).resolve() == items_scraper.database_file.resolve():
+                index_source = "database"
+            else:
+                index_source = "user"
             
-            # Load existing database
+            # Load existing database (personal database: .db file with the SQLite backend)
+            storage_path = get_items_storage_path(self.source_db_path)
             existing_items = {}
-            if self.merge and self.source_db_path.exists():
-                with open(self.source_db_path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
-                    existing_items = existing_data.get("items", {})
+            if self.merge and storage_path.exists():
+                existing_items = load_items_document(self.source_db_path).get("items", {})
             
-            # Backup
-            if self.auto_backup and self.source_db_path.exists():
+            # Backup (a resumed import was backed up when it started)
+            if self.auto_backup and storage_path.exists() and not checkpoint.processed:
                 self.log_message.emit("Creating backup...", "info")
                 if self.path_manager:  # Check if path_manager exists
                     import zipfile
@@ -146,7 +178,7 @@ class ImportWorker(QThread):
                     
                     try:
                         with zipfile.ZipFile(backup_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                            zipf.write(self.source_db_path, arcname=self.source_db_path.name)
+                            zipf.write(storage_path, arcname=storage_path.name)
                         
                         logging.info(f"Database backed up to {backup_zip_path}")
                         self.log_message.emit(f"✅ Backup created: {backup_zip_path}", "success")
@@ -158,41 +190,163 @@ class ImportWorker(QThread):
             
             # Process items
             merged_items = existing_items.copy() if self.merge else {}
-            duplicates_count = 0
-            added_count = 0
-            failed_count = 0
-            variants_found = 0
-            all_filtered_items = []  # Store all filtered items for review
+            merged_items.update(checkpoint.items)  # Entries of the resumed import (if any)
+            variant_index = ItemVariantIndex(merged_items)  # name -> realm variants
+            duplicates_count = checkpoint.counters["duplicates"]
+            added_count = checkpoint.counters["added"]
+            failed_count = checkpoint.counters["failed"]
+            variants_found = checkpoint.counters["variants"]
+            all_filtered_items = checkpoint.filtered_items  # Store all filtered items for review
             
             try:
-                # Extract unique items
-                unique_items = {}
-                for key, item_basic in new_items_names.items():
-                    item_name = item_basic["name"]
-                    if item_name not in unique_items:
-                        unique_items[item_name] = item_basic
-                
-                total_items = len(unique_items)
+                total_items = 0  # Unique item names parsed so far
+                parse_errors = []
+                processed_count = 0
+                skipped_count = 0  # Already processed (resumed import) or ignored
+                already_processed = checkpoint.get_processed_names()
+                pending = {}  # item name -> search result waiting for its variant details
+                last_stages_emit = 0.0
                 
-                # Update monitor with correct total
                 self.progress_updated.emit({
                     'processed': 0,
-                    'total': total_items,
-                    'added': 0,
-                    'variants': 0,
-                    'failed': 0,
-                    'duplicates': 0
+                    'total': 0,
+                    'added': added_count,
+                    'variants': variants_found,
+                    'failed': failed_count,
+                    'duplicates': duplicates_count,
+                    'workers': len(session_pool)
                 })
                 
-                self.log_message.emit("", "separator")
-                self.log_message.emit(f"🔍 {total_items} item(s) unique(s) à traiter", "info")
-                self.log_message.emit("", "separator")
+                def search_task(worker_id, work):
+                    item_name, should_bypass = work
+                    return worker_scrapers[worker_id].find_all_item_variants(
+                        item_name,
+                        return_filtered=True,
+                        skip_filters=should_bypass,
+                        force_scrape=self.force_scrape
+                    )
                 
-                for idx, (item_name, item_basic) in enumerate(unique_items.items(), 1):
+                def details_task(worker_id, work):
+                    item_name, composite_key, item_id, variant_realm = work
+                    return worker_scrapers[worker_id].get_item_details(item_id, variant_realm, item_name,
+                                                                       use_cache=not self.force_scrape)
+                
+                pipeline.start_workers(search_task, details_task, worker_count=len(session_pool))
+                
+                # This thread is the merge stage and the single writer: every merge happens here,
+                # in completion order, and it decides which names and variants the sessions scrape
+                for event, source, work, result in pipeline.events():
+                    if self._stop_requested:
+                        pipeline.stop()
+                    
+                    now = time.monotonic()
+                    if now - last_stages_emit >= STAGES_EMIT_SECONDS:
+                        last_stages_emit = now
+                        self.progress_updated.emit({'stages': pipeline.get_stage_stats()})
+                    
+                    # --- Parse stage ---
+                    if event == "parsed_file":
+                        file_name, item_count, error = source, work, result
+                        if error:
+                            parse_errors.append(f"Error parsing {file_name}: {error}")
+                            self.log_message.emit(parse_errors[-1], "warning")
+                        else:
+                            self.log_message.emit(f"📄 {file_name}: {item_count} item(s) trouvé(s)", "info")
+                        continue
+                    
+                    if event == "parsed":
+                        item_name = source
+                        total_items += 1
+                        self.progress_updated.emit({'total': total_items})
+                        
+                        # Ignored and already processed (resumed import) items are not searched
+                        is_ignored, has_bypass = variant_index.get_flags(item_name)
+                        if item_name.lower() in already_processed or is_ignored:
+                            processed_count += 1
+                            skipped_count += 1
+                            if is_ignored:
+                                self.log_message.emit(f"   🚫 Item is ignored - skipping: {item_name}", "info")
+                            self.progress_updated.emit({'processed': processed_count})
+                            continue
+                        
+                        # Use skip_filters if in retry mode OR if item has bypass tag in DB
+                        pipeline.submit_search((item_name, self.skip_filters_mode or has_bypass))
+                        continue
+                    
+                    if event == "parse_done":
+                        if not total_items:
+                            self.log_message.emit("❌ Aucun item parsé depuis les fichiers template", "error")
+                            
+                            # Show parsing errors if any
+                            if parse_errors:
+                                self.log_message.emit(f"⚠️ {len(parse_errors)} erreur(s) de parsing:", "warning")
+                                for error in parse_errors:
+                                    self.log_message.emit(f"  • {error}", "warning")
+                            else:
+                                self.log_message.emit("ℹ️ Les fichiers ne contiennent peut-être pas d'items avec 'Source Type: Loot'", "info")
+                                self.log_message.emit("ℹ️ Format attendu: Name: <nom> + Source Type: Loot", "info")
+                            
+                            self.import_finished.emit(False, "No items parsed from template files", {})
+                            return
+                        
+                        self.log_message.emit(f"Fichiers parsés: {len(self.file_paths)}", "info")
+                        self.log_message.emit("", "separator")
+                        self.log_message.emit(f"🔍 {total_items} item(s) unique(s) à traiter", "info")
+                        self.log_message.emit("", "separator")
+                        if already_processed:
+                            self.log_message.emit(f"⏯️ {skipped_count} item(s) already processed or ignored - skipped", "info")
+                        continue
+                    
+                    # --- Search / details stages (Eden sessions) ---
+                    if event == "idle":
+                        self.progress_updated.emit({'worker': source, 'worker_item': None})
+                        continue
+                    
+                    item_name = work[0]
+                    if event == "start":
+                        self.progress_updated.emit({'current_item': item_name, 'worker': source, 'worker_item': item_name})
+                        continue
+                    
+                    entry = None  # Stays None when the search failed
+                    if event == "searched":
+                        variants, filtered = result
+                        entry = {'bypass': work[1], 'variants': variants, 'filtered': filtered,
+                                 'details': {}, 'waiting': set()}
+                        
+                        # Details of the variants not already in the database
+                        for variant in variants or []:
+                            variant_realm = variant.get('realm') or 'All'
+                            if not variant_realm.strip():
+                                variant_realm = 'All'
+                            
+                            realm_lower = variant_realm.lower() if variant_realm != "All" else "all"
+                            composite_key = f"{item_name.lower()}:{realm_lower}"
+                            if (self.remove_duplicates and composite_key in merged_items) or composite_key in entry['waiting']:
+                                continue
+                            
+                            entry['waiting'].add(composite_key)
+                            pipeline.submit_details((item_name, composite_key, variant['id'], variant_realm))
+                        
+                        if entry['waiting']:
+                            pending[item_name] = entry
+                            continue
+                    
+                    elif item_name in pending:
+                        # Details of one variant (None when the fetch failed)
+                        entry = pending[item_name]
+                        composite_key = work[1]
+                        entry['details'][composite_key] = result if event == "details" else None
+                        entry['waiting'].discard(composite_key)
+                        if entry['waiting']:
+                            continue
+                        del pending[item_name]
+                    
+                    # --- Merge stage: search failed, or every variant of the item fetched ---
+                    processed_count += 1
+                    
                     # Update progress
                     self.progress_updated.emit({
-                        'processed': idx,
-                        'current_item': item_name,
+                        'processed': processed_count,
                         'added': added_count,
                         'variants': variants_found,
                         'failed': failed_count,
@@ -200,39 +354,22 @@ class ImportWorker(QThread):
                     })
                     
                     self.log_message.emit("", "separator")
-                    self.log_message.emit(f"[{idx}/{total_items}] Processing: {item_name}", "search")
+                    self.log_message.emit(f"[{processed_count}/{total_items}] Processing: {item_name} (session {source})", "search")
                     
+                    if entry is None:
+                        # Not recorded in the checkpoint: retried when the import is resumed
+                        failed_count += 1
+                        self.log_message.emit(f"Error processing {item_name}: {result}", "error")
+                        self.progress_updated.emit({'failed': failed_count})
+                        continue
+                    
+                    changed_keys = []  # Entries of merged_items written for this item
                     try:
-                        # Check if item already exists in DB with bypass_filters flag
-                        item_key_base = item_name.lower()
-                        should_bypass = self.skip_filters_mode  # Default from worker mode
-                        should_ignore = False
+                        if entry['bypass'] and not self.skip_filters_mode:
+                            self.log_message.emit(f"   🔓 Item has bypass_filters tag - ignoring level/utility restrictions", "info")
                         
-                        # Check existing items for bypass_filters tag or ignore_item flag
-                        for key, existing_item in merged_items.items():
-                            if key.startswith(item_key_base + ":"):
-                                # Check if item is marked as ignored
-                                if existing_item.get("ignore_item", False):
-                                    should_ignore = True
-                                    self.log_message.emit(f"   🚫 Item is ignored - skipping", "info")
-                                    break
-                                # Check if item has bypass_filters tag
-                                if existing_item.get("bypass_filters", False):
-                                    should_bypass = True
-                                    self.log_message.emit(f"   🔓 Item has bypass_filters tag - ignoring level/utility restrictions", "info")
-                                    break
-                        
-                        # Skip if item is marked as ignored
-                        if should_ignore:
-                            continue
-                        
-                        # Find variants (with filtered items tracking)
-                        # Use skip_filters if in retry mode OR if item has bypass tag in DB
-                        variants, filtered = items_scraper.find_all_item_variants(
-                            item_name, 
-                            return_filtered=True,
-                            skip_filters=should_bypass
-                        )
+                        # Variants and details scraped by the sessions (filtered items tracking)
+                        variants, filtered, details = entry['variants'], entry['filtered'], entry['details']
                         
                         # Store filtered items for potential retry
                         if filtered:
@@ -246,8 +383,7 @@ class ImportWorker(QThread):
                         
                         if not variants:
                             # Check if item already exists in DB
-                            item_key_base = item_name.lower()
-                            exists_in_db = any(k.startswith(item_key_base + ":") for k in merged_items.keys())
+                            exists_in_db = variant_index.has_item(item_name)
                             
                             if exists_in_db:
                                 self.log_message.emit(f"Item déjà dans la DB: {item_name}", "duplicate")
@@ -273,7 +409,7 @@ class ImportWorker(QThread):
                             if not variant_realm or not variant_realm.strip():
                                 variant_realm = 'All'
                             
-                            self.log_message.emit(f"  → Scraping variant {variant_realm} (ID: {item_id})...", "search")
+                            self.log_message.emit(f"  → Variant {variant_realm} (ID: {item_id})...", "search")
                             
                             # Composite key
                             realm_lower = variant_realm.lower() if variant_realm != "All" else "all"
@@ -288,6 +424,7 @@ class ImportWorker(QThread):
                                     existing_item = merged_items[composite_key]
                                     if not existing_item.get("bypass_filters", False):
                                         existing_item["bypass_filters"] = True
+                                        changed_keys.append(composite_key)
                                         self.log_message.emit(f"    🔓 Duplicate found, added bypass_filters flag: {composite_key}", "info")
                                     else:
                                         self.log_message.emit(f"    ⏭️ Duplicate skipped (already has bypass_filters): {composite_key}", "duplicate")
@@ -297,8 +434,8 @@ class ImportWorker(QThread):
                                 self.progress_updated.emit({'duplicates': duplicates_count})
                                 continue
                             
-                            # Get details
-                            item_details = items_scraper.get_item_details(item_id, variant_realm, item_name)
+                            # Details scraped by the sessions
+                            item_details = details.get(composite_key)
                             
                             if not item_details:
                                 self.log_message.emit(f"    ⚠️ Failed to get details for {variant_realm}", "warning")
@@ -350,8 +487,13 @@ class ImportWorker(QThread):
                                 item_data["merchant_zone"] = merchant.get("zone") or "Unknown"
                                 item_data["merchant_price"] = str(price_parsed.get("amount")) if price_parsed else "Unknown"
                                 item_data["merchant_currency"] = currency
+                                # Date the details page was fetched (older when served by the page cache)
+                                stamp_scraped_item(item_data, item_details.get("fetched_at"))
                                 
                                 merged_items[composite_key] = item_data
+                                changed_keys.append(composite_key)
+                                variant_index.add(composite_key, item_data)
+                                items_scraper.update_item_id_index({composite_key: item_data}, source=index_source)
                                 added_count += 1
                                 
                                 merchant_info = f"{item_data.get('merchant_zone', '?')} - {item_data.get('merchant_price', '?')} {item_data.get('merchant_currency', '')}"
@@ -383,17 +525,44 @@ class ImportWorker(QThread):
                         self.log_message.emit(f"Error processing {item_name}: {e}", "error")
                         self.progress_updated.emit({'failed': failed_count})
                         continue
+                    
+                    finally:
+                        checkpoint.record(item_name, merged_items, changed_keys, all_filtered_items, {
+                            "added": added_count,
+                            "variants": variants_found,
+                            "failed": failed_count,
+                            "duplicates": duplicates_count
+                        })
+                        pipeline.record_merged()
             
             finally:
+                # Stop the pipeline threads before their sessions are closed
+                pipeline.stop()
+                pipeline.join(timeout=10)
+                
+                # Flush the items web cache journal (shared by every session scraper)
+                items_scraper.close()
+                
                 # Guaranteed cleanup even in case of error in loop
-                if eden_scraper:
+                if session_pool:
                     try:
-                        eden_scraper.close()
+                        session_pool.close()
                         self.log_message.emit("", "separator")
-                        self.log_message.emit("Eden scraper closed", "info")
-                        logging.info("Eden scraper closed cleanly in worker thread")
+                        self.log_message.emit("Eden sessions closed", "info")
+                        logging.info("Eden sessions closed cleanly in worker thread")
                     except Exception as e:
-                        logging.warning(f"Error closing Eden scraper in worker: {e}")
+                        logging.warning(f"Error closing Eden sessions in worker: {e}")
+            
+            # Stopped (monitor closed): the database is written when the import is resumed
+            if self._stop_requested:
+                checkpoint.save()
+                self.log_message.emit("", "separator")
+                self.log_message.emit(f"⏸️ Import stopped - {len(checkpoint.processed)} item(s) saved in the checkpoint, "
+                                      f"use 'Resume last import' to continue", "warning")
+                self.import_finished.emit(False, "Import stopped - resume available", {
+                    "filtered_items": all_filtered_items
+                })
+                return
             
             # Save database
             database = {
@@ -409,20 +578,18 @@ class ImportWorker(QThread):
                 "items": merged_items
             }
             
-            self.source_db_path.parent.mkdir(parents=True, exist_ok=True)
-            
             self.log_message.emit("", "separator")
             self.log_message.emit(f"Saving database ({len(merged_items)} items)...", "info")
             
-            with open(self.source_db_path, 'w', encoding='utf-8') as f:
-                json.dump(database, f, indent=2, ensure_ascii=False)
+            save_items_document(self.source_db_path, database)
             
-            self.log_message.emit(f"Database saved: {self.source_db_path}", "success")
+            self.log_message.emit(f"Database saved: {storage_path}", "success")
+            checkpoint.remove()
             
             # Build stats
             stats = {
                 "files_processed": len(self.file_paths),
-                "unique_items_processed": len(unique_items),
+                "unique_items_processed": total_items,
                 "variants_found": variants_found,
                 "items_added": added_count,
                 "items_failed": failed_count,
@@ -455,13 +622,21 @@ class ImportWorker(QThread):
         except Exception as e:
             logging.error(f"Error in ImportWorker: {e}", exc_info=True)
             self.log_message.emit(f"CRITICAL ERROR: {e}", "error")
+            if checkpoint is not None and checkpoint.processed and checkpoint.save():
+                self.log_message.emit(f"⏯️ Progress saved ({len(checkpoint.processed)} item(s)) - "
+                                      f"use 'Resume last import' to continue", "warning")
             self.import_finished.emit(False, f"Error building database: {str(e)}", {})
         
         finally:
-            # Final guaranteed cleanup - close scraper even in case of critical exception
-            if eden_scraper:
+            # Final guaranteed cleanup - close sessions even in case of critical exception
+            if pipeline:
+                pipeline.stop()
+                pipeline.join(timeout=10)
+                self._pipeline = None
+            if session_pool:
                 try:
-                    eden_scraper.close()
-                    logging.info("Final cleanup: Eden scraper closed in ImportWorker")
+                    session_pool.close()
+                    logging.info("Final cleanup: Eden sessions closed in ImportWorker")
                 except Exception as e:
                     logging.warning(f"Final cleanup error in ImportWorker: {e}")
+                self._session_pool = None
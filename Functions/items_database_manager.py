@@ -6,7 +6,9 @@ Description: Manages dual-mode items database (internal read-only vs personal us
 
 This module handles:
 - Database path resolution (internal Data/ or personal Armory/)
-- Item search in active database
+- Item search in active database (resident in-memory store, reloaded on file change)
+- Optional SQLite storage backend for the personal database (armory.storage_backend)
+- Whole-database load/save with the active backend (mass import, migrations, scraper index)
 - Personal database creation (copy from internal)
 - Adding scraped items with deduplication
 - Statistics (internal/personal/user-added counts)
@@ -15,12 +17,15 @@ This module handles:
 
 import json
 import shutil
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-from Functions.config_manager import ConfigManager
+from Functions.config_manager import ConfigManager, config
 from Functions.path_manager import PathManager
+from Functions.items_database_sqlite import ItemsSQLiteStore
 import logging
 
 
@@ -52,6 +57,133 @@ ITEM_CATEGORIES = {
     }
 }
 
+# Minimum delay (seconds) between two file signature checks of the resident store.
+# Writes performed through ItemsDatabaseManager invalidate the store immediately,
+# this interval only bounds how fast external edits (DB editor, tools) are seen.
+ITEMS_STORE_CHECK_INTERVAL = 2.0
+
+# File name of the personal database (Armory folder); the SQLite backend keeps
+# its items in a .db file of the same name next to it
+PERSONAL_DB_FILENAME = "items_database.json"
+
+
+# ============================================================================
+# PERSONAL DATABASE STORAGE
+# ============================================================================
+# Whole-database readers and writers (mass import, migrations, scraper ID index)
+# go through these functions, so the personal database has a single source of
+# truth whatever the storage backend: the .db file with "sqlite", the JSON file
+# otherwise. The internal database (items_database_src.json) is always JSON.
+
+_sqlite_stores: Dict[Path, ItemsSQLiteStore] = {}
+_sqlite_stores_lock = threading.Lock()
+
+
+def get_items_sqlite_store(db_path, storage_backend: Optional[str] = None) -> Optional[ItemsSQLiteStore]:
+    """
+    Get the shared SQLite store backing a personal database
+    
+    The store is created on first use by a one-shot import of the JSON
+    database (including its _metadata section). When the JSON file is newer
+    than the .db file (edited while the JSON backend was selected), it is
+    imported again so those edits are not hidden by the older .db content.
+    
+    Args:
+        db_path: Database path (JSON path, as found in the config)
+        storage_backend: "json" or "sqlite" (default: armory.storage_backend)
+        
+    Returns:
+        Optional[ItemsSQLiteStore]: Store, or None if the JSON backend is active
+            or db_path is not the personal database
+    """
+    if storage_backend is None:
+        storage_backend = config.get("armory.storage_backend", "json")
+    db_path = Path(db_path)
+    if storage_backend != "sqlite" or db_path.name != PERSONAL_DB_FILENAME:
+        return None
+    
+    sqlite_path = db_path.with_suffix(".db")
+    with _sqlite_stores_lock:
+        store = _sqlite_stores.get(sqlite_path)
+        is_new = store is None and not sqlite_path.exists()
+        json_is_newer = not is_new and _is_file_newer(db_path, sqlite_path)
+        if store is None:
+            store = ItemsSQLiteStore(sqlite_path)
+            _sqlite_stores[sqlite_path] = store
+        if (is_new or json_is_newer) and db_path.exists():
+            with open(db_path, "r", encoding="utf-8") as f:
+                count = store.replace_document(json.load(f))
+            if is_new:
+                logging.info(f"Imported personal database into SQLite: {sqlite_path} ({count} items)", 
+                    extra={"action": "ITEMDB_SQLITE"})
+            else:
+                logging.warning(f"Personal database JSON is newer than its SQLite store, "
+                                f"re-imported into {sqlite_path} ({count} items)", 
+                    extra={"action": "ITEMDB_SQLITE"})
+        return store
+
+
+def _is_file_newer(path: Path, other_path: Path) -> bool:
+    """True if path was modified after other_path (both must exist)"""
+    try:
+        return path.stat().st_mtime > other_path.stat().st_mtime
+    except OSError:
+        return False
+
+
+def get_items_storage_path(db_path) -> Path:
+    """
+    Get the file actually holding the items of a database (backups, existence checks)
+    
+    Args:
+        db_path: Database path (JSON path)
+        
+    Returns:
+        Path: The .db file with the SQLite backend, db_path otherwise
+    """
+    sqlite_store = get_items_sqlite_store(db_path)
+    return sqlite_store.db_path if sqlite_store else Path(db_path)
+
+
+def load_items_document(db_path) -> Dict:
+    """
+    Load a whole items database with the active storage backend
+    
+    Args:
+        db_path: Database path (JSON path)
+        
+    Returns:
+        Dict: Database document ({"_metadata": ..., ..., "items": {...}})
+        
+    Raises:
+        OSError, ValueError: The JSON file could not be read
+    """
+    sqlite_store = get_items_sqlite_store(db_path)
+    if sqlite_store:
+        return sqlite_store.load_document()
+    with open(db_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_items_document(db_path, document: Dict):
+    """
+    Replace a whole items database with the active storage backend
+    
+    Args:
+        db_path: Database path (JSON path)
+        document: Database document
+        
+    Raises:
+        OSError, sqlite3.Error: The database could not be written
+    """
+    sqlite_store = get_items_sqlite_store(db_path)
+    if sqlite_store:
+        sqlite_store.replace_document(document)
+        return
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(db_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+
 
 class ItemsDatabaseManager:
     """Manages access to items databases with dual-mode support"""
@@ -71,6 +203,13 @@ class ItemsDatabaseManager:
         # Use get_resource_path for PyInstaller compatibility (bundled resources in sys._MEIPASS)
         self.internal_db_path = Path(self.path_manager.get_resource_path("Data")) / "items_database_src.json"
         
+        # Resident items store (composite "name:realm" key -> item data)
+        self._store_lock = threading.RLock()
+        self._store_items = None
+        self._store_path = None
+        self._store_signature = None
+        self._store_checked_at = 0.0
+        
         logging.info("ItemsDatabaseManager initialized", extra={"action": "ITEMDB_INIT"})
 
     def is_personal_database(self) -> bool:
@@ -82,6 +221,41 @@ class ItemsDatabaseManager:
         """
         return self.config_manager.config.get("armory", {}).get("use_personal_database", False)
 
+    def is_sqlite_backend(self) -> bool:
+        """
+        Check if the SQLite storage backend is selected for the personal database
+        
+        Returns:
+            bool: True if armory.storage_backend is "sqlite"
+        """
+        return self.config_manager.config.get("armory", {}).get("storage_backend", "json") == "sqlite"
+
+    def get_sqlite_store(self, db_path: Optional[Path] = None) -> Optional[ItemsSQLiteStore]:
+        """
+        Get the SQLite store backing the personal database
+        
+        The SQLite file sits next to the personal JSON database (same name, .db
+        suffix). On first use it is created by a one-shot import of the JSON
+        database, including its _metadata section, and the JSON is imported again
+        when it is newer than the .db file. The store is shared with the other
+        readers and writers of the personal database (get_items_sqlite_store).
+        
+        Args:
+            db_path: Active database path (resolved from config if omitted)
+            
+        Returns:
+            Optional[ItemsSQLiteStore]: Store, or None if the JSON backend is active
+                or the active database is the internal (read-only) one
+        """
+        if not self.is_sqlite_backend():
+            return None
+        
+        db_path = db_path or self.get_active_database_path()
+        if db_path == self.internal_db_path:
+            return None
+        
+        return get_items_sqlite_store(db_path, storage_backend="sqlite")
+
     def get_active_database_path(self) -> Path:
         """
         Get path to the active database based on config
@@ -147,32 +321,126 @@ class ItemsDatabaseManager:
             
             logging.info(f"Saved database to {db_path} ({len(data.get('items', {}))} items)", 
                 extra={"action": "ITEMDB_SAVE"})
+            self.invalidate_items_store()
             return True
         except Exception as e:
             logging.error(f"Error saving database to {db_path}: {e}", extra={"action": "ITEMDB_SAVE_ERROR"})
             return False
 
+    def _save_items(self, db_path: Path, database: Optional[Dict], changed_items: Dict[str, Dict]) -> bool:
+        """
+        Persist modified items with the active storage backend
+        
+        Args:
+            db_path: Path to database file
+            database: Full JSON database content (None with the SQLite backend)
+            changed_items: Modified items keyed by composite key
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        sqlite_store = self.get_sqlite_store(db_path)
+        if not sqlite_store:
+            return self._save_database(db_path, database)
+        
+        try:
+            sqlite_store.put_items(changed_items)
+            logging.info(f"Saved {len(changed_items)} item(s) to {sqlite_store.db_path}", 
+                extra={"action": "ITEMDB_SAVE"})
+            self.invalidate_items_store()
+            return True
+        except Exception as e:
+            logging.error(f"Error saving items to {sqlite_store.db_path}: {e}", extra={"action": "ITEMDB_SAVE_ERROR"})
+            return False
+
+    @staticmethod
+    def _get_file_signature(db_path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Get the change signature of a database file
+        
+        Args:
+            db_path: Path to database file
+            
+        Returns:
+            Optional[Tuple[int, int]]: (mtime_ns, size) or None if file is missing
+        """
+        try:
+            stat = db_path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def get_items_store(self) -> Dict[str, Dict]:
+        """
+        Get the resident items store of the active database
+        
+        The store is loaded once and kept in memory. The active database file is
+        only re-read when its mtime/size signature changes (checked at most every
+        ITEMS_STORE_CHECK_INTERVAL seconds) or after invalidate_items_store().
+        
+        Returns:
+            Dict[str, Dict]: Items keyed by lowercase composite key ("name:realm").
+                The returned dict is shared and must be treated as read-only.
+        """
+        with self._store_lock:
+            now = time.monotonic()
+            if self._store_items is not None and now - self._store_checked_at < ITEMS_STORE_CHECK_INTERVAL:
+                return self._store_items
+            
+            db_path = self.get_active_database_path()
+            sqlite_store = self.get_sqlite_store(db_path)
+            source_path = sqlite_store.db_path if sqlite_store else db_path
+            signature = self._get_file_signature(source_path)
+            
+            if (self._store_items is None or source_path != self._store_path
+                    or signature != self._store_signature):
+                if sqlite_store:
+                    self._store_items = sqlite_store.get_all_items()
+                else:
+                    self._store_items = self._load_database(db_path).get("items", {})
+                self._store_path = source_path
+                self._store_signature = signature
+                logging.info(f"Items store loaded from {source_path} ({len(self._store_items)} items)", 
+                    extra={"action": "ITEMDB_STORE"})
+            
+            self._store_checked_at = now
+            return self._store_items
+
+    def invalidate_items_store(self):
+        """
+        Drop the resident items store so the next lookup reloads the active database
+        
+        Called automatically after every save performed by this manager. External
+        writers (database editor, maintenance tools) may call it to force a reload
+        without waiting for the file signature check.
+        """
+        with self._store_lock:
+            self._store_items = None
+            self._store_path = None
+            self._store_signature = None
+            self._store_checked_at = 0.0
+
     def search_item(self, item_name: str) -> Optional[Dict]:
         """
         Search for an item in the active database
         
+        Lookups are served from the resident items store (no disk I/O while the
+        database file is unchanged).
+        
         Args:
-            item_name: Name of the item to search (case-insensitive)
+            item_name: Name of the item or composite key "name:realm" (case-insensitive)
             
         Returns:
-            Optional[Dict]: Item data if found, None otherwise
+            Optional[Dict]: Item data if found (read-only), None otherwise
         """
-        db_path = self.get_active_database_path()
-        database = self._load_database(db_path)
-        
         # Search by lowercase key
         search_key = item_name.lower()
-        item_data = database.get("items", {}).get(search_key)
+        item_data = self.get_items_store().get(search_key)
         
         if item_data:
-            logging.info(f"Found item '{item_name}' in database", extra={"action": "ITEMDB_SEARCH"})
+            logging.debug(f"Found item '{item_name}' in database", extra={"action": "ITEMDB_SEARCH"})
         else:
-            logging.info(f"Item '{item_name}' not found in database", extra={"action": "ITEMDB_SEARCH"})
+            logging.debug(f"Item '{item_name}' not found in database", extra={"action": "ITEMDB_SEARCH"})
         
         return item_data
 
@@ -206,6 +474,12 @@ class ItemsDatabaseManager:
             # Copy internal database to personal location
             shutil.copy2(self.internal_db_path, personal_db_path)
             
+            # SQLite backend: a .db left by a previous personal database is replaced too
+            sqlite_store = self.get_sqlite_store(personal_db_path)
+            if sqlite_store:
+                sqlite_store.replace_document(self._load_database(self.internal_db_path))
+            self.invalidate_items_store()
+            
             # Update config
             self.config_manager.config.setdefault("armory", {})
             self.config_manager.config["armory"]["personal_db_created"] = True
@@ -248,15 +522,22 @@ class ItemsDatabaseManager:
             if db_path == self.internal_db_path:
                 return False, "Cannot modify internal database"
             
-            database = self._load_database(db_path)
-            
             # Get item name and create lowercase key
             item_name = item_data.get("name", "")
             if not item_name:
                 return False, "Item name is required"
             
             search_key = item_name.lower()
-            items = database.setdefault("items", {})
+            
+            # SQLite backend: only the affected row is read and written
+            sqlite_store = self.get_sqlite_store(db_path)
+            if sqlite_store:
+                database = None
+                existing = sqlite_store.get_item(search_key)
+                items = {search_key: existing} if existing else {}
+            else:
+                database = self._load_database(db_path)
+                items = database.setdefault("items", {})
             
             # Check if item already exists
             if search_key in items:
@@ -310,7 +591,7 @@ class ItemsDatabaseManager:
                 logging.info(f"Added new item '{item_name}' to database", extra={"action": "ITEMDB_ADD"})
             
             # Save database
-            if self._save_database(db_path, database):
+            if self._save_items(db_path, database, {search_key: items[search_key]}):
                 return True, f"Item '{item_name}' added successfully"
             else:
                 return False, "Failed to save database"
@@ -346,8 +627,11 @@ class ItemsDatabaseManager:
             if armor_path:
                 personal_db_path = Path(armor_path) / "items_database.json"
                 if personal_db_path.exists():
-                    personal_db = self._load_database(personal_db_path)
-                    items = personal_db.get("items", {})
+                    sqlite_store = self.get_sqlite_store(personal_db_path)
+                    if sqlite_store:
+                        items = sqlite_store.get_all_items()
+                    else:
+                        items = self._load_database(personal_db_path).get("items", {})
                     stats["personal_count"] = len(items)
                     
                     # Count user-added items
@@ -388,8 +672,15 @@ class ItemsDatabaseManager:
             # Copy internal database to personal location
             shutil.copy2(self.internal_db_path, personal_db_path)
             
-            # Update config
             internal_db = self._load_database(self.internal_db_path)
+            
+            # SQLite backend: replace its content with the fresh copy
+            sqlite_store = self.get_sqlite_store(personal_db_path)
+            if sqlite_store:
+                sqlite_store.replace_document(internal_db)
+            self.invalidate_items_store()
+            
+            # Update config
             self.config_manager.config.setdefault("armory", {})
             self.config_manager.config["armory"]["last_internal_db_version"] = internal_db.get("version", "1.0")
             self.config_manager.save_config()
@@ -467,11 +758,18 @@ class ItemsDatabaseManager:
                     return False, f"Failed to create personal database: {msg}"
                 db_path = self.get_active_database_path()
             
-            database = self._load_database(db_path)
-            items = database.get("items", {})
-            
             # Find item (case-insensitive)
             item_key = item_name.lower()
+            
+            sqlite_store = self.get_sqlite_store(db_path)
+            if sqlite_store:
+                database = None
+                existing = sqlite_store.get_item(item_key)
+                items = {item_key: existing} if existing else {}
+            else:
+                database = self._load_database(db_path)
+                items = database.get("items", {})
+            
             if item_key not in items:
                 return False, f"Item '{item_name}' not found in database"
             
@@ -480,8 +778,9 @@ class ItemsDatabaseManager:
             items[item_key]["ignore_item"] = (category != "unknown")  # Ignore if categorized
             
             # Save database
-            database["items"] = items
-            if not self._save_database(db_path, database):
+            if database is not None:
+                database["items"] = items
+            if not self._save_items(db_path, database, {item_key: items[item_key]}):
                 return False, "Failed to save database"
             
             category_label = self.get_category_label(category, "en")
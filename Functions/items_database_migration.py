@@ -422,15 +422,17 @@ def needs_migration(personal_db_path: str, embedded_db_path: str) -> Tuple[bool,
     Returns:
         tuple: (needs_migration: bool, personal_version: int, embedded_version: int)
     """
+    # Imported here: items_database_manager depends on this module
+    from Functions.items_database_manager import load_items_document
+    
     # Check if personal DB exists
     if not os.path.exists(personal_db_path):
         logger.debug("[ITEMS DB MIGRATION] Personal DB does not exist, no migration needed")
         return False, 0, CURRENT_DB_VERSION
     
     try:
-        # Load personal DB
-        with open(personal_db_path, 'r', encoding='utf-8') as f:
-            personal_data = json.load(f)
+        # Load personal DB (active storage backend)
+        personal_data = load_items_document(personal_db_path)
         
         personal_version = get_db_version(personal_data)
         
@@ -470,6 +472,9 @@ def migrate_personal_database(
     Returns:
         tuple: (success: bool, message: str, stats: dict)
     """
+    # Imported here: items_database_manager depends on this module
+    from Functions.items_database_manager import get_items_storage_path, load_items_document, save_items_document
+    
     logger.info("=" * 70)
     logger.info("ITEMS DATABASE MIGRATION STARTED")
     logger.info("=" * 70)
@@ -496,9 +501,8 @@ def migrate_personal_database(
             logger.info("=" * 70)
             return True, message, stats
         
-        # Load databases
-        with open(personal_db_path, 'r', encoding='utf-8') as f:
-            personal_data = json.load(f)
+        # Load databases (personal DB: .db file with the SQLite backend)
+        personal_data = load_items_document(personal_db_path)
         
         with open(embedded_db_path, 'r', encoding='utf-8') as f:
             embedded_data = json.load(f)
@@ -506,7 +510,7 @@ def migrate_personal_database(
         # Create backup
         if not dry_run:
             logger.info("[ITEMS DB MIGRATION] Creating backup...")
-            backup_path, backup_success = create_backup(personal_db_path)
+            backup_path, backup_success = create_backup(str(get_items_storage_path(personal_db_path)))
             stats["backup_created"] = backup_success
             
             if not backup_success:
@@ -547,8 +551,7 @@ def migrate_personal_database(
         
         # Save migrated data
         if not dry_run:
-            with open(personal_db_path, 'w', encoding='utf-8') as f:
-                json.dump(migrated_data, f, indent=2, ensure_ascii=False)
+            save_items_document(personal_db_path, migrated_data)
             logger.info(f"[ITEMS DB MIGRATION] Saved migrated database to: {personal_db_path}")
         
         message = f"Migration successful: v{personal_version} → v{embedded_version}"
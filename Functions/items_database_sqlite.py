@@ -0,0 +1,400 @@
+"""
+Items Database SQLite Backend
+Optional SQLite storage for the items database (alternative to the v2 JSON document).
+
+The JSON database is a single document rewritten in full on every change. The
+SQLite backend stores one row per item with indexed columns for the fields used
+by lookups and filters, so point updates and imports only touch the rows that
+changed.
+
+Storage layout:
+- items:    one row per composite key ("name:realm"), indexed columns
+            (name, realm, slot, model, merchant_zone, item_category, ignore_item)
+            plus the full item dict serialized in 'data'
+- metadata: key/value table holding the v2 '_metadata' section (version,
+            migration_history, ...) and any other top-level document keys
+
+One-shot conversion:
+- import_json_database(): v2 JSON file -> SQLite file
+- export_json_database(): SQLite file -> v2 JSON file (metadata preserved)
+
+Command line:
+    python -m Functions.items_database_sqlite import <json_path> <sqlite_path>
+    python -m Functions.items_database_sqlite export <sqlite_path> <json_path>
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Tuple
+import logging
+
+from Functions.items_database_migration import CURRENT_DB_VERSION, create_metadata, get_db_version
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONSTANTS
+# ============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    name TEXT,
+    name_lower TEXT,
+    realm TEXT,
+    slot TEXT,
+    model TEXT,
+    merchant_zone TEXT,
+    merchant_price TEXT,
+    item_category TEXT,
+    ignore_item INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_name ON items(name_lower);
+CREATE INDEX IF NOT EXISTS idx_items_realm ON items(realm);
+CREATE INDEX IF NOT EXISTS idx_items_slot ON items(slot);
+CREATE INDEX IF NOT EXISTS idx_items_model ON items(model);
+CREATE INDEX IF NOT EXISTS idx_items_merchant_zone ON items(merchant_zone);
+CREATE INDEX IF NOT EXISTS idx_items_item_category ON items(item_category);
+CREATE INDEX IF NOT EXISTS idx_items_ignore_item ON items(ignore_item);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_INSERT_ITEM_SQL = (
+    "INSERT OR REPLACE INTO items (key, name, name_lower, realm, slot, model, "
+    "merchant_zone, merchant_price, item_category, ignore_item, data) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class ItemsSQLiteStore:
+    """SQLite-backed items database with indexed columns and point updates"""
+
+    def __init__(self, db_path):
+        """
+        Open (or create) an SQLite items database
+
+        Args:
+            db_path: Path to the .db file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        logger.debug(f"SQLite items store opened: {self.db_path}")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------------
+    # Rows <-> items
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _item_to_row(key: str, item: Dict[str, Any]) -> Tuple:
+        """Convert an item dict to an 'items' table row"""
+        name = item.get("name") or ""
+        model = item.get("model")
+        return (
+            key.lower(),
+            name,
+            name.lower(),
+            item.get("realm"),
+            item.get("slot"),
+            str(model) if model is not None else None,
+            item.get("merchant_zone"),
+            item.get("merchant_price"),
+            item.get("item_category"),
+            1 if item.get("ignore_item") else 0,
+            json.dumps(item, ensure_ascii=False)
+        )
+
+    # ------------------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------------------
+
+    def get_item(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get one item by composite key
+
+        Args:
+            key: Composite key "name:realm" (case-insensitive)
+
+        Returns:
+            Optional[Dict]: Item data or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM items WHERE key = ?", (key.lower(),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_all_items(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every item
+
+        Returns:
+            Dict: Items keyed by composite key
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT key, data FROM items ORDER BY rowid").fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+    def put_item(self, key: str, item: Dict[str, Any]):
+        """
+        Insert or replace one item
+
+        Args:
+            key: Composite key "name:realm"
+            item: Item data
+        """
+        self.put_items({key: item})
+
+    def put_items(self, items: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Insert or replace many items in a single transaction
+
+        Args:
+            items: Items keyed by composite key
+
+        Returns:
+            int: Number of rows written
+        """
+        rows = [self._item_to_row(key, item) for key, item in items.items()]
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT_ITEM_SQL, rows)
+            self._touch_metadata()
+        return len(rows)
+
+    def delete_items(self, keys: Iterable[str]) -> int:
+        """
+        Delete items by composite key
+
+        Args:
+            keys: Composite keys to delete
+
+        Returns:
+            int: Number of rows deleted
+        """
+        params = [(key.lower(),) for key in keys]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("DELETE FROM items WHERE key = ?", params)
+            deleted = self._conn.total_changes - before
+            self._touch_metadata()
+        return deleted
+
+    def count_items(self) -> int:
+        """
+        Returns:
+            int: Number of items in the store
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    # ------------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------------
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        Get the document-level metadata (v2 '_metadata' section and other keys)
+
+        Returns:
+            Dict: {top-level key: value} without 'items'
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT key, value FROM metadata").fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def set_metadata(self, metadata: Dict[str, Any]):
+        """
+        Replace the document-level metadata
+
+        Args:
+            metadata: {top-level key: value} (the 'items' key is ignored)
+        """
+        rows = [(key, json.dumps(value, ensure_ascii=False))
+                for key, value in metadata.items() if key != "items"]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM metadata")
+            self._conn.executemany("INSERT INTO metadata (key, value) VALUES (?, ?)", rows)
+
+    def _touch_metadata(self):
+        """Update last_update/item_count of the '_metadata' section (inside a transaction)"""
+        row = self._conn.execute("SELECT value FROM metadata WHERE key = '_metadata'").fetchone()
+        metadata = json.loads(row[0]) if row else create_metadata(CURRENT_DB_VERSION, 0)
+        metadata["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        metadata["item_count"] = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        self._conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('_metadata', ?)",
+            (json.dumps(metadata, ensure_ascii=False),)
+        )
+
+    def get_db_version(self) -> int:
+        """
+        Returns:
+            int: Items database version (same rules as items_database_migration)
+        """
+        return get_db_version(self.get_metadata())
+
+    # ------------------------------------------------------------------------
+    # Documents
+    # ------------------------------------------------------------------------
+
+    def load_document(self) -> Dict[str, Any]:
+        """
+        Rebuild the full v2 JSON document
+
+        Returns:
+            Dict: {"_metadata": ..., ..., "items": {...}}
+        """
+        document = self.get_metadata()
+        document["items"] = self.get_all_items()
+        return document
+
+    def replace_document(self, document: Dict[str, Any]) -> int:
+        """
+        Replace the whole store content with a JSON document
+
+        Args:
+            document: v1/v2 database dictionary
+
+        Returns:
+            int: Number of items imported
+        """
+        items = document.get("items", {})
+        rows = [self._item_to_row(key, item) for key, item in items.items()]
+        metadata = {key: value for key, value in document.items() if key != "items"}
+        if "_metadata" not in metadata:
+            metadata["_metadata"] = create_metadata(get_db_version(document), len(rows))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM items")
+            self._conn.executemany(_INSERT_ITEM_SQL, rows)
+            self._conn.execute("DELETE FROM metadata")
+            self._conn.executemany(
+                "INSERT INTO metadata (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in metadata.items()]
+            )
+        return len(rows)
+
+
+# ============================================================================
+# IMPORT / EXPORT
+# ============================================================================
+
+def import_json_database(json_path, sqlite_path) -> Tuple[bool, str, int]:
+    """
+    One-shot import of a JSON items database into an SQLite file.
+
+    The '_metadata' section (version, migration_history, ...) is kept as-is.
+
+    Args:
+        json_path: Source JSON database (v1 or v2)
+        sqlite_path: Target SQLite file (content replaced)
+
+    Returns:
+        tuple: (success: bool, message: str, item_count: int)
+    """
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+
+        store = ItemsSQLiteStore(sqlite_path)
+        try:
+            count = store.replace_document(document)
+        finally:
+            store.close()
+
+        message = f"Imported {count} items from {json_path} (v{get_db_version(document)})"
+        logger.info(f"[ITEMS DB SQLITE] {message}")
+        return True, message, count
+
+    except Exception as e:
+        message = f"Import failed: {e}"
+        logger.error(f"[ITEMS DB SQLITE] {message}")
+        return False, message, 0
+
+
+def export_json_database(sqlite_path, json_path) -> Tuple[bool, str, int]:
+    """
+    One-shot export of an SQLite items database to a v2 JSON file.
+
+    Args:
+        sqlite_path: Source SQLite file
+        json_path: Target JSON file (overwritten)
+
+    Returns:
+        tuple: (success: bool, message: str, item_count: int)
+    """
+    if not os.path.exists(sqlite_path):
+        return False, f"SQLite database not found: {sqlite_path}", 0
+
+    try:
+        store = ItemsSQLiteStore(sqlite_path)
+        try:
+            document = store.load_document()
+        finally:
+            store.close()
+
+        # Keep '_metadata' first, like the JSON databases
+        ordered = {"_metadata": document.pop("_metadata")} if "_metadata" in document else {}
+        ordered.update(document)
+
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(ordered, f, indent=2, ensure_ascii=False)
+
+        count = len(ordered.get("items", {}))
+        message = f"Exported {count} items to {json_path}"
+        logger.info(f"[ITEMS DB SQLITE] {message}")
+        return True, message, count
+
+    except Exception as e:
+        message = f"Export failed: {e}"
+        logger.error(f"[ITEMS DB SQLITE] {message}")
+        return False, message, 0
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if len(sys.argv) != 4 or sys.argv[1] not in ("import", "export"):
+        print("Usage:")
+        print("  python -m Functions.items_database_sqlite import <json_path> <sqlite_path>")
+        print("  python -m Functions.items_database_sqlite export <sqlite_path> <json_path>")
+        sys.exit(1)
+
+    if sys.argv[1] == "import":
+        success, message, _ = import_json_database(sys.argv[2], sys.argv[3])
+    else:
+        success, message, _ = export_json_database(sys.argv[2], sys.argv[3])
+
+    print(message)
+    sys.exit(0 if success else 1)
@@ -119,7 +119,7 @@ def search_item_for_database(item_name, items_scraper, realm="All", force_scrape
     logging.info(f"ID found: {item_id} ({item_name})")
     
     # Get details
-    details = items_scraper.get_item_details(item_id, realm, item_name)
+    details = items_scraper.get_item_details(item_id, realm, item_name, use_cache=not force_scrape)
     
     if not details:
         logging.warning(f"Details not available: {item_name}")
@@ -230,7 +230,8 @@ def build_database_from_folder(folder_path, output_file=None, realm="All"):
             else:
                 fail_count += 1
     finally:
-        # Close scraper
+        # Close scraper (flushes the web cache journal first)
+        items_scraper.close()
         eden_scraper.close()
         logging.info("Scraper closed")
     
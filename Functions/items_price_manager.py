@@ -11,16 +11,187 @@ Naming Convention: All functions use 'items_price_*' prefix for easy discovery
 and grouping with autocomplete.
 
 Functions:
+  - items_price_resolve_batch()    Resolve prices for a whole item list in one pass
+  - items_price_get_display()      Get (price_str, source, category) from a batch
+  - items_price_format_merchant()  Format DB merchant price/currency for display
   - items_price_sync_template()    Sync template prices with database
   - items_price_find_missing()     Find items without prices in template
 """
 
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Currency fallback when an item has a merchant_zone but no merchant_currency
+MERCHANT_ZONE_CURRENCIES = {
+    "DF": "Seals",
+    "SH": "Grimoires",
+    "ToA": "Glasses",
+    "Drake": "Scales",
+    "Epic": "Souls/Roots/Ices",
+    "Epik": "Souls/Roots/Ices"
+}
+
+# Database stores "Gold" prices in copper, displayed as platinum (PP)
+COPPER_PER_PLATINUM = 100_000_000
+
+# Lookup tiers counted by items_price_resolve_batch()
+PRICE_LOOKUP_TIERS = ("metadata", "realm", "all", "legacy", "missing")
+
+
+def items_price_format_merchant(item_data: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Format the merchant price of a database item for display.
+
+    Resolves the currency from merchant_zone when merchant_currency is empty
+    and converts copper "Gold" prices to platinum.
+
+    Args:
+        item_data: Database item dict containing 'merchant_price'
+
+    Returns:
+        tuple: (price, currency) as display strings (currency may be empty)
+    """
+    price = item_data['merchant_price']
+    currency = item_data.get('merchant_currency', '')
+
+    if not currency:
+        currency = MERCHANT_ZONE_CURRENCIES.get(item_data.get('merchant_zone', ''), '')
+
+    if currency == "Gold":
+        try:
+            platinum = int(price) / COPPER_PER_PLATINUM
+            price = f"{int(platinum)}" if platinum % 1 == 0 else f"{platinum:.2f}"
+            currency = "PP"
+        except (ValueError, TypeError):
+            pass
+
+    return str(price), currency
+
+
+def items_price_resolve_batch(
+    items_list: Iterable[Union[str, Dict[str, Any]]],
+    realm: str = "",
+    db_manager=None,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Resolve prices for a whole template item list in one pass.
+
+    Every unique item name is looked up once in the resident items store of
+    the database manager with the usual fallback chain (name:realm, name:all,
+    bare name). Template metadata prices take priority for display, the
+    database lookup is still reported so callers can sync or audit it.
+
+    Args:
+        items_list: Item names or item dicts with a 'name' key
+        realm: Character realm for realm-specific search
+        db_manager: ItemsDatabaseManager instance (optional)
+        metadata: Template metadata dict with optional prices
+
+    Returns:
+        tuple: (results, tier_counts)
+            - results: {item_name: entry} where entry contains
+              'price_str', 'price', 'currency', 'source' ('json', 'db' or None),
+              'category', 'item_data' (DB item or None), 'has_db_price' and
+              'tier' (DB tier: 'realm', 'all', 'legacy' or 'missing')
+            - tier_counts: Number of unique items per tier of PRICE_LOOKUP_TIERS.
+              Each item is counted once: 'metadata' for items priced from the
+              template JSON, its DB tier otherwise (the entry 'tier' still
+              reports the DB tier), so the counts add up to len(results)
+
+    Example:
+        >>> results, tiers = items_price_resolve_batch(
+        ...     ["Sword", {"name": "Helm", "slot": "Head"}],
+        ...     realm="Hibernia",
+        ...     db_manager=db_manager
+        ... )
+        >>> results["Sword"]["price_str"], tiers["realm"]
+        ('100 Scales', 1)
+    """
+    metadata_prices = metadata.get('prices', {}) if metadata else {}
+    realm_suffix = realm.lower() if realm else "all"
+    tier_counts = dict.fromkeys(PRICE_LOOKUP_TIERS, 0)
+    results = {}
+
+    store = {}
+    if db_manager:
+        try:
+            store = db_manager.get_items_store()
+        except Exception as e:
+            logger.debug(f"Items store unavailable for price resolution: {e}")
+
+    for item in items_list:
+        item_name = item.get('name', '') if isinstance(item, dict) else item
+        if not item_name or item_name in results:
+            continue
+
+        item_name_lower = item_name.lower()
+        item_data = store.get(f"{item_name_lower}:{realm_suffix}")
+        tier = "realm"
+        if not item_data:
+            item_data = store.get(f"{item_name_lower}:all")
+            tier = "all"
+        if not item_data:
+            item_data = store.get(item_name_lower)
+            tier = "legacy"
+        if not item_data:
+            tier = "missing"
+        # One tier per item: template prices are displayed first, so they count as 'metadata'
+        tier_counts["metadata" if item_name in metadata_prices else tier] += 1
+
+        has_db_price = bool(item_data) and 'merchant_price' in item_data
+        entry = {
+            'price_str': None,
+            'price': None,
+            'currency': None,
+            'source': None,
+            'category': item_data.get('item_category') if item_data else None,
+            'item_data': item_data,
+            'has_db_price': has_db_price,
+            'tier': tier
+        }
+
+        if item_name in metadata_prices:
+            entry['price_str'] = metadata_prices[item_name]
+            entry['source'] = 'json'
+        elif has_db_price:
+            price, currency = items_price_format_merchant(item_data)
+            entry['price'] = price
+            entry['currency'] = currency
+            entry['price_str'] = f"{price} {currency}" if currency else price
+            entry['source'] = 'db'
+
+        results[item_name] = entry
+
+    logger.debug(f"Resolved {len(results)} item prices (tiers: {tier_counts})")
+    return results, tier_counts
+
+
+def items_price_get_display(
+    resolved: Dict[str, Dict[str, Any]],
+    item_name: str
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Get the display tuple of an item from items_price_resolve_batch() results.
+
+    Args:
+        resolved: Results dict returned by items_price_resolve_batch()
+        item_name: Name of the item
+
+    Returns:
+        tuple: (price_str, source, category) - same contract as
+            template_get_item_price() (metadata prices carry no category)
+    """
+    entry = resolved.get(item_name)
+    if not entry:
+        return (None, None, None)
+    if entry['source'] == 'json':
+        return (entry['price_str'], 'json', None)
+    return (entry['price_str'], entry['source'], entry['category'])
+
 
 def items_price_sync_template(
     metadata_path: str,
@@ -65,28 +236,14 @@ def items_price_sync_template(
         return 0
 
     items_to_remove = []
-    realm_lower = realm.lower()
 
     try:
-        for item_name in prices_dict.keys():
-            # Check if item now exists in database
-            item_name_lower = item_name.lower()
-
-            # Try realm-specific search
-            search_key_realm = f"{item_name_lower}:{realm_lower}"
-            item_data = db_manager.search_item(search_key_realm)
-
-            # Try ":all" suffix
-            if not item_data:
-                search_key_all = f"{item_name_lower}:all"
-                item_data = db_manager.search_item(search_key_all)
-
-            # Try without suffix
-            if not item_data:
-                item_data = db_manager.search_item(item_name)
+        # Resolve all template items against the database in one pass
+        resolved, _ = items_price_resolve_batch(prices_dict.keys(), realm, db_manager)
 
+        for item_name, entry in resolved.items():
             # If item found in DB with a price, mark for removal from JSON
-            if item_data and 'merchant_price' in item_data:
+            if entry['has_db_price']:
                 items_to_remove.append(item_name)
                 logger.info(
                     f"Item '{item_name}' now found in DB, removing from template JSON"
@@ -157,6 +314,14 @@ def items_price_find_missing(
     items_without_price = []
     metadata_prices = metadata.get('prices', {}) if metadata else {}
 
+    # Resolve every item against the database in one pass
+    resolved = {}
+    if db_manager:
+        try:
+            resolved, _ = items_price_resolve_batch(items_list, realm, db_manager)
+        except Exception as e:
+            logger.debug(f"Error looking up prices: {e}")
+
     for item in items_list:
         item_name = item.get('name', '')
         if not item_name:
@@ -166,30 +331,8 @@ def items_price_find_missing(
         has_price_in_metadata = item_name in metadata_prices
 
         # Check if price exists in database
-        has_price_in_db = False
-        if db_manager:
-            try:
-                item_name_lower = item_name.lower()
-                realm_lower = realm.lower()
-
-                # Try realm-specific search
-                search_key_realm = f"{item_name_lower}:{realm_lower}"
-                item_data = db_manager.search_item(search_key_realm)
-
-                # Try ":all" suffix
-                if not item_data:
-                    search_key_all = f"{item_name_lower}:all"
-                    item_data = db_manager.search_item(search_key_all)
-
-                # Try without suffix
-                if not item_data:
-                    item_data = db_manager.search_item(item_name)
-
-                has_price_in_db = (
-                    item_data and 'merchant_price' in item_data
-                )
-            except Exception as e:
-                logger.debug(f"Error looking up price for '{item_name}': {e}")
+        entry = resolved.get(item_name)
+        has_price_in_db = bool(entry and entry['has_db_price'])
 
         # Add to missing list if no price found anywhere
         if not has_price_in_metadata and not has_price_in_db:
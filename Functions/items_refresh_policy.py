@@ -0,0 +1,155 @@
+"""
+Items Refresh Policy
+Staleness tracking and item selection for SuperAdminTools.refresh_all_items.
+
+Every database entry written from a scrape carries:
+  - last_scraped: date of the scrape ("%Y-%m-%d %H:%M:%S")
+  - content_hash: hash of the scraped fields (SCRAPED_FIELDS), so a refresh
+    can tell a changed entry from a re-scrape returning the same data
+
+A refresh then only has to visit the items that need it. Modes:
+  - "all":      every item (previous behavior)
+  - "stale":    items whose oldest variant was scraped more than N days ago
+                (never scraped counts as stale)
+  - "missing":  items with a variant missing its model or merchant price
+  - "priority": every item, stalest first (with a limit: the N stalest only)
+
+Entries are grouped by base item name: an item is as stale as its oldest
+realm variant.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+REFRESH_MODES = ("all", "stale", "missing", "priority")
+
+# Fields of an entry that come from Eden (hashed to detect changes)
+SCRAPED_FIELDS = (
+    "id", "slot", "type", "model", "dps", "speed", "damage_type", "usable_by",
+    "merchant_zone", "merchant_price", "merchant_currency"
+)
+
+# Values meaning "not scraped" for the missing data mode
+MISSING_VALUES = (None, "", "Unknown")
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def compute_content_hash(item_data: Dict[str, Any]) -> str:
+    """
+    Hash the scraped fields of an entry
+
+    Args:
+        item_data: Database entry
+
+    Returns:
+        str: Hex digest (16 chars), identical for identical scraped data
+    """
+    content = {field: item_data.get(field) for field in SCRAPED_FIELDS}
+    payload = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def stamp_scraped_item(item_data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Set last_scraped and content_hash on an entry built from a scrape
+
+    Args:
+        item_data: Database entry (modified in place)
+        now: Scrape date, i.e. when the page was fetched from Eden (default: now)
+
+    Returns:
+        dict: The same entry
+    """
+    item_data["last_scraped"] = (now or datetime.now()).strftime(TIMESTAMP_FORMAT)
+    item_data["content_hash"] = compute_content_hash(item_data)
+    return item_data
+
+
+def get_item_age_days(variants: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> float:
+    """
+    Age of an item: days since its oldest variant was scraped
+
+    Args:
+        variants: Database entries of the item (all realms)
+        now: Reference date (default: now)
+
+    Returns:
+        float: Age in days (infinite if a variant was never scraped)
+    """
+    now = now or datetime.now()
+    oldest = None
+    for item_data in variants:
+        try:
+            scraped = datetime.strptime(item_data.get("last_scraped") or "", TIMESTAMP_FORMAT)
+        except ValueError:
+            return float("inf")
+        if oldest is None or scraped < oldest:
+            oldest = scraped
+    if oldest is None:
+        return float("inf")
+    return (now - oldest).total_seconds() / 86400
+
+
+def is_missing_data(variants: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Tell if a variant of an item lacks its model or merchant price
+
+    Args:
+        variants: Database entries of the item (all realms)
+
+    Returns:
+        bool: True if a model or price is missing (or the item has no variant)
+    """
+    found = False
+    for item_data in variants:
+        found = True
+        if item_data.get("model") in MISSING_VALUES or item_data.get("merchant_price") in MISSING_VALUES:
+            return True
+    return not found
+
+
+def select_items_to_refresh(items_variants: Dict[str, List[Dict[str, Any]]], mode: str = "all",
+                            max_age_days: float = 30, limit: Optional[int] = None,
+                            now: Optional[datetime] = None) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Choose the items a refresh must scrape
+
+    Args:
+        items_variants: {item name: [database entries of the item]}
+        mode: One of REFRESH_MODES
+        max_age_days: Age above which an item is stale ("stale" mode)
+        limit: Maximum number of items to scrape (None = no limit)
+        now: Reference date (default: now)
+
+    Returns:
+        tuple: (item names in scraping order, {skip reason: count})
+            reasons: "fresh" (stale mode), "complete" (missing mode), "limit"
+    """
+    if mode not in REFRESH_MODES:
+        raise ValueError(f"Unknown refresh mode: {mode}")
+
+    now = now or datetime.now()
+    skipped = {"fresh": 0, "complete": 0, "limit": 0}
+    selected = []
+    for name, variants in items_variants.items():
+        if mode == "stale" and get_item_age_days(variants, now) <= max_age_days:
+            skipped["fresh"] += 1
+            continue
+        if mode == "missing" and not is_missing_data(variants):
+            skipped["complete"] += 1
+            continue
+        selected.append(name)
+
+    # Stalest first (never scraped first of all); stable for equal ages
+    if mode in ("stale", "priority"):
+        ages = {name: get_item_age_days(items_variants[name], now) for name in selected}
+        selected.sort(key=lambda name: ages[name], reverse=True)
+
+    if limit is not None and len(selected) > limit:
+        skipped["limit"] = len(selected) - limit
+        selected = selected[:limit]
+
+    return selected, {reason: count for reason, count in skipped.items() if count}
@@ -6,7 +6,11 @@ Items Scraper - Récupération des données de la Database Items Eden
 Permet de rechercher et extraire les informations des items
 """
 
+import os
+import logging
+import copy
 import time
+import threading
 import json
 import html
 import re
@@ -15,11 +19,19 @@ from pathlib import Path
 from datetime import datetime
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 
 from .debug_logging_manager import get_logger, LOGGER_EDEN
+from .eden_wait_policy import (
+    wait_until_ready, wait_condition_all, wait_condition_document_ready, wait_condition_element_present,
+    wait_condition_count_stable, wait_condition_stale
+)
+from .eden_http_client import http_check_items_search, http_check_item_details
+from .eden_page_cache import page_cache_get_stored_at
+from .eden_html_parser import html_parse_fragment, html_parse_items_search
+from .eden_request_scheduler import scheduler_navigate, scheduler_slot
+from .eden_scraper import EDEN_BASE_URL
+from .items_database_manager import PERSONAL_DB_FILENAME, get_items_storage_path, load_items_document
 from .path_manager import get_resource_path
 
 
@@ -118,6 +130,15 @@ class ItemsScraper:
         "Epik": "Souls/Roots/Ices"  # Ancienne orthographe
     }
     
+    # Sources de l'index des IDs, par ordre de priorité
+    ID_INDEX_SOURCES = ("database", "user", "cache")
+    
+    # Cache négatif (recherches Eden sans variante valide): durée de validité par défaut
+    NEGATIVE_CACHE_TTL_HOURS = 24
+    
+    # Journal du cache web: taille au-delà de laquelle il est compacté dans le snapshot
+    CACHE_JOURNAL_COMPACT_BYTES = 256 * 1024
+    
     def __init__(self, eden_scraper):
         """
         Initialise le ItemsScraper avec un EdenScraper déjà connecté
@@ -128,13 +149,12 @@ class ItemsScraper:
         self.eden_scraper = eden_scraper
         self.driver = eden_scraper.driver
         self.logger = get_logger(LOGGER_EDEN)
-        self.base_url = "https://eden-daoc.net/items"
+        self.base_url = f"{EDEN_BASE_URL}/items"
         
         # Database path (embedded) - Use get_resource_path for PyInstaller compatibility
         self.database_file = Path(get_resource_path("Data")) / 'items_database_src.json'
         
         # Cache path (user profile)
-        import os
         user_profile = os.getenv('LOCALAPPDATA') or os.getenv('APPDATA')
         if user_profile:
             cache_dir = Path(user_profile) / 'DAOC_Character_Manager' / 'ItemCache'
@@ -144,13 +164,51 @@ class ItemsScraper:
         
         cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = cache_dir / 'items_cache.json'
+        # Append-only journal (one JSON line per mutation), compacted into cache_file
+        self.cache_journal_file = cache_dir / 'items_cache.journal'
+        
+        # Verrou du cache web, partagé par les scrapers d'un pool de sessions (for_session)
+        self._cache_lock = threading.RLock()
         
         # Initialize cache (web items only)
         self.cache = self._load_cache()
+        
+        # Negative cache TTL (armory.negative_cache_ttl_hours, 0 = disabled)
+        self.negative_cache_ttl_hours = self._get_negative_cache_ttl()
+        self._purge_negative_cache()
+        
+        # Journal laissé par une session interrompue: le replier dans le snapshot
+        # (repart aussi d'un journal propre si sa dernière ligne est tronquée)
+        if self.cache_journal_file.exists() and self.cache_journal_file.stat().st_size:
+            self.compact_cache()
+        
+        # Merged item ID index (DB source > DB user > web cache), built on first lookup
+        self._item_id_index = None
+    
+    def for_session(self, eden_scraper):
+        """
+        Crée un ItemsScraper pour une autre session Eden (pool de sessions)
+        
+        Le clone partage le cache web, son journal, son verrou et l'index des IDs
+        avec ce scraper: seul le driver change. Un seul close() suffit.
+        
+        Args:
+            eden_scraper: Autre instance de EdenScraper connectée
+        
+        Returns:
+            ItemsScraper: Scraper lié au driver de eden_scraper
+        """
+        # Construire l'index maintenant: il doit être le même objet pour tous les clones
+        self._get_item_id_index()
+        
+        clone = copy.copy(self)
+        clone.eden_scraper = eden_scraper
+        clone.driver = eden_scraper.driver
+        return clone
     
     def _load_cache(self):
         """
-        Charge le cache des IDs d'items
+        Charge le cache des IDs d'items (snapshot + rejeu du journal)
         Le cache ne contient QUE les items trouvés via recherche web (pas ceux des databases)
         
         Returns:
@@ -161,18 +219,64 @@ class ItemsScraper:
             if self.cache_file.exists():
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
                     cache = json.load(f)
-                    self.logger.debug(f"Cache web chargé: {len(cache.get('items', {}))} items", 
-                                    extra={"action": "CACHE"})
-                    return cache
             else:
                 # First run: create empty cache (no longer copies from database)
                 self.logger.info("Premier démarrage: création d'un cache vide", 
                                extra={"action": "CACHE"})
-                return self._create_empty_cache()
+                cache = self._create_empty_cache()
                 
         except Exception as e:
             self.logger.warning(f"Erreur chargement cache: {e}", extra={"action": "CACHE"})
-            return self._create_empty_cache()
+            cache = self._create_empty_cache()
+        
+        # Rejouer les mutations non compactées (session précédente interrompue)
+        replayed = self._replay_cache_journal(cache)
+        
+        self.logger.debug(f"Cache web chargé: {len(cache.get('items', {}))} items"
+                          f"{f' ({replayed} mutation(s) du journal rejouée(s))' if replayed else ''}", 
+                          extra={"action": "CACHE"})
+        return cache
+    
+    def _replay_cache_journal(self, cache):
+        """
+        Applique les mutations du journal au cache chargé
+        
+        Une ligne illisible (écriture interrompue par un crash) est ignorée:
+        les mutations précédentes restent appliquées.
+        
+        Args:
+            cache: Cache (snapshot) à mettre à jour
+        
+        Returns:
+            int: Nombre de mutations rejouées
+        """
+        if not self.cache_journal_file.exists():
+            return 0
+        
+        replayed = 0
+        try:
+            with open(self.cache_journal_file, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        section = cache.setdefault(record["section"], {})
+                        if record["op"] == "set":
+                            section[record["key"]] = record["value"]
+                        elif record["op"] == "del":
+                            section.pop(record["key"], None)
+                        else:
+                            continue
+                        replayed += 1
+                    except (ValueError, KeyError, TypeError, AttributeError) as e:
+                        self.logger.warning(f"Journal cache: ligne {line_number} ignorée ({e})", 
+                                          extra={"action": "CACHE"})
+        except Exception as e:
+            self.logger.warning(f"Erreur lecture journal cache: {e}", extra={"action": "CACHE"})
+        
+        return replayed
     
     def _create_empty_cache(self):
         """
@@ -185,7 +289,8 @@ class ItemsScraper:
             "version": "1.0",
             "description": "Web search cache - items NOT in databases",
             "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "items": {}
+            "items": {},
+            "not_found": {}
         }
         
         # Create Armory folder if needed
@@ -202,10 +307,101 @@ class ItemsScraper:
         
         return cache
     
+    def _build_item_id_index(self):
+        """
+        Construit l'index fusionné des IDs d'items (DB source + DB user + cache web)
+        Les fichiers ne sont lus qu'une seule fois par instance de ItemsScraper
+        
+        Returns:
+            dict: Index {clé composite: {source: item_id}}
+        """
+        index = {}
+        user_db_file = self.cache_file.parent / PERSONAL_DB_FILENAME
+        
+        for source, db_file in (("database", self.database_file), ("user", user_db_file)):
+            try:
+                # DB user: fichier .db avec le stockage SQLite
+                if get_items_storage_path(db_file).exists():
+                    database = load_items_document(db_file)
+                    self._index_item_ids(index, database.get("items", {}), source)
+            except Exception as e:
+                self.logger.debug(f"Erreur lecture DB {source}: {e}", extra={"action": "DATABASE"})
+        
+        self._index_item_ids(index, self.cache.get("items", {}), "cache")
+        
+        self.logger.debug(f"Index IDs construit: {len(index)} clés", extra={"action": "DATABASE"})
+        return index
+    
+    @staticmethod
+    def _index_item_ids(index, items, source):
+        """
+        Ajoute les IDs d'un dictionnaire d'items à l'index pour une source donnée
+        
+        Args:
+            index: Index {clé composite: {source: item_id}} à compléter
+            items: Items {clé composite: données item}
+            source: Source des items ("database", "user" ou "cache")
+        """
+        for key, item_data in items.items():
+            item_id = item_data.get('id') if isinstance(item_data, dict) else None
+            if item_id:
+                index.setdefault(key.lower(), {})[source] = item_id
+    
+    def _get_item_id_index(self):
+        """
+        Retourne l'index des IDs d'items (construit au premier appel)
+        
+        Returns:
+            dict: Index {clé composite: {source: item_id}}
+        """
+        if self._item_id_index is None:
+            self._item_id_index = self._build_item_id_index()
+        return self._item_id_index
+    
+    def update_item_id_index(self, items, source="user"):
+        """
+        Synchronise l'index des IDs avec des items nouvellement écrits
+        (ex: ImportWorker qui ajoute des items à la DB)
+        
+        Args:
+            items: Items {clé composite: données item}
+            source: Source des items ("database", "user" ou "cache")
+        """
+        if source not in self.ID_INDEX_SOURCES:
+            raise ValueError(f"Unknown item ID index source: {source}")
+        self._index_item_ids(self._get_item_id_index(), items, source)
+    
+    def _lookup_item_id(self, item_name, realm=None, sources=ID_INDEX_SOURCES):
+        """
+        Recherche un ID dans l'index en mémoire (aucun accès disque)
+        Ordre: source par source (DB source, DB user, cache web), clé realm puis "all"
+        
+        Args:
+            item_name: Nom de l'item
+            realm: Royaume (optionnel)
+            sources: Sources autorisées, par ordre de priorité
+        
+        Returns:
+            tuple: (item_id, source, realm_key) ou (None, None, None)
+        """
+        index = self._get_item_id_index()
+        keys = [(self._get_cache_key(item_name, realm), realm)]
+        if realm and realm != "All":
+            keys.append((self._get_cache_key(item_name, "All"), "All"))
+        
+        for source in sources:
+            for key, key_realm in keys:
+                item_id = index.get(key, {}).get(source)
+                if item_id:
+                    return item_id, source, key_realm
+        
+        return None, None, None
+    
     def _get_item_from_databases(self, item_name, realm=None):
         """
         Recherche un item dans les bases de données (source + user) avec clé composite
         Supporte fallback sur realm "all" si realm spécifique non trouvé
+        La recherche utilise l'index en mémoire (voir _get_item_id_index)
         
         Args:
             item_name: Nom de l'item
@@ -214,79 +410,93 @@ class ItemsScraper:
         Returns:
             str: ID de l'item ou None si non trouvé
         """
-        # Try realm-specific key first
-        cache_key = self._get_cache_key(item_name, realm)
-        
-        # Check source database first (embedded)
-        try:
-            if self.database_file.exists():
-                with open(self.database_file, 'r', encoding='utf-8') as f:
-                    database = json.load(f)
-                    
-                    # Direct lookup with realm
-                    item_data = database.get("items", {}).get(cache_key)
-                    if item_data and item_data.get('id'):
-                        item_id = item_data.get('id')
-                        self.logger.info(f"✅ Item trouvé dans DB source: {item_name} ({realm}) → ID {item_id}", 
-                                       extra={"action": "DATABASE"})
-                        return item_id
-                    
-                    # Fallback: try "all" realm if specific realm not found
-                    if realm and realm != "All":
-                        all_key = self._get_cache_key(item_name, "All")
-                        item_data = database.get("items", {}).get(all_key)
-                        if item_data and item_data.get('id'):
-                            item_id = item_data.get('id')
-                            self.logger.info(f"✅ Item trouvé dans DB source (All): {item_name} → ID {item_id}", 
-                                           extra={"action": "DATABASE"})
-                            return item_id
-        except Exception as e:
-            self.logger.debug(f"Erreur lecture DB source: {e}", extra={"action": "DATABASE"})
-        
-        # Check user database (Armory/items_database.json) if exists
-        user_db_file = self.cache_file.parent / 'items_database.json'
-        try:
-            if user_db_file.exists():
-                with open(user_db_file, 'r', encoding='utf-8') as f:
-                    database = json.load(f)
-                    
-                    # Direct lookup with realm
-                    item_data = database.get("items", {}).get(cache_key)
-                    if item_data and item_data.get('id'):
-                        item_id = item_data.get('id')
-                        self.logger.info(f"✅ Item trouvé dans DB user: {item_name} ({realm}) → ID {item_id}", 
-                                       extra={"action": "DATABASE"})
-                        return item_id
-                    
-                    # Fallback: try "all" realm
-                    if realm and realm != "All":
-                        all_key = self._get_cache_key(item_name, "All")
-                        item_data = database.get("items", {}).get(all_key)
-                        if item_data and item_data.get('id'):
-                            item_id = item_data.get('id')
-                            self.logger.info(f"✅ Item trouvé dans DB user (All): {item_name} → ID {item_id}", 
-                                           extra={"action": "DATABASE"})
-                            return item_id
-        except Exception as e:
-            self.logger.debug(f"Erreur lecture DB user: {e}", extra={"action": "DATABASE"})
-        
-        return None
+        item_id, source, key_realm = self._lookup_item_id(item_name, realm, ("database", "user"))
+        if item_id:
+            db_label = "DB source" if source == "database" else "DB user"
+            self.logger.info(f"✅ Item trouvé dans {db_label}: {item_name} ({key_realm}) → ID {item_id}", 
+                           extra={"action": "DATABASE"})
+        return item_id
     
     def _save_cache(self):
         """
-        Sauvegarde le cache dans le fichier JSON
+        Sauvegarde le snapshot complet du cache dans le fichier JSON
+        (écriture atomique: fichier temporaire puis remplacement)
+        
+        Returns:
+            bool: True si le snapshot a été écrit
         """
         try:
-            self.cache["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, indent=4, ensure_ascii=False)
+            with self._cache_lock:
+                self.cache["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                temp_file = self.cache_file.with_suffix('.json.tmp')
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.cache, f, indent=4, ensure_ascii=False)
+                os.replace(temp_file, self.cache_file)
             
             self.logger.debug(f"Cache sauvegardé: {len(self.cache.get('items', {}))} items", 
                             extra={"action": "CACHE"})
+            return True
         except Exception as e:
             self.logger.error(f"Erreur sauvegarde cache: {e}", extra={"action": "CACHE"})
+            return False
+    
+    def _journal_cache_mutation(self, op, section, key, value=None):
+        """
+        Enregistre une mutation du cache dans le journal (une ligne JSON)
+        
+        Le snapshot n'est réécrit qu'au compactage (fermeture ou journal trop gros),
+        au lieu d'être réécrit en entier à chaque item.
+        
+        Args:
+            op: "set" ou "del"
+            section: Section du cache ("items", "not_found")
+            key: Clé de l'entrée
+            value: Nouvelle valeur (op "set")
+        """
+        record = {"op": op, "section": section, "key": key}
+        if op == "set":
+            record["value"] = value
+        
+        try:
+            with self._cache_lock:
+                with open(self.cache_journal_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception as e:
+            # Journal indisponible: retomber sur l'écriture du snapshot complet
+            self.logger.warning(f"Erreur écriture journal cache: {e}", extra={"action": "CACHE"})
+            self._save_cache()
+            return
+        
+        try:
+            journal_size = self.cache_journal_file.stat().st_size
+        except OSError:
+            return
+        if journal_size >= self.CACHE_JOURNAL_COMPACT_BYTES:
+            self.compact_cache()
+    
+    def compact_cache(self):
+        """
+        Compacte le journal dans le snapshot puis vide le journal
+        
+        Un crash entre les deux étapes est sans perte: le rejeu est idempotent.
+        """
+        with self._cache_lock:
+            if not self._save_cache():
+                return
+            try:
+                if self.cache_journal_file.exists():
+                    open(self.cache_journal_file, 'w', encoding='utf-8').close()
+                self.logger.debug("Journal cache compacté", extra={"action": "CACHE"})
+            except Exception as e:
+                self.logger.warning(f"Erreur vidage journal cache: {e}", extra={"action": "CACHE"})
+    
+    def close(self):
+        """Fin de session: compacte le journal du cache web (le driver reste géré par EdenScraper)"""
+        self.compact_cache()
     
     def _get_cache_key(self, item_name, realm=None):
         """
@@ -324,10 +534,10 @@ class ItemsScraper:
             str: ID de l'item ou None si non trouvé
         """
         cache_key = self._get_cache_key(item_name)
-        item_data = self.cache.get("items", {}).get(cache_key)
+        item_id, _, _ = self._lookup_item_id(item_name, sources=("cache",))
         
-        if item_data:
-            item_id = item_data.get('id')
+        if item_id:
+            item_data = self.cache.get("items", {}).get(cache_key, {})
             item_display_name = item_data.get('name', item_name)
             self.logger.info(f"✅ Item trouvé dans cache: {item_display_name} (ID: {item_id})", 
                            extra={"action": "CACHE"})
@@ -371,12 +581,144 @@ class ItemsScraper:
                 if price_parsed:
                     cache_entry["merchant_price"] = str(price_parsed.get('amount'))
         
-        self.cache["items"][cache_key] = cache_entry
-        self._save_cache()
+        with self._cache_lock:
+            self.cache["items"][cache_key] = cache_entry
+            self._journal_cache_mutation("set", "items", cache_key, cache_entry)
+        self.update_item_id_index({cache_key: cache_entry}, source="cache")
         
         self.logger.info(f"💾 Item sauvegardé dans cache: {item_name} (ID: {item_id})", 
                        extra={"action": "CACHE"})
     
+    def _get_negative_cache_ttl(self):
+        """
+        Lit la durée de validité du cache négatif dans la configuration
+        
+        Returns:
+            float: TTL en heures (0 = cache négatif désactivé)
+        """
+        try:
+            from Functions.config_manager import ConfigManager
+            ttl = ConfigManager().get('armory.negative_cache_ttl_hours', self.NEGATIVE_CACHE_TTL_HOURS)
+            return max(float(ttl), 0.0)
+        except Exception as e:
+            self.logger.debug(f"TTL cache négatif par défaut ({e})", extra={"action": "CACHE"})
+            return float(self.NEGATIVE_CACHE_TTL_HOURS)
+    
+    @staticmethod
+    def _get_negative_cache_key(item_name, skip_filters=False):
+        """
+        Génère la clé du cache négatif: nom normalisé + mode de filtrage
+        
+        Returns:
+            str: Clé "name|filtered" ou "name|nofilter"
+        """
+        mode = "nofilter" if skip_filters else "filtered"
+        return f"{item_name.strip().lower()}|{mode}"
+    
+    def _is_negative_entry_expired(self, entry):
+        """
+        Vérifie si une entrée du cache négatif a dépassé le TTL
+        
+        Returns:
+            bool: True si expirée (ou date illisible)
+        """
+        if self.negative_cache_ttl_hours <= 0:
+            return True
+        try:
+            cached_at = datetime.strptime(entry.get("cached_at", ""), "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            return True
+        age_hours = (datetime.now() - cached_at).total_seconds() / 3600
+        return age_hours > self.negative_cache_ttl_hours
+    
+    def _purge_negative_cache(self):
+        """Supprime les entrées expirées du cache négatif (sans sauvegarde)"""
+        not_found = self.cache.setdefault("not_found", {})
+        expired = [key for key, entry in not_found.items() if self._is_negative_entry_expired(entry)]
+        for key in expired:
+            del not_found[key]
+        if expired:
+            self.logger.debug(f"Cache négatif: {len(expired)} entrée(s) expirée(s) supprimée(s)", 
+                            extra={"action": "CACHE"})
+    
+    def get_negative_cache_entry(self, item_name, skip_filters=False):
+        """
+        Récupère une entrée valide du cache négatif.
+        
+        Une recherche SANS filtres restée vide l'est aussi AVEC filtres: en mode
+        filtré, l'entrée "nofilter" est donc aussi consultée.
+        
+        Args:
+            item_name: Nom de l'item recherché
+            skip_filters: Mode de filtrage de la recherche
+        
+        Returns:
+            dict: Entrée {query, skip_filters, reasons, result_rows, filtered, cached_at} ou None
+        """
+        if self.negative_cache_ttl_hours <= 0 or not item_name or not item_name.strip():
+            return None
+        
+        not_found = self.cache.get("not_found", {})
+        modes = (True,) if skip_filters else (False, True)
+        for mode in modes:
+            entry = not_found.get(self._get_negative_cache_key(item_name, mode))
+            if entry and not self._is_negative_entry_expired(entry):
+                return entry
+        return None
+    
+    def save_negative_result(self, item_name, skip_filters, reasons, result_rows, filtered_items):
+        """
+        Mémorise une recherche Eden sans variante valide
+        
+        Args:
+            item_name: Nom de l'item recherché
+            skip_filters: Mode de filtrage de la recherche
+            reasons: Compteurs des raisons de rejet {raison: nombre}
+            result_rows: Nombre de lignes brutes retournées par Eden
+            filtered_items: Items filtrés (level/utility) à restituer lors d'un hit
+        """
+        if self.negative_cache_ttl_hours <= 0:
+            return
+        
+        key = self._get_negative_cache_key(item_name, skip_filters)
+        entry = {
+            "query": item_name,
+            "skip_filters": bool(skip_filters),
+            "reasons": {reason: count for reason, count in reasons.items() if count},
+            "result_rows": result_rows,
+            "filtered": filtered_items,
+            "cached_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        with self._cache_lock:
+            self.cache.setdefault("not_found", {})[key] = entry
+            self._journal_cache_mutation("set", "not_found", key, entry)
+        
+        self.logger.info(f"🚫 Recherche sans résultat mémorisée: {item_name} (skip_filters={skip_filters})", 
+                       extra={"action": "CACHE"})
+    
+    def clear_negative_cache(self, item_name=None):
+        """
+        Vide le cache négatif (entièrement ou pour un item)
+        
+        Args:
+            item_name: Nom de l'item (None = tout le cache négatif)
+        
+        Returns:
+            int: Nombre d'entrées supprimées
+        """
+        with self._cache_lock:
+            not_found = self.cache.setdefault("not_found", {})
+            if item_name is None:
+                keys = list(not_found.keys())
+            else:
+                keys = [self._get_negative_cache_key(item_name, mode) for mode in (False, True)]
+                keys = [key for key in keys if key in not_found]
+            
+            for key in keys:
+                del not_found[key]
+                self._journal_cache_mutation("del", "not_found", key)
+        return len(keys)
+    
     @staticmethod
     def parse_price(price_str):
         """
@@ -535,10 +877,10 @@ class ItemsScraper:
         """
         try:
             self.logger.info(f"Navigation vers {self.base_url}", extra={"action": "ITEMDB"})
-            self.driver.get(self.base_url)
+            scheduler_navigate(self.driver, self.base_url)
             
-            # Wait longer for page load (items database may be slower)
-            time.sleep(5)  # Increased from 2 to 5 seconds
+            # Wait for page load (items database may be slower)
+            wait_until_ready(self.driver, "eden_page", wait_condition_document_ready(), description="items")
             
             # Get current page source ONCE
             html_content = self.driver.page_source
@@ -834,7 +1176,7 @@ class ItemsScraper:
         Args:
             item_name: Nom de l'item
             realm: Royaume spécifique (Hibernia, Albion, Midgard, All)
-            force_scrape: Si True, ignore les DBs et force la recherche web
+            force_scrape: Si True, ignore les DBs et le cache négatif et force la recherche web
             skip_filters: Si True, ignore les filtres level/utility (retry mode)
         
         Returns:
@@ -856,7 +1198,7 @@ class ItemsScraper:
         self.logger.info(f"⚠️ Item non trouvé (DB/cache), recherche en ligne...", extra={"action": "SEARCH"})
         
         # Utiliser find_all_item_variants puis filtrer par realm (with optional skip_filters)
-        variants = self.find_all_item_variants(item_name, skip_filters=skip_filters)
+        variants = self.find_all_item_variants(item_name, skip_filters=skip_filters, force_scrape=force_scrape)
         
         if not variants:
             return None
@@ -878,15 +1220,21 @@ class ItemsScraper:
         
         return None
     
-    def find_all_item_variants(self, item_name, return_filtered=False, skip_filters=False):
+    def find_all_item_variants(self, item_name, return_filtered=False, skip_filters=False, force_scrape=False,
+                               use_cache=True):
         """
         Trouve TOUTES les variantes d'un item (tous les realms).
         Utilisé pour alimenter la DB avec toutes les versions disponibles.
         
+        Les recherches sans variante valide sont mémorisées dans le cache négatif
+        (par mode de filtrage) et ne sont pas relancées avant expiration du TTL.
+        
         Args:
             item_name: Nom de l'item à rechercher
             return_filtered: Si True, retourne aussi les items filtrés avec raisons
             skip_filters: Si True, ignore les filtres level/utility (retry mode)
+            force_scrape: Si True, ignore le cache négatif et force la recherche web
+            use_cache: Si False, ignore le cache de pages (rafraîchissement de la base)
         
         Returns:
             Si return_filtered=False:
@@ -895,6 +1243,20 @@ class ItemsScraper:
                 Tuple[List[Dict], List[Dict]]: (variants, filtered_items)
                 filtered_items contient: [{'name': ..., 'realm': ..., 'reason': ..., 'level': ..., 'utility': ...}]
         """
+        # Cache négatif: recherche déjà connue sans résultat
+        if not force_scrape:
+            negative_entry = self.get_negative_cache_entry(item_name, skip_filters)
+            if negative_entry:
+                reasons = ", ".join(f"{count} {reason}" for reason, count in negative_entry.get("reasons", {}).items())
+                self.logger.info(
+                    f"🚫 Cache négatif: '{item_name}' sans variante depuis {negative_entry.get('cached_at')}"
+                    f"{f' ({reasons})' if reasons else ''} - recherche ignorée",
+                    extra={"action": "CACHE"}
+                )
+                if return_filtered:
+                    return [], [dict(fitem) for fitem in negative_entry.get("filtered", [])]
+                return []
+        
         try:
             # Build search URL avec r=0 (ALL realms)
             import urllib.parse
@@ -907,32 +1269,45 @@ class ItemsScraper:
                 self.logger.info(f"🔍 Recherche TOUTES variantes: {item_name}", extra={"action": "ITEMDB"})
             self.logger.debug(f"📍 URL: {search_url}", extra={"action": "ITEMDB"})
             
-            # Navigate to search URL
-            self.driver.get(search_url)
-            
-            # Wait for results table to load
-            self.logger.debug("⏳ Attente chargement des résultats...", extra={"action": "ITEMDB"})
-            time.sleep(8)
-            
-            # Wait for table results
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "table_result"))
+            # Chemin rapide HTTP, sinon navigation Selenium
+            # (une page HTTP/cache a déjà passé sa vérification de complétude)
+            table_loaded = False
+            page_source = self.eden_scraper.fetch_html(
+                search_url, "items_search", http_check_items_search(), use_cache=use_cache and not force_scrape
+            )
+            if page_source is None:
+                # Navigate to search URL
+                scheduler_navigate(self.driver, search_url)
+                
+                # Wait for results table: present, then row count stable (JavaScript population)
+                self.logger.debug("⏳ Attente chargement des résultats...", extra={"action": "ITEMDB"})
+                table_loaded = wait_until_ready(
+                    self.driver, "items_search",
+                    wait_condition_all(
+                        wait_condition_element_present(By.ID, "table_result"),
+                        wait_condition_count_stable(By.CSS_SELECTOR, "tr[id^='result_row_']", empty_stable_seconds=3.0)
+                    ),
+                    description=item_name
                 )
-                self.logger.debug("✅ Table de résultats chargée", extra={"action": "ITEMDB"})
-            except:
-                self.logger.warning("⚠️ Timeout attente table résultats", extra={"action": "ITEMDB"})
-            
-            # Small additional wait for JavaScript population
-            time.sleep(3)
+                if table_loaded:
+                    self.logger.debug("✅ Table de résultats chargée", extra={"action": "ITEMDB"})
+                else:
+                    self.logger.warning("⚠️ Timeout attente table résultats", extra={"action": "ITEMDB"})
+                page_source = self.driver.page_source
+                if table_loaded:
+                    self.eden_scraper.store_page(search_url, "items_search", page_source, http_check_items_search())
+            else:
+                table_loaded = True
+                self.logger.debug("✅ Résultats récupérés par HTTP/cache", extra={"action": "ITEMDB"})
             
-            # Parse results
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Parse results: table_result seule, colonnes level/utility lues dans l'en-tête
+            result_rows, columns = html_parse_items_search(page_source)
+            level_column = columns.get('level')
+            utility_column = columns.get('utility')
             
             # Collecter TOUS les result_row avec leur icône realm
             variants = []
             filtered_items = []  # Initialize filtered items list
-            result_rows = soup.find_all('tr', id=re.compile(r'^result_row_\d+$'))
             
             # Counters for filtering reasons
             skip_reasons = {
@@ -948,38 +1323,22 @@ class ItemsScraper:
             self.logger.info(f"📊 {len(result_rows)} résultat(s) brut(s) trouvé(s)", extra={"action": "ITEMDB"})
             
             # 🔍 DEBUG: Afficher la structure de la première ligne pour analyse
-            if result_rows and len(result_rows) > 0:
-                first_row = result_rows[0]
-                cells = first_row.find_all('td')
-                self.logger.debug(f"🔍 DEBUG - Structure de la première ligne ({len(cells)} colonnes):", extra={"action": "ITEMDB"})
-                for idx, cell in enumerate(cells):
-                    content = cell.get_text(strip=True)[:50]  # Limite à 50 caractères
-                    img = cell.find('img')
-                    img_src = img.get('src', '') if img else 'NO IMAGE'
-                    self.logger.debug(f"  Colonne {idx}: '{content}' | Image: {img_src}", extra={"action": "ITEMDB"})
+            if result_rows and self.logger.isEnabledFor(logging.DEBUG):
+                first_cells = result_rows[0]['cells']
+                self.logger.debug(f"🔍 DEBUG - Structure de la première ligne ({len(first_cells)} colonnes), "
+                                  f"colonnes en-tête: {columns or 'non identifiées'}: "
+                                  f"{[text[:50] for text in first_cells]}", extra={"action": "ITEMDB"})
             
             for row in result_rows:
-                # Extraire l'ID depuis result_row_XXXXX
-                row_id = row.get('id', '')
-                match = re.search(r'result_row_(\d+)', row_id)
-                if not match:
-                    continue
-                
-                item_id = match.group(1)
-                
-                # DEBUG: Afficher toutes les cellules de cette ligne
-                all_cells = row.find_all('td')
-                self.logger.debug(f"🔍 Processing ID {item_id} - {len(all_cells)} colonnes", extra={"action": "ITEMDB"})
+                item_id = row['id']
                 
-                # Extraire les valeurs de toutes les colonnes de façon robuste
-                cells_text = [cell.get_text(strip=True) for cell in all_cells]
+                # Valeurs de toutes les colonnes (extraites une seule fois par ligne)
+                cells_text = row['cells']
                 
                 # FILTRAGE 1: Vérifier le NOM EXACT (case-insensitive)
-                # La colonne avec le nom est généralement la 2ème <td> (index 1)
-                # Mais on cherche aussi dans les autres colonnes si ce n'est pas là
-                name_cell = all_cells[1] if len(all_cells) > 1 else None
-                if name_cell:
-                    found_name = name_cell.get_text(strip=True)
+                # La colonne avec le nom est la 2ème <td> (index 1)
+                if len(cells_text) > 1:
+                    found_name = cells_text[1]
                     # Comparaison case-insensitive
                     if found_name.lower() != item_name.lower():
                         skip_reasons['name_mismatch'] += 1
@@ -992,20 +1351,22 @@ class ItemsScraper:
                     continue
                 
                 # FILTRAGE 2: Vérifier le LEVEL ≥ 50
-                # Chercher dynamiquement la colonne qui contient un nombre entre 1 et 51
+                # Colonne de l'en-tête, sinon première colonne contenant un nombre entre 1 et 51
                 level = None
                 level_idx = None
                 level_text = "N/A"
-                for idx, text in enumerate(cells_text):
-                    if idx == 0 or idx == 1:  # Skip icône et nom
-                        continue
+                if level_column is not None:
+                    candidates = [level_column] if level_column < len(cells_text) else []
+                else:
+                    candidates = range(2, len(cells_text))  # Skip icône et nom
+                for idx in candidates:
+                    text = cells_text[idx]
                     try:
                         val = int(text)
                         if 1 <= val <= 51:  # Level DAOC range
                             level = val
                             level_idx = idx
                             level_text = text
-                            self.logger.debug(f"  ✓ Level trouvé: {level} (colonne {idx})", extra={"action": "ITEMDB"})
                             break
                     except ValueError:
                         continue
@@ -1026,27 +1387,26 @@ class ItemsScraper:
                         # Continue to get realm before storing
                         skip_level = True
                     else:
-                        self.logger.debug(f"  ✓ Level {level} (filter bypassed)", extra={"action": "ITEMDB"})
                         skip_level = False
                 else:
                     skip_level = False
                 
                 # FILTRAGE 3: Vérifier UTILITY ≥ 100
-                # Chercher dynamiquement la colonne qui contient un nombre décimal > 50
+                # Colonne de l'en-tête, sinon première colonne décimale ≥ 50
                 # IMPORTANT: Sauter la colonne du level trouvé précédemment
                 utility = None
                 utility_text = "N/A"
-                for idx, text in enumerate(cells_text):
-                    if idx == 0 or idx == 1:  # Skip icône et nom
-                        continue
-                    if level_idx is not None and idx == level_idx:  # SKIP la colonne level
-                        continue
+                if utility_column is not None:
+                    candidates = [utility_column] if utility_column < len(cells_text) else []
+                else:
+                    candidates = [idx for idx in range(2, len(cells_text)) if idx != level_idx]
+                for idx in candidates:
+                    text = cells_text[idx]
                     try:
                         val = float(text)
                         if val >= 50:  # Utility généralement > 50
                             utility = val
                             utility_text = text
-                            self.logger.debug(f"  ✓ Utility trouvée: {utility} (colonne {idx})", extra={"action": "ITEMDB"})
                             break
                     except ValueError:
                         continue
@@ -1064,10 +1424,8 @@ class ItemsScraper:
                         }
                         skip_utility = True
                     else:
-                        self.logger.debug(f"  ✓ Utility {utility} (filter bypassed)", extra={"action": "ITEMDB"})
                         skip_utility = False
                 elif utility is None:
-                    self.logger.debug(f"  ℹ️ Pas de colonne utility trouvée pour '{found_name}' (ID {item_id}), on continue", extra={"action": "ITEMDB"})
                     skip_utility = False
                     if 'filtered_info' in locals() and 'skip_level' in locals() and skip_level:
                         filtered_info['utility'] = None
@@ -1077,14 +1435,12 @@ class ItemsScraper:
                         filtered_info['utility'] = utility
                 
                 # Extraire le realm depuis l'icône (OBLIGATOIRE)
-                # Chercher l'icône avec différents chemins possibles
-                realm_img = row.find('img', src=re.compile(r'(albion_logo|hibernia_logo|midgard_logo|all_logo)\.png'))
-                if not realm_img:
+                src = row['realm_src']
+                if src is None:
                     skip_reasons['no_realm_icon'] += 1
                     self.logger.warning(f"⚠️ Pas d'icône realm pour '{found_name}' (ID {item_id}), SKIP", extra={"action": "ITEMDB"})
                     continue
                 
-                src = realm_img.get('src', '')
                 if 'albion_logo' in src:
                     item_realm = 'Albion'
                 elif 'hibernia_logo' in src:
@@ -1148,7 +1504,21 @@ class ItemsScraper:
                     self.logger.warning(f"❌ Aucun résultat trouvé pour '{item_name}' sur Eden", extra={"action": "ITEMDB"})
                 else:
                     self.logger.warning(f"❌ Aucune variante trouvée pour '{item_name}' (raison inconnue)", extra={"action": "ITEMDB"})
+                
+                # Mémoriser uniquement un résultat fiable (table chargée, pas de timeout)
+                if table_loaded:
+                    self.save_negative_result(item_name, skip_filters, skip_reasons, len(result_rows), filtered_items)
             else:
+                # Item trouvé: invalider les entrées négatives devenues fausses
+                not_found = self.cache.get("not_found", {})
+                stale_keys = [self._get_negative_cache_key(item_name, True)]
+                if not skip_filters:
+                    stale_keys.append(self._get_negative_cache_key(item_name, False))
+                with self._cache_lock:
+                    for key in stale_keys:
+                        if not_found.pop(key, None) is not None:
+                            self._journal_cache_mutation("del", "not_found", key)
+                
                 total_skipped = sum(skip_reasons.values())
                 if total_skipped > 0:
                     self.logger.info(
@@ -1173,7 +1543,57 @@ class ItemsScraper:
             else:
                 return []
     
-    def get_item_details(self, item_id, realm="All", item_name=None):
+    def _load_item_details_page(self, item_id, item_url):
+        """
+        Affiche les détails d'un item dans le navigateur (clic sur la ligne
+        des résultats, sinon navigation directe) et attend leur chargement
+        
+        Returns:
+            str: Code source de la page
+        """
+        # Details of a previously opened item (must be replaced before parsing)
+        previous_lines = self.driver.find_elements(By.CLASS_NAME, "item_line_left")
+        previous_line = previous_lines[0] if previous_lines else None
+        
+        # Try to find and click on the item row in search results
+        try:
+            row = self.driver.find_element(By.ID, f"result_row_{item_id}")
+            with scheduler_slot(item_url):
+                row.click()
+            self.logger.debug("✅ Clic sur l'item effectué", extra={"action": "ITEMDB"})
+            
+        except Exception as e:
+            # If row not found, navigate directly to item URL
+            self.logger.debug(f"Row non trouvé, navigation directe vers l'item", extra={"action": "ITEMDB"})
+            
+            scheduler_navigate(self.driver, item_url)
+            self.logger.debug(f"✅ Navigation directe vers {item_url}", extra={"action": "ITEMDB"})
+        
+        # Wait for item details to load via JavaScript
+        self.logger.debug("⏳ Attente chargement détails item...", extra={"action": "ITEMDB"})
+        
+        # Wait for item details table with actual data (not empty search table):
+        # rows "item_line_left" present, previous details gone, row count stable
+        if wait_until_ready(
+            self.driver, "item_details",
+            wait_condition_all(
+                wait_condition_stale(previous_line),
+                wait_condition_element_present(By.CLASS_NAME, "item_line_left"),
+                wait_condition_count_stable(By.CLASS_NAME, "item_line_left", min_count=1)
+            ),
+            description=f"ID {item_id}"
+        ):
+            self.logger.debug("✅ Détails item chargés (lignes item_line_left trouvées)", extra={"action": "ITEMDB"})
+        else:
+            self.logger.warning(f"⚠️ Timeout attente détails item ID {item_id}", extra={"action": "ITEMDB"})
+            return self.driver.page_source
+        
+        # Détails chargés: page gardée dans le cache de pages
+        page_source = self.driver.page_source
+        self.eden_scraper.store_page(item_url, "item_details", page_source, http_check_item_details())
+        return page_source
+    
+    def get_item_details(self, item_id, realm="All", item_name=None, use_cache=True):
         """
         Récupère les détails complets d'un item via son ID
         
@@ -1181,44 +1601,31 @@ class ItemsScraper:
             item_id: ID de l'item
             realm: Royaume (pour contexte)
             item_name: Nom de l'item (pour recherche si besoin)
+            use_cache: Si False, ignore le cache de pages (rafraîchissement de la base)
         
         Returns:
             dict: Détails complets de l'item avec merchants, stats, etc.
+                  'fetched_at' (datetime) est la date de récupération de la page
+                  sur Eden (plus ancienne si elle vient du cache de pages)
         """
         try:
             self.logger.info(f"📄 Récupération détails item ID: {item_id}", extra={"action": "ITEMDB"})
             
-            # Try to find and click on the item row in search results
-            try:
-                row = self.driver.find_element(By.ID, f"result_row_{item_id}")
-                row.click()
-                self.logger.debug("✅ Clic sur l'item effectué", extra={"action": "ITEMDB"})
-                time.sleep(2)
-                
-            except Exception as e:
-                # If row not found, navigate directly to item URL
-                self.logger.debug(f"Row non trouvé, navigation directe vers l'item", extra={"action": "ITEMDB"})
-                
-                item_url = f"{self.base_url}?id={item_id}"
-                self.driver.get(item_url)
-                time.sleep(3)
-                self.logger.debug(f"✅ Navigation directe vers {item_url}", extra={"action": "ITEMDB"})
-            
-            # Wait for item details to load via JavaScript
-            self.logger.debug("⏳ Attente chargement détails item...", extra={"action": "ITEMDB"})
-            
-            # Wait for item details table with actual data (not empty search table)
-            # We need to wait for table rows with class "item_line_left" which contain the actual item data
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "item_line_left"))
-                )
-                self.logger.debug("✅ Détails item chargés (lignes item_line_left trouvées)", extra={"action": "ITEMDB"})
-            except Exception as e:
-                self.logger.warning(f"⚠️ Timeout attente détails item: {e}", extra={"action": "ITEMDB"})
-            
-            # Additional wait for complete rendering
-            time.sleep(2)
+            # Chemin rapide HTTP, sinon clic/navigation Selenium
+            item_url = f"{self.base_url}?id={item_id}"
+            fetch_start = time.time()
+            page_source = self.eden_scraper.fetch_html(
+                item_url, "item_details", http_check_item_details(), use_cache=use_cache
+            )
+            fetched_at = datetime.now()
+            if page_source is None:
+                page_source = self._load_item_details_page(item_id, item_url)
+            else:
+                self.logger.debug("✅ Détails item récupérés par HTTP/cache", extra={"action": "ITEMDB"})
+                # Page servie par le cache (stockée avant l'appel) : date de son téléchargement
+                stored_at = page_cache_get_stored_at(item_url, "item_details")
+                if stored_at is not None and stored_at < fetch_start:
+                    fetched_at = datetime.fromtimestamp(stored_at)
             
             # DEBUG: Save HTML for inspection (if enabled in config)
             from pathlib import Path
@@ -1229,11 +1636,11 @@ class ItemsScraper:
                 debug_folder.mkdir(parents=True, exist_ok=True)
                 debug_file = debug_folder / f"item_{item_id}_clicked.html"
                 with open(debug_file, 'w', encoding='utf-8') as f:
-                    f.write(self.driver.page_source)
+                    f.write(page_source)
                 self.logger.debug(f"💾 HTML détails sauvegardé: {debug_file}", extra={"action": "ITEMDB"})
             
-            # Parse page
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Parse page (tables résultat et marchands uniquement)
+            soup = html_parse_fragment(page_source, ("table_result", "table_merchants"))
             
             item_data = {
                 'id': item_id,
@@ -1246,7 +1653,8 @@ class ItemsScraper:
                 'speed': None,        # Weapon Speed (weapons only)
                 'damage_type': None,  # Crush/Slash/Thrust (weapons only)
                 'usable_by': 'ALL',   # Classes that can use this item (default: ALL)
-                'merchants': []
+                'merchants': [],
+                'fetched_at': fetched_at  # Date the page was fetched from Eden
             }
             
             # Extract data from HTML table (only reliable source)
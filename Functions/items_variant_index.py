@@ -0,0 +1,153 @@
+"""
+Items Variant Index
+Secondary index from base item name to its realm variants.
+
+Composite keys are "name:realm" (lowercase). Finding every realm variant of an
+item used to mean scanning all keys with startswith(name + ":"), which makes a
+mass import O(items x DB size). ItemVariantIndex keeps, for each base name,
+the {composite_key: item_data} of its variants so lookups are O(1).
+
+The index stores references to the item dicts, so flags changed in place
+(ignore_item, bypass_filters) are seen without re-indexing. Keys added or
+removed must go through add()/remove().
+"""
+
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+
+class ItemVariantIndex:
+    """Base name -> {composite_key: item_data} index over an items dictionary"""
+
+    def __init__(self, items: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            items: Optional items dictionary (composite key -> item data) to index
+        """
+        self._variants: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        if items:
+            self.build(items)
+
+    @staticmethod
+    def get_base_name(key: str) -> str:
+        """
+        Extract the base item name from a composite key
+
+        Args:
+            key: Composite key "name:realm"
+
+        Returns:
+            str: Lowercase base name ("name")
+        """
+        return key.rsplit(":", 1)[0].lower() if ":" in key else key.lower()
+
+    def build(self, items: Dict[str, Dict[str, Any]]):
+        """
+        (Re)build the index from an items dictionary
+
+        Args:
+            items: Items dictionary (composite key -> item data)
+        """
+        self._variants = {}
+        for key, item_data in items.items():
+            self.add(key, item_data)
+
+    def add(self, key: str, item_data: Dict[str, Any]):
+        """
+        Index (or re-index) one item
+
+        Args:
+            key: Composite key "name:realm"
+            item_data: Item data (stored by reference)
+        """
+        self._variants.setdefault(self.get_base_name(key), {})[key] = item_data
+
+    def remove(self, key: str):
+        """
+        Remove one item from the index
+
+        Args:
+            key: Composite key "name:realm"
+        """
+        base_name = self.get_base_name(key)
+        variants = self._variants.get(base_name)
+        if variants is None:
+            return
+        variants.pop(key, None)
+        if not variants:
+            del self._variants[base_name]
+
+    def get_variants(self, item_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get every realm variant of an item
+
+        Args:
+            item_name: Item name (case-insensitive)
+
+        Returns:
+            Dict: {composite_key: item_data} (empty if unknown)
+        """
+        return self._variants.get(item_name.lower(), {})
+
+    def has_item(self, item_name: str) -> bool:
+        """
+        Args:
+            item_name: Item name (case-insensitive)
+
+        Returns:
+            bool: True if at least one realm variant exists
+        """
+        return item_name.lower() in self._variants
+
+    def get_flags(self, item_name: str) -> Tuple[bool, bool]:
+        """
+        Get the ignore_item / bypass_filters flags of an item.
+
+        Same rule as the former prefix scan: the first variant carrying either
+        flag decides (ignore_item checked before bypass_filters).
+
+        Args:
+            item_name: Item name (case-insensitive)
+
+        Returns:
+            tuple: (ignore_item: bool, bypass_filters: bool)
+        """
+        for item_data in self.get_variants(item_name).values():
+            if item_data.get("ignore_item", False):
+                return True, False
+            if item_data.get("bypass_filters", False):
+                return False, True
+        return False, False
+
+    def iter_names(self) -> Iterator[Tuple[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Iterate over indexed items
+
+        Yields:
+            tuple: (base_name, {composite_key: item_data})
+        """
+        return iter(self._variants.items())
+
+    def find_duplicate_keys(self) -> List[str]:
+        """
+        Find keys describing the same item (same name + realm) as an earlier key.
+
+        Returns:
+            List[str]: Composite keys to remove (the first variant of each
+                       (name, realm) pair is kept)
+        """
+        seen = set()
+        duplicates = []
+        for variants in self._variants.values():
+            for key, item_data in variants.items():
+                dup_key = ((item_data.get("name") or "").lower(), (item_data.get("realm") or "").lower())
+                if dup_key in seen:
+                    duplicates.append(key)
+                else:
+                    seen.add(dup_key)
+        return duplicates
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    def __contains__(self, item_name: str) -> bool:
+        return self.has_item(item_name)
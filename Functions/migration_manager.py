@@ -11,6 +11,7 @@ from Functions.config_manager import config
 from Functions.path_manager import get_base_path
 from Functions.language_manager import lang
 from Functions.debug_logging_manager import get_logger, log_with_action, LOGGER_BACKUP
+from Functions.json_bulk_loader import json_bulk_load
 
 logger = get_logger(LOGGER_BACKUP)
 
@@ -503,21 +504,23 @@ def get_expected_json_structure():
     }
 
 
-def validate_and_upgrade_json_structure(file_path):
+def validate_and_upgrade_json_structure(file_path, char_data=None):
     """
     Validates a character JSON file and upgrades its structure if needed.
     Adds missing fields with default values while preserving existing data.
     
     Args:
         file_path (str): Path to the JSON file to validate/upgrade
+        char_data (dict): Content of the file already loaded (None = read the file)
         
     Returns:
         tuple: (needs_update: bool, updated_data: dict, changes: list)
     """
     try:
         # Read existing file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            char_data = json.load(f)
+        if char_data is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                char_data = json.load(f)
         
         if not isinstance(char_data, dict):
             logging.error(f"Invalid JSON structure in {file_path}: not a dictionary")
@@ -635,6 +638,7 @@ def upgrade_all_character_files():
     
     try:
         # Walk through all directories to find JSON files
+        file_paths = []
         for root, dirs, files in os.walk(base_char_dir):
             for file in files:
                 if not file.endswith('.json'):
@@ -643,62 +647,67 @@ def upgrade_all_character_files():
                 if file.startswith('.'):  # Skip hidden files like .migration_done
                     continue
                 
-                stats["total_files"] += 1
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, base_char_dir)
+                file_paths.append(os.path.join(root, file))
+        
+        # Read and parse all files at once (thread pool), then check them in order
+        for file_path, char_data, error in json_bulk_load(file_paths):
+            stats["total_files"] += 1
+            rel_path = os.path.relpath(file_path, base_char_dir)
+            
+            logging.info(f"\nChecking: {rel_path}")
+            
+            # Unreadable files are read again by the validation, which reports the error
+            needs_update, updated_data, changes = validate_and_upgrade_json_structure(
+                file_path, char_data if error is None else None)
+            stats["checked"] += 1
+            
+            if updated_data is None:
+                # Error occurred
+                logging.error(f"  ✗ Error: {changes[0] if changes else 'Unknown error'}")
+                stats["errors"] += 1
+                continue
+            
+            if not needs_update:
+                logging.info(f"  ✓ Structure OK, no changes needed")
+                continue
+            
+            # File needs updating
+            logging.info(f"  → Upgrading structure...")
+            for change in changes:
+                logging.info(f"    • {change}")
+            
+            try:
+                # Create backup of original file
+                backup_path = file_path + '.backup'
+                shutil.copy2(file_path, backup_path)
                 
-                logging.info(f"\nChecking: {rel_path}")
+                # Write updated data
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(updated_data, f, indent=2, ensure_ascii=False)
                 
-                needs_update, updated_data, changes = validate_and_upgrade_json_structure(file_path)
-                stats["checked"] += 1
+                # Verify the write was successful
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    verify_data = json.load(f)
                 
-                if updated_data is None:
-                    # Error occurred
-                    logging.error(f"  ✗ Error: {changes[0] if changes else 'Unknown error'}")
-                    stats["errors"] += 1
-                    continue
+                # Remove backup if verification successful
+                os.remove(backup_path)
                 
-                if not needs_update:
-                    logging.info(f"  ✓ Structure OK, no changes needed")
-                    continue
+                logging.info(f"  ✓ Successfully upgraded")
+                stats["upgraded"] += 1
+                changes_by_file[rel_path] = changes
                 
-                # File needs updating
-                logging.info(f"  → Upgrading structure...")
-                for change in changes:
-                    logging.info(f"    • {change}")
+            except Exception as e:
+                logging.error(f"  ✗ Failed to upgrade: {e}")
+                stats["errors"] += 1
                 
-                try:
-                    # Create backup of original file
-                    backup_path = file_path + '.backup'
-                    shutil.copy2(file_path, backup_path)
-                    
-                    # Write updated data
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(updated_data, f, indent=2, ensure_ascii=False)
-                    
-                    # Verify the write was successful
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        verify_data = json.load(f)
-                    
-                    # Remove backup if verification successful
-                    os.remove(backup_path)
-                    
-                    logging.info(f"  ✓ Successfully upgraded")
-                    stats["upgraded"] += 1
-                    changes_by_file[rel_path] = changes
-                    
-                except Exception as e:
-                    logging.error(f"  ✗ Failed to upgrade: {e}")
-                    stats["errors"] += 1
-                    
-                    # Restore from backup if it exists
-                    if os.path.exists(backup_path):
-                        try:
-                            shutil.copy2(backup_path, file_path)
-                            os.remove(backup_path)
-                            logging.info(f"  ✓ Restored from backup")
-                        except:
-                            logging.error(f"  ✗ Could not restore from backup!")
+                # Restore from backup if it exists
+                if os.path.exists(backup_path):
+                    try:
+                        shutil.copy2(backup_path, file_path)
+                        os.remove(backup_path)
+                        logging.info(f"  ✓ Restored from backup")
+                    except:
+                        logging.error(f"  ✗ Could not restore from backup!")
         
         # Summary
         logging.info("\n" + "=" * 60)
@@ -26,7 +26,10 @@ from Functions.path_manager import PathManager
 from Functions.items_parser import parse_template_file, search_item_for_database
 from Functions.eden_scraper import EdenScraper, _connect_to_eden_herald
 from Functions.cookie_manager import CookieManager
+from Functions.eden_session_pool import EdenSessionPool
 from Functions.items_scraper import ItemsScraper
+from Functions.items_variant_index import ItemVariantIndex
+from Functions.items_refresh_policy import compute_content_hash, select_items_to_refresh, stamp_scraped_item
 
 
 class SuperAdminTools:
@@ -493,6 +496,9 @@ class SuperAdminTools:
                         continue
             
             finally:
+                # Flush the items web cache journal
+                items_scraper.close()
+                
                 # Guaranteed cleanup even in case of error
                 if eden_scraper:
                     try:
@@ -583,20 +589,8 @@ class SuperAdminTools:
             # Backup before modification
             self.backup_source_database()
             
-            # Track duplicates: key = (name_lower, realm_lower), value = list of keys
-            seen = {}
-            duplicates_to_remove = []
-            
-            for key, item_data in items.items():
-                name = item_data.get("name", "").lower()
-                realm = item_data.get("realm", "").lower()
-                dup_key = (name, realm)
-                
-                if dup_key in seen:
-                    # Duplicate found, mark for removal
-                    duplicates_to_remove.append(key)
-                else:
-                    seen[dup_key] = key
+            # Duplicates = same (name_lower, realm_lower), grouped by base name
+            duplicates_to_remove = ItemVariantIndex(items).find_duplicate_keys()
             
             # Remove duplicates
             for key in duplicates_to_remove:
@@ -624,7 +618,9 @@ class SuperAdminTools:
             logging.error(f"Error cleaning duplicates: {e}", extra={"action": "SUPERADMIN_CLEAN_ERROR"})
             return False, f"Error: {str(e)}", 0
     
-    def refresh_all_items(self, progress_callback=None, item_filter: List[str] = None, skip_filters: bool = False) -> Tuple[bool, str, Dict]:
+    def refresh_all_items(self, progress_callback=None, item_filter: List[str] = None, skip_filters: bool = False,
+                          force_scrape: bool = False, mode: str = "all", max_age_days: float = 30,
+                          limit: Optional[int] = None) -> Tuple[bool, str, Dict]:
         """
         Refresh all items in the database by re-scraping them from Eden.
         
@@ -633,17 +629,28 @@ class SuperAdminTools:
         - Crée/met à jour une entrée par realm dans la DB
         - Exemple: "Cudgel of the Undead" → 3 entrées (Albion, Hibernia, Midgard)
         
+        Search and details pages are always fetched from Eden: the page cache
+        is only read in offline mode.
+        
         Args:
             progress_callback: Optional callback(current, total, item_name) for progress updates
             item_filter: Liste optionnelle de noms d'items à rafraîchir (pour debug)
-                        Si None, rafraîchit TOUS les items
+                        Si None, rafraîchit TOUS les items (sauf ignore_item)
+                        Les items listés sont rafraîchis même s'ils sont ignorés
                         Exemple: ["Cloth Cap", "Cudgel of the Undead"]
             skip_filters: If True, bypass utility/level filters to get ALL variants
+            force_scrape: If True, ignore the negative cache and search Eden again
+            mode: Items to refresh when item_filter is None (see items_refresh_policy):
+                  "all", "stale" (older than max_age_days), "missing" (no model/price),
+                  "priority" (stalest first)
+            max_age_days: Age above which an item is stale ("stale" mode)
+            limit: Maximum number of items to scrape, stalest first in "stale"/"priority" modes
             
         Returns:
             Tuple[bool, str, Dict]: (Success, Message, Stats dict)
         """
-        eden_scraper = None
+        session_pool = None
+        items_scraper = None
         
         try:
             if not self.source_db_path.exists():
@@ -654,9 +661,11 @@ class SuperAdminTools:
                 data = json.load(f)
             
             items = data.get("items", {})
+            variant_index = ItemVariantIndex(items)  # name -> realm variants
             
             # LOGIC FIX: If item_filter provided (Single Item Refresh), use IT to build unique_items
             # Otherwise, extract unique items from existing database (All Items Refresh)
+            skipped_reasons = {}
             if item_filter is not None:
                 # Single Item Refresh: Build unique_items from filter list
                 unique_items = {name: {"name": name} for name in item_filter}
@@ -664,36 +673,58 @@ class SuperAdminTools:
             else:
                 # All Items Refresh: Extract unique items from database (ignore realm duplicates)
                 unique_items = {}
-                for key, item_data in items.items():
-                    item_name = item_data.get("name", "")
-                    if item_name and item_name not in unique_items:
-                        unique_items[item_name] = item_data
-                logging.info(f"All Items Refresh mode: {len(unique_items)} items from database")
+                items_variants = {}
+                for base_name, variants in variant_index.iter_names():
+                    for item_data in variants.values():
+                        item_name = item_data.get("name", "")
+                        if item_name and item_name not in unique_items:
+                            unique_items[item_name] = item_data
+                            items_variants[item_name] = list(variants.values())
+                
+                # Only the items due for a refresh (last_scraped / missing data), in priority order
+                selected, skipped_reasons = select_items_to_refresh(items_variants, mode, max_age_days, limit)
+                unique_items = {item_name: unique_items[item_name] for item_name in selected}
+                logging.info(f"All Items Refresh mode ({mode}): {len(unique_items)}/{len(items_variants)} items "
+                             f"from database, skipped: {skipped_reasons}")
             
             total_items = len(unique_items)
             
             if total_items == 0:
+                if skipped_reasons:
+                    stats = {
+                        "unique_items_processed": 0,
+                        "items_skipped": sum(skipped_reasons.values()),
+                        "skipped_reasons": skipped_reasons,
+                        "total_db_entries": len(items)
+                    }
+                    return True, f"All items are up to date (mode: {mode})", stats
                 return False, "No items to refresh", {}
             
             # Backup before modification
             logging.info("Creating backup before refresh...")
             self.backup_source_database()
             
-            # Initialize scraper with driver using centralized connection
-            logging.info("Initializing web scraper...")
+            # Initialize the Eden sessions (armory.import_sessions)
+            logging.info("Initializing web scraper sessions...")
             start_init = time.time()
             
-            eden_scraper, error_message = _connect_to_eden_herald(headless=False)
-            if not eden_scraper:
+            session_pool = EdenSessionPool(headless=False)
+            success, error_message = session_pool.open()
+            if not success:
                 return False, f"Failed to connect to Eden Herald: {error_message}", {}
             
-            logging.info(f"⏱️  Total initialization: {time.time() - start_init:.2f}s")
+            logging.info(f"⏱️  Total initialization: {time.time() - start_init:.2f}s ({len(session_pool)} session(s))")
             
-            items_scraper = ItemsScraper(eden_scraper)
+            # One ItemsScraper per session, all sharing the web cache and the ID index
+            items_scraper = ItemsScraper(session_pool.sessions[0])
+            worker_scrapers = {1: items_scraper}
+            for worker_id, session in enumerate(session_pool.sessions[1:], 2):
+                worker_scrapers[worker_id] = items_scraper.for_session(session)
             
             # Statistics
             items_created = 0
             items_updated = 0
+            items_unchanged = 0
             variants_found = 0
             failed_count = 0
             fields_updated = {
@@ -710,101 +741,103 @@ class SuperAdminTools:
             # We will update/add items, not recreate everything
             new_items = dict(items)  # Copy of current database
             
-            # Process each unique item
-            for idx, item_name in enumerate(unique_items.keys(), 1):
-                # Filter already applied when building unique_items - no need to filter again here
+            # Ignored items are skipped before dispatching the work to the sessions
+            # (All Items Refresh only: an explicit item_filter always scrapes its items)
+            started = 0
+            work_items = []
+            for item_name in unique_items:
+                # Honor ignore_item / bypass_filters flags of existing variants
+                is_ignored, has_bypass = variant_index.get_flags(item_name)
+                if is_ignored and item_filter is None:
+                    started += 1
+                    skipped_reasons["ignored"] = skipped_reasons.get("ignored", 0) + 1
+                    logging.info(f"🚫 Item is ignored - skipping: {item_name}")
+                    continue
+                work_items.append((item_name, skip_filters or has_bypass))
+            
+            def refresh_task(worker_id, eden_scraper, work):
+                item_name, item_skip_filters = work
+                return self._refresh_scrape_item(worker_scrapers[worker_id], item_name,
+                                                 item_skip_filters, force_scrape)
+            
+            # This thread is the single writer: every merge happens here, in result order
+            for event, worker_id, work, payload in session_pool.run(work_items, refresh_task):
+                if event == "done":
+                    continue
+                
+                item_name = work[0]
+                if event == "start":
+                    started += 1
+                    if progress_callback:
+                        progress_callback(started, total_items, item_name)
+                    logging.info(f"Refreshing {started}/{total_items}: {item_name} (session {worker_id})")
+                    continue
+                
+                if event == "error":
+                    logging.error(f"Error refreshing {item_name}: {payload}")
+                    failed_count += 1
+                    continue
                 
-                if progress_callback:
-                    progress_callback(idx, total_items, item_name)
+                variants, scraped_variants = payload
+                if not variants:
+                    logging.warning(f"❌ No variants found for: {item_name}")
+                    failed_count += 1
+                    continue
                 
-                logging.info(f"Refreshing {idx}/{total_items}: {item_name}")
-                item_start = time.time()
+                logging.info(f"✅ Found {len(variants)} variant(s) for '{item_name}'")
+                variants_found += len(variants)
                 
-                try:
-                    # Find ALL item variants (all realms) with optional filter bypass
-                    logging.debug(f"Searching ALL variants for '{item_name}' (skip_filters={skip_filters})")
-                    variants = items_scraper.find_all_item_variants(item_name, skip_filters=skip_filters)
+                for item_id, realm, item_details in scraped_variants:
+                    # Create DB key (realm is now guaranteed to be valid)
+                    db_key = f"{item_name.lower()}:{realm.lower()}"
                     
-                    if not variants:
-                        logging.warning(f"❌ No variants found for: {item_name}")
-                        failed_count += 1
-                        time.sleep(0.5)
-                        continue
+                    # Check if item already exists
+                    is_new = db_key not in items
                     
-                    logging.info(f"✅ Found {len(variants)} variant(s) for '{item_name}'")
-                    variants_found += len(variants)
+                    # Prepare full data
+                    item_data = {
+                        "id": item_id,
+                        "name": item_name,
+                        "realm": realm,
+                        "slot": item_details.get("slot", "Unknown"),
+                        "type": item_details.get("type"),
+                        "model": item_details.get("model"),
+                        "dps": item_details.get("dps"),
+                        "speed": item_details.get("speed"),
+                        "damage_type": item_details.get("damage_type"),
+                        "usable_by": item_details.get("usable_by", "ALL"),
+                        "merchant_zone": item_details.get("merchant_zone"),
+                        "merchant_price": item_details.get("merchant_price"),
+                        "merchant_currency": item_details.get("merchant_currency"),
+                        "source": "internal"
+                    }
                     
-                    # Scrape details of each variant
-                    for variant in variants:
-                        variant_start = time.time()
-                        item_id = variant['id']
-                        realm = variant.get('realm') or 'All'
-                        
-                        # Validate realm
-                        if not realm or not realm.strip():
-                            realm = 'All'
-                        
-                        logging.info(f"  Scraping variant: {realm} (ID: {item_id})")
-                        
-                        # Get full details
-                        item_details = items_scraper.get_item_details(item_id, realm, item_name)
-                        
-                        if not item_details:
-                            logging.warning(f"  ⚠️ Failed to get details for {realm} variant")
-                            continue
-                        
-                        # Create DB key (realm is now guaranteed to be valid)
-                        db_key = f"{item_name.lower()}:{realm.lower()}"
-                        
-                        # Check if item already exists
-                        is_new = db_key not in items
-                        
-                        # Prepare full data
-                        item_data = {
-                            "id": item_id,
-                            "name": item_name,
-                            "realm": realm,
-                            "slot": item_details.get("slot", "Unknown"),
-                            "type": item_details.get("type"),
-                            "model": item_details.get("model"),
-                            "dps": item_details.get("dps"),
-                            "speed": item_details.get("speed"),
-                            "damage_type": item_details.get("damage_type"),
-                            "usable_by": item_details.get("usable_by", "ALL"),
-                            "merchant_zone": item_details.get("merchant_zone"),
-                            "merchant_price": item_details.get("merchant_price"),
-                            "merchant_currency": item_details.get("merchant_currency"),
-                            "source": "internal"
-                        }
-                        
-                        # Stocker dans la nouvelle structure
-                        new_items[db_key] = item_data
-                        
-                        if is_new:
-                            items_created += 1
-                            logging.info(f"  ✨ NEW: {db_key}")
-                        else:
-                            items_updated += 1
-                            # Count updated fields
-                            old_item = items.get(db_key, {})
-                            for field in ['model', 'dps', 'speed', 'damage_type', 'type', 'slot', 'usable_by']:
-                                if item_data.get(field) != old_item.get(field) and item_data.get(field):
-                                    fields_updated[field] += 1
-                            logging.info(f"  ♻️  UPDATED: {db_key}")
-                        
-                        logging.info(f"  ⏱️  Variant scraped in {time.time() - variant_start:.2f}s")
-                        time.sleep(1)  # Delay between variants
+                    # Keep the bypass_filters tag of the existing entry
+                    if new_items.get(db_key, {}).get("bypass_filters", False):
+                        item_data["bypass_filters"] = True
                     
-                    logging.info(f"⏱️  Item '{item_name}' completed in {time.time() - item_start:.2f}s")
-                    time.sleep(2)  # Delay between items
+                    # Scrape date and content hash (staleness-aware refreshes): the date the
+                    # details page was fetched, older than now if it came from the page cache
+                    stamp_scraped_item(item_data, item_details.get("fetched_at"))
                     
-                except Exception as e:
-                    logging.error(f"Error refreshing {item_name}: {e}")
-                    import traceback
-                    logging.debug(traceback.format_exc())
-                    failed_count += 1
-                    time.sleep(0.5)
-                    continue
+                    # Stocker dans la nouvelle structure
+                    new_items[db_key] = item_data
+                    variant_index.add(db_key, item_data)
+                    
+                    if is_new:
+                        items_created += 1
+                        logging.info(f"  ✨ NEW: {db_key}")
+                    elif compute_content_hash(items[db_key]) == item_data["content_hash"]:
+                        items_unchanged += 1
+                        logging.info(f"  ✔️  UNCHANGED: {db_key}")
+                    else:
+                        items_updated += 1
+                        # Count updated fields
+                        old_item = items.get(db_key, {})
+                        for field in ['model', 'dps', 'speed', 'damage_type', 'type', 'slot', 'usable_by']:
+                            if item_data.get(field) != old_item.get(field) and item_data.get(field):
+                                fields_updated[field] += 1
+                        logging.info(f"  ♻️  UPDATED: {db_key}")
             
             # Update metadata
             data["items"] = new_items
@@ -826,6 +859,9 @@ class SuperAdminTools:
                 "variants_found": variants_found,
                 "items_created": items_created,
                 "items_updated": items_updated,
+                "items_unchanged": items_unchanged,
+                "items_skipped": sum(skipped_reasons.values()),
+                "skipped_reasons": skipped_reasons,
                 "failed": failed_count,
                 "total_db_entries": len(new_items),
                 "fields_updated": fields_updated
@@ -833,9 +869,11 @@ class SuperAdminTools:
             
             message = f"Database refresh completed!\n\n"
             message += f"Unique items processed: {total_items}\n"
+            message += f"Items skipped: {stats['items_skipped']}\n"
             message += f"Total variants found: {variants_found}\n"
             message += f"New DB entries: {items_created}\n"
             message += f"Updated DB entries: {items_updated}\n"
+            message += f"Unchanged DB entries: {items_unchanged}\n"
             message += f"Failed: {failed_count}\n"
             message += f"Total DB entries: {len(new_items)}\n\n"
             message += f"Fields updated:\n"
@@ -857,6 +895,57 @@ class SuperAdminTools:
             return False, f"Error refreshing database: {str(e)}", {}
         
         finally:
-            # Close browser
-            if eden_scraper:
-                eden_scraper.close()
+            # Flush the items web cache journal, then close browsers
+            if items_scraper:
+                items_scraper.close()
+            if session_pool:
+                session_pool.close()
+
+    def _refresh_scrape_item(self, items_scraper: ItemsScraper, item_name: str, skip_filters: bool,
+                             force_scrape: bool) -> Tuple[List[Dict], List[Tuple[str, str, Dict]]]:
+        """
+        Scrape all variants of one item (runs in a session pool thread)
+        
+        Only scrapes: the merge into the database is done by refresh_all_items.
+        
+        Returns:
+            Tuple[List[Dict], List[Tuple[str, str, Dict]]]: (variants, [(item_id, realm, details)])
+        """
+        item_start = time.time()
+        
+        # Find ALL item variants (all realms) with optional filter bypass
+        logging.debug(f"Searching ALL variants for '{item_name}' (skip_filters={skip_filters})")
+        # Live pages only: the page cache would serve details up to a week old
+        variants = items_scraper.find_all_item_variants(
+            item_name, skip_filters=skip_filters, force_scrape=force_scrape, use_cache=False
+        )
+        
+        # Pacing between requests is done by the Eden request scheduler (all sessions)
+        if not variants:
+            return [], []
+        
+        # Scrape details of each variant
+        scraped_variants = []
+        for variant in variants:
+            variant_start = time.time()
+            item_id = variant['id']
+            realm = variant.get('realm') or 'All'
+            
+            # Validate realm
+            if not realm or not realm.strip():
+                realm = 'All'
+            
+            logging.info(f"  Scraping variant: {realm} (ID: {item_id})")
+            
+            # Get full details
+            item_details = items_scraper.get_item_details(item_id, realm, item_name, use_cache=False)
+            
+            if not item_details:
+                logging.warning(f"  ⚠️ Failed to get details for {realm} variant")
+                continue
+            
+            scraped_variants.append((item_id, realm, item_details))
+            logging.info(f"  ⏱️  Variant scraped in {time.time() - variant_start:.2f}s")
+        
+        logging.info(f"⏱️  Item '{item_name}' completed in {time.time() - item_start:.2f}s")
+        return variants, scraped_variants
@@ -13,6 +13,7 @@ from .template_metadata import (
     normalize_description
 )
 from .config_manager import config
+from .json_bulk_loader import json_bulk_load
 
 
 class TemplateManager:
@@ -376,9 +377,15 @@ class TemplateManager:
             "templates": []
         }
 
-        # Rebuild from metadata files
-        for metadata_file in metadata_files:
-            metadata = TemplateMetadata.load(metadata_file)
+        # Rebuild from metadata files (read and parsed at once, in path order)
+        for metadata_file, data, error in json_bulk_load(sorted(metadata_files)):
+            try:
+                if error is not None:
+                    raise error
+                metadata = TemplateMetadata.from_dict(data)
+            except Exception as e:
+                print(f"[TEMPLATE_METADATA] Error loading metadata: {e}")
+                continue
             if metadata:
                 self.index["templates"].append({
                     "file": metadata.template_name,
@@ -29,6 +29,11 @@ from pathlib import Path
 from collections import defaultdict
 from typing import Tuple, Dict, List, Optional
 
+from Functions.items_price_manager import (
+    items_price_resolve_batch,
+    items_price_get_display,
+)
+
 logger = logging.getLogger(__name__)
 
 # Model viewer slots - items that have visual models available
@@ -149,6 +154,9 @@ def template_get_item_price(
     1. Template metadata JSON (manually added prices)
     2. Database with realm-aware search (realm-specific, then :all, then generic)
 
+    Single-item convenience wrapper around items_price_resolve_batch(). Template
+    parsers resolve their whole equipment list at once instead.
+
     Args:
         item_name: Name of the item
         realm: Character realm
@@ -162,62 +170,8 @@ def template_get_item_price(
             - category: Item category or None
     """
     try:
-        if metadata and 'prices' in metadata:
-            if item_name in metadata['prices']:
-                return (metadata['prices'][item_name], 'json', None)
-
-        if not db_manager:
-            return (None, None, None)
-
-        item_name_lower = item_name.lower()
-        realm_lower = realm.lower()
-
-        search_key_realm = f"{item_name_lower}:{realm_lower}"
-        item_data = db_manager.search_item(search_key_realm)
-
-        if not item_data:
-            search_key_all = f"{item_name_lower}:all"
-            item_data = db_manager.search_item(search_key_all)
-
-        if not item_data:
-            item_data = db_manager.search_item(item_name)
-
-        item_category = item_data.get('item_category') if item_data else None
-
-        if item_data and 'merchant_price' in item_data:
-            price = item_data['merchant_price']
-            currency = item_data.get('merchant_currency', '')
-
-            if not currency:
-                merchant_zone = item_data.get('merchant_zone', '')
-                currency_map = {
-                    "DF": "Seals",
-                    "SH": "Grimoires",
-                    "ToA": "Glasses",
-                    "Drake": "Scales",
-                    "Epic": "Souls/Roots/Ices",
-                    "Epik": "Souls/Roots/Ices"
-                }
-                currency = currency_map.get(merchant_zone, '')
-
-            # Convert copper to PP for display (database stores in copper)
-            if currency == "Gold":
-                try:
-                    copper_value = int(price)
-                    platinum = copper_value / 100_000_000
-                    display_price = f"{int(platinum)}" if platinum % 1 == 0 else f"{platinum:.2f}"
-                    currency = "PP"
-                    price = display_price
-                except (ValueError, TypeError):
-                    pass
-
-            if currency:
-                return (f"{price} {currency}", 'db', item_category)
-            return (str(price), 'db', item_category)
-
-        if item_category:
-            return (None, None, item_category)
-
+        resolved, _ = items_price_resolve_batch([item_name], realm, db_manager, metadata)
+        return items_price_get_display(resolved, item_name)
     except Exception as e:
         logger.debug(f"Failed to lookup price for '{item_name}': {e}")
 
@@ -545,6 +499,9 @@ def template_parse_loki(
         )
         max_len = max(max_len, 35)
 
+        # Resolve every equipment price in one pass over the items store
+        resolved_prices, _ = items_price_resolve_batch(equipment, realm, db_manager, metadata)
+
         items_without_price = []
         currency_totals_temp = defaultdict(int)
 
@@ -553,8 +510,8 @@ def template_parse_loki(
             for item in armor_items:
                 clean_item_text = f"{item['name']} ({item['slot']})"
 
-                price_str, price_source, item_category = template_get_item_price(
-                    item['name'], realm, db_manager, metadata
+                price_str, price_source, item_category = items_price_get_display(
+                    resolved_prices, item['name']
                 )
 
                 # Add clickable model icon ONLY if item exists in DB and has visual model
@@ -617,8 +574,8 @@ def template_parse_loki(
                 if left_slot in jewelry_dict:
                     left_item = jewelry_dict[left_slot]
                     left_text = f"{left_item['name']} ({left_item['slot']})"
-                    left_price_str, left_price_source, left_item_category = template_get_item_price(
-                        left_item['name'], realm, db_manager, metadata
+                    left_price_str, left_price_source, left_item_category = items_price_get_display(
+                        resolved_prices, left_item['name']
                     )
                     left_name_padded = left_text.ljust(max_item_name_width)
                     left_display = template_format_item_with_price(
@@ -639,8 +596,8 @@ def template_parse_loki(
                     if left_item:
                         clean_left_text = f"{left_item['name']} ({left_item['slot']})"
 
-                        left_price_str, left_price_source, left_item_category = template_get_item_price(
-                            left_item['name'], realm, db_manager, metadata
+                        left_price_str, left_price_source, left_item_category = items_price_get_display(
+                            resolved_prices, left_item['name']
                         )
 
                         # Add clickable model icon ONLY if item exists in DB and has visual model
@@ -681,8 +638,8 @@ def template_parse_loki(
                     if right_item:
                         clean_right_text = f"{right_item['name']} ({right_item['slot']})"
 
-                        right_price_str, right_price_source, right_item_category = template_get_item_price(
-                            right_item['name'], realm, db_manager, metadata
+                        right_price_str, right_price_source, right_item_category = items_price_get_display(
+                            resolved_prices, right_item['name']
                         )
 
                         # Add clickable model icon ONLY if item exists in DB and has visual model
@@ -728,8 +685,8 @@ def template_parse_loki(
             for item in weapon_items:
                 clean_item_text = f"{item['name']} ({item['slot']})"
 
-                price_str, price_source, item_category = template_get_item_price(
-                    item['name'], realm, db_manager, metadata
+                price_str, price_source, item_category = items_price_get_display(
+                    resolved_prices, item['name']
                 )
 
                 # Add clickable model icon ONLY if item exists in DB and has visual model
@@ -947,74 +904,13 @@ def template_parse_zenkcraft(
 
     equipment_count = len(equipment)
 
-    # Helper function to get item price from template JSON or database
-    def get_item_price(item_name):
-        """
-        Lookup item price with priority chain:
-        1. Template metadata JSON (manually added prices via search)
-        2. Database (internal or personal) with realm-aware search
-
-        Returns tuple: (formatted_price_string, source, item_category)
-        - source can be: 'json' (from template) or 'db' (from database)
-        - item_category: Category key (quest_reward, event_reward, unknown) or None
-        """
-        try:
-            # Step 1: Check template metadata JSON for stored price
-            if metadata and 'prices' in metadata:
-                if item_name in metadata['prices']:
-                    return (metadata['prices'][item_name], 'json', None)
-
-            # Step 2: Try database with realm-aware search (only if db_manager provided)
-            if not db_manager:
-                return (None, None, None)
-
-            item_name_lower = item_name.lower()
-            realm_lower = realm.lower() if realm else "all"
-
-            # Priority 1: Try with specific realm suffix
-            search_key_realm = f"{item_name_lower}:{realm_lower}"
-            item_data = db_manager.search_item(search_key_realm)
-
-            # Priority 2: Try with ":all" suffix
-            if not item_data:
-                search_key_all = f"{item_name_lower}:all"
-                item_data = db_manager.search_item(search_key_all)
-
-            # Priority 3: Try without realm suffix (legacy)
-            if not item_data:
-                item_data = db_manager.search_item(item_name)
-
-            # Check if item is categorized
-            item_category = item_data.get('item_category') if item_data else None
-
-            # Format price if found in database
-            if item_data and 'merchant_price' in item_data:
-                price = item_data['merchant_price']
-                currency = item_data.get('merchant_currency', '')
-
-                # Convert copper to PP for display (database stores in copper)
-                if currency == "Gold":
-                    try:
-                        copper_value = int(price)
-                        platinum = copper_value / 100_000_000
-                        display_price = f"{int(platinum)}" if platinum % 1 == 0 else f"{platinum:.2f}"
-                        currency = "PP"
-                        price = display_price
-                    except (ValueError, TypeError):
-                        pass
-
-                if currency:
-                    return (f"{price} {currency}", 'db', item_category)
-                return (price, 'db', item_category)
-
-            # Return category even if no price found
-            if item_category:
-                return (None, None, item_category)
+    # Resolve every equipment price in one pass over the items store
+    # (priority: template metadata JSON, then realm-aware database search)
+    resolved_prices, _ = items_price_resolve_batch(equipment, realm, db_manager, metadata)
 
-        except Exception as e:
-            logger.debug(f"Failed to lookup price for '{item_name}': {e}")
-
-        return (None, None, None)
+    def get_item_price(item_name):
+        """Return (formatted_price_string, source, item_category) for an item."""
+        return items_price_get_display(resolved_prices, item_name)
 
     output = []
 
@@ -1174,26 +1070,11 @@ def template_parse_zenkcraft(
                 item_name = item['name']
                 item_text = f"{item_name} ({item['slot']})"
 
-                # Try to get model ID from database
+                # Get model ID from the resolved database entry
                 model_id = None
-                if db_manager:
-                    try:
-                        item_name_lower = item_name.lower()
-                        realm_lower = realm.lower() if realm else "all"
-
-                        # Search for item in DB
-                        search_key = f"{item_name_lower}:{realm_lower}"
-                        item_data = db_manager.search_item(search_key)
-                        if not item_data:
-                            search_key = f"{item_name_lower}:all"
-                            item_data = db_manager.search_item(search_key)
-                        if not item_data:
-                            item_data = db_manager.search_item(item_name)
-
-                        if item_data:
-                            model_id = item_data.get('model') or item_data.get('model_id')
-                    except Exception:
-                        pass
+                item_data = resolved_prices.get(item_name, {}).get('item_data')
+                if item_data:
+                    model_id = item_data.get('model') or item_data.get('model_id')
 
                 # Add model icon if model exists
                 if model_id:
@@ -1266,8 +1147,8 @@ def template_parse_zenkcraft(
                 if left_item:
                     clean_left_text = f"{left_item['name']} ({left_item['slot']})"
 
-                    left_price_str, left_price_source, left_item_category = template_get_item_price(
-                        left_item['name'], realm, db_manager, metadata
+                    left_price_str, left_price_source, left_item_category = items_price_get_display(
+                        resolved_prices, left_item['name']
                     )
 
                     # Add clickable model icon ONLY if item is Cloak and exists in DB
@@ -1302,8 +1183,8 @@ def template_parse_zenkcraft(
                 if right_item:
                     clean_right_text = f"{right_item['name']} ({right_item['slot']})"
 
-                    right_price_str, right_price_source, right_item_category = template_get_item_price(
-                        right_item['name'], realm, db_manager, metadata
+                    right_price_str, right_price_source, right_item_category = items_price_get_display(
+                        resolved_prices, right_item['name']
                     )
 
                     # Add clickable model icon ONLY if item is Cloak and exists in DB
@@ -1347,23 +1228,11 @@ def template_parse_zenkcraft(
                 item_name = item['name']
                 item_text = f"{item_name} ({item['slot']})"
 
-                # Try to get model ID from database
+                # Get model ID from the resolved database entry
                 model_id = None
-                if db_manager:
-                    try:
-                        item_name_lower = item_name.lower()
-                        realm_lower = realm.lower() if realm else "all"
-                        search_key = f"{item_name_lower}:{realm_lower}"
-                        item_data = db_manager.search_item(search_key)
-                        if not item_data:
-                            search_key = f"{item_name_lower}:all"
-                            item_data = db_manager.search_item(search_key)
-                        if not item_data:
-                            item_data = db_manager.search_item(item_name)
-                        if item_data:
-                            model_id = item_data.get('model') or item_data.get('model_id')
-                    except Exception:
-                        pass
+                item_data = resolved_prices.get(item_name, {}).get('item_data')
+                if item_data:
+                    model_id = item_data.get('model') or item_data.get('model_id')
 
                 # Add model icon if model exists
                 if model_id:
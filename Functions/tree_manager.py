@@ -3,8 +3,8 @@ Tree Manager - Gère l'affichage et les interactions avec la liste des personnag
 Extrait de main.py pour améliorer la maintenabilité
 """
 import logging
-from PySide6.QtGui import QStandardItemModel, QStandardItem, QIcon
-from PySide6.QtCore import Qt, QByteArray, QSortFilterProxyModel
+from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, QByteArray, QSortFilterProxyModel, QAbstractTableModel, QModelIndex
 from PySide6.QtWidgets import QHeaderView
 
 from Functions.character_manager import (
@@ -30,6 +30,293 @@ class RealmSortProxyModel(QSortFilterProxyModel):
         
         # for the autres colonnes, utiliser the comportement par défaut
         return super().lessThan(left, right)
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        Trie les lignes
+        
+        CharacterListModel se trie lui-même (une clé par ligne) : le proxy
+        reste dans l'ordre du modèle au lieu d'appeler lessThan et data()
+        en Python à chaque comparaison.
+        """
+        source = self.sourceModel()
+        if isinstance(source, CharacterListModel):
+            source.sort(column, order)
+            return
+        super().sort(column, order)
+
+
+# Colonnes: Selection(0), Realm(1), Name(2), Class(3), Level(4), Rank(5), Title(6), Guild(7), Page(8), Server(9), Race(10), URL(11)
+COLUMN_COUNT = 12
+
+# Champs du personnage affichés dans une ligne (détection des lignes modifiées)
+ROW_SOURCE_FIELDS = ('realm', 'name', 'class', 'level', 'realm_points', 'guild', 'page', 'server', 'race', 'url')
+
+# Drapeaux des cellules (Selection : case à cocher)
+NO_ITEM_FLAGS = Qt.NoItemFlags
+ROW_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+SELECTION_FLAGS = ROW_FLAGS | Qt.ItemIsUserCheckable
+
+
+class CharacterListModel(QAbstractTableModel):
+    """
+    Modèle virtuel de la liste des personnages
+    
+    Les cellules sont servies directement depuis les données des personnages :
+    chaque ligne ne garde qu'un tuple des textes affichés (rang et titre de
+    royaume calculés une seule fois par ligne, en lot via
+    DataManager.get_realm_ranks_batch), au lieu de
+    12 QStandardItem avec leur police et leur alignement.
+    
+    Rôles servis (utilisés par RealmSortProxyModel et les delegates) :
+        Realm (1): DecorationRole = icône, UserRole = id du personnage,
+                   UserRole + 1 = royaume (couleur de fond), UserRole + 2 = royaume (tri)
+        Title (6): UserRole = royaume (couleur du titre)
+        Selection (0): CheckStateRole (conservé par id lors des mises à jour)
+    """
+    
+    def __init__(self, data_manager, realm_icons, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.realm_icons = realm_icons  # Dictionnaire partagé avec TreeManager (rempli après coup)
+        self._headers = [""] * COLUMN_COUNT
+        self._ids = []  # id du personnage par ligne
+        self._rows = []  # textes affichés par ligne (tuple de COLUMN_COUNT)
+        self._sources = {}  # id -> valeurs de ROW_SOURCE_FIELDS de la ligne
+        self._checked = set()  # ids des personnages cochés
+        self._sort_column = -1  # colonne triée (-1 : ordre d'ajout)
+        self._sort_order = Qt.AscendingOrder
+    
+    # --- Lecture (QAbstractTableModel) ---
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else COLUMN_COUNT
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        
+        if role == Qt.DisplayRole:
+            # Selection et Realm (icône seule) n'ont pas de texte
+            return self._rows[row][column] if column > 1 else None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter if column else None
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._ids[row] in self._checked else Qt.Unchecked
+            return None
+        if column == 1:
+            realm_name = self._rows[row][1]
+            if role == Qt.UserRole:
+                return self._ids[row]
+            if role == Qt.DecorationRole:
+                return self.realm_icons.get(realm_name)
+            if role in (Qt.UserRole + 1, Qt.UserRole + 2) and self.realm_icons.get(realm_name):
+                return realm_name
+            return None
+        if column == 6 and role == Qt.UserRole:
+            return self._rows[row][1]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and 0 <= section < COLUMN_COUNT:
+            if role == Qt.DisplayRole:
+                return self._headers[section]
+            if role == Qt.TextAlignmentRole and section != 0 and section != 11:
+                return Qt.AlignCenter
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        # Appelé pour chaque ligne à la mise en page de la vue : drapeaux précalculés
+        if not index.isValid():
+            return NO_ITEM_FLAGS
+        return SELECTION_FLAGS if index.column() == 0 else ROW_FLAGS
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        """Coche/décoche un personnage (colonne Selection)"""
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        char_id = self._ids[index.row()]
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked.add(char_id)
+        else:
+            self._checked.discard(char_id)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+    
+    # --- Accès par ligne ---
+    
+    def character_id(self, row):
+        """Retourne l'id du personnage d'une ligne"""
+        return self._ids[row]
+    
+    def set_headers(self, headers):
+        """Définit les en-têtes des colonnes"""
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, COLUMN_COUNT - 1)
+    
+    def set_all_checked(self, checked):
+        """Coche ou décoche toutes les lignes (un seul signal dataChanged)"""
+        self._checked = set(self._ids) if checked else set()
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0), [Qt.CheckStateRole])
+    
+    def get_checked_rows(self):
+        """Retourne les lignes cochées"""
+        return [row for row, char_id in enumerate(self._ids) if char_id in self._checked]
+    
+    # --- Tri ---
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        Trie les lignes (même ordre que RealmSortProxyModel.lessThan)
+        
+        Realm est trié par nom du royaume, Selection par case cochée et les
+        autres colonnes par texte affiché. Le tri est stable et réappliqué
+        par sync_characters ; les index persistants (sélection) suivent.
+        """
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0 or column >= COLUMN_COUNT or len(self._rows) < 2:
+            return
+        
+        if column == 0:
+            keys = [char_id in self._checked for char_id in self._ids]
+        else:
+            keys = [row[column] or '' for row in self._rows]
+        new_order = sorted(range(len(keys)), key=keys.__getitem__, reverse=order == Qt.DescendingOrder)
+        if new_order == list(range(len(keys))):
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(new_order)}
+        self._ids = [self._ids[old_row] for old_row in new_order]
+        self._rows = [self._rows[old_row] for old_row in new_order]
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    # --- Mise à jour ---
+    
+    def sync_characters(self, characters):
+        """
+        Aligne les lignes sur une liste de personnages (par id)
+        
+        Les lignes des personnages disparus sont supprimées, les nouveaux
+        personnages ajoutés à la fin et seules les lignes dont une valeur
+        affichée a changé sont recalculées.
+        
+        Args:
+            characters: Liste des personnages (get_all_characters)
+            
+        Returns:
+            tuple: (ajoutés, modifiés, supprimés)
+        """
+        characters_by_id = {char.get('id'): char for char in characters}
+        
+        # Suppressions, par blocs de lignes contiguës en partant de la fin
+        removed_rows = [row for row, char_id in enumerate(self._ids) if char_id not in characters_by_id]
+        for first, last in reversed(self._group_rows(removed_rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for char_id in self._ids[first:last + 1]:
+                self._sources.pop(char_id, None)
+                self._checked.discard(char_id)
+            del self._ids[first:last + 1]
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        
+        # Mises à jour
+        updated_rows = []
+        for row, char_id in enumerate(self._ids):
+            char = characters_by_id[char_id]
+            source = self._get_source(char)
+            if source != self._sources.get(char_id):
+                self._sources[char_id] = source
+                updated_rows.append(row)
+        updated_chars = [characters_by_id[self._ids[row]] for row in updated_rows]
+        for row, new_row in zip(updated_rows, self._build_rows(updated_chars)):
+            self._rows[row] = new_row
+            self.dataChanged.emit(self.index(row, 1), self.index(row, COLUMN_COUNT - 1))
+        updated = len(updated_rows)
+        
+        # Ajouts
+        known = set(self._ids)
+        new_characters = [char for char_id, char in characters_by_id.items() if char_id not in known]
+        if new_characters:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_characters) - 1)
+            self._rows.extend(self._build_rows(new_characters))
+            for char in new_characters:
+                char_id = char.get('id')
+                self._ids.append(char_id)
+                self._sources[char_id] = self._get_source(char)
+            self.endInsertRows()
+        
+        # Garder l'ordre de tri courant
+        if new_characters or updated:
+            self.sort(self._sort_column, self._sort_order)
+        
+        return len(new_characters), updated, len(removed_rows)
+    
+    def _get_source(self, char):
+        return tuple(char.get(field) for field in ROW_SOURCE_FIELDS)
+    
+    def _build_rows(self, characters):
+        """Calcule les textes affichés de plusieurs lignes (rangs calculés par royaume en un appel)"""
+        # Rang et titre de royaume : un appel groupé par royaume
+        rank_infos = [None] * len(characters)
+        positions_by_realm = {}
+        for position, char in enumerate(characters):
+            positions_by_realm.setdefault(char.get('realm', 'N/A'), []).append(position)
+        for realm_name, positions in positions_by_realm.items():
+            realm_points = [characters[position].get('realm_points', 0) for position in positions]
+            for position, rank_info in zip(positions, self.data_manager.get_realm_ranks_batch(realm_name, realm_points)):
+                rank_infos[position] = rank_info
+        
+        return [self._build_row(char, rank_info) for char, rank_info in zip(characters, rank_infos)]
+    
+    def _build_row(self, char, rank_info):
+        """Calcule les textes affichés d'une ligne (rank_info : voir DataManager.get_realm_ranks_batch)"""
+        realm_name = char.get('realm', 'N/A')
+        
+        # Rang et titre de royaume
+        realm_rank_level = '1L1'
+        realm_title = ''
+        if rank_info:
+            realm_rank_level = rank_info['level']
+            realm_title = rank_info['title']
+        
+        # Ordre: Selection, Realm, Name, Class, Level, Rank, Title, Guild, Page, Server, Race, URL
+        return (
+            None,
+            realm_name,
+            char.get('name', 'N/A'),
+            char.get('class', ''),
+            str(char.get('level', 1)),
+            str(realm_rank_level),
+            realm_title,
+            char.get('guild', ''),
+            str(char.get('page', 1)),
+            char.get('server', 'Eden'),
+            char.get('race', ''),
+            char.get('url', ''),
+        )
+    
+    @staticmethod
+    def _group_rows(rows):
+        """Regroupe des lignes triées en blocs contigus [(première, dernière)]"""
+        blocks = []
+        for row in rows:
+            if blocks and blocks[-1][1] == row - 1:
+                blocks[-1] = (blocks[-1][0], row)
+            else:
+                blocks.append((row, row))
+        return blocks
 
 
 class TreeManager:
@@ -47,24 +334,29 @@ class TreeManager:
         self.main_window = main_window
         self.tree_view = tree_view
         self.data_manager = data_manager
-        self.model = QStandardItemModel()
+        self.characters_by_id = {}
+        self.realm_icons = {}
+        self.model = CharacterListModel(data_manager, self.realm_icons)
         
         # Utiliser un proxy model for the tri personnalisé of the colonne Realm
         self.proxy_model = RealmSortProxyModel()
         self.proxy_model.setSourceModel(self.model)
         self.tree_view.setModel(self.proxy_model)
         
-        self.characters_by_id = {}
-        self.realm_icons = {}
+        self._columns_initialized = False  # Header state/visibility applied on the first load
         
         # Configuration initiale du tree view
         self._configure_tree_view()
         self._load_realm_icons()
         
+        # Connecter the signal of changement for the compteur of sélection (une seule fois)
+        self.model.dataChanged.connect(self.main_window.update_selection_count)
+        
     def _configure_tree_view(self):
         """Configure l'apparence et le comportement du tree view"""
         self.tree_view.setAlternatingRowColors(True)
         self.tree_view.setRootIsDecorated(False)
+        self.tree_view.setUniformRowHeights(True)  # Lignes d'une seule ligne de texte : pas de mesure ligne par ligne
         self.tree_view.setSortingEnabled(True)
         
         # Appliquer le style initial
@@ -126,13 +418,45 @@ class TreeManager:
                 self.realm_icons[realm] = None
                 
     def refresh_character_list(self):
-        """Rafraîchit la liste complète des personnages"""
+        """
+        Rafraîchit la liste des personnages
+        
+        Seules les lignes des personnages ajoutés, modifiés ou supprimés (par id)
+        sont touchées : l'en-tête, le défilement, la sélection et les cases cochées
+        des autres lignes sont conservés.
+        """
         logging.debug("Refreshing character list")
         
-        self.model.clear()
-        self.characters_by_id.clear()
+        # En-têtes (retraduits à chaque rafraîchissement)
+        self._set_header_labels()
+        
+        # Charger les personnages (seuls les fichiers modifiés sont relus)
+        characters = get_all_characters()
+        self.characters_by_id = {char.get('id'): char for char in characters}
+        added, updated, removed = self.model.sync_characters(characters)
+        
+        logging.debug(f"Character list: {len(characters)} character(s) "
+                      f"({added} added, {updated} updated, {removed} removed)")
+        
+        if not self._columns_initialized:
+            self._columns_initialized = True
+            
+            # Restaurer l'état of l'en-tête
+            self._restore_header_state()
+            
+            # Appliquer the visibilité des colonnes
+            self.apply_column_visibility()
+            
+            # Appliquer le mode de redimensionnement
+            manual_resize = config.get("ui.manual_column_resize", True)
+            self.apply_column_resize_mode(manual_resize)
+        
+        # Lignes ajoutées/supprimées : dataChanged n'est pas émis
+        if added or removed:
+            self.main_window.update_selection_count()
         
-        # Définir the en-têtes
+    def _set_header_labels(self):
+        """Définit les en-têtes des colonnes dans la langue courante"""
         # Ordre: Selection, Realm, Name, Class, Level, Rank, Title, Guild, Page, Server, Race, URL
         headers = [
             lang.get("column_selection"),
@@ -148,149 +472,8 @@ class TreeManager:
             lang.get("column_race", default="Race"),
             lang.get("column_url", default="URL Herald")
         ]
-        self.model.setHorizontalHeaderLabels(headers)
-        
-        # Centrer the en-têtes of certaines colonnes
-        # Ordre: Selection(0), Realm(1), Name(2), Class(3), Level(4), Rank(5), Title(6), Guild(7), Page(8), Server(9), Race(10), URL(11)
-        for col_index in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:  # Realm, Name, Class, Level, Rank, Title, Guild, Page, Server, Race
-            header_item = self.model.horizontalHeaderItem(col_index)
-            if header_item:
-                header_item.setTextAlignment(Qt.AlignCenter)
-        
-        # Charger les personnages
-        characters = get_all_characters()
-        logging.debug(f"Loading {len(characters)} character(s)")
-        
-        for char in characters:
-            self._add_character_row(char)
-        
-        # Restaurer l'état of l'en-tête
-        self._restore_header_state()
-        
-        # Appliquer the visibilité des colonnes
-        self.apply_column_visibility()
-        
-        # Appliquer le mode de redimensionnement
-        manual_resize = config.get("ui.manual_column_resize", True)
-        self.apply_column_resize_mode(manual_resize)
-        
-        # Connecter the signal of changement for the compteur of sélection
-        self.model.dataChanged.connect(self.main_window.update_selection_count)
-        
-    def _add_character_row(self, char):
-        """Ajoute une ligne de personnage au modèle"""
-        realm_name = char.get('realm', 'N/A')
-        char_id = char.get('id')
-        self.characters_by_id[char_id] = char
-        
-        # Icône of royaume
-        item_realm = QStandardItem()
-        realm_icon = self.realm_icons.get(realm_name)
-        if realm_icon:
-            item_realm.setData(realm_name, Qt.UserRole + 1)  # Pour le delegate (couleur de fond)
-            item_realm.setData(realm_name, Qt.UserRole + 2)  # Pour le tri
-            item_realm.setIcon(realm_icon)
-        item_realm.setData(char_id, Qt.UserRole)
-        item_realm.setTextAlignment(Qt.AlignCenter)
-        item_realm.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        
-        # Autres colonnes
-        item_name = QStandardItem(char.get('name', 'N/A'))
-        item_name.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_name.setTextAlignment(Qt.AlignCenter)  # Centrer le texte
-        # S'assurer que le nom n'est pas en gras
-        font_name = item_name.font()
-        font_name.setBold(False)
-        item_name.setFont(font_name)
-        
-        item_level = QStandardItem(str(char.get('level', 1)))
-        item_level.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_level.setTextAlignment(Qt.AlignCenter)
-        font_level = item_level.font()
-        font_level.setBold(False)
-        item_level.setFont(font_level)
-        
-        # Calcul du rang et titre de royaume
-        realm_points = char.get('realm_points', 0)
-        realm_rank_level = '1L1'
-        realm_title = ''
-        
-        rank_info = self.data_manager.get_realm_rank_info(realm_name, realm_points)
-        if rank_info:
-            realm_rank_level = rank_info['level']
-            realm_title = rank_info['title']
-        
-        item_realm_rank = QStandardItem(str(realm_rank_level))
-        item_realm_rank.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_realm_rank.setTextAlignment(Qt.AlignCenter)
-        font_rank = item_realm_rank.font()
-        font_rank.setBold(False)
-        item_realm_rank.setFont(font_rank)
-        
-        item_realm_title = QStandardItem(realm_title)
-        item_realm_title.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_realm_title.setTextAlignment(Qt.AlignCenter)
-        item_realm_title.setData(realm_name, Qt.UserRole)
-        font_title = item_realm_title.font()
-        font_title.setBold(False)
-        item_realm_title.setFont(font_title)
-        
-        item_guild = QStandardItem(char.get('guild', ''))
-        item_guild.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_guild.setTextAlignment(Qt.AlignCenter)  # Centrer le texte
-        font_guild = item_guild.font()
-        font_guild.setBold(False)
-        item_guild.setFont(font_guild)
-        
-        item_page = QStandardItem(str(char.get('page', 1)))
-        item_page.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_page.setTextAlignment(Qt.AlignCenter)
-        font_page = item_page.font()
-        font_page.setBold(False)
-        item_page.setFont(font_page)
-        
-        item_server = QStandardItem(char.get('server', 'Eden'))
-        item_server.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_server.setTextAlignment(Qt.AlignCenter)
-        font_server = item_server.font()
-        font_server.setBold(False)
-        item_server.setFont(font_server)
-        
-        item_class = QStandardItem(char.get('class', ''))
-        item_class.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_class.setTextAlignment(Qt.AlignCenter)
-        font_class = item_class.font()
-        font_class.setBold(False)
-        item_class.setFont(font_class)
-        
-        item_race = QStandardItem(char.get('race', ''))
-        item_race.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_race.setTextAlignment(Qt.AlignCenter)
-        font_race = item_race.font()
-        font_race.setBold(False)
-        item_race.setFont(font_race)
-        
-        # Colonne URL Herald
-        item_url = QStandardItem(char.get('url', ''))
-        item_url.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-        item_url.setTextAlignment(Qt.AlignCenter)
-        font_url = item_url.font()
-        font_url.setBold(False)
-        item_url.setFont(font_url)
-        
-        # Case à cocher for the sélection
-        item_selection = QStandardItem()
-        item_selection.setCheckable(True)
-        item_selection.setCheckState(Qt.Unchecked)
-        item_selection.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
-        
-        # Ordre: Selection, Realm, Name, Class, Level, Rank, Title, Guild, Page, Server, Race, URL
-        row_items = [
-            item_selection, item_realm, item_name, item_class, item_level,
-            item_realm_rank, item_realm_title, item_guild, item_page,
-            item_server, item_race, item_url
-        ]
-        self.model.appendRow(row_items)
+        # (en-têtes centrés sauf Selection et URL, voir CharacterListModel.headerData)
+        self.model.set_headers(headers)
         
     def _restore_header_state(self):
         """Restaure l'état sauvegardé de l'en-tête (ordre et taille des colonnes)"""
@@ -390,30 +573,23 @@ class TreeManager:
     def get_checked_character_ids(self):
         """Retourne la liste des IDs des personnages cochés"""
         checked_ids = []
-        for row in range(self.model.rowCount()):
-            selection_item = self.model.item(row, 0)
-            if selection_item and selection_item.checkState() == Qt.Checked:
-                name_item = self.model.item(row, 2)
-                char_name = name_item.text()
-                if char_name:
-                    checked_ids.append(char_name)
+        for row in self.model.get_checked_rows():
+            char_name = self.model.index(row, 2).data()
+            if char_name:
+                checked_ids.append(char_name)
         return checked_ids
         
     def select_all_characters(self):
         """Coche tous les personnages"""
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, 0)
-            # Utiliser setData au lieu de setCheckState pour forcer le signal
-            self.model.setData(index, Qt.Checked, Qt.CheckStateRole)
+        # Un seul signal dataChanged pour toutes les lignes
+        self.model.set_all_checked(True)
         
         logging.debug(f"All {self.model.rowCount()} characters selected")
         
     def deselect_all_characters(self):
         """Décoche tous les personnages"""
-        for row in range(self.model.rowCount()):
-            index = self.model.index(row, 0)
-            # Utiliser setData au lieu de setCheckState pour forcer le signal
-            self.model.setData(index, Qt.Unchecked, Qt.CheckStateRole)
+        # Un seul signal dataChanged pour toutes les lignes
+        self.model.set_all_checked(False)
         
         logging.debug("All characters deselected")
         
@@ -428,7 +604,6 @@ class TreeManager:
         source_index = self.proxy_model.mapToSource(proxy_index)
         row = source_index.row()
         
-        name_item = self.model.item(row, 2)
-        char_name = name_item.text()
+        char_name = self.model.index(row, 2).data()
         
         return self.characters_by_id.get(char_name)
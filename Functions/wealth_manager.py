@@ -5,12 +5,12 @@ Uses the CharacterProfileScraper to get wealth data from character profiles
 Version: 0.107
 """
 
-import json
 import os
 from pathlib import Path
 from Functions.character_profile_scraper import CharacterProfileScraper
 from Functions.cookie_manager import CookieManager
 from Functions.debug_logging_manager import get_logger, log_with_action
+from Functions.json_bulk_loader import json_bulk_iter
 
 wealth_logger = get_logger("WEALTH")
 
@@ -70,10 +70,12 @@ def get_first_character_per_realm(character_folder):
                     continue
                 
                 # Find first character JSON file with level >= 11
-                for char_file in realm_dir.glob('*.json'):
+                # (files are read ahead on a pool, in name order, until one matches)
+                char_files = sorted(realm_dir.glob('*.json'))
+                for char_file, char_data, error in json_bulk_iter(char_files):
                     try:
-                        with open(char_file, 'r', encoding='utf-8') as f:
-                            char_data = json.load(f)
+                        if error is not None:
+                            raise error
                         
                         name = char_data.get('name')
                         url = char_data.get('url')
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Character List Benchmark
+Compares the QStandardItemModel rows used before with CharacterListModel
+(Functions/tree_manager.py) on characters written by generate_test_characters.py:
+time to fill the model and show it in a sorted QTreeView, and the memory held
+by the rows.
+
+Methods:
+  - QStandardItemModel   previous list (12 QStandardItem per row, font and
+                         alignment set on each item, rank looked up per row)
+  - CharacterListModel   virtual model (one tuple of texts per row, ranks in batch,
+                         sorted by the model instead of RealmSortProxyModel.lessThan)
+
+Each method runs in its own process (offscreen Qt platform) so the memory of
+one does not hide the other. Memory is the resident set size (RSS) growth
+between the loaded characters and the filled view.
+
+Usage:
+    python Tools/Development/benchmark_character_list.py
+    python Tools/Development/benchmark_character_list.py --rows 10000 --repeat 3
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+METHODS = ["QStandardItemModel", "CharacterListModel"]
+
+
+def get_rss_mb():
+    """Resident set size of the process (MB)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def load_characters(base_dir):
+    """Character files of base_dir, in os.walk order like get_all_characters"""
+    from Functions.json_bulk_loader import json_bulk_load
+    paths = []
+    for root, _, files in os.walk(base_dir):
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.json'))
+    return [data for _, data, error in json_bulk_load(paths) if error is None]
+
+
+def build_standard_model(characters, data_manager, realm_icons):
+    """Previous list: rows of QStandardItem (TreeManager._build_row_items before the virtual model)"""
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QStandardItemModel, QStandardItem
+
+    model = QStandardItemModel()
+    model.setColumnCount(12)
+    for char in characters:
+        realm_name = char.get('realm', 'N/A')
+
+        item_realm = QStandardItem()
+        realm_icon = realm_icons.get(realm_name)
+        if realm_icon:
+            item_realm.setData(realm_name, Qt.UserRole + 1)
+            item_realm.setData(realm_name, Qt.UserRole + 2)
+            item_realm.setIcon(realm_icon)
+        item_realm.setData(char.get('id'), Qt.UserRole)
+        item_realm.setTextAlignment(Qt.AlignCenter)
+        item_realm.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
+
+        realm_rank_level, realm_title = '1L1', ''
+        rank_info = data_manager.get_realm_rank_info(realm_name, char.get('realm_points', 0))
+        if rank_info:
+            realm_rank_level, realm_title = rank_info['level'], rank_info['title']
+
+        texts = [
+            char.get('name', 'N/A'), char.get('class', ''), str(char.get('level', 1)),
+            str(realm_rank_level), realm_title, char.get('guild', ''), str(char.get('page', 1)),
+            char.get('server', 'Eden'), char.get('race', ''), char.get('url', '')
+        ]
+        text_items = []
+        for text in texts:
+            item = QStandardItem(text)
+            item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
+            item.setTextAlignment(Qt.AlignCenter)
+            font = item.font()
+            font.setBold(False)
+            item.setFont(font)
+            text_items.append(item)
+        text_items[4].setData(realm_name, Qt.UserRole)  # Titre : couleur du royaume
+
+        item_selection = QStandardItem()
+        item_selection.setCheckable(True)
+        item_selection.setCheckState(Qt.Unchecked)
+        item_selection.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+
+        model.appendRow([item_selection, item_realm] + text_items)
+    return model
+
+
+def build_virtual_model(characters, data_manager, realm_icons):
+    """Current list: CharacterListModel"""
+    from Functions.tree_manager import CharacterListModel
+
+    model = CharacterListModel(data_manager, realm_icons)
+    model.sync_characters(characters)
+    return model
+
+
+def run_method(method, base_dir):
+    """Fill and show the list with one method (child process), return the measures"""
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication, QTreeView
+    from Functions.character_manager import REALM_ICONS
+    from Functions.data_manager import DataManager
+    from Functions.debug_logging_manager import get_img_dir
+    from Functions.tree_manager import RealmSortProxyModel
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    data_manager = DataManager()
+    realm_icons = {realm: QIcon(f"{get_img_dir()}/{filename}") for realm, filename in REALM_ICONS.items()}
+    characters = load_characters(base_dir)
+    build = build_standard_model if method == "QStandardItemModel" else build_virtual_model
+
+    # Configuration of TreeManager._configure_tree_view (uniform row heights came with the virtual model)
+    view = QTreeView()
+    view.resize(1200, 800)
+    view.setAlternatingRowColors(True)
+    view.setRootIsDecorated(False)
+    view.setUniformRowHeights(method == "CharacterListModel")
+    view.setSortingEnabled(True)
+    view.show()
+    app.processEvents()
+
+    gc.collect()
+    rss_before = get_rss_mb()
+    start = time.perf_counter()
+    model = build(characters, data_manager, realm_icons)
+    proxy = RealmSortProxyModel()
+    proxy.setSourceModel(model)
+    view.setModel(proxy)
+    view.sortByColumn(2, view.header().sortIndicatorOrder())
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    rss_after = get_rss_mb()
+
+    return {"rows": proxy.rowCount(), "time": elapsed, "memory": rss_after - rss_before}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the character list model")
+    parser.add_argument("--rows", type=int, default=10000, help="Generated characters (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method, best kept (default: 3)")
+    parser.add_argument("--run", choices=METHODS, help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_method(args.run, args.corpus)))
+        return
+
+    from generate_test_characters import generate_test_characters
+
+    with tempfile.TemporaryDirectory(prefix="character_list_bench_") as temp_dir:
+        count_per_realm = -(-args.rows // 3)
+        print(f"Generating {count_per_realm * 3} characters in {temp_dir}...")
+        generate_test_characters(temp_dir, count_per_realm, verbose=False)
+        print()
+
+        baseline = None
+        print(f"{'Method':<20} {'Rows':>7} {'Time':>10} {'Memory':>10} {'Speedup':>8} {'Memory ratio':>13}")
+        for method in METHODS:
+            runs = []
+            for _ in range(args.repeat):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--run", method, "--corpus", temp_dir],
+                    capture_output=True, text=True, check=True, cwd=str(project_root)
+                ).stdout
+                runs.append(json.loads(output.strip().splitlines()[-1]))
+            result = {
+                "rows": runs[0]["rows"],
+                "time": min(run["time"] for run in runs),
+                "memory": min(run["memory"] for run in runs),
+            }
+            if baseline is None:
+                baseline = result
+            print(f"{method:<20} {result['rows']:>7} {result['time'] * 1000:>8.0f}ms "
+                  f"{result['memory']:>8.1f}MB {baseline['time'] / result['time']:>7.1f}x "
+                  f"{baseline['memory'] / max(result['memory'], 0.1):>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
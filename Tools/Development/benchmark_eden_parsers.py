@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eden Parsers Micro-benchmark
+Compares the full-page BeautifulSoup parsing used before with the targeted
+parsing of Functions/eden_html_parser.py on saved Eden pages, and checks that
+both read the same rows.
+
+Pages are taken from the page cache (items_search and item_details folders)
+or given as files (e.g. Logs/items_details_debug/*.html).
+
+Usage:
+    python Tools/Development/benchmark_eden_parsers.py
+    python Tools/Development/benchmark_eden_parsers.py --repeat 20 Logs/items_details_debug/*.html
+"""
+
+import argparse
+import gzip
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from bs4 import BeautifulSoup
+
+from Functions.eden_html_parser import (
+    REALM_ICON_PATTERN, html_get_backend, html_parse_fragment, html_parse_items_search
+)
+from Functions.eden_page_cache import PAGE_CACHE_SUFFIX
+
+RESULT_ROW_REGEX = re.compile(r'^result_row_\d+$')
+
+
+def load_pages(pages_dir, files):
+    """{page_type: [html]} from the page cache folders and the given files"""
+    pages = {"items_search": [], "item_details": []}
+    for page_type in pages:
+        for path in sorted(Path(pages_dir).glob(f"{page_type}/*{PAGE_CACHE_SUFFIX}")):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                pages[page_type].append(f.read())
+    for path in files:
+        html = Path(path).read_text(encoding="utf-8", errors="replace")
+        page_type = "item_details" if "item_line_left" in html else "items_search"
+        pages[page_type].append(html)
+    return pages
+
+
+def full_page_items_search(html):
+    """Previous parsing: whole page tree, rows found by id regex"""
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = []
+    for row in soup.find_all('tr', id=RESULT_ROW_REGEX):
+        realm_img = row.find('img', src=REALM_ICON_PATTERN)
+        rows.append({
+            'id': row['id'][len('result_row_'):],
+            'cells': [cell.get_text(strip=True) for cell in row.find_all('td')],
+            'realm_src': realm_img.get('src', '') if realm_img else None,
+        })
+    return rows
+
+
+def full_page_item_details(html):
+    """Previous parsing: whole page tree, then the two tables"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return _item_details_rows(soup)
+
+
+def fragment_item_details(html):
+    soup = html_parse_fragment(html, ("table_result", "table_merchants"))
+    return _item_details_rows(soup)
+
+
+def _item_details_rows(soup):
+    rows = []
+    for table_id in ("table_result", "table_merchants"):
+        table = soup.find('table', id=table_id)
+        if table:
+            rows.extend([cell.get_text(strip=True) for cell in tr.find_all('td')] for tr in table.find_all('tr'))
+    return rows
+
+
+def time_it(function, pages, repeat):
+    """Average milliseconds per page"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            function(html)
+    return (time.perf_counter() - start) / (repeat * len(pages)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Eden HTML parsing on saved pages")
+    parser.add_argument("files", nargs="*", help="Saved HTML pages (in addition to the page cache)")
+    parser.add_argument("--pages", type=Path, default=None, help="Page cache directory (default: user page cache)")
+    parser.add_argument("--repeat", type=int, default=10, help="Passes over the pages (default: 10)")
+    args = parser.parse_args()
+
+    if args.pages is None:
+        from Functions.path_manager import get_user_data_dir
+        args.pages = get_user_data_dir() / "PageCache"
+
+    pages = load_pages(args.pages, args.files)
+    print(f"Parser backend: {html_get_backend()}")
+
+    benchmarks = (
+        ("items_search", full_page_items_search, lambda html: html_parse_items_search(html)[0]),
+        ("item_details", full_page_item_details, fragment_item_details),
+    )
+    for page_type, previous, targeted in benchmarks:
+        page_list = pages[page_type]
+        if not page_list:
+            print(f"\n{page_type}: no saved page")
+            continue
+
+        mismatches = sum(1 for html in page_list if previous(html) != targeted(html))
+        previous_ms = time_it(previous, page_list, args.repeat)
+        targeted_ms = time_it(targeted, page_list, args.repeat)
+        speedup = previous_ms / targeted_ms if targeted_ms else 0.0
+
+        print(f"\n{page_type}: {len(page_list)} pages x {args.repeat}")
+        print(f"  full page (html.parser): {previous_ms:8.2f} ms/page")
+        print(f"  targeted ({html_get_backend()}): {targeted_ms:8.2f} ms/page  -> x{speedup:.1f}")
+        print(f"  same rows: {len(page_list) - mismatches}/{len(page_list)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
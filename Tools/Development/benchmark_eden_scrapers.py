@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eden Scrapers Benchmark
+Drives the real scraping code (ItemsScraper.find_all_item_variants /
+get_item_details, search_herald_character, CharacterProfileScraper) against
+the local Eden stand-in server, with a real browser, and reports throughput
+and the time spent waiting for pages versus the rest (navigation, HTTP,
+parsing).
+
+Runs fully offline: the server replays pages recorded in the page cache, the
+application data directory is redirected to a temporary folder (cookies,
+browser profile) and the page cache is disabled for the run.
+
+Usage:
+    # Items recorded in the page cache (names taken from the items database)
+    python Tools/Development/benchmark_eden_scrapers.py --items 20 --latency-ms 150 --js-delay-ms 800
+
+    # Herald search and character profiles
+    python Tools/Development/benchmark_eden_scrapers.py --characters Charname1 Charname2 --profiles
+
+    # Browser only (HTTP fast path disabled)
+    python Tools/Development/benchmark_eden_scrapers.py --items 20 --no-http
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+import urllib.parse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from eden_standin_server import EDEN_ORIGIN, RecordedPages, StandinServer, default_pages_dir
+
+
+def redirect_user_data(temp_dir):
+    """Isolated application data directory (cookies, browser profile, caches)"""
+    os.environ["XDG_DATA_HOME"] = str(temp_dir)
+    os.environ["LOCALAPPDATA"] = str(temp_dir)
+    os.environ["APPDATA"] = str(temp_dir)
+
+
+def write_standin_cookies():
+    """Valid cookie file: the stand-in server accepts any session"""
+    from Functions.cookie_manager import CookieManager
+    cookie_manager = CookieManager()
+    cookie_manager.cookie_file.parent.mkdir(parents=True, exist_ok=True)
+    cookies = [{"name": "standin_session", "value": "benchmark", "path": "/",
+                "expiry": int(time.time()) + 86400}]
+    with open(cookie_manager.cookie_file, "wb") as f:
+        pickle.dump(cookies, f)
+    return cookie_manager
+
+
+def recorded_item_names(pages, limit):
+    """Item names of the items database whose search page was recorded"""
+    db_file = project_root / "Data" / "items_database_src.json"
+    with open(db_file, "r", encoding="utf-8") as f:
+        items = json.load(f).get("items", {})
+
+    names = []
+    for item in items.values():
+        name = item.get("name")
+        if not name or name in names:
+            continue
+        if pages.has(f"{EDEN_ORIGIN}/items?s={urllib.parse.quote(name)}&r=0"):
+            names.append(name)
+            if len(names) >= limit:
+                break
+    return names
+
+
+class Phase:
+    """Wall time of a benchmark phase with the wait/HTTP statistics it produced"""
+
+    def __init__(self, name):
+        self.name = name
+        self.units = 0
+        self.failures = 0
+
+    def __enter__(self):
+        from Functions.eden_http_client import http_reset_stats
+        from Functions.eden_request_scheduler import scheduler_reset_stats
+        from Functions.eden_wait_policy import wait_reset_stats
+        wait_reset_stats()
+        http_reset_stats()
+        scheduler_reset_stats()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        from Functions.eden_http_client import http_get_stats
+        from Functions.eden_request_scheduler import scheduler_get_stats
+        from Functions.eden_wait_policy import wait_get_stats
+        self.elapsed = time.perf_counter() - self.start
+        self.wait_stats = wait_get_stats()
+        self.http_stats = http_get_stats()
+        self.scheduler_stats = scheduler_get_stats()
+        return False
+
+    def report(self, unit):
+        wait_seconds = sum(stats["total_seconds"] for stats in self.wait_stats.values())
+        http_seconds = sum(stats["total_seconds"] for stats in self.http_stats.values())
+        other_seconds = max(self.elapsed - wait_seconds - http_seconds, 0.0)
+        per_minute = self.units / self.elapsed * 60 if self.elapsed else 0.0
+
+        print(f"\n=== {self.name} ===")
+        print(f"  {self.units} {unit} ({self.failures} failed) in {self.elapsed:.1f}s -> {per_minute:.1f} {unit}/min")
+        print(f"  Waiting for pages : {wait_seconds:7.2f}s ({self._share(wait_seconds)})")
+        print(f"  HTTP fetches      : {http_seconds:7.2f}s ({self._share(http_seconds)})")
+        print(f"  Navigation/parsing: {other_seconds:7.2f}s ({self._share(other_seconds)})")
+        for page_type, stats in sorted(self.wait_stats.items()):
+            print(f"    wait {page_type:<22} {int(stats['count']):4d} x avg {stats['avg_seconds']:.2f}s"
+                  f" max {stats['max_seconds']:.2f}s timeouts {int(stats['timeouts'])}")
+        for page_type, stats in sorted(self.http_stats.items()):
+            print(f"    http {page_type:<22} {int(stats['hits']):4d} hits {int(stats['fallbacks']):4d} fallbacks")
+        for host, stats in sorted(self.scheduler_stats.items()):
+            print(f"    scheduler {host:<17} {int(stats['requests']):4d} requests, {int(stats['throttled'])} throttled "
+                  f"({stats['total_wait_seconds']:.2f}s), max {int(stats['max_in_flight'])} in flight, "
+                  f"{int(stats['errors'])} errors, {int(stats['bot_checks'])} bot checks")
+
+    def _share(self, seconds):
+        return f"{seconds / self.elapsed * 100:.0f}%" if self.elapsed else "-"
+
+
+def bench_items(scraper, names):
+    """find_all_item_variants + get_item_details for every variant"""
+    from Functions.items_scraper import ItemsScraper
+
+    items_scraper = ItemsScraper(scraper)
+    with Phase("Items (search + details)") as phase:
+        for name in names:
+            variants = items_scraper.find_all_item_variants(name, skip_filters=True, force_scrape=True)
+            if not variants:
+                phase.failures += 1
+            for variant in variants:
+                details = items_scraper.get_item_details(variant["id"], variant.get("realm", "All"), name)
+                phase.units += 1
+                if not details:
+                    phase.failures += 1
+    phase.report("items")
+
+
+def bench_herald_search(names):
+    """search_herald_character (shared Herald session)"""
+    from Functions.eden_scraper import search_herald_character
+
+    with Phase("Herald search") as phase:
+        for name in names:
+            success, _, _ = search_herald_character(name)
+            phase.units += 1
+            if not success:
+                phase.failures += 1
+    phase.report("searches")
+
+
+def bench_profiles(names, headless):
+    """CharacterProfileScraper.scrape_profile (all sections)"""
+    from Functions.character_profile_scraper import CharacterProfileScraper
+    from Functions.eden_scraper import EDEN_BASE_URL
+
+    profile_scraper = CharacterProfileScraper()
+    success, error_message = profile_scraper.connect(headless=headless)
+    if not success:
+        print(f"Profile scraper connection failed: {error_message}")
+        return
+    try:
+        with Phase("Character profiles") as phase:
+            for name in names:
+                results = profile_scraper.scrape_profile(f"{EDEN_BASE_URL}/herald?n=player&k={name}")
+                phase.units += 1
+                if not all(result.get("success") for key, result in results.items() if key != "achievements"):
+                    phase.failures += 1
+        phase.report("profiles")
+    finally:
+        profile_scraper.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Eden scrapers against the local stand-in server")
+    parser.add_argument("--pages", type=Path, default=None, help="Recorded pages directory (default: user page cache)")
+    parser.add_argument("--items", type=int, default=0, help="Number of recorded items to scrape")
+    parser.add_argument("--characters", nargs="*", default=[], help="Character names for Herald search/profiles")
+    parser.add_argument("--profiles", action="store_true", help="Also scrape the profile of each character")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server response delay in ms")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random +/- variation of the delay in ms")
+    parser.add_argument("--js-delay-ms", type=float, default=0.0, help="Page body inserted by JavaScript after this delay")
+    parser.add_argument("--no-http", action="store_true", help="Disable the HTTP fast path (browser only)")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Request scheduler rate per second (default: configured rate)")
+    parser.add_argument("--headless", action="store_true", help="Run the browser headless")
+    args = parser.parse_args()
+
+    # Recorded pages are read from the real user data directory, before it is redirected
+    pages = RecordedPages(args.pages or default_pages_dir())
+    if not len(pages):
+        print(f"No recorded pages in {pages.pages_dir} - browse Eden with the page cache enabled first")
+        return 1
+
+    server = StandinServer(pages, 0, args.latency_ms, args.jitter_ms, args.js_delay_ms)
+    server.start_in_background()
+    print(f"Eden stand-in: {len(pages)} recorded pages served on {server.base_url}")
+
+    # Must be set before the Functions modules are imported (EDEN_BASE_URL, data directories)
+    os.environ["DAOC_EDEN_BASE_URL"] = server.base_url
+    temp_dir = tempfile.mkdtemp(prefix="eden_benchmark_")
+    redirect_user_data(temp_dir)
+
+    from Functions.config_manager import config
+    config.set("system.page_cache.enabled", False, save=False)
+    config.set("system.page_cache.offline", False, save=False)
+    config.set("system.http_fast_path", not args.no_http, save=False)
+    if args.rate is not None:
+        config.set("system.request_scheduler.rate_per_second", args.rate, save=False)
+
+    from Functions.eden_herald_session import herald_session_shutdown
+    from Functions.eden_scraper import _connect_to_eden_herald
+
+    write_standin_cookies()
+    scraper = None
+    try:
+        if args.items:
+            names = recorded_item_names(pages, args.items)
+            print(f"{len(names)} recorded items selected")
+            if names:
+                scraper, error_message = _connect_to_eden_herald(headless=args.headless)
+                if not scraper:
+                    print(f"Connection failed: {error_message}")
+                    return 1
+                bench_items(scraper, names)
+
+        if args.characters:
+            bench_herald_search(args.characters)
+            if args.profiles:
+                bench_profiles(args.characters, args.headless)
+    finally:
+        if scraper:
+            scraper.close()
+        herald_session_shutdown()
+        server.shutdown()
+
+    print(f"\nPages served: {server.counters['served']}, not recorded: {server.counters['missing']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Loading Micro-benchmark
+Compares the serial json.load scans used before with Functions/json_bulk_loader.py
+on a generated corpus of character files (Characters/<Season>/<Realm>/<Name>.json),
+and checks that every method reads the same documents in the same order.
+
+Methods:
+  - serial json.load     previous scans (open in text mode, json.load, one file after the other)
+  - bulk, json           json_bulk_load with the json module
+  - bulk, orjson         json_bulk_load with orjson (if installed)
+
+Each method is run with 1 worker (decoder gain only) and with the given pool
+size. Files stay in the OS cache after the corpus is generated: run with
+--corpus on an existing folder after a reboot to measure a cold disk.
+
+Usage:
+    python Tools/Development/benchmark_json_loading.py
+    python Tools/Development/benchmark_json_loading.py --files 20000 --workers 16 --repeat 5
+    python Tools/Development/benchmark_json_loading.py --corpus Characters
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Functions import json_bulk_loader
+from Functions.json_bulk_loader import json_bulk_load
+
+SEASONS = ["S1", "S2", "S3"]
+REALMS = ["Albion", "Hibernia", "Midgard"]
+CLASSES = ["Armsman", "Cleric", "Wizard", "Bard", "Druid", "Hero", "Healer", "Skald", "Thane"]
+
+
+def generate_corpus(base_dir, count, seed=42):
+    """Write count character files spread over seasons and realms"""
+    rng = random.Random(seed)
+    for index in range(count):
+        season = SEASONS[index % len(SEASONS)]
+        realm = REALMS[(index // len(SEASONS)) % len(REALMS)]
+        name = f"Bench{index:05d}"
+        character = {
+            "id": name,
+            "name": name,
+            "realm": realm,
+            "class": rng.choice(CLASSES),
+            "race": "Briton",
+            "level": rng.randint(1, 50),
+            "season": season,
+            "server": "Eden",
+            "page": rng.randint(1, 5),
+            "guild": rng.choice(["Les Gardiens", "Storm Riders", ""]),
+            "realm_rank": f"{rng.randint(1, 12)}L{rng.randint(0, 9)}",
+            "realm_title": "Guardian",
+            "realm_points": rng.randint(0, 5_000_000),
+            "url": f"https://eden-daoc.net/herald?n=player&k={name}",
+            "armor": {slot: {"name": f"Item {rng.randint(1, 9999)}", "quality": 100}
+                      for slot in ("Head", "Chest", "Arms", "Hands", "Legs", "Feet")},
+            "created_at": "2025-01-01 12:00:00",
+            "updated_at": "2025-01-02 12:00:00",
+        }
+        folder = Path(base_dir) / season / realm
+        folder.mkdir(parents=True, exist_ok=True)
+        with open(folder / f"{name}.json", 'w', encoding='utf-8') as f:
+            json.dump(character, f, indent=2, ensure_ascii=False)
+
+
+def list_files(base_dir):
+    """Character files in os.walk order, like the application scans"""
+    paths = []
+    for root, _, files in os.walk(base_dir):
+        paths.extend(os.path.join(root, name) for name in files if name.endswith('.json'))
+    return paths
+
+
+def serial_load(paths):
+    """Previous scans: text mode + json.load, one file after the other"""
+    results = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                results.append((path, json.load(f), None))
+        except (OSError, ValueError) as e:
+            results.append((path, None, e))
+    return results
+
+
+def bulk_load(paths, workers, use_orjson):
+    saved = json_bulk_loader.orjson
+    if not use_orjson:
+        json_bulk_loader.orjson = None
+    try:
+        return json_bulk_load(paths, max_workers=workers)
+    finally:
+        json_bulk_loader.orjson = saved
+
+
+def measure(func, repeat):
+    """Best time of repeat runs (seconds) and the last result"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the bulk JSON loader")
+    parser.add_argument("--files", type=int, default=5000, help="Generated character files (default: 5000)")
+    parser.add_argument("--workers", type=int, default=json_bulk_loader.DEFAULT_WORKERS,
+                        help=f"Pool threads (default: {json_bulk_loader.DEFAULT_WORKERS})")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per method, best kept (default: 3)")
+    parser.add_argument("--corpus", help="Existing folder to scan instead of a generated corpus")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="json_bench_") as temp_dir:
+        if args.corpus:
+            base_dir = args.corpus
+        else:
+            base_dir = temp_dir
+            print(f"Generating {args.files} character files in {base_dir}...")
+            generate_corpus(base_dir, args.files)
+
+        paths = list_files(base_dir)
+        size_mb = sum(os.path.getsize(path) for path in paths) / (1024 * 1024)
+        print(f"Corpus: {len(paths)} files, {size_mb:.1f} MB")
+        print(f"Decoder available: {json_bulk_loader.json_get_backend()}")
+        print()
+
+        methods = [("serial json.load", lambda: serial_load(paths))]
+        backends = [False, True] if json_bulk_loader.orjson is not None else [False]
+        for use_orjson in backends:
+            name = "orjson" if use_orjson else "json"
+            for workers in sorted({1, args.workers}):
+                methods.append((f"bulk, {name}, {workers} worker(s)",
+                                lambda w=workers, o=use_orjson: bulk_load(paths, w, o)))
+
+        baseline_time, baseline = None, None
+        print(f"{'Method':<32} {'Time':>10} {'Files/s':>10} {'Speedup':>8}")
+        for name, func in methods:
+            elapsed, result = measure(func, args.repeat)
+            if baseline is None:
+                baseline_time, baseline = elapsed, result
+                same = True
+            else:
+                same = [(p, d) for p, d, _ in result] == [(p, d) for p, d, _ in baseline]
+            print(f"{name:<32} {elapsed * 1000:>8.1f}ms {len(paths) / elapsed:>10.0f} "
+                  f"{baseline_time / elapsed:>7.2f}x" + ("" if same else "  MISMATCH"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eden Stand-in Server
+Local HTTP server replaying recorded Eden pages (items search, item details,
+Herald search and character profile tabs) for offline scraper benchmarks.
+
+Recorded pages are read from a page cache directory (see
+Functions/eden_page_cache.py): every page visited by the application with the
+page cache enabled is replayed under the same path and query.
+
+Options simulate the live site:
+  --latency-ms / --jitter-ms   Response delay
+  --js-delay-ms                Page body inserted by JavaScript after this delay
+                               (empty page for the HTTP fast path, condition
+                               based waits exercised in the browser)
+
+Point the application at the server with DAOC_EDEN_BASE_URL=http://127.0.0.1:<port>
+(Tools/Development/benchmark_eden_scrapers.py does it automatically).
+
+Usage:
+    python Tools/Development/eden_standin_server.py --port 8765 --latency-ms 150 --js-delay-ms 800
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from Functions.eden_page_cache import PAGE_CACHE_SUFFIX, page_cache_normalize_url
+
+# Origin of the recorded URLs (cache keys are computed on it)
+EDEN_ORIGIN = "https://eden-daoc.net"
+
+# Connected Herald landing page, served when / or /herald were not recorded
+DEFAULT_PAGE = "<html><head><title>Eden stand-in</title></head><body><div id=\"herald\">Eden stand-in</div></body></html>"
+
+# Clicking a search result row opens the item details page (Eden does it with its own scripts).
+# The row id prefix is split so that the raw HTML does not look like a rendered results page.
+ROW_CLICK_SCRIPT = (
+    "<script>document.addEventListener('click', function (e) {"
+    "var row = e.target.closest(\"tr[id^='result_\" + \"row_']\");"
+    "if (row) { location.href = '/items?id=' + row.id.substring(11); }"
+    "}, true);</script>"
+)
+
+BODY_PATTERN = re.compile(r"(<body[^>]*>)(.*)(</body>)", re.IGNORECASE | re.DOTALL)
+
+
+class RecordedPages:
+    """Index of recorded pages: {cache key: gzip file}"""
+
+    def __init__(self, pages_dir):
+        self.pages_dir = Path(pages_dir)
+        self.files = {}
+        for path in self.pages_dir.glob(f"*/*{PAGE_CACHE_SUFFIX}"):
+            self.files[path.name[:-len(PAGE_CACHE_SUFFIX)]] = path
+
+    def __len__(self):
+        return len(self.files)
+
+    def has(self, url):
+        return self._get_key(url) in self.files
+
+    def get(self, url):
+        """Recorded HTML of an Eden URL, or None"""
+        path = self.files.get(self._get_key(url))
+        if path is None:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+
+    @staticmethod
+    def _get_key(url):
+        return hashlib.sha256(page_cache_normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def delay_body(html, js_delay_ms):
+    """
+    Replace the page body with a script inserting it after js_delay_ms
+    (base64 encoded: the content markers are absent from the raw HTML)
+    """
+    match = BODY_PATTERN.search(html)
+    if not match:
+        return html
+    encoded = base64.b64encode(match.group(2).encode("utf-8")).decode("ascii")
+    script = (
+        "<script>setTimeout(function () {"
+        f"var bytes = Uint8Array.from(atob('{encoded}'), function (c) {{ return c.charCodeAt(0); }});"
+        "document.body.innerHTML = new TextDecoder().decode(bytes);"
+        f"}}, {int(js_delay_ms)});</script>"
+    )
+    return html[:match.start()] + match.group(1) + script + match.group(3) + html[match.end():]
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Serves recorded pages with the server latency / JavaScript settings"""
+
+    server_version = "EdenStandin/1.0"
+
+    def do_GET(self):
+        settings = self.server.settings
+        delay = settings["latency_ms"] + random.uniform(-settings["jitter_ms"], settings["jitter_ms"])
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        url = EDEN_ORIGIN + self.path
+        html = self.server.pages.get(url)
+        status = 200
+        if html is None:
+            if self.path.split("?")[0].rstrip("/") in ("", "/herald"):
+                html = DEFAULT_PAGE
+            else:
+                status = 404
+                html = "<html><body>Not recorded</body></html>"
+                self.server.count("missing")
+        else:
+            self.server.count("served")
+            if settings["js_delay_ms"] > 0:
+                html = delay_body(html, settings["js_delay_ms"])
+            html = html.replace("</body>", ROW_CLICK_SCRIPT + "</body>", 1)
+
+        body = html.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.settings["verbose"]:
+            super().log_message(format, *args)
+
+
+class StandinServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer holding the recorded pages and the simulation settings"""
+
+    daemon_threads = True
+
+    def __init__(self, pages, port=0, latency_ms=0.0, jitter_ms=0.0, js_delay_ms=0.0, verbose=False):
+        super().__init__(("127.0.0.1", port), StandinHandler)
+        self.pages = pages
+        self.settings = {"latency_ms": latency_ms, "jitter_ms": jitter_ms,
+                         "js_delay_ms": js_delay_ms, "verbose": verbose}
+        self.counters = {"served": 0, "missing": 0}
+        self._counters_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, name):
+        with self._counters_lock:
+            self.counters[name] += 1
+
+    def start_in_background(self):
+        """Serve from a daemon thread (benchmark runner)"""
+        thread = threading.Thread(target=self.serve_forever, name="EdenStandin", daemon=True)
+        thread.start()
+        return thread
+
+
+def default_pages_dir():
+    """Page cache of the current user (pages recorded by the application)"""
+    from Functions.path_manager import get_user_data_dir
+    return get_user_data_dir() / "PageCache"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded Eden pages on a local HTTP server")
+    parser.add_argument("--pages", type=Path, default=None, help="Recorded pages directory (default: user page cache)")
+    parser.add_argument("--port", type=int, default=8765, help="Listening port (default: 8765)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Response delay in ms")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random +/- variation of the delay in ms")
+    parser.add_argument("--js-delay-ms", type=float, default=0.0, help="Insert the page body by JavaScript after this delay")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    pages = RecordedPages(args.pages or default_pages_dir())
+    server = StandinServer(pages, args.port, args.latency_ms, args.jitter_ms, args.js_delay_ms, args.verbose)
+
+    print(f"Eden stand-in: {len(pages)} recorded pages from {pages.pages_dir}")
+    print(f"Listening on {server.base_url} - set DAOC_EDEN_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStopped - {server.counters['served']} pages served, {server.counters['missing']} not recorded")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,25 @@
 """
 Script de génération de personnages de test pour DAOC Character Manager
 Génère des fichiers JSON de test dans les dossiers Albion/Hibernia/Midgard
+
+Usage:
+    python Tools/Development/generate_test_characters.py
+    python Tools/Development/generate_test_characters.py --count 3334 --output /tmp/Characters
 """
 
+import argparse
 import json
 import os
 import random
 
-def generate_test_characters():
+def generate_test_characters(base_path="Characters", count_per_realm=3, verbose=True):
+    """
+    Génère count_per_realm personnages par royaume dans base_path/<Royaume>
+    
+    Returns:
+        list: Chemins des fichiers créés
+    """
     # Configuration
-    base_path = "Characters"
     realms = ["Albion", "Hibernia", "Midgard"]
     
     # Classes par royaume
@@ -38,12 +48,14 @@ def generate_test_characters():
     # Guildes
     guilds = ["Les Gardiens", "Warriors of Light", "Dark Brotherhood", "Phoenix Rising", "Storm Riders", ""]
     
-    # Générer 3 personnages par royaume
+    created = []
+    
+    # Générer count_per_realm personnages par royaume
     for realm in realms:
         realm_path = os.path.join(base_path, realm)
         os.makedirs(realm_path, exist_ok=True)
         
-        for i in range(1, 4):
+        for i in range(1, count_per_realm + 1):
             # Structure ANCIENNE VERSION (avant v0.105) pour tester la migration
             character = {
                 "id": f"{realm}_Test_{i}",
@@ -67,9 +79,19 @@ def generate_test_characters():
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(character, f, indent=4, ensure_ascii=False)
             
-            print(f" Créé: {filepath}")
+            created.append(filepath)
+            if verbose:
+                print(f" Créé: {filepath}")
+    
+    return created
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère des personnages de test")
+    parser.add_argument("--count", type=int, default=3, help="Personnages par royaume (défaut: 3)")
+    parser.add_argument("--output", default="Characters", help="Dossier de sortie (défaut: Characters)")
+    parser.add_argument("--quiet", action="store_true", help="Ne pas lister les fichiers créés")
+    args = parser.parse_args()
+    
     print(" Génération de personnages de test...")
-    generate_test_characters()
-    print(" Terminé!")
+    created = generate_test_characters(args.output, args.count, verbose=not args.quiet)
+    print(f" Terminé! ({len(created)} personnages)")
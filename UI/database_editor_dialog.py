@@ -1036,6 +1036,7 @@ class DatabaseEditorDialog(QMainWindow):
                     f"{lang.get('db_editor.refresh_connect_error', default='Failed to connect to Eden Herald')}:\n{error_message}")
                 return
             
+            items_scraper = None
             try:
                 items_scraper = ItemsScraper(eden_scraper)
                 
@@ -1047,7 +1048,8 @@ class DatabaseEditorDialog(QMainWindow):
                 item_details = items_scraper.get_item_details(
                     item_id=item_id,
                     realm=self.database['items'][item_key].get('realm', 'All'),
-                    item_name=item_name
+                    item_name=item_name,
+                    use_cache=False
                 )
                 
                 if not item_details:
@@ -1097,7 +1099,9 @@ class DatabaseEditorDialog(QMainWindow):
                         lang.get('db_editor.refresh_no_changes', default="No changes detected."))
                 
             finally:
-                # Always close scraper
+                # Always close scraper (flush the web cache journal first)
+                if items_scraper:
+                    items_scraper.close()
                 eden_scraper.close()
                 
         except Exception as e:
@@ -1153,15 +1157,17 @@ class DatabaseEditorDialog(QMainWindow):
                     f"{lang.get('db_editor.full_scan_connect_error', default='Failed to connect to Eden Herald')}:\n{error_message}")
                 return
             
+            items_scraper = None
             try:
                 items_scraper = ItemsScraper(eden_scraper)
                 
                 # Find all variants (skip_filters=True by default)
+                # Explicit single-item scan: always search Eden (ignore the negative cache)
                 progress.setLabelText(lang.get('db_editor.full_scan_searching', 
                     default="Searching all variants on Eden..."))
                 QApplication.processEvents()
                 
-                variants = items_scraper.find_all_item_variants(item_name, skip_filters=True)
+                variants = items_scraper.find_all_item_variants(item_name, skip_filters=True, force_scrape=True)
                 
                 if not variants:
                     progress.close()
@@ -1202,7 +1208,8 @@ class DatabaseEditorDialog(QMainWindow):
                     item_details = items_scraper.get_item_details(
                         item_id=variant_id,
                         realm=variant_realm,
-                        item_name=item_name
+                        item_name=item_name,
+                        use_cache=False
                     )
                     
                     if not item_details:
@@ -1271,7 +1278,9 @@ class DatabaseEditorDialog(QMainWindow):
                             default=f"Scanned {len(variants)} variant(s), no changes needed."))
                 
             finally:
-                # Always close scraper
+                # Always close scraper (flush the web cache journal first)
+                if items_scraper:
+                    items_scraper.close()
                 eden_scraper.close()
                 
         except Exception as e:
@@ -1664,6 +1673,7 @@ class DatabaseEditorDialog(QMainWindow):
             
             progress.complete_step(0)
             
+            items_scraper = None
             try:
                 # Step 1: Refresh items
                 progress.start_step(1)
@@ -1687,7 +1697,8 @@ class DatabaseEditorDialog(QMainWindow):
                     item_details = items_scraper.get_item_details(
                         item_id=item_data['id'],
                         realm=self.database['items'][item_key].get('realm', 'All'),
-                        item_name=item_data['name']
+                        item_name=item_data['name'],
+                        use_cache=False
                     )
                     
                     if item_details:
@@ -1715,6 +1726,8 @@ class DatabaseEditorDialog(QMainWindow):
                 progress.start_step(3)
                 
             finally:
+                if items_scraper:
+                    items_scraper.close()
                 eden_scraper.close()
                 progress.complete_step(3)
                 
@@ -1804,6 +1817,7 @@ class DatabaseEditorDialog(QMainWindow):
             
             progress.complete_step(0)
             
+            items_scraper = None
             try:
                 items_scraper = ItemsScraper(eden_scraper)
                 
@@ -1830,8 +1844,8 @@ class DatabaseEditorDialog(QMainWindow):
                     progress.set_status_message(f"🔍 {item_name} ({i+1}/{len(unique_names)})")
                     QApplication.processEvents()
                     
-                    # Find all variants
-                    variants = items_scraper.find_all_item_variants(item_name, skip_filters=True)
+                    # Find all variants (known-dead names are skipped via the negative cache)
+                    variants = items_scraper.find_all_item_variants(item_name, skip_filters=True, use_cache=False)
                     
                     if not variants:
                         scan_results.append((item_name, 0, 0))
@@ -1860,7 +1874,8 @@ class DatabaseEditorDialog(QMainWindow):
                         item_details = items_scraper.get_item_details(
                             item_id=variant_id,
                             realm=variant_realm,
-                            item_name=item_name
+                            item_name=item_name,
+                            use_cache=False
                         )
                         
                         if not item_details:
@@ -1912,6 +1927,8 @@ class DatabaseEditorDialog(QMainWindow):
                 progress.start_step(5)
                 
             finally:
+                if items_scraper:
+                    items_scraper.close()
                 eden_scraper.close()
                 progress.complete_step(5)
                 
@@ -3840,8 +3840,9 @@ class SearchThread(QThread):
         
         if self._scraper and hasattr(self._scraper, 'driver') and self._scraper.driver:
             try:
+                from Functions.eden_herald_session import herald_session_release
                 module_logger.info("Cleanup: Fermeture forcée du navigateur")
-                self._scraper.driver.quit()
+                herald_session_release(self._scraper, discard=True)
                 module_logger.info("Cleanup: Navigateur fermé avec succès")
             except Exception as e:
                 module_logger.warning(f"Cleanup: Erreur lors de la fermeture: {e}")
@@ -3860,12 +3861,15 @@ class SearchThread(QThread):
     def run(self):
         """Execute search with progress updates"""
         from Functions.cookie_manager import CookieManager
-        from Functions.eden_scraper import EdenScraper
+        from Functions.eden_herald_session import herald_session_acquire, herald_session_release
+        from Functions.eden_http_client import http_check_herald_search
+        from Functions.eden_request_scheduler import scheduler_navigate
+        from Functions.eden_scraper import EDEN_BASE_URL, _herald_search_ready
+        from Functions.eden_wait_policy import wait_until_ready
         from bs4 import BeautifulSoup
         from datetime import datetime
         from pathlib import Path
         import tempfile
-        import time
         import json
         import logging
         
@@ -3900,28 +3904,22 @@ class SearchThread(QThread):
             module_logger.info(f"Cookies valides - {info.get('cookie_count', 0)} cookies chargés", extra={"action": "SEARCH"})
             self._emit_step_complete(0)
             
-            # Step 1: Browser initialization
+            # Step 1: Browser initialization (shared Herald session, started only if needed)
             self._emit_step_start(1, "🌐 Initialisation du navigateur Chrome...")
-            scraper = EdenScraper(cookie_manager)
+            scraper, error_message = herald_session_acquire(cookie_manager=cookie_manager, headless=False)
             self._scraper = scraper  # Store reference for external cleanup
             
-            if not scraper.initialize_driver(headless=False):
-                module_logger.error("Impossible d'initialiser le navigateur", extra={"action": "SEARCH"})
-                self.step_error.emit(1, "Impossible d'initialiser le navigateur")
-                result_message = "Impossible d'initialiser le navigateur Chrome."
+            if not scraper:
+                module_logger.error(f"Impossible d'ouvrir la session Herald: {error_message}", extra={"action": "SEARCH"})
+                self.step_error.emit(1, error_message)
+                result_message = error_message
                 return
             
             module_logger.info("Navigateur initialisé avec succès", extra={"action": "SEARCH"})
             self._emit_step_complete(1)
             
-            # Step 2: Loading cookies
+            # Step 2: Loading cookies (done by the session)
             self._emit_step_start(2, "🍪 Chargement des cookies dans le navigateur...")
-            if not scraper.load_cookies():
-                module_logger.error("Impossible de charger les cookies dans le navigateur", extra={"action": "SEARCH"})
-                self.step_error.emit(2, "Impossible de charger les cookies")
-                result_message = "Impossible de charger les cookies."
-                return
-            
             module_logger.info("Cookies chargés dans le navigateur - Authentification complétée", extra={"action": "SEARCH"})
             self._emit_step_complete(2)
             
@@ -3932,14 +3930,17 @@ class SearchThread(QThread):
             
             # Step 3: Navigation to search page
             if self.realm_filter:
-                search_url = f"https://eden-daoc.net/herald?n=search&r={self.realm_filter}&s={self.character_name}"
+                search_url = f"{EDEN_BASE_URL}/herald?n=search&r={self.realm_filter}&s={self.character_name}"
             else:
-                search_url = f"https://eden-daoc.net/herald?n=search&s={self.character_name}"
+                search_url = f"{EDEN_BASE_URL}/herald?n=search&s={self.character_name}"
             
             self._emit_step_start(3, f"🔍 Recherche de '{self.character_name}' sur Eden Herald...")
             module_logger.info(f"Recherche Herald: {search_url}", extra={"action": "SEARCH"})
             
-            scraper.driver.get(search_url)
+            # Chemin rapide HTTP/cache (mêmes cookies), sinon navigation via l'ordonnanceur Eden
+            page_source = scraper.fetch_html(search_url, "herald_search", http_check_herald_search())
+            if page_source is None:
+                scheduler_navigate(scraper.driver, search_url)
             self._emit_step_complete(3)
             
             # Check if stop requested
@@ -3949,14 +3950,18 @@ class SearchThread(QThread):
             
             # Step 4: Wait for page loading
             self._emit_step_start(4, "⏳ Chargement de la page de recherche...")
-            module_logger.info("Attente du chargement de la page de recherche (5 secondes)...", extra={"action": "SEARCH"})
+            module_logger.info("Attente du chargement de la page de recherche...", extra={"action": "SEARCH"})
             
-            # Interruptible sleep (check flag every 0.5 seconds)
-            for i in range(10):  # 10 x 0.5s = 5s
+            if page_source is None:
+                # Results table stable or "not available" message (interruptible)
+                wait_until_ready(scraper.driver, "herald_search", _herald_search_ready(),
+                                 description=self.character_name, stop=lambda: self._stop_requested)
                 if self._stop_requested:
-                    module_logger.info("Arrêt demandé par l'utilisateur (pendant sleep)", extra={"action": "SEARCH"})
+                    module_logger.info("Arrêt demandé par l'utilisateur (pendant l'attente)", extra={"action": "SEARCH"})
                     return
-                time.sleep(0.5)
+                
+                page_source = scraper.driver.page_source
+                scraper.store_page(search_url, "herald_search", page_source, http_check_herald_search())
             
             self._emit_step_complete(4)
             
@@ -3967,7 +3972,6 @@ class SearchThread(QThread):
             
             # Step 5: Data extraction
             self._emit_step_start(5, "📊Sentence Extraction des résultats de recherche...")
-            page_source = scraper.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             module_logger.info(f"Page chargée - Taille: {len(page_source)} caractères", extra={"action": "SEARCH"})
@@ -4064,16 +4068,16 @@ class SearchThread(QThread):
                     if 'col_1_links' in result and result['col_1_links']:
                         href = result['col_1_links'][0]
                         if href.startswith('?'):
-                            url = f"https://eden-daoc.net/herald{href}"
+                            url = f"{EDEN_BASE_URL}/herald{href}"
                         elif href.startswith('http'):
                             url = href
                         else:
-                            url = f"https://eden-daoc.net{href}"
+                            url = f"{EDEN_BASE_URL}{href}"
                     else:
                         # Fallback: build URL from name if no link found
                         clean_name = name.split()[0] if name else ""
                         if clean_name:
-                            url = f"https://eden-daoc.net/herald?n=player&k={clean_name}"
+                            url = f"{EDEN_BASE_URL}/herald?n=player&k={clean_name}"
                     
                     # Nettoyer le nom (retirer les codes couleur HTML)
                     import re
@@ -4119,12 +4123,12 @@ class SearchThread(QThread):
             result_message = f"Erreur: {str(e)}"
             
         finally:
-            # Step 8: Close browser cleanly
+            # Step 8: Release the browser (kept warm for the next Herald operation)
             if scraper and scraper.driver:
                 try:
                     self._emit_step_start(8, "🔄 Fermeture du navigateur...")
-                    scraper.driver.quit()
-                    module_logger.info("Navigateur fermé", extra={"action": "SEARCH"})
+                    herald_session_release(scraper, discard=self._stop_requested)
+                    module_logger.info("Session Herald libérée", extra={"action": "SEARCH"})
                     self._emit_step_complete(8)
                 except Exception as e:
                     module_logger.warning(f"Erreur lors de la fermeture du navigateur: {e}", extra={"action": "SEARCH"})
@@ -4171,7 +4175,7 @@ class StatsUpdateThread(QThread):
         if self._scraper:
             try:
                 logger.info("Cleanup forcé : Fermeture scraper stats")
-                self._scraper.close()
+                self._scraper.close(discard=True)
                 logger.info("Scraper fermé avec succès")
             except Exception as e:
                 logger.warning(f"Erreur cleanup scraper: {e}")
@@ -4225,83 +4229,43 @@ class StatsUpdateThread(QThread):
                 logger.info("Arrêt demandé après init scraper")
                 return
             
-            # Étape 1 : Scraping RvR Captures
+            # Étapes 1 à 5 : une seule visite du profil, chaque section est
+            # analysée depuis la même session (onglets sans navigation navigateur)
+            section_steps = {'rvr': 1, 'pvp': 2, 'pve': 3, 'wealth': 4, 'achievements': 5}
             self.step_started.emit(1)
-            logger.info("Scraping RvR captures...")
-            
-            results['rvr'] = scraper.scrape_rvr_captures(self.character_url)
-            
-            if results['rvr']['success']:
-                logger.info(f"RvR captures récupérées: T={results['rvr']['tower_captures']}, K={results['rvr']['keep_captures']}, R={results['rvr']['relic_captures']}")
-                self.step_completed.emit(1)
-            else:
-                logger.warning(f"Échec RvR: {results['rvr'].get('error', 'Erreur inconnue')}")
-                self.step_error.emit(1, f"RvR: {results['rvr'].get('error', 'Erreur inconnue')}")
-            
-            if self._stop_requested:
-                return
-            
-            # Étape 2 : Scraping PvP Stats
-            self.step_started.emit(2)
-            logger.info("Scraping PvP stats...")
-            
-            results['pvp'] = scraper.scrape_pvp_stats(self.character_url)
-            
-            if results['pvp']['success']:
-                logger.info(f"PvP stats récupérées: SK={results['pvp']['solo_kills']}, DB={results['pvp']['deathblows']}, K={results['pvp']['kills']}")
-                self.step_completed.emit(2)
-            else:
-                logger.warning(f"Échec PvP: {results['pvp'].get('error', 'Erreur inconnue')}")
-                self.step_error.emit(2, f"PvP: {results['pvp'].get('error', 'Erreur inconnue')}")
-            
-            if self._stop_requested:
-                return
-            
-            # Étape 3 : Scraping PvE Stats
-            self.step_started.emit(3)
-            logger.info("Scraping PvE stats...")
-            
-            results['pve'] = scraper.scrape_pve_stats(self.character_url)
-            
-            if results['pve']['success']:
-                logger.info(f"PvE stats récupérées: Dragons={results['pve']['dragon_kills']}, Legion={results['pve']['legion_kills']}")
-                self.step_completed.emit(3)
-            else:
-                logger.warning(f"Échec PvE: {results['pve'].get('error', 'Erreur inconnue')}")
-                self.step_error.emit(3, f"PvE: {results['pve'].get('error', 'Erreur inconnue')}")
-            
-            if self._stop_requested:
-                return
-            
-            # Étape 4 : Scraping Wealth (Money)
-            self.step_started.emit(4)
-            logger.info("Scraping wealth...")
+            logger.info("Scraping profil (RvR, PvP, PvE, Wealth, Achievements)...")
             
-            results['wealth'] = scraper.scrape_wealth_money(self.character_url)
-            
-            if results['wealth']['success']:
-                logger.info(f"Wealth récupérée: {results['wealth']['money']}")
-                self.step_completed.emit(4)
-            else:
-                logger.warning(f"Échec Wealth: {results['wealth'].get('error', 'Erreur inconnue')}")
-                self.step_error.emit(4, f"Wealth: {results['wealth'].get('error', 'Erreur inconnue')}")
-            
-            if self._stop_requested:
-                return
-            
-            # Étape 5 : Scraping Achievements (conditionnel - ne bloque pas si échec)
-            self.step_started.emit(5)
-            logger.info("Scraping achievements...")
-            
-            results['achievements'] = scraper.scrape_achievements(self.character_url)
-            
-            if results['achievements']['success']:
-                logger.info(f"Achievements récupérés: {len(results['achievements']['achievements'])} achievements")
-                self.step_completed.emit(5)
-            else:
-                logger.warning(f"Échec Achievements: {results['achievements'].get('error', 'Erreur inconnue')}")
-                # Pas d'erreur bloquante pour achievements
-                self.step_completed.emit(5)  # Marqué complété même si échec (conditionnel)
+            for section, section_result in scraper.iter_profile_sections(self.character_url):
+                step = section_steps[section]
+                results[section] = section_result
+                
+                if section == 'rvr' and section_result['success']:
+                    logger.info(f"RvR captures récupérées: T={section_result['tower_captures']}, K={section_result['keep_captures']}, R={section_result['relic_captures']}")
+                elif section == 'pvp' and section_result['success']:
+                    logger.info(f"PvP stats récupérées: SK={section_result['solo_kills']}, DB={section_result['deathblows']}, K={section_result['kills']}")
+                elif section == 'pve' and section_result['success']:
+                    logger.info(f"PvE stats récupérées: Dragons={section_result['dragon_kills']}, Legion={section_result['legion_kills']}")
+                elif section == 'wealth' and section_result['success']:
+                    logger.info(f"Wealth récupérée: {section_result['money']}")
+                elif section == 'achievements' and section_result['success']:
+                    logger.info(f"Achievements récupérés: {len(section_result['achievements'])} achievements")
+                
+                if section_result['success'] or section == 'achievements':
+                    if not section_result['success']:
+                        # Pas d'erreur bloquante pour achievements (conditionnel)
+                        logger.warning(f"Échec Achievements: {section_result.get('error', 'Erreur inconnue')}")
+                    self.step_completed.emit(step)
+                else:
+                    label = {'rvr': 'RvR', 'pvp': 'PvP', 'pve': 'PvE', 'wealth': 'Wealth'}[section]
+                    logger.warning(f"Échec {label}: {section_result.get('error', 'Erreur inconnue')}")
+                    self.step_error.emit(step, f"{label}: {section_result.get('error', 'Erreur inconnue')}")
+                
+                # ✅ Pattern 3 : Check entre chaque section
+                if self._stop_requested:
+                    return
+                
+                if step < 5:
+                    self.step_started.emit(step + 1)
             
             # Vérifier si au moins RvR/PvP/PvE/Wealth ont réussi
             all_critical_success = (
@@ -4348,7 +4312,7 @@ class StatsUpdateThread(QThread):
                 try:
                     self.step_started.emit(6)
                     logger.info("Fermeture scraper...")
-                    scraper.close()
+                    scraper.close(discard=self._stop_requested)
                     logger.info("Scraper fermé")
                     self.step_completed.emit(6)
                 except Exception as e:
@@ -4398,8 +4362,9 @@ class CharacterUpdateThread(QThread):
         
         if self._scraper:
             try:
+                from Functions.eden_herald_session import herald_session_release
                 logger.info("Cleanup forcé : Fermeture scraper character update")
-                self._scraper.close()
+                herald_session_release(self._scraper, discard=True)
                 logger.info("Scraper fermé avec succès")
             except Exception as e:
                 logger.warning(f"Erreur cleanup scraper: {e}")
@@ -4409,7 +4374,6 @@ class CharacterUpdateThread(QThread):
     def run(self):
         """Exécute la mise à jour du personnage avec sécurité thread"""
         import logging
-        import time
         from datetime import datetime
         from urllib.parse import urlparse, parse_qs
         from bs4 import BeautifulSoup
@@ -4417,7 +4381,11 @@ class CharacterUpdateThread(QThread):
         logger = logging.getLogger(__name__)
         
         from Functions.cookie_manager import CookieManager
-        from Functions.eden_scraper import EdenScraper, _normalize_herald_data
+        from Functions.eden_scraper import EDEN_BASE_URL, _herald_search_ready, _normalize_herald_data
+        from Functions.eden_herald_session import herald_session_acquire, herald_session_release
+        from Functions.eden_http_client import http_check_herald_search
+        from Functions.eden_request_scheduler import scheduler_navigate
+        from Functions.eden_wait_policy import wait_until_ready
         
         scraper = None
         
@@ -4454,12 +4422,12 @@ class CharacterUpdateThread(QThread):
             self.step_started.emit(1)
             logger.info("Initialisation scraper Herald...")
             
+            # Session Herald partagée (navigateur + cookies), démarrée seulement si nécessaire
             cookie_manager = CookieManager()
-            scraper = EdenScraper(cookie_manager)
+            scraper, error_msg = herald_session_acquire(cookie_manager=cookie_manager, headless=False)
             self._scraper = scraper  # ✅ Pattern 2 : Stocker pour cleanup externe
             
-            if not scraper.initialize_driver(headless=False):
-                error_msg = "Impossible d'initialiser le navigateur"
+            if not scraper:
                 logger.error(error_msg)
                 self.step_error.emit(1, error_msg)
                 result_error = error_msg
@@ -4471,17 +4439,8 @@ class CharacterUpdateThread(QThread):
             if self._stop_requested:
                 return
             
-            # Étape 2 : Chargement des cookies
+            # Étape 2 : Chargement des cookies (fait par la session)
             self.step_started.emit(2)
-            logger.info("Chargement des cookies...")
-            
-            if not scraper.load_cookies():
-                error_msg = "Impossible de charger les cookies"
-                logger.error(error_msg)
-                self.step_error.emit(2, error_msg)
-                result_error = error_msg
-                return
-            
             logger.info("Cookies chargés")
             self.step_completed.emit(2)
             
@@ -4490,10 +4449,13 @@ class CharacterUpdateThread(QThread):
             
             # Étape 3 : Navigation vers la page de recherche
             self.step_started.emit(3)
-            search_url = f"https://eden-daoc.net/herald?n=search&s={character_name}"
+            search_url = f"{EDEN_BASE_URL}/herald?n=search&s={character_name}"
             logger.info(f"Navigation vers: {search_url}")
             
-            scraper.driver.get(search_url)
+            # Chemin rapide HTTP/cache (mêmes cookies), sinon navigation via l'ordonnanceur Eden
+            page_source = scraper.fetch_html(search_url, "herald_search", http_check_herald_search())
+            if page_source is None:
+                scheduler_navigate(scraper.driver, search_url)
             
             logger.info("Page chargée")
             self.step_completed.emit(3)
@@ -4505,12 +4467,16 @@ class CharacterUpdateThread(QThread):
             self.step_started.emit(4)
             logger.info("Attente chargement page...")
             
-            # ✅ Pattern 3 : Sleep interruptible (5 secondes)
-            for i in range(10):  # 10 x 0.5s = 5s
+            if page_source is None:
+                # ✅ Pattern 3 : Attente interruptible (table de résultats stable ou message "not available")
+                wait_until_ready(scraper.driver, "herald_search", _herald_search_ready(),
+                                 description=character_name, stop=lambda: self._stop_requested)
                 if self._stop_requested:
-                    logger.info("Arrêt demandé pendant sleep")
+                    logger.info("Arrêt demandé pendant l'attente")
                     return
-                time.sleep(0.5)
+                
+                page_source = scraper.driver.page_source
+                scraper.store_page(search_url, "herald_search", page_source, http_check_herald_search())
             
             logger.info("Chargement terminé")
             self.step_completed.emit(4)
@@ -4522,7 +4488,6 @@ class CharacterUpdateThread(QThread):
             self.step_started.emit(5)
             logger.info("Extraction données HTML...")
             
-            page_source = scraper.driver.page_source
             soup = BeautifulSoup(page_source, 'html.parser')
             
             logger.info(f"Page analysée: {len(page_source)} caractères")
@@ -4589,16 +4554,16 @@ class CharacterUpdateThread(QThread):
                     if 'col_1_links' in result and result['col_1_links']:
                         href = result['col_1_links'][0]
                         if href.startswith('?'):
-                            url = f"https://eden-daoc.net/herald{href}"
+                            url = f"{EDEN_BASE_URL}/herald{href}"
                         elif href.startswith('/'):
-                            url = f"https://eden-daoc.net{href}"
+                            url = f"{EDEN_BASE_URL}{href}"
                         elif not href.startswith('http'):
-                            url = f"https://eden-daoc.net/herald?{href}"
+                            url = f"{EDEN_BASE_URL}/herald?{href}"
                         else:
                             url = href
                     else:
                         clean_name = name.split()[0]
-                        url = f"https://eden-daoc.net/herald?n=player&k={clean_name}"
+                        url = f"{EDEN_BASE_URL}/herald?n=player&k={clean_name}"
                     
                     if name and char_class:
                         clean_name = name.split()[0]
@@ -4659,13 +4624,13 @@ class CharacterUpdateThread(QThread):
         
         finally:
             # ✅ Pattern 2 : Cleanup normal (s'exécute si pas terminate())
-            # Étape 7 : Fermeture scraper
+            # Étape 7 : Libération du navigateur (gardé actif pour la prochaine opération)
             if scraper and scraper.driver:
                 try:
                     self.step_started.emit(7)
-                    logger.info("Fermeture navigateur...")
-                    scraper.driver.quit()
-                    logger.info("Navigateur fermé")
+                    logger.info("Libération navigateur...")
+                    herald_session_release(scraper, discard=self._stop_requested)
+                    logger.info("Navigateur libéré")
                     self.step_completed.emit(7)
                 except Exception as e:
                     logger.warning(f"Erreur fermeture navigateur: {e}")
@@ -6560,6 +6525,7 @@ class SearchMissingPricesDialog(QDialog):
         
         # Perform search
         eden_scraper = None  # Track scraper for cleanup
+        items_scraper = None
         try:
             self.status_label.setText(lang.get("search_prices_dialog.status_connecting", default="Connecting to Eden Herald..."))
             QApplication.processEvents()
@@ -6683,6 +6649,10 @@ class SearchMissingPricesDialog(QDialog):
             )
         
         finally:
+            # Flush the items web cache journal
+            if items_scraper:
+                items_scraper.close()
+            
             # CRITICAL: Always close browser to prevent zombie processes
             if eden_scraper:
                 try:
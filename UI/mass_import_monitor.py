@@ -50,6 +50,7 @@ class MassImportMonitor(QMainWindow):
         self.items_failed = 0
         self.duplicates_skipped = 0
         self.current_item = None
+        self.worker_items = {}  # Session id -> item being scraped (parallel import)
         self.error_list = []  # Error list for tracking
         self.filtered_items = []  # Items filtered by level/utility restrictions
         self.retry_worker = None  # Worker for retry operations
@@ -343,6 +344,32 @@ class MassImportMonitor(QMainWindow):
         self.current_item_label.setWordWrap(True)  # Allow line wrap for long names
         progress_layout.addWidget(self.current_item_label)
         
+        # Per-session progress (only shown when the import runs several Eden sessions)
+        self.workers_label = QLabel()
+        self.workers_label.setStyleSheet("""
+            QLabel {
+                font-size: 9pt;
+                color: #808080;
+                padding: 2px 5px;
+            }
+        """)
+        self.workers_label.setWordWrap(True)
+        self.workers_label.setVisible(False)
+        progress_layout.addWidget(self.workers_label)
+        
+        # Throughput and queue depth of each import pipeline stage
+        self.stages_label = QLabel()
+        self.stages_label.setStyleSheet("""
+            QLabel {
+                font-size: 9pt;
+                color: #808080;
+                padding: 2px 5px;
+            }
+        """)
+        self.stages_label.setWordWrap(True)
+        self.stages_label.setVisible(False)
+        progress_layout.addWidget(self.stages_label)
+        
         progress_group.setLayout(progress_layout)
         main_layout.addWidget(progress_group)
         
@@ -440,6 +467,25 @@ class MassImportMonitor(QMainWindow):
         """)
         footer_layout.addWidget(self.start_button)
         
+        # Resume button (visible when an interrupted import left a checkpoint)
+        self.resume_button = QPushButton()
+        self.resume_button.clicked.connect(self.resume_import)
+        self.resume_button.setVisible(False)
+        self.resume_button.setStyleSheet("""
+            QPushButton {
+                background-color: #569cd6;
+                color: #1e1e1e;
+                padding: 8px 25px;
+                font-size: 11pt;
+                font-weight: bold;
+                border-radius: 3px;
+            }
+            QPushButton:hover {
+                background-color: #66acf6;
+            }
+        """)
+        footer_layout.addWidget(self.resume_button)
+        
         self.review_filtered_btn = QPushButton(lang.get("settings.pages.mass_import_monitor.review_filtered", default="🔍 Review Filtered Items"))
         self.review_filtered_btn.clicked.connect(self.open_review_filtered_dialog)
         self.review_filtered_btn.setVisible(False)  # Hidden until filtered items exist
@@ -489,6 +535,9 @@ class MassImportMonitor(QMainWindow):
         self.items_added = 0
         self.items_failed = 0
         self.duplicates_skipped = 0
+        self.worker_items = {}
+        self.workers_label.setVisible(False)
+        self.stages_label.setVisible(False)
         
         # Display template files if provided
         if template_files:
@@ -549,6 +598,40 @@ class MassImportMonitor(QMainWindow):
         
         self.log_message(lang.get("settings.pages.mass_import_monitor.ready_to_select", 
             default="✅ Ready. Please select template files to import."), "info")
+        
+        self.update_resume_button(announce=True)
+    
+    def update_resume_button(self, announce=False):
+        """Show the resume button when an interrupted import of the target database can be resumed"""
+        from Functions.import_checkpoint import ImportCheckpoint
+        
+        checkpoint = ImportCheckpoint.load(self.source_db_path)
+        if checkpoint is None:
+            self.resume_button.setVisible(False)
+            return
+        
+        count = len(checkpoint.processed)
+        self.resume_button.setText(lang.get("settings.pages.mass_import_monitor.resume_button", count=count,
+                                            default=f"⏯️ Resume Last Import ({count})"))
+        self.resume_button.setVisible(True)
+        if announce:
+            self.log_message(lang.get("settings.pages.mass_import_monitor.resume_available", count=count,
+                                      default=f"⏯️ An interrupted import can be resumed ({count} item(s) already processed)"), "info")
+    
+    def resume_import(self):
+        """Resume the interrupted import of the target database (already processed items are skipped)"""
+        from Functions.import_worker import ImportWorker
+        
+        worker = ImportWorker.from_checkpoint(self.source_db_path, self.path_manager)
+        if worker is None:
+            self.log_message("❌ No interrupted import to resume.", "error")
+            self.resume_button.setVisible(False)
+            return
+        
+        self.start_button.setEnabled(False)
+        self.start_button.setVisible(False)
+        self.resume_button.setVisible(False)
+        self._start_main_worker(worker, worker.file_paths)
     
     def select_template_files(self):
         """Open file dialog to select template files"""
@@ -636,14 +719,14 @@ class MassImportMonitor(QMainWindow):
         self.start_button.setEnabled(False)
         self.start_button.setVisible(False)
         
+        self.resume_button.setVisible(False)
+        
         # Import and start worker
         from Functions.import_worker import ImportWorker
-        from PySide6.QtCore import Qt
-        from pathlib import Path
         
         params = self.pending_import_params
         
-        self.main_worker = ImportWorker(
+        worker = ImportWorker(
             file_paths=params['file_paths'],
             realm=params['realm'],
             merge=params['merge'],
@@ -652,6 +735,14 @@ class MassImportMonitor(QMainWindow):
             source_db_path=params['source_db_path'],
             path_manager=params['path_manager']
         )
+        self._start_main_worker(worker, params['file_paths'])
+    
+    def _start_main_worker(self, worker, file_paths):
+        """Connect and start the main import worker (new or resumed import)"""
+        from PySide6.QtCore import Qt
+        from pathlib import Path
+        
+        self.main_worker = worker
         
         # Connect signals
         self.main_worker.progress_updated.connect(self.update_stats_slot)
@@ -665,6 +756,9 @@ class MassImportMonitor(QMainWindow):
                 # Pass filtered items to monitor for review option
                 if stats and 'filtered_items' in stats:
                     self.set_filtered_items(stats['filtered_items'])
+                
+                # Import stopped or crashed with its progress saved
+                self.update_resume_button()
                     
             except Exception as e:
                 self.log_message(f"Error in import finish: {e}", "error")
@@ -707,8 +801,8 @@ class MassImportMonitor(QMainWindow):
         self.main_worker.finished.connect(on_thread_finished, Qt.QueuedConnection)
         
         # Start import UI
-        total_items = len(params['file_paths'])
-        template_file_names = [Path(fp).name for fp in params['file_paths']]
+        total_items = len(file_paths)
+        template_file_names = [Path(fp).name for fp in file_paths]
         self.start_import(total_items, template_files=template_file_names)
         
         # Start worker thread
@@ -743,6 +837,9 @@ class MassImportMonitor(QMainWindow):
             failed: Number of failures
             duplicates: Number of duplicates skipped
             current_item: Name of item being processed
+            workers: Number of parallel Eden sessions
+            worker: Session id whose current item is given by worker_item (None = idle)
+            stages: Import pipeline metrics {stage: {processed, per_minute, queue_depth, busy_ratio}}
         """
         
         if 'total' in kwargs:
@@ -780,11 +877,60 @@ class MassImportMonitor(QMainWindow):
             else:
                 self.current_item_label.setText(lang.get('mass_import_monitor.waiting', default='En attente...'))
         
+        if 'workers' in kwargs:
+            self.worker_items = {worker_id: None for worker_id in range(1, kwargs['workers'] + 1)}
+        
+        if 'worker' in kwargs:
+            self.worker_items[kwargs['worker']] = kwargs.get('worker_item')
+        
+        if 'workers' in kwargs or 'worker' in kwargs:
+            self.update_workers_label()
+        
+        if 'stages' in kwargs:
+            self.update_stages_label(kwargs['stages'])
+        
         # Update unique items count
         self.unique_items_label.setText(f"{lang.get('settings.pages.mass_import_monitor.unique_items', default='🔍 Items uniques:')} {self.items_total}")
         
         # NO processEvents() - UI updates automatically via Qt's event loop
     
+    def update_workers_label(self):
+        """Show the item handled by each Eden session (hidden for a single session)"""
+        if len(self.worker_items) < 2:
+            self.workers_label.setVisible(False)
+            return
+        
+        idle = lang.get('settings.pages.mass_import_monitor.session_idle', default='idle')
+        lines = []
+        for worker_id, item_name in sorted(self.worker_items.items()):
+            prefix = lang.get('settings.pages.mass_import_monitor.session_worker', id=worker_id,
+                              default=f"🧵 Session {worker_id}:")
+            lines.append(f"{prefix} {item_name or idle}")
+        self.workers_label.setText("\n".join(lines))
+        self.workers_label.setVisible(True)
+    
+    def update_stages_label(self, stages):
+        """Show the rate and queue depth of each pipeline stage, marking the busiest one"""
+        if not stages:
+            self.stages_label.setVisible(False)
+            return
+        
+        bottleneck = max(stages, key=lambda name: stages[name].get('busy_ratio', 0))
+        lines = []
+        for name, metrics in stages.items():
+            stage_name = lang.get(f'settings.pages.mass_import_monitor.stage_{name}', default=name.capitalize())
+            line = lang.get('settings.pages.mass_import_monitor.pipeline_stage',
+                            stage=stage_name,
+                            rate=f"{metrics.get('per_minute', 0):.1f}",
+                            queue=metrics.get('queue_depth', 0),
+                            busy=f"{metrics.get('busy_ratio', 0) * 100:.0f}",
+                            default="{stage}: {rate}/min, queue {queue}, busy {busy}%")
+            if name == bottleneck and stages[name].get('busy_ratio', 0) > 0:
+                line += f" {lang.get('settings.pages.mass_import_monitor.pipeline_bottleneck', default='⬅ bottleneck')}"
+            lines.append(line)
+        self.stages_label.setText("\n".join(lines))
+        self.stages_label.setVisible(True)
+    
     def update_stats_slot(self, stats):
         """Slot for update_stats signal from worker thread"""
         self.update_stats(**stats)
@@ -1171,17 +1317,16 @@ class MassImportMonitor(QMainWindow):
     def mark_items_as_ignored(self, items_to_ignore):
         """Mark items as permanently ignored in the database"""
         try:
-            import json
+            from Functions.items_database_manager import get_items_storage_path, load_items_document, save_items_document
             
-            # Use the appropriate database path (embedded or personal)
+            # Use the appropriate database path (embedded or personal, JSON or SQLite backend)
             db_path = self.source_db_path
-            if not db_path.exists():
+            if not get_items_storage_path(db_path).exists():
                 self.log_message(f"⚠️ Database not found: {db_path}", "warning")
                 return
             
             # Load DB
-            with open(db_path, 'r', encoding='utf-8') as f:
-                db_data = json.load(f)
+            db_data = load_items_document(db_path)
             
             items_dict = db_data.get('items', {})
             ignored_count = 0
@@ -1216,8 +1361,7 @@ class MassImportMonitor(QMainWindow):
                     self.log_message(lang.get("settings.pages.mass_import_monitor.item_added_ignore_list", name=item_name, default=f"  ✓ Added '{item_name}' to ignore list"), "info")
             
             # Save updated DB
-            with open(db_path, 'w', encoding='utf-8') as f:
-                json.dump(db_data, f, indent=2, ensure_ascii=False)
+            save_items_document(db_path, db_data)
             
             self.log_message(lang.get("settings.pages.mass_import_monitor.items_ignored_success", count=ignored_count, default=f"✅ Successfully ignored {ignored_count} item(s)"), "success")
             
@@ -1241,6 +1385,15 @@ class MassImportMonitor(QMainWindow):
         logger = logging.getLogger(__name__)
         logger.info("MassImportMonitor closeEvent triggered")
         
+        # Main import still running: stop it after the items being scraped, progress goes to its checkpoint
+        if self.main_worker is not None and self.main_worker.isRunning():
+            logger.warning("Main import worker still running, stopping it (checkpoint kept for resume)...")
+            self.log_message(lang.get("settings.pages.mass_import_monitor.stopping_import",
+                                      default="⏸️ Stopping import, saving progress..."), "warning")
+            self.main_worker.request_stop()
+            if not self.main_worker.wait(30000):  # Wait up to 30 seconds (items in progress)
+                logger.warning("Main import worker still stopping, it will save its checkpoint when done")
+        
         # If a retry worker is running, warn and wait
         if hasattr(self, 'retry_worker') and self.retry_worker is not None:
             if self.retry_worker.isRunning():
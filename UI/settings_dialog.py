@@ -2900,9 +2900,10 @@ class SettingsDialog(QDialog):
         # Show result
         if success:
             stats_text = f"\n\n{lang.get('superadmin.stats_title', default='Statistics')}:\n"
-            stats_text += f"• {lang.get('superadmin.refresh_stats_total', default='Total items')}: {stats.get('total_items', 0)}\n"
-            stats_text += f"• {lang.get('superadmin.refresh_stats_updated', default='Updated')}: {stats.get('updated', 0)}\n"
-            stats_text += f"• {lang.get('superadmin.refresh_stats_skipped', default='Unchanged')}: {stats.get('skipped', 0)}\n"
+            stats_text += f"• {lang.get('superadmin.refresh_stats_total', default='Total items')}: {stats.get('total_db_entries', 0)}\n"
+            stats_text += f"• {lang.get('superadmin.refresh_stats_updated', default='Updated')}: {stats.get('items_updated', 0) + stats.get('items_created', 0)}\n"
+            stats_text += f"• {lang.get('superadmin.refresh_stats_skipped', default='Unchanged')}: {stats.get('items_unchanged', 0)}\n"
+            stats_text += f"• {lang.get('superadmin.refresh_stats_not_due', default='Not due (skipped)')}: {stats.get('items_skipped', 0)}\n"
             stats_text += f"• {lang.get('superadmin.refresh_stats_failed', default='Failed')}: {stats.get('failed', 0)}\n\n"
             
             fields = stats.get('fields_updated', {})
@@ -2977,6 +2978,44 @@ class SettingsDialog(QDialog):
                 if confirm_reply != QMessageBox.Yes:
                     return
             
+            # Refresh mode (all items refresh): only the items due for a refresh
+            refresh_mode = "all"
+            max_age_days = 30
+            refresh_limit = None
+            if not item_filter:
+                mode_labels = {
+                    lang.get('superadmin.refresh_mode_all', default="Tous les items"): "all",
+                    lang.get('superadmin.refresh_mode_stale', default="Items de plus de N jours"): "stale",
+                    lang.get('superadmin.refresh_mode_missing', default="Items sans modèle ou prix"): "missing",
+                    lang.get('superadmin.refresh_mode_priority', default="Items les plus anciens d'abord (nombre limité)"): "priority"
+                }
+                mode_label, ok = QInputDialog.getItem(
+                    self,
+                    lang.get('superadmin.refresh_mode_title', default="Mode de rafraîchissement"),
+                    lang.get('superadmin.refresh_mode_label', default="Quels items faut-il re-scraper ?"),
+                    list(mode_labels), 0, False
+                )
+                if not ok:
+                    return
+                refresh_mode = mode_labels[mode_label]
+                
+                if refresh_mode == "stale":
+                    max_age_days, ok = QInputDialog.getInt(
+                        self, mode_label,
+                        lang.get('superadmin.refresh_max_age_label', default="Rafraîchir les items scrapés il y a plus de N jours :"),
+                        max_age_days, 1, 3650
+                    )
+                    if not ok:
+                        return
+                elif refresh_mode == "priority":
+                    refresh_limit, ok = QInputDialog.getInt(
+                        self, mode_label,
+                        lang.get('superadmin.refresh_limit_label', default="Nombre d'items à rafraîchir (les plus anciens d'abord) :"),
+                        50, 1, 100000
+                    )
+                    if not ok:
+                        return
+            
             # Confirmation dialog
             title = lang.get('superadmin.refresh_confirm_title', 
                 default="Confirmer le rafraîchissement")
@@ -2996,6 +3035,9 @@ class SettingsDialog(QDialog):
                            "⚠️ Cette opération peut prendre plusieurs minutes.\n"
                            "Une sauvegarde sera créée automatiquement.")
             
+            if refresh_mode != "all":
+                message = f"🕒 {mode_label}\n\n{message}"
+            
             reply = SilentMessageBox.question(self, title, message,
                                         QMessageBox.Yes | QMessageBox.No)
             
@@ -3042,10 +3084,13 @@ class SettingsDialog(QDialog):
             
             # Execute refresh
             try:
-                logging.info(f"REFRESH: Calling refresh_all_items with filter={item_filter}...")
+                logging.info(f"REFRESH: Calling refresh_all_items with filter={item_filter}, mode={refresh_mode}...")
                 success, message, stats = superadmin.refresh_all_items(
                     progress_callback=update_progress,
-                    item_filter=item_filter  # None = tous les items, ou liste spécifique
+                    item_filter=item_filter,  # None = tous les items, ou liste spécifique
+                    mode=refresh_mode,
+                    max_age_days=max_age_days,
+                    limit=refresh_limit
                 )
                 logging.info(f"REFRESH: Result - success={success}, stats={stats}")
             except InterruptedError:
@@ -3065,9 +3110,10 @@ class SettingsDialog(QDialog):
             # Show result
             if success:
                 stats_text = f"\n\n{lang.get('superadmin.stats_title', default='Statistiques')}:\n"
-                stats_text += f"• {lang.get('superadmin.refresh_stats_total', default='Total items')}: {stats.get('total_items', 0)}\n"
-                stats_text += f"• {lang.get('superadmin.refresh_stats_updated', default='Mis à jour')}: {stats.get('updated', 0)}\n"
-                stats_text += f"• {lang.get('superadmin.refresh_stats_skipped', default='Inchangés')}: {stats.get('skipped', 0)}\n"
+                stats_text += f"• {lang.get('superadmin.refresh_stats_total', default='Total items')}: {stats.get('total_db_entries', 0)}\n"
+                stats_text += f"• {lang.get('superadmin.refresh_stats_updated', default='Mis à jour')}: {stats.get('items_updated', 0) + stats.get('items_created', 0)}\n"
+                stats_text += f"• {lang.get('superadmin.refresh_stats_skipped', default='Inchangés')}: {stats.get('items_unchanged', 0)}\n"
+                stats_text += f"• {lang.get('superadmin.refresh_stats_not_due', default='Non dus (ignorés)')}: {stats.get('items_skipped', 0)}\n"
                 stats_text += f"• {lang.get('superadmin.refresh_stats_failed', default='Échecs')}: {stats.get('failed', 0)}\n\n"
                 
                 fields = stats.get('fields_updated', {})
@@ -3112,6 +3158,7 @@ class SettingsDialog(QDialog):
             
             # Connect signal to refresh stats when database is modified
             dialog.database_modified.connect(self._refresh_superadmin_stats)
+            dialog.database_modified.connect(self.db_manager.invalidate_items_store)
             
             # Store reference to prevent garbage collection
             if not hasattr(self, '_database_editors'):
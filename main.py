@@ -1063,8 +1063,7 @@ class CharacterApp(QMainWindow):
     @Slot(int, int, int)
     def _on_section_moved(self, logical_index, old_visual_index, new_visual_index):
         """Log le déplacement d'une colonne"""
-        header_item = self.tree_manager.model.horizontalHeaderItem(logical_index)
-        column_name = header_item.text() if header_item else f"Column {logical_index}"
+        column_name = self.tree_manager.model.headerData(logical_index, Qt.Horizontal) or f"Column {logical_index}"
         logging.debug(f"Column '{column_name}' moved from {old_visual_index} to {new_visual_index}")
         
     def closeEvent(self, event):
@@ -1085,9 +1084,20 @@ class CharacterApp(QMainWindow):
                     self.ui_manager.eden_status_thread.wait()
                 logging.info("Eden status thread stopped")
         
+        # Fermer la session Herald partagée (navigateur gardé actif entre les opérations)
+        try:
+            from Functions.eden_herald_session import herald_session_shutdown
+            herald_session_shutdown()
+        except Exception as e:
+            logging.warning(f"Error closing shared Herald session: {e}")
+        
         # Save l'état of l'en-tête
         self.tree_manager.save_header_state()
         
+        # Écrire les sauvegardes de personnages encore différées
+        from Functions.character_file_writer import character_file_flush_pending
+        character_file_flush_pending()
+        
         if self.debug_window:
             self.debug_window.close()
             